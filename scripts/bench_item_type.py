@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""Micro-benchmark item-type classification over a corpus of real IIIF manifests.
+
+The corpus is every `manifest.json` found under the given paths, by default the
+configured downloads directory (each downloaded item keeps its manifest under
+`data/manifest.json`). Timings compare the original rule-by-rule substring
+scan with the compiled rule table (`infer_item_type`) and the batch
+classifier used by library-wide reclassification (`infer_item_types`), and
+check that all three agree.
+
+    python scripts/bench_item_type.py [PATH ...] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from universal_iiif_core import library_catalog
+from universal_iiif_core.config_manager import get_config_manager
+
+Document = tuple[str, str, dict[str, str]]
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments for the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark item-type classification on local manifests.")
+    parser.add_argument("paths", nargs="*", type=Path, help="Manifest files or folders (default: downloads dir)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per variant; the best is reported")
+    return parser.parse_args()
+
+
+def load_corpus(paths: list[Path]) -> list[Document]:
+    """Read `(label, description, metadata)` classification inputs from every manifest found."""
+    files: list[Path] = []
+    for path in paths:
+        files.extend(sorted(path.rglob("manifest.json")) if path.is_dir() else [path])
+    documents: list[Document] = []
+    for file in files:
+        try:
+            manifest = json.loads(file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not isinstance(manifest, dict):
+            continue
+        documents.append(
+            (
+                library_catalog.flatten_iiif_value(manifest.get("label") or manifest.get("title")),
+                library_catalog.flatten_iiif_value(manifest.get("description")),
+                library_catalog.metadata_to_map(manifest.get("metadata") or []),
+            )
+        )
+    return documents
+
+
+def sequential_infer_item_type(label: str, description: str = "", metadata: dict[str, str] | None = None):
+    """Baseline: the rule-by-rule, token-by-token substring scan the compiled matcher replaced."""
+    metadata = metadata or {}
+    keys = ("type", "genre", "format", "material", "description")
+    corpus = " ".join(chunk for chunk in (label, description, *(metadata.get(k, "") for k in keys)) if chunk).lower()
+    for item_type, tokens, confidence in library_catalog._TYPE_RULES:
+        for token in tokens:
+            if token in corpus:
+                return item_type, confidence, f"match:{token}"
+    return "non classificato", 0.2, "fallback:no-rule-match"
+
+
+def best_of(repeat: int, fn: Callable[[], list]) -> tuple[float, list]:
+    """Return the fastest wall time of `repeat` runs and the last result."""
+    best = float("inf")
+    result: list = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> int:
+    """Run the benchmark and print per-document timings."""
+    args = parse_args()
+    paths = args.paths or [get_config_manager().get_downloads_dir()]
+    documents = load_corpus(paths)
+    if not documents:
+        print(f"No manifest.json found under: {', '.join(map(str, paths))}")
+        return 1
+
+    variants = {
+        "sequential scan": lambda: [sequential_infer_item_type(*doc) for doc in documents],
+        "compiled, per document": lambda: [library_catalog.infer_item_type(*doc) for doc in documents],
+        "compiled, batch": lambda: library_catalog.infer_item_types(documents),
+    }
+    results = {}
+    print(f"{len(documents)} manifests, best of {args.repeat} runs")
+    for name, fn in variants.items():
+        elapsed, results[name] = best_of(args.repeat, fn)
+        print(f"  {name:<24} {elapsed * 1000:9.2f} ms  {elapsed / len(documents) * 1e6:8.2f} µs/doc")
+
+    baseline = results["sequential scan"]
+    mismatches = [name for name, result in results.items() if result != baseline]
+    if mismatches:
+        print(f"Results differ from the sequential scan: {', '.join(mismatches)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
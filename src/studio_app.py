@@ -12,6 +12,7 @@ from starlette.staticfiles import StaticFiles
 
 from studio_ui.routes.api import setup_api_routes
 from studio_ui.routes.discovery import setup_discovery_routes
+from studio_ui.routes.events import setup_event_routes
 from studio_ui.routes.export import setup_export_routes
 from studio_ui.routes.library import setup_library_routes
 from studio_ui.routes.settings import setup_settings_routes
@@ -21,33 +22,36 @@ from universal_iiif_core import __version__
 from universal_iiif_core.config_manager import get_config_manager
 from universal_iiif_core.logger import get_logger, setup_logging
 
-# Initialize logging
-setup_logging()
 logger = get_logger(__name__)
 
 # Initialize configuration
 config = get_config_manager()
 
 
-# On startup, reset any stale download jobs left as pending/running by previous process.
-try:
-    from universal_iiif_core.services.storage.vault_manager import VaultManager
+# NOTE: keep module scope free of startup side effects. Process pools started with
+# forkserver/spawn (PDF rasterization) re-import the entry module in their workers,
+# so anything here would also run inside a live server, mid-job.
+def _reset_stale_jobs() -> None:
+    """Mark download/export jobs left pending/running by a previous process as errored."""
+    try:
+        from universal_iiif_core.services.storage.vault_manager import VaultManager
 
-    vm = VaultManager()
-    reset_download_count = vm.reset_active_downloads()
-    if reset_download_count:
-        logger.info(f"Marked {reset_download_count} stale download job(s) as errored on startup")
+        vm = VaultManager()
+        reset_download_count = vm.reset_active_downloads()
+        if reset_download_count:
+            logger.info(f"Marked {reset_download_count} stale download job(s) as errored on startup")
 
-    reset_export_count = vm.reset_active_exports()
-    if reset_export_count:
-        logger.info(f"Marked {reset_export_count} stale export job(s) as errored on startup")
-except Exception:
-    logger.debug("Failed to reset stale jobs on startup", exc_info=True)
+        reset_export_count = vm.reset_active_exports()
+        if reset_export_count:
+            logger.info(f"Marked {reset_export_count} stale export job(s) as errored on startup")
+    except Exception:
+        logger.debug("Failed to reset stale jobs on startup", exc_info=True)
 
 
 async def lifespan(app):
     """Gestione del ciclo di vita dell'app FastHTML."""
     # Startup: reset any stale DB jobs and kick off housekeeping in background
+    _reset_stale_jobs()
     try:
         from universal_iiif_core.services.export.service import prune_storage_on_startup
         from universal_iiif_core.services.storage.vault_manager import VaultManager
@@ -136,7 +140,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             path = ""
 
         if request.method.upper() == "GET" and (
-            path.startswith("/api/download_status/") or path == "/api/download_manager"
+            path.startswith("/api/download_status/") or path in {"/api/download_manager", "/api/events"}
         ):
             logger.debug(f"Polling: [{request.method}] {path}")
         else:
@@ -173,6 +177,9 @@ setup_settings_routes(app)
 # Statistics page routes
 setup_stats_routes(app)
 
+# Live event stream (SSE)
+setup_event_routes(app)
+
 
 # Root redirect
 @rt("/")
@@ -199,6 +206,7 @@ def main():
     args = parser.parse_args()
     reload_enabled = bool(args.reload)
 
+    setup_logging()
     logger.info("🚀 Starting Scriptoria")
     logger.info(f"📍 Downloads directory: {config.get_downloads_dir()}")
     logger.info(
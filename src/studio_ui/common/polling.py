@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 from studio_ui.config import get_setting
 
 _MIN_SECONDS = 1
@@ -34,3 +36,55 @@ def build_every_seconds_trigger(seconds: int) -> str:
     """Build a canonical HTMX polling trigger string."""
     bounded = max(_MIN_SECONDS, min(_MAX_SECONDS, int(seconds)))
     return f"every {bounded}s"
+
+
+# DOM events dispatched on <body> by the live event stream bootstrap (see layout).
+LIVE_EVENT_JOBS = "studio-jobs"
+LIVE_EVENT_OCR = "studio-ocr"
+LIVE_EVENT_EXPORT = "studio-export"
+LIVE_EVENT_DOCS = "studio-docs"
+_LIVE_FLAG = "window.studioLiveEvents"
+# Un-keyed fragments wait this long after the last event, so a burst over many entities costs one request.
+_LIVE_BURST_DELAY_MS = 250
+
+
+def get_live_throttle_ms() -> int:
+    """Return the shortest gap between two live updates of one entity: never faster than the fallback poll."""
+    return 1000 * max(get_download_status_interval_seconds(), get_download_manager_interval_seconds())
+
+
+def _live_filter_value(value: object) -> str:
+    if isinstance(value, bool) or not isinstance(value, int):
+        escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
+        return f"'{escaped}'"
+    return str(value)
+
+
+def build_live_trigger(
+    seconds: int,
+    event: str,
+    *,
+    on_load: bool = False,
+    match: Mapping[str, object] | None = None,
+    state_only: bool = False,
+) -> str:
+    """Build a trigger that refreshes on a live bus event and polls only while the stream is down.
+
+    Args:
+        seconds: Fallback polling interval.
+        event: Live DOM event name (one of the ``LIVE_EVENT_*`` constants).
+        on_load: Also fire once when the fragment is loaded.
+        match: Payload fields the event must carry (e.g. ``{"key": "job:<id>"}``), so the
+            fragment only reacts to its own entity.
+        state_only: Ignore events that only move progress forward; the live bootstrap applies
+            those to ``data-live-*`` elements in place, without a request.
+    """
+    parts = ["load"] if on_load else []
+    parts.append(f"{build_every_seconds_trigger(seconds)} [!{_LIVE_FLAG}]")
+    conditions = ["detail.stateChanged"] if state_only else []
+    conditions.extend(f"detail.{field}=={_live_filter_value(value)}" for field, value in (match or {}).items())
+    spec = f"{event}[{' && '.join(conditions)}] from:body" if conditions else f"{event} from:body"
+    if not match:
+        spec = f"{spec} delay:{_LIVE_BURST_DELAY_MS}ms"
+    parts.append(spec)
+    return ", ".join(parts)
@@ -9,7 +9,10 @@ from .discovery_download_panel import (
 from .discovery_form import discovery_form
 from .discovery_page import discovery_content
 from .discovery_results import (
+    federated_status_text,
     render_error_message,
+    render_federated_cards_html,
+    render_federated_results_shell,
     render_feedback_message,
     render_load_more_fragment,
     render_pdf_capability_badge,
@@ -20,10 +23,13 @@ from .discovery_results import (
 __all__ = [
     "discovery_content",
     "discovery_form",
+    "federated_status_text",
     "render_download_job_card",
     "render_download_manager",
     "render_download_status",
     "render_error_message",
+    "render_federated_cards_html",
+    "render_federated_results_shell",
     "render_feedback_message",
     "render_load_more_fragment",
     "render_pdf_capability_badge",
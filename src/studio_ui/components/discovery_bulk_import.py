@@ -0,0 +1,98 @@
+"""Discovery bulk import form and job status renderers."""
+
+from __future__ import annotations
+
+from urllib.parse import urlencode
+
+from fasthtml.common import H3, Button, Details, Div, Form, Input, Li, P, Span, Summary, Textarea, Ul
+
+from studio_ui.common.polling import LIVE_EVENT_JOBS, build_live_trigger
+
+_STATUS_LABELS = {
+    "imported": "importati",
+    "not_found": "non trovati",
+    "error": "errori",
+}
+_MAX_LISTED_PROBLEMS = 50
+
+
+def bulk_import_panel() -> Details:
+    """Collapsible form to import a TXT/CSV shelf list into the library."""
+    return Details(
+        Summary(
+            "Importazione massiva (TXT / CSV)",
+            cls="cursor-pointer text-sm font-semibold text-slate-700 dark:text-slate-200",
+        ),
+        P(
+            "Un identificativo per riga (segnatura, ID o URL), oppure un CSV con colonne 'identifier' e "
+            "'library'. Ricaricare la stessa lista riprende l'importazione dal punto in cui si era fermata.",
+            cls="text-xs text-slate-500 dark:text-slate-400 mt-2 mb-3",
+        ),
+        Form(
+            Input(type="file", name="import_file", accept=".txt,.csv,text/plain,text/csv", cls="app-field"),
+            Textarea(
+                name="import_text",
+                rows=4,
+                placeholder="…oppure incolla qui l'elenco",
+                cls="app-field font-mono text-xs",
+            ),
+            Button("Avvia importazione", type="submit", cls="app-btn app-btn-accent font-semibold py-2"),
+            hx_post="/api/discovery/bulk_import",
+            hx_encoding="multipart/form-data",
+            hx_target="#bulk-import-status",
+            cls="grid gap-3",
+        ),
+        Div(id="bulk-import-status", cls="mt-3"),
+        cls=(
+            "mt-4 rounded-xl border border-slate-200/80 dark:border-slate-700 "
+            "bg-white/90 dark:bg-slate-900/50 p-4 shadow-sm"
+        ),
+    )
+
+
+def _problem_items(report: dict) -> list:
+    problems = [item for item in (report.get("items") or {}).values() if item.get("status") != "imported"]
+    problems.sort(key=lambda item: int(item.get("line") or 0))
+    rows = [
+        Li(
+            Span(f"riga {item.get('line')}: ", cls="text-slate-500"),
+            Span(str(item.get("identifier") or ""), cls="font-mono"),
+            Span(f" — {item.get('message') or _STATUS_LABELS.get(item.get('status'), '')}", cls="text-slate-500"),
+        )
+        for item in problems[:_MAX_LISTED_PROBLEMS]
+    ]
+    if len(problems) > _MAX_LISTED_PROBLEMS:
+        rows.append(Li(f"… e altri {len(problems) - _MAX_LISTED_PROBLEMS}", cls="text-slate-500"))
+    return rows
+
+
+def render_bulk_import_status(
+    *, job_id: str, import_id: str, job: dict | None, report: dict, counts: dict[str, int]
+) -> Div:
+    """Render progress and the per-item report of a bulk import; refreshes on its job's live events while it runs."""
+    status = str((job or {}).get("status") or "completed")
+    running = status in {"pending", "queued", "running", "cancelling"}
+    total = int(report.get("total") or 0)
+    processed = sum(counts.values())
+    summary = " · ".join(f"{counts.get(key, 0)} {label}" for key, label in _STATUS_LABELS.items())
+    problems = _problem_items(report)
+    poll = (
+        {
+            "hx_get": f"/api/discovery/bulk_import/status?{urlencode({'job_id': job_id, 'import_id': import_id})}",
+            "hx_trigger": build_live_trigger(2, LIVE_EVENT_JOBS, match={"key": f"job:{job_id}"}),
+            "hx_swap": "outerHTML",
+        }
+        if running
+        else {}
+    )
+    return Div(
+        H3(
+            f"Importazione {'in corso' if running else 'terminata'}: {processed}/{total}",
+            cls="text-sm font-semibold text-slate-800 dark:text-slate-100",
+        ),
+        P(summary, cls="text-xs text-slate-600 dark:text-slate-300"),
+        Ul(*problems, cls="mt-2 text-xs space-y-0.5 max-h-48 overflow-y-auto") if problems else "",
+        id="bulk-import-status",
+        cls="mt-3",
+        **poll,
+    )
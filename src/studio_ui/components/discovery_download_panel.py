@@ -5,12 +5,13 @@ from urllib.parse import quote
 from fasthtml.common import H3, A, Button, Div, P, Span
 
 from studio_ui.common.polling import (
-    build_every_seconds_trigger,
+    LIVE_EVENT_JOBS,
+    build_live_trigger,
     get_download_manager_interval_seconds,
     get_download_status_interval_seconds,
 )
-from studio_ui.common.title_utils import resolve_preferred_title, truncate_title
 from studio_ui.components.discovery_results import render_error_message
+from universal_iiif_core.title_utils import resolve_preferred_title, truncate_title
 
 
 def render_download_status(download_id: str, doc_id: str, library: str, status_data: dict) -> Div:
@@ -29,7 +30,10 @@ def render_download_status(download_id: str, doc_id: str, library: str, status_d
     percent_cls = "text-3xl font-extrabold text-indigo-400"
     progress_bg_cls = "w-full bg-slate-700 rounded-full h-2.5 mb-2"
     progress_bar_cls = "bg-indigo-500 h-2.5 rounded-full transition-all duration-500 ease-out"
-    status_poll_trigger = build_every_seconds_trigger(get_download_status_interval_seconds())
+    live_key = f"job:{download_id}"
+    status_poll_trigger = build_live_trigger(
+        get_download_status_interval_seconds(), LIVE_EVENT_JOBS, match={"key": live_key}, state_only=True
+    )
 
     if status in {"cancelling", "pausing"}:
         header = Div(
@@ -136,15 +140,17 @@ def render_download_status(download_id: str, doc_id: str, library: str, status_d
             Span(library, cls=badge_cls),
             cls="flex items-center justify-between",
         ),
-        P(f"{current}/{total} pagine", cls=subtext_cls),
+        P(f"{current}/{total} pagine", cls=subtext_cls, data_live_text="{current}/{total} pagine"),
         cls="mb-4",
     )
     percent_block = Div(
-        Div(f"{percent}%", cls=percent_cls),
+        Div(f"{percent}%", cls=percent_cls, data_live_text="{percent}%"),
         P("Scaricamento in corso...", cls="text-sm text-slate-500"),
         cls="flex items-center gap-4 mb-4",
     )
-    progress_bar = Div(Div(Div(cls=progress_bar_cls, style=f"width: {percent}%"), cls=progress_bg_cls))
+    progress_bar = Div(
+        Div(Div(cls=progress_bar_cls, style=f"width: {percent}%", data_live_bar="1"), cls=progress_bg_cls)
+    )
     body = Div(
         header,
         percent_block,
@@ -158,6 +164,7 @@ def render_download_status(download_id: str, doc_id: str, library: str, status_d
         hx_get=f"/api/download_status/{download_id}?doc_id={doc_id}&library={library}",
         hx_trigger=status_poll_trigger,
         hx_swap="outerHTML",
+        data_live_key=live_key,
         cls=card_cls,
     )
 
@@ -166,7 +173,7 @@ def render_download_manager(jobs: list[dict]) -> Div:
     """Render the full download manager panel."""
     active_statuses = {"queued", "running", "cancelling", "pausing", "pending", "starting"}
     should_poll = any(str(job.get("status") or "").lower() in active_statuses for job in jobs)
-    manager_poll_trigger = build_every_seconds_trigger(get_download_manager_interval_seconds())
+    manager_poll_trigger = build_live_trigger(get_download_manager_interval_seconds(), LIVE_EVENT_JOBS, state_only=True)
     library_jobs = [job for job in jobs if str(job.get("job_origin") or "library_download") != "studio_export_page"]
     studio_jobs = [job for job in jobs if str(job.get("job_origin") or "") == "studio_export_page"]
 
@@ -389,10 +396,14 @@ def _download_job_progress(status: str, current: int, total: int, percent: int,
     counts_line = P(f"{current}/{total} pagine", cls="text-[11px] text-slate-400 mt-1")
     progress = Div(
         Div(
-            Div(cls="h-2 rounded bg-indigo-500", style=f"width: {percent}%"),
+            Div(cls="h-2 rounded bg-indigo-500", style=f"width: {percent}%", data_live_bar="1"),
             cls="w-full bg-slate-700 rounded h-2",
         ),
-        P(f"{current}/{total} ({percent}%)", cls="text-[11px] text-slate-400 mt-1") if total > 0 else counts_line,
+        P(
+            f"{current}/{total} ({percent}%)" if total > 0 else f"{current}/{total} pagine",
+            cls="text-[11px] text-slate-400 mt-1",
+            data_live_text="{current}/{total} ({percent}%)",
+        ),
         cls="mt-2",
     )
     if status == "queued":
@@ -444,5 +455,6 @@ def render_download_job_card(job: dict) -> Div:
             Div(*right_actions, cls="flex flex-wrap gap-2 ml-auto"),
             cls="mt-2 flex items-start gap-2",
         ),
+        data_live_key=f"job:{job_id}",
         cls="bg-slate-900/50 border border-slate-700 rounded-lg p-3",
     )
@@ -4,7 +4,7 @@ import json
 
 from fasthtml.common import H3, A, Button, Div, Form, Input, Label, Option, P, Script, Select
 
-from studio_ui.library_options import library_options
+from studio_ui.library_options import FEDERATED_LIBRARY_LABEL, FEDERATED_LIBRARY_VALUE, library_options
 from universal_iiif_core.providers import iter_providers
 
 
@@ -105,6 +105,7 @@ def discovery_form() -> Div:
                     ),
                     Select(
                         *[Option(label, value=value) for label, value in libraries],
+                        Option(FEDERATED_LIBRARY_LABEL, value=FEDERATED_LIBRARY_VALUE),
                         id="lib-select",
                         name="library",
                         cls="app-field",
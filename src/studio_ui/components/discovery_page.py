@@ -2,6 +2,7 @@
 
 from fasthtml.common import H2, H3, Div
 
+from .discovery_bulk_import import bulk_import_panel
 from .discovery_form import discovery_form
 
 
@@ -17,6 +18,7 @@ def discovery_content(initial_preview=None, active_download_fragment=None) -> Di
         Div(
             Div(
                 discovery_form(),
+                bulk_import_panel(),
                 preview_block,
                 cls="w-full xl:w-[66%] xl:pr-4",
             ),
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from urllib.parse import quote
 
-from fasthtml.common import H3, A, Button, Div, Img, P, Span
+from fasthtml.common import H3, A, Button, Div, Img, P, Script, Span, to_xml
 
 
 def _provider_viewer_fallback(library: str, doc_id: str, ark: str = "", manifest_url: str = "") -> str:
@@ -301,6 +301,104 @@ def render_search_results_list(results: list, *, pagination: dict | None = None)
     )
 
 
+_FEDERATED_STATUS_LABELS = {
+    "pending": "in attesa",
+    "results": "{count} risultati",
+    "empty": "nessun risultato",
+    "timeout": "tempo scaduto",
+    "error": "errore",
+}
+
+
+def federated_status_text(status: str, count: int = 0) -> str:
+    """Return the short label shown on a provider chip of a federated search."""
+    return _FEDERATED_STATUS_LABELS.get(status, status).format(count=count)
+
+
+def render_federated_cards_html(results: list) -> str:
+    """Serialize result cards for one provider answer of a federated search."""
+    return "".join(to_xml(card) for card in _build_result_cards(results))
+
+
+def render_federated_results_shell(query: str, providers: list[tuple[str, str]], stream_url: str) -> Div:
+    """Render the federated results container that fills in as each provider answers.
+
+    Args:
+        query: The search text, shown in the header.
+        providers: `(key, label)` pairs of the providers being queried.
+        stream_url: SSE endpoint streaming one `provider` event per answer and a final `done`.
+    """
+    chips = [
+        Span(
+            f"{label}: {federated_status_text('pending')}",
+            data_federated_provider=key,
+            data_label=label,
+            cls=(
+                "text-[11px] px-2 py-0.5 rounded-full border border-slate-300 dark:border-slate-600 "
+                "text-slate-500 dark:text-slate-400"
+            ),
+        )
+        for key, label in providers
+    ]
+    return Div(
+        Div(
+            H3(
+                f"Ricerca federata su {len(providers)} biblioteche",
+                id="federated-results-header",
+                cls="text-lg font-semibold text-slate-900 dark:text-slate-100",
+            ),
+            Span(
+                f"«{query}» — i risultati compaiono man mano che le biblioteche rispondono.",
+                cls="text-xs text-slate-500",
+            ),
+            Div(*chips, id="federated-provider-status", cls="flex flex-wrap gap-1.5 mt-2"),
+            cls="mb-4 pb-3 border-b border-slate-200 dark:border-slate-700",
+        ),
+        Div(id="discovery-results-cards", cls="space-y-3 max-h-[640px] overflow-y-auto pr-1"),
+        Script(
+            f"""
+            (function () {{
+                const root = document.getElementById('discovery-preview');
+                const cards = document.getElementById('discovery-results-cards');
+                const header = document.getElementById('federated-results-header');
+                if (!root || !cards || typeof EventSource === 'undefined') return;
+                const source = new EventSource({json.dumps(stream_url)});
+                let total = 0;
+                const alive = () => {{
+                    if (document.body.contains(root)) return true;
+                    source.close();
+                    return false;
+                }};
+                source.addEventListener('provider', (event) => {{
+                    if (!alive()) return;
+                    const data = JSON.parse(event.data || '{{}}');
+                    const chip = root.querySelector(`[data-federated-provider="${{CSS.escape(data.provider || '')}}"]`);
+                    if (chip) {{
+                        chip.textContent = `${{chip.dataset.label}}: ${{data.label || data.status}}`;
+                        chip.classList.toggle('text-emerald-600', data.status === 'results');
+                        chip.classList.toggle('text-rose-500', data.status === 'error' || data.status === 'timeout');
+                    }}
+                    if (data.html) {{
+                        cards.insertAdjacentHTML('beforeend', data.html);
+                        if (window.htmx && typeof window.htmx.process === 'function') {{
+                            window.htmx.process(cards);
+                        }}
+                    }}
+                    total += data.count || 0;
+                    if (header) header.textContent = `Trovati ${{total}} risultati`;
+                }});
+                source.addEventListener('done', () => {{
+                    source.close();
+                    if (alive() && header) header.textContent = `Trovati ${{total}} risultati (ricerca completata)`;
+                }});
+                source.onerror = () => source.close();
+            }})();
+            """
+        ),
+        id="discovery-preview",
+    )
+
+
 def render_load_more_fragment(results: list, *, has_more: bool = False, pagination: dict | None = None) -> Div:
     """Render new cards + optional next load-more button (replaces #load-more-section)."""
     cards = _build_result_cards(results)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from fasthtml.common import H2, H3, A, Button, Div, P, Span
 
+from studio_ui.common.polling import LIVE_EVENT_EXPORT, build_live_trigger
+
 _STATUS_CLASSES = {
     "queued": "app-chip app-chip-primary",
     "running": "app-chip app-chip-warning",
@@ -51,7 +53,7 @@ def render_export_jobs_panel(
         poll_every = max(4, int(poll_interval_seconds or 4))
         attrs = {
             "hx_get": hx_url,
-            "hx_trigger": f"load, every {poll_every}s",
+            "hx_trigger": build_live_trigger(poll_every, LIVE_EVENT_EXPORT, on_load=True, state_only=True),
             "hx_swap": "outerHTML",
         }
 
@@ -113,7 +115,11 @@ def render_export_jobs_panel(
                     Div(
                         Span(job_id, cls="font-mono text-[11px] text-slate-600 dark:text-slate-300 break-all"),
                         _status_chip(status),
-                        Span(f"Progress {progress_text}", cls=f"app-chip {progress_tone} text-[11px] tracking-wide"),
+                        Span(
+                            f"Progress {progress_text}",
+                            cls=f"app-chip {progress_tone} text-[11px] tracking-wide",
+                            data_live_text="Progress {current}/{total}",
+                        ),
                         cls="flex flex-wrap items-center gap-2",
                     ),
                     Div(
@@ -157,6 +163,7 @@ def render_export_jobs_panel(
                     else ""
                 ),
                 Div(*actions, cls="flex items-center gap-2"),
+                data_live_key=f"export:{job_id}",
                 cls=(
                     "border border-slate-200 dark:border-slate-700 rounded-2xl p-4 "
                     "bg-white dark:bg-slate-900/60 shadow-sm space-y-3"
@@ -7,6 +7,7 @@ import json
 
 from fasthtml.common import A, Body, Button, Div, Head, Html, Img, Link, Main, Meta, Nav, Script, Title
 
+from studio_ui.common.polling import get_live_throttle_ms
 from studio_ui.config import get_setting
 from studio_ui.theme import mix_hex, parse_hex_rgb, readable_ink, resolve_ui_theme
 from universal_iiif_core import __version__
@@ -146,6 +147,83 @@ def _library_nav_filters_bootstrap_script(default_mode: str) -> str:
     """
 
 
+def _live_events_bootstrap_script(throttle_ms: int) -> str:
+    """Open the SSE stream and re-dispatch bus events as throttled DOM events on <body>.
+
+    Events are coalesced per entity key and dispatched at most once per ``throttle_ms``
+    (leading edge, then the latest pending state). Each dispatch first writes the payload
+    progress into ``[data-live-key]`` elements (``data-live-bar`` width, ``data-live-text``
+    templates) and flags ``detail.stateChanged`` when status or queue position moved, so
+    HTMX fragments re-fetch only on real state changes. Fragments listen for
+    ``studio-<topic>`` and stop their interval polling while ``window.studioLiveEvents`` is true.
+    """
+    return """
+        (function () {
+            if (window.__studioLiveEventsBound || typeof EventSource === 'undefined') return;
+            window.__studioLiveEventsBound = true;
+            window.studioLiveEvents = false;
+
+            const THROTTLE_MS = __THROTTLE_MS__;
+            const pending = {};
+            const timers = {};
+            const lastSent = {};
+            const lastState = {};
+
+            function applyProgress(detail) {
+                if (!detail.key || typeof CSS === 'undefined') return;
+                const total = Number(detail.total || detail.total_steps || 0);
+                const current = Number(detail.current || detail.current_step || 0);
+                const percent = total > 0
+                    ? Math.floor((current * 100) / total)
+                    : Math.floor(Number(detail.progress || 0) * 100);
+                document.querySelectorAll('[data-live-key="' + CSS.escape(detail.key) + '"]').forEach((root) => {
+                    root.querySelectorAll('[data-live-bar]').forEach((el) => { el.style.width = percent + '%'; });
+                    root.querySelectorAll('[data-live-text]').forEach((el) => {
+                        el.textContent = String(el.dataset.liveText || '')
+                            .replace('{current}', current)
+                            .replace('{total}', total)
+                            .replace('{percent}', percent);
+                    });
+                });
+            }
+
+            function flush(key) {
+                timers[key] = null;
+                const entry = pending[key];
+                delete pending[key];
+                if (!entry || !document.body) return;
+                lastSent[key] = Date.now();
+                const detail = entry.detail;
+                const state = String(detail.status || '') + '|' + String(detail.queue_position || '');
+                detail.stateChanged = lastState[key] !== state;
+                lastState[key] = state;
+                applyProgress(detail);
+                document.body.dispatchEvent(new CustomEvent('studio-' + entry.topic, { detail: detail }));
+            }
+
+            function schedule(topic, detail) {
+                const key = topic + '|' + String(detail.key || '');
+                pending[key] = { topic: topic, detail: detail };
+                if (timers[key]) return;
+                const wait = Math.max(0, (lastSent[key] || 0) + THROTTLE_MS - Date.now());
+                timers[key] = window.setTimeout(() => flush(key), wait);
+            }
+
+            const source = new EventSource('/api/events?topics=jobs,ocr,export,docs');
+            source.addEventListener('ready', () => { window.studioLiveEvents = true; });
+            source.onerror = () => { window.studioLiveEvents = false; };
+            ['jobs', 'ocr', 'export', 'docs'].forEach((topic) => {
+                source.addEventListener(topic, (evt) => {
+                    let detail = {};
+                    try { detail = JSON.parse(evt.data || '{}'); } catch (_err) { detail = {}; }
+                    schedule(topic, detail);
+                });
+            });
+            window.addEventListener('beforeunload', () => source.close());
+        })();
+    """.replace("__THROTTLE_MS__", str(int(throttle_ms)))
+
+
 def base_layout(title: str, content, active_page: str = "") -> Html:
     """Generate base page layout with sidebar, dark mode toggle, and headers."""
     theme = resolve_ui_theme(
@@ -193,6 +271,7 @@ def base_layout(title: str, content, active_page: str = "") -> Html:
                 })();
             """),
             Script(_library_nav_filters_bootstrap_script(library_default_mode)),
+            Script(_live_events_bootstrap_script(get_live_throttle_ms())),
             _style_tag(),
         ),
         Body(
@@ -16,8 +16,8 @@ from studio_ui.common.library_constants import (
     LINK_BUTTON_CLS,
     STATE_STYLE,
 )
-from studio_ui.common.title_utils import truncate_title
 from universal_iiif_core.library_catalog import ITEM_TYPES
+from universal_iiif_core.title_utils import truncate_title
 
 _STATE_STYLE = STATE_STYLE
 _CATEGORY_LABELS = CATEGORY_LABELS
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from fasthtml.common import H3, Div, P
 
-from studio_ui.components.settings.controls import setting_number
+from studio_ui.components.settings.controls import setting_number, setting_toggle
 
 
 def _build_discovery_pane(cm, s):
@@ -34,6 +34,75 @@ def _build_discovery_pane(cm, s):
                     "è possibile caricare ulteriori risultati con il pulsante 'Carica altri'."
                 ),
             ),
+            setting_number(
+                "Timeout ricerca federata (s)",
+                "settings.discovery.federated_timeout_s",
+                discovery.get("federated_timeout_s", 20),
+                min_val=3,
+                max_val=120,
+                step_val=1,
+                help_text=(
+                    "Tempo massimo di attesa per 'Tutte le biblioteche': i risultati arrivano man mano "
+                    "che ciascun provider risponde; quelli ancora in corsa alla scadenza vengono ignorati."
+                ),
+            ),
+            setting_number(
+                "Cache risultati (s)",
+                "settings.discovery.search_cache_ttl_s",
+                discovery.get("search_cache_ttl_s", 600),
+                min_val=0,
+                max_val=86400,
+                step_val=60,
+                help_text="Per quanto tempo una ricerca identica viene servita dalla cache locale (0 = disattivata).",
+            ),
+            setting_number(
+                "Pagine in cache",
+                "settings.discovery.search_cache_max_entries",
+                discovery.get("search_cache_max_entries", 128),
+                min_val=0,
+                max_val=2000,
+                step_val=1,
+                help_text="Numero massimo di pagine di risultati conservate; le meno usate vengono scartate.",
+            ),
+            setting_number(
+                "Worker importazione massiva",
+                "settings.discovery.bulk_import_workers",
+                discovery.get("bulk_import_workers", 4),
+                min_val=1,
+                max_val=16,
+                step_val=1,
+                help_text="Identificativi risolti in parallelo durante l'importazione di una lista TXT/CSV.",
+            ),
+            setting_toggle(
+                "Precarica la pagina successiva",
+                "settings.discovery.prefetch_next_page",
+                discovery.get("prefetch_next_page", True),
+                help_text="Scarica in background la pagina seguente, così 'Carica altri' risponde subito.",
+            ),
+            setting_toggle(
+                "Cerca prima nell'indice locale",
+                "settings.discovery.local_index_enabled",
+                discovery.get("local_index_enabled", True),
+                help_text="Risponde dalle collezioni già indicizzate; le ricerche senza risultati locali vanno online.",
+            ),
+            setting_number(
+                "Manifest indicizzati per esecuzione",
+                "settings.discovery.harvest_max_manifests",
+                discovery.get("harvest_max_manifests", 500),
+                min_val=0,
+                max_val=100000,
+                step_val=50,
+                help_text="Manifest letti da ogni indicizzazione per ricavare segnatura, data e lingua.",
+            ),
+            setting_number(
+                "Cache manifest Internet Culturale (ore)",
+                "settings.discovery.iccu_manifest_cache_ttl_hours",
+                discovery.get("iccu_manifest_cache_ttl_hours", 168),
+                min_val=0,
+                max_val=8760,
+                step_val=1,
+                help_text="Per quanto tempo un manifest ICCU già convertito viene riusato (0 = sempre riscaricato).",
+            ),
             cls="grid grid-cols-1 md:grid-cols-2 gap-4",
         ),
         cls="p-4",
@@ -322,6 +322,9 @@ def _build_network_pane(cm, s):
     libraries_cfg = network.get("libraries", {})
     if not isinstance(libraries_cfg, dict):
         libraries_cfg = {}
+    cache_cfg = network.get("http_cache", {})
+    if not isinstance(cache_cfg, dict):
+        cache_cfg = {}
     defaults = DEFAULT_NETWORK_SETTINGS
 
     global_section = Div(
@@ -438,6 +441,52 @@ def _build_network_pane(cm, s):
                 ),
                 cls="grid grid-cols-1 md:grid-cols-2 gap-4",
             ),
+            cls=(
+                "p-4 rounded-2xl border border-slate-200/70 dark:border-slate-700/80 "
+                "bg-white/60 dark:bg-slate-900/40 mb-4"
+            ),
+        ),
+        Div(
+            H4(
+                "Cache HTTP (manifest, info.json, ricerche)",
+                cls="text-sm font-semibold text-slate-700 dark:text-slate-200 mb-2",
+            ),
+            Div(
+                setting_toggle(
+                    "Cache JSON su disco",
+                    "settings.network.http_cache.enabled",
+                    cache_cfg.get("enabled", defaults["http_cache"]["enabled"]),
+                    help_text="Riusa le risposte JSON e le rivalida con ETag/Last-Modified.",
+                ),
+                setting_number(
+                    "Dimensione massima (byte)",
+                    "settings.network.http_cache.max_bytes",
+                    cache_cfg.get("max_bytes", defaults["http_cache"]["max_bytes"]),
+                    min_val=1048576,
+                    max_val=4294967296,
+                    step_val=1048576,
+                    help_text="Oltre questa soglia le voci meno usate vengono rimosse.",
+                ),
+                setting_number(
+                    "TTL predefinito (s)",
+                    "settings.network.http_cache.default_ttl_s",
+                    cache_cfg.get("default_ttl_s", defaults["http_cache"]["default_ttl_s"]),
+                    min_val=0,
+                    max_val=2592000,
+                    step_val=60,
+                    help_text="Validità quando il server non invia Cache-Control/Expires.",
+                ),
+                setting_number(
+                    "TTL massimo (s)",
+                    "settings.network.http_cache.max_ttl_s",
+                    cache_cfg.get("max_ttl_s", defaults["http_cache"]["max_ttl_s"]),
+                    min_val=60,
+                    max_val=31536000,
+                    step_val=60,
+                    help_text="Tetto applicato anche a max-age dichiarati dal server.",
+                ),
+                cls="grid grid-cols-1 md:grid-cols-2 gap-4",
+            ),
             cls="p-4 rounded-2xl border border-slate-200/70 dark:border-slate-700/80 bg-white/60 dark:bg-slate-900/40",
         ),
         **{"data-network-tab-pane": "global"},
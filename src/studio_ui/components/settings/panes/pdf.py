@@ -430,6 +430,15 @@ def _build_pdf_pane(cm, s):
                 step_val=1,
                 help_text="Numero righe iniziali del campo descrizione nel form Export item.",
             ),
+            setting_number(
+                "Thread codifica pagine",
+                "settings.pdf.export.encode_workers",
+                export_cfg.get("encode_workers", 0),
+                min_val=0,
+                max_val=16,
+                step_val=1,
+                help_text="Thread che ricodificano le immagini durante la generazione PDF (0 = automatico).",
+            ),
             cls="grid grid-cols-1 md:grid-cols-2 gap-4",
         ),
         **{"data-pdf-tab-pane": "defaults"},
@@ -43,6 +43,27 @@ def _build_processing_pane(cm, s):
                 max_val=100,
                 step_val=1.0,
             ),
+            setting_number(
+                "PDF Raster Workers",
+                "settings.pdf.raster_workers",
+                pdf.get("raster_workers", 0),
+                help_text=(
+                    "Processi usati per convertire un PDF nativo in scans JPG, ciascuno su un gruppo di pagine. "
+                    "0 = uno per core (max 4), 1 = conversione sequenziale."
+                ),
+                min_val=0,
+                max_val=16,
+                step_val=1,
+            ),
+            setting_toggle(
+                "Extract Embedded JPEG",
+                "settings.pdf.extract_embedded_images",
+                pdf.get("extract_embedded_images", True),
+                help_text=(
+                    "Le pagine di un PDF nativo composte da una sola immagine JPEG a piena pagina vengono salvate "
+                    "così come sono, senza rasterizzazione né ricodifica. Le altre pagine usano DPI e qualità sopra."
+                ),
+            ),
             setting_toggle(
                 "Prefer Native PDF",
                 "settings.pdf.prefer_native_pdf",
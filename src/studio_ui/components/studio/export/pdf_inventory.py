@@ -6,6 +6,8 @@ from urllib.parse import quote
 
 from fasthtml.common import A, Div, Span
 
+from studio_ui.common.polling import LIVE_EVENT_EXPORT, build_live_trigger
+
 
 def _bytes_label(size_bytes: int) -> str:
     size = int(size_bytes or 0)
@@ -30,7 +32,7 @@ def render_pdf_inventory_panel(pdf_files: list[dict], *, doc_id: str, library: s
     if polling:
         attrs = {
             "hx_get": f"/api/studio/export/pdf_list?doc_id={encoded_doc}&library={encoded_lib}",
-            "hx_trigger": "load, every 12s",
+            "hx_trigger": build_live_trigger(12, LIVE_EVENT_EXPORT, on_load=True, state_only=True),
             "hx_swap": "outerHTML",
         }
 
@@ -556,12 +556,22 @@ def render_studio_export_tab(
                                 ),
                                 cls="space-y-1",
                             ),
-                            Button(
-                                "Crea PDF",
-                                type="submit",
-                                form="studio-export-form",
-                                data_export_submit="1",
-                                cls="app-btn app-btn-accent",
+                            Div(
+                                Button(
+                                    "Scarica ZIP immagini",
+                                    type="button",
+                                    id="studio-export-zip-download",
+                                    title="Scarica subito le scansioni selezionate in un archivio ZIP",
+                                    cls="app-btn app-btn-neutral",
+                                ),
+                                Button(
+                                    "Crea PDF",
+                                    type="submit",
+                                    form="studio-export-form",
+                                    data_export_submit="1",
+                                    cls="app-btn app-btn-accent",
+                                ),
+                                cls="flex flex-wrap items-center gap-2",
                             ),
                             cls=(
                                 "studio-export-actionbar flex flex-wrap items-center justify-between gap-3 "
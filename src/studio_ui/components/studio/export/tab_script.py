@@ -499,6 +499,23 @@ def _export_tab_script() -> Script:
                         });
                     }
 
+                    const zipDownloadBtn = panel.querySelector('#studio-export-zip-download');
+                    if (form && zipDownloadBtn && zipDownloadBtn.dataset.bound !== '1') {
+                        zipDownloadBtn.dataset.bound = '1';
+                        zipDownloadBtn.addEventListener('click', () => {
+                            const mode = selectionModeHidden ? selectionModeHidden.value : 'all';
+                            const pages = hidden ? hidden.value : '';
+                            if (mode === 'custom' && !pages) return;
+                            const params = new URLSearchParams({
+                                doc_id: form.querySelector('input[name="doc_id"]').value,
+                                library: form.querySelector('input[name="library"]').value,
+                                selection_mode: mode,
+                                selected_pages: pages,
+                            });
+                            window.location.href = `/api/export/stream/zip?${params.toString()}`;
+                        });
+                    }
+
                     if (form && form.dataset.bound !== '1') {
                         form.dataset.bound = '1';
                         form.addEventListener('submit', () => {
@@ -6,6 +6,8 @@ from urllib.parse import quote
 
 from fasthtml.common import Button, Div, Img, Option, Select, Span
 
+from studio_ui.common.polling import LIVE_EVENT_DOCS, build_live_trigger
+
 from .pdf_inventory import _bytes_label
 
 
@@ -36,13 +38,16 @@ def _thumbnail_card_id(page: int) -> str:
     return f"studio-thumb-card-{int(page)}"
 
 
-def _thumb_live_url(*, doc_id: str, library: str, thumb_page: int, page_size: int) -> str:
+def _thumb_live_url(*, doc_id: str, library: str, thumb_page: int, page_size: int, revision: str = "") -> str:
     encoded_doc = quote(doc_id, safe="")
     encoded_lib = quote(library, safe="")
-    return (
+    url = (
         f"/api/studio/export/thumbs/live?doc_id={encoded_doc}&library={encoded_lib}"
         f"&thumb_page={thumb_page}&page_size={page_size}"
     )
+    if revision:
+        url += f"&rev={quote(revision, safe='')}"
+    return url
 
 
 def render_export_thumbnail_card(
@@ -230,14 +235,26 @@ def render_export_thumbs_poller(
     page_size: int,
     has_active_page_actions: bool,
     hx_swap_oob: str | None = None,
+    revision: str = "",
 ) -> Div:
-    """Render the hidden live poller used for per-card export updates."""
+    """Render the hidden live poller used for per-card export updates.
+
+    `revision` is the document revision token the rendered cards reflect; the
+    live endpoint answers 204 while it is still current. The poller fires on the
+    document's own revision events and polls only while the live stream is down.
+    """
     attrs: dict[str, str] = {"id": "studio-export-live-state-poller", "cls": "hidden"}
     if has_active_page_actions:
         attrs.update(
             {
-                "hx_get": _thumb_live_url(doc_id=doc_id, library=library, thumb_page=thumb_page, page_size=page_size),
-                "hx_trigger": "load, every 2s",
+                "hx_get": _thumb_live_url(
+                    doc_id=doc_id,
+                    library=library,
+                    thumb_page=thumb_page,
+                    page_size=page_size,
+                    revision=revision,
+                ),
+                "hx_trigger": build_live_trigger(2, LIVE_EVENT_DOCS, on_load=True, match={"doc_id": doc_id}),
                 "hx_swap": "none",
             }
         )
@@ -321,6 +338,7 @@ def render_export_thumbnails_panel(
     page_size: int,
     page_size_options: list[int],
     has_active_page_actions: bool = False,
+    revision: str = "",
 ) -> Div:
     """Render one paginated thumbnails slice for export selection."""
     cards = [
@@ -368,6 +386,7 @@ def render_export_thumbnails_panel(
         thumb_page=thumb_page,
         page_size=page_size,
         has_active_page_actions=has_active_page_actions,
+        revision=revision,
     )
 
     return Div(
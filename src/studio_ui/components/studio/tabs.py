@@ -5,6 +5,7 @@ from urllib.parse import quote
 
 from fasthtml.common import Button, Div, Script, Span
 
+from studio_ui.common.polling import LIVE_EVENT_OCR, build_live_trigger
 from studio_ui.components.studio.history import history_tab_content
 from studio_ui.components.studio.info import info_tab_content, visual_tab_content
 from studio_ui.components.studio.snippets import snippets_tab_content
@@ -423,7 +424,9 @@ def render_studio_tabs(
                 "flex items-center justify-center pointer-events-auto"
             ),
             hx_get=hx_path,
-            hx_trigger="every 2s",
+            hx_trigger=build_live_trigger(
+                2, LIVE_EVENT_OCR, match={"doc_id": doc_id, "page": int(page_idx)}, state_only=True
+            ),
             hx_target="#studio-right-panel",
             hx_swap="outerHTML",
         )
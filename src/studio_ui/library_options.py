@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from universal_iiif_core.providers import normalize_provider_value, provider_library_options
 
+FEDERATED_LIBRARY_VALUE = "__all__"
+FEDERATED_LIBRARY_LABEL = "Tutte le biblioteche (ricerca federata)"
+
 
 def library_options() -> list[tuple[str, str]]:
     """Return available libraries as (label, value) pairs."""
@@ -1,7 +1,10 @@
 """Shared state helpers for in-flight OCR jobs."""
 
+import time
 from typing import Any
 
+from universal_iiif_core.event_bus import TOPIC_OCR, publish_event
+
 # Keep track of background OCR jobs keyed by (doc_id, page).
 OCR_JOBS_STATE: dict[tuple[str, int], dict[str, Any]] = {}
 
@@ -15,3 +18,16 @@ def is_ocr_job_running(doc_id: str, page: int) -> bool:
 def get_ocr_job_state(doc_id: str, page: int) -> dict[str, Any] | None:
     """Return the stored OCR job state if available."""
     return OCR_JOBS_STATE.get((doc_id, page))
+
+
+def set_ocr_job_state(doc_id: str, page: int, status: str, message: str | None = None) -> None:
+    """Record an OCR job transition and notify live Studio subscribers."""
+    state: dict[str, Any] = {"status": status, "timestamp": time.time()}
+    if message is not None:
+        state["message"] = message
+    OCR_JOBS_STATE[(doc_id, page)] = state
+    publish_event(
+        TOPIC_OCR,
+        f"ocr:{doc_id}:{page}",
+        {"doc_id": doc_id, "page": int(page), "status": status, "ts": state["timestamp"]},
+    )
@@ -7,11 +7,11 @@ from urllib.parse import quote, unquote
 
 from fasthtml.common import H2, A, Div, P, Request, Script, Span
 
-from studio_ui.common.title_utils import resolve_preferred_title, truncate_title
 from studio_ui.components.layout import base_layout
 from universal_iiif_core.config_manager import get_config_manager
 from universal_iiif_core.logger import get_logger
 from universal_iiif_core.services.storage.vault_manager import VaultManager
+from universal_iiif_core.title_utils import resolve_preferred_title, truncate_title
 
 logger = get_logger(__name__)
 
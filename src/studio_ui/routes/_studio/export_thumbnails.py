@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+import time
 from contextlib import suppress
 from pathlib import Path
 from typing import Any
@@ -16,7 +17,7 @@ from universal_iiif_core.services.ocr.storage import OCRStorage
 from universal_iiif_core.services.scan_optimize import summarize_scan_folder
 from universal_iiif_core.services.storage.vault_manager import VaultManager
 from universal_iiif_core.thumbnail_utils import ensure_thumbnail, guess_available_pages
-from universal_iiif_core.utils import load_json, save_json
+from universal_iiif_core.utils import load_json
 
 from .download_feedback import (
     _merge_page_feedback,
@@ -29,6 +30,7 @@ from .page_job_prefs import _load_last_optimization_meta, _page_delta_map
 from .page_source_prefs import _load_page_source_pref
 from .scan_resolution import (
     _local_scan_info,
+    _probe_remote_dims_batch,
     _resolve_remote_dims,
     _stats_download_method_map,
     _stats_page_meta_map,
@@ -37,10 +39,9 @@ from .scan_resolution import (
 from .thumbnail_cache import (
     _export_tab_defaults,
     _is_export_job_active,
-    _normalize_remote_cache,
-    _prune_remote_cache,
+    _load_remote_cache,
     _prune_stale_thumbnails,
-    _remote_cache_limits,
+    _save_remote_cache,
     _thumb_page_size,
     _thumb_page_size_options,
     _to_downloads_url,
@@ -48,6 +49,8 @@ from .thumbnail_cache import (
 
 logger = get_logger(__name__)
 
+_REMOTE_PROBE_RETRY_S = 600
+
 
 def _build_thumbnail_item(
     *,
@@ -56,16 +59,13 @@ def _build_thumbnail_item(
     thumbnails_dir: Path,
     max_px: int,
     quality: int,
-    manifest_json: dict,
     remote_cache: dict[str, dict],
-    remote_probe_enabled: bool,
     page_delta_by_num: dict[int, dict[str, Any]],
     page_feedback_by_num: dict[int, dict[str, str]],
     stitch_feedback_by_num: dict[int, dict[str, str]],
     optimize_feedback_by_num: dict[int, dict[str, str]],
     download_method_by_num: dict[int, str],
     stats_by_num: dict[int, dict[str, Any]],
-    force_remote_refresh: bool = False,
 ) -> tuple[dict[str, Any], int]:
     thumb_path = ensure_thumbnail(
         scans_dir=scans_dir,
@@ -77,13 +77,7 @@ def _build_thumbnail_item(
     thumb_url = _to_downloads_url(thumb_path) if thumb_path else ""
     scan_path = scans_dir / f"pag_{page_num - 1:04d}.jpg"
     local_w, local_h, local_bytes = _local_scan_info(scan_path)
-    remote_w, remote_h, remote_service = _resolve_remote_dims(
-        page_num=page_num,
-        manifest_json=manifest_json,
-        remote_cache=remote_cache,
-        remote_probe_enabled=remote_probe_enabled,
-        force_refresh=force_remote_refresh,
-    )
+    remote_w, remote_h, remote_service = _resolve_remote_dims(page_num=page_num, remote_cache=remote_cache)
     verified_w, verified_h = _verified_direct_dims(
         page_num=page_num,
         stats_by_num=stats_by_num,
@@ -120,6 +114,47 @@ def _build_thumbnail_item(
     )
 
 
+def _scan_file_size(scans_dir: Path, page_num: int) -> int:
+    try:
+        return int((scans_dir / f"pag_{page_num - 1:04d}.jpg").stat().st_size)
+    except OSError:
+        return 0
+
+
+def _slice_bytes_summary(slice_sizes: list[int]) -> dict[str, int]:
+    sizes = [size for size in slice_sizes if size > 0]
+    if not sizes:
+        return {}
+    total_bytes = sum(sizes)
+    return {
+        "slice_bytes_total": int(total_bytes),
+        "slice_bytes_avg": int(total_bytes // max(len(slice_sizes), 1)),
+        "slice_bytes_min": int(min(sizes)),
+        "slice_bytes_max": int(max(sizes)),
+    }
+
+
+def _pages_needing_remote_probe(
+    page_slice: list[int],
+    remote_cache: dict[str, dict],
+    page_feedback_by_num: dict[int, dict[str, str]],
+) -> list[int]:
+    """Return visible pages with no cached remote size or with an active high-res job.
+
+    Pages whose last probe found no size are retried only after `_REMOTE_PROBE_RETRY_S`.
+    """
+    retry_before = int(time.time()) - _REMOTE_PROBE_RETRY_S
+    pages: list[int] = []
+    for page_num in page_slice:
+        entry = remote_cache.get(str(page_num)) or {}
+        feedback_state = str((page_feedback_by_num.get(page_num) or {}).get("state") or "").strip().lower()
+        missing_size = not entry.get("width") or not entry.get("height")
+        retry_due = int(entry.get("updated_ts") or 0) < retry_before
+        if feedback_state in {"queued", "running"} or (missing_size and retry_due):
+            pages.append(page_num)
+    return pages
+
+
 def _build_export_thumbnail_slice(
     doc_id: str,
     library: str,
@@ -132,7 +167,9 @@ def _build_export_thumbnail_slice(
     page_feedback_by_num: dict[int, dict[str, str]] | None = None,
     stitch_feedback_by_num: dict[int, dict[str, str]] | None = None,
     optimize_feedback_by_num: dict[int, dict[str, str]] | None = None,
+    only_pages: set[int] | None = None,
 ) -> dict[str, object]:
+    """Build the visible thumbnails slice; with `only_pages`, items are built for those pages only."""
     storage = OCRStorage()
     paths = storage.get_document_paths(doc_id, library)
     scans_dir = Path(paths["scans"])
@@ -201,61 +238,54 @@ def _build_export_thumbnail_slice(
 
     manifest_json = load_json(paths["manifest"]) or {}
     stats_payload = load_json(paths["stats"]) or {}
-    remote_cache_path = Path(paths["data"]) / "remote_resolution_cache.json"
-    cache_max_bytes, cache_retention_hours, cache_max_items = _remote_cache_limits(cm)
-    remote_cache = _normalize_remote_cache(load_json(remote_cache_path) or {})
+    remote_cache = _load_remote_cache(
+        doc_id,
+        page_slice,
+        legacy_path=Path(paths["data"]) / "remote_resolution_cache.json",
+    )
 
-    remote_probe_enabled = bool(cm.get_setting("images.probe_remote_max_resolution", True))
+    remote_probes_pending: set[int] = set()
+    if bool(cm.get_setting("images.probe_remote_max_resolution", True)):
+        probe_pages = _pages_needing_remote_probe(page_slice, remote_cache, page_feedback_by_num)
+        remote_probes_pending = _probe_remote_dims_batch(
+            doc_id=doc_id,
+            manifest_json=manifest_json,
+            pages=probe_pages,
+            remote_cache=remote_cache,
+            max_workers=int(cm.get_setting("images.remote_probe_max_workers", 6) or 6),
+            wait_s=int(cm.get_setting("images.remote_probe_inline_wait_ms", 1500) or 0) / 1000.0,
+        )
+        if only_pages is not None:
+            # Probes resolved inline are not revision bumps, so render them now.
+            only_pages = only_pages | (set(probe_pages) - remote_probes_pending)
     download_method_by_num = _stats_download_method_map(stats_payload)
     stats_by_num = _stats_page_meta_map(stats_payload)
     items: list[dict] = []
-    total_bytes = 0
-    bytes_min = 0
-    bytes_max = 0
+    slice_sizes: list[int] = []
     for page_num in page_slice:
-        feedback_hint = page_feedback_by_num.get(page_num) or {}
-        should_refresh_remote = str(feedback_hint.get("state") or "").strip().lower() in {"queued", "running"}
+        if only_pages is not None and page_num not in only_pages:
+            slice_sizes.append(_scan_file_size(scans_dir, page_num))
+            continue
         item, local_bytes = _build_thumbnail_item(
             page_num=page_num,
             scans_dir=scans_dir,
             thumbnails_dir=thumbnails_dir,
             max_px=max_px,
             quality=quality,
-            manifest_json=manifest_json,
             remote_cache=remote_cache,
-            remote_probe_enabled=remote_probe_enabled,
             page_delta_by_num=page_delta_by_num,
             page_feedback_by_num=page_feedback_by_num,
             stitch_feedback_by_num=stitch_feedback_by_num,
             optimize_feedback_by_num=optimize_feedback_by_num,
             download_method_by_num=download_method_by_num,
             stats_by_num=stats_by_num,
-            force_remote_refresh=should_refresh_remote,
         )
-        if local_bytes > 0:
-            total_bytes += local_bytes
-            bytes_min = local_bytes if bytes_min <= 0 else min(bytes_min, local_bytes)
-            bytes_max = max(bytes_max, local_bytes)
+        slice_sizes.append(local_bytes)
         items.append(item)
 
-    remote_cache = _prune_remote_cache(
-        remote_cache,
-        max_bytes=cache_max_bytes,
-        retention_hours=cache_retention_hours,
-        max_items=cache_max_items,
-    )
-    with suppress(Exception):
-        save_json(remote_cache_path, remote_cache)
+    _save_remote_cache(doc_id, remote_cache, cm)
 
-    if total_bytes > 0:
-        scan_summary.update(
-            {
-                "slice_bytes_total": int(total_bytes),
-                "slice_bytes_avg": int(total_bytes // max(len(page_slice), 1)),
-                "slice_bytes_min": int(bytes_min),
-                "slice_bytes_max": int(bytes_max),
-            }
-        )
+    scan_summary.update(_slice_bytes_summary(slice_sizes))
     return {
         "items": items,
         "available_pages": available_pages,
@@ -264,6 +294,7 @@ def _build_export_thumbnail_slice(
         "total_pages": total_pages,
         "page_size": safe_page_size,
         "scan_summary": scan_summary,
+        "remote_probes_pending": sorted(remote_probes_pending),
     }
 
 
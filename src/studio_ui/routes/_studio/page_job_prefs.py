@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from typing import Any
 
+from universal_iiif_core.doc_revisions import bump_document_revision
 from universal_iiif_core.logger import get_logger
 from universal_iiif_core.services.storage.vault_manager import VaultManager
 
@@ -82,6 +83,7 @@ def _save_page_job_pref(doc_id: str, pref_key: str, page_jobs: dict[int, dict[st
         if int(page) > 0 and str((entry or {}).get("job_id") or "").strip()
     }
     VaultManager().set_manuscript_ui_pref(doc_id, pref_key, payload)
+    bump_document_revision(doc_id)
 
 
 def _load_highres_pref(doc_id: str) -> dict[int, dict[str, Any]]:
@@ -6,6 +6,7 @@ import time
 from contextlib import suppress
 from typing import Any
 
+from universal_iiif_core.doc_revisions import bump_document_revision
 from universal_iiif_core.logger import get_logger
 from universal_iiif_core.services.storage.vault_manager import VaultManager
 
@@ -48,6 +49,7 @@ def _save_page_source_pref(doc_id: str, page_source_map: dict[int, dict[str, str
         if int(page) > 0 and str((entry or {}).get("source") or "").strip() in {"highres", "optimized", "stitched"}
     }
     VaultManager().set_manuscript_ui_pref(doc_id, _STUDIO_EXPORT_PAGE_SOURCE_PREF_KEY, payload)
+    bump_document_revision(doc_id)
 
 
 def _merge_page_source_pref(
@@ -1,14 +1,18 @@
-"""Local scan info, remote dimension probing, download-method helpers."""
+"""Local scan info, batched remote dimension probing, download-method helpers."""
 
 from __future__ import annotations
 
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from contextlib import suppress
 from pathlib import Path
 from typing import Any
 
+from universal_iiif_core.doc_revisions import bump_document_revision
 from universal_iiif_core.iiif_resolution import probe_remote_max_dimensions
 from universal_iiif_core.logger import get_logger
+from universal_iiif_core.services.storage.vault_manager import VaultManager
 
 logger = get_logger(__name__)
 
@@ -28,34 +32,127 @@ def _local_scan_info(scan_path: Path) -> tuple[int | None, int | None, int]:
     return local_w, local_h, local_bytes
 
 
+_PROBE_LOCK = threading.Lock()
+_PROBE_EXECUTOR: ThreadPoolExecutor | None = None
+_PROBE_EXECUTOR_WORKERS = 0
+_PROBES_IN_FLIGHT: set[tuple[str, int]] = set()
+
+
+def _probe_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the shared info.json probe pool, resized when the setting changes."""
+    global _PROBE_EXECUTOR, _PROBE_EXECUTOR_WORKERS
+    with _PROBE_LOCK:
+        if _PROBE_EXECUTOR is None or max_workers != _PROBE_EXECUTOR_WORKERS:
+            if _PROBE_EXECUTOR is not None:
+                _PROBE_EXECUTOR.shutdown(wait=False)
+            _PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="iiif-dims-probe")
+            _PROBE_EXECUTOR_WORKERS = max_workers
+        return _PROBE_EXECUTOR
+
+
+def _probe_one_page(doc_id: str, manifest_json: dict, page_num: int) -> tuple[int, dict[str, Any]]:
+    try:
+        width, height, service_url = probe_remote_max_dimensions(manifest_json, page_num)
+    finally:
+        with _PROBE_LOCK:
+            _PROBES_IN_FLIGHT.discard((doc_id, page_num))
+    now_ts = int(time.time())
+    return page_num, {
+        "width": width,
+        "height": height,
+        "service_url": service_url,
+        "updated_ts": now_ts,
+        "last_access_ts": now_ts,
+    }
+
+
+def _persist_late_probes(doc_id: str, futures: list[Future]) -> None:
+    """Batch-upsert probe results that complete after the HTTP response was built."""
+    lock = threading.Lock()
+    remaining = len(futures)
+    results: dict[str, dict[str, Any]] = {}
+
+    def _on_done(future: Future) -> None:
+        nonlocal remaining
+        page_entry = None
+        with suppress(Exception):
+            page_entry = future.result()
+        with lock:
+            if page_entry is not None:
+                results[str(page_entry[0])] = page_entry[1]
+            remaining -= 1
+            if remaining:
+                return
+            batch = dict(results)
+        if batch:
+            try:
+                VaultManager().upsert_remote_page_dims(doc_id, batch)
+                bump_document_revision(doc_id, [int(page) for page in batch])
+            except Exception:
+                logger.debug("Unable to persist late remote probes for %s", doc_id, exc_info=True)
+
+    for future in futures:
+        future.add_done_callback(_on_done)
+
+
+def _probe_remote_dims_batch(
+    *,
+    doc_id: str,
+    manifest_json: dict,
+    pages: list[int],
+    remote_cache: dict[str, dict],
+    max_workers: int = 6,
+    wait_s: float = 1.5,
+) -> set[int]:
+    """Probe `info.json` for many pages concurrently and merge what completes within `wait_s`.
+
+    Pages already being probed by an earlier request are not dispatched again.
+    Results arriving later are written to the vault in one batch and picked up
+    by the next live thumbnails poll. Returns the pages still pending.
+    """
+    if not pages:
+        return set()
+    executor = _probe_executor(max(1, int(max_workers)))
+    futures: list[Future] = []
+    pending: set[int] = set()
+    with _PROBE_LOCK:
+        to_submit = []
+        for page_num in pages:
+            key = (doc_id, int(page_num))
+            if key in _PROBES_IN_FLIGHT:
+                pending.add(int(page_num))
+                continue
+            _PROBES_IN_FLIGHT.add(key)
+            to_submit.append(int(page_num))
+    for page_num in to_submit:
+        futures.append(executor.submit(_probe_one_page, doc_id, manifest_json, page_num))
+
+    if futures:
+        wait(futures, timeout=max(0.0, float(wait_s)))
+    late = [future for future in futures if not future.done()]
+    for future in futures:
+        if future in late:
+            continue
+        try:
+            page_num, entry = future.result()
+        except Exception:
+            logger.debug("Remote dimension probe failed for %s", doc_id, exc_info=True)
+            continue
+        remote_cache[str(page_num)] = {**(remote_cache.get(str(page_num)) or {}), **entry}
+    if late:
+        _persist_late_probes(doc_id, late)
+        with _PROBE_LOCK:
+            pending.update(page for (doc, page) in _PROBES_IN_FLIGHT if doc == doc_id and page in set(pages))
+    return pending
+
+
 def _resolve_remote_dims(
     *,
     page_num: int,
-    manifest_json: dict,
     remote_cache: dict[str, dict],
-    remote_probe_enabled: bool,
-    force_refresh: bool = False,
 ) -> tuple[int | None, int | None, str | None]:
-    page_key = str(page_num)
-    remote_entry = remote_cache.get(page_key) or {}
-    remote_w = remote_entry.get("width")
-    remote_h = remote_entry.get("height")
-    remote_service = remote_entry.get("service_url")
-    if remote_probe_enabled and (force_refresh or not remote_w or not remote_h):
-        pw, ph, service_url = probe_remote_max_dimensions(manifest_json, page_num)
-        remote_w, remote_h = pw, ph
-        remote_service = service_url or remote_service
-        remote_cache[page_key] = {
-            "width": remote_w,
-            "height": remote_h,
-            "service_url": remote_service,
-            "updated_ts": int(time.time()),
-            "last_access_ts": int(time.time()),
-        }
-    elif remote_entry:
-        remote_entry["last_access_ts"] = int(time.time())
-        remote_cache[page_key] = remote_entry
-    return remote_w, remote_h, remote_service
+    remote_entry = remote_cache.get(str(page_num)) or {}
+    return remote_entry.get("width"), remote_entry.get("height"), remote_entry.get("service_url")
 
 
 def _normalize_download_method(raw_method: Any, original_url: Any = "") -> str:
@@ -121,70 +121,47 @@ def _remote_cache_limits(cm) -> tuple[int, int, int]:
     )
 
 
-def _cache_payload_size(cache: dict[str, dict]) -> int:
-    return len(json.dumps(cache, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+def _import_legacy_remote_cache(vault: VaultManager, doc_id: str, legacy_path: Path) -> None:
+    """Move a pre-table `remote_resolution_cache.json` blob into the vault, once."""
+    if not legacy_path.exists():
+        return
+    try:
+        raw_cache = json.loads(legacy_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        raw_cache = {}
+    if isinstance(raw_cache, dict):
+        try:
+            vault.upsert_remote_page_dims(doc_id, raw_cache)
+        except Exception:
+            logger.debug("Unable to import legacy remote cache for %s", doc_id, exc_info=True)
+            return
+    with suppress(OSError):
+        legacy_path.unlink()
 
 
-def _normalize_remote_cache(raw_cache: object) -> dict[str, dict]:
-    if not isinstance(raw_cache, dict):
+def _load_remote_cache(doc_id: str, pages: list[int], *, legacy_path: Path | None = None) -> dict[str, dict]:
+    """Return cached remote dimensions for the requested pages only."""
+    try:
+        vault = VaultManager()
+        if legacy_path is not None:
+            _import_legacy_remote_cache(vault, doc_id, legacy_path)
+        return vault.get_remote_page_dims(doc_id, pages)
+    except Exception:
+        logger.debug("Unable to load remote dimension cache for %s", doc_id, exc_info=True)
         return {}
-    normalized: dict[str, dict] = {}
-    now_ts = int(time.time())
-    for key, value in raw_cache.items():
-        if not isinstance(value, dict):
-            continue
-        page_key = str(key).strip()
-        if not page_key:
-            continue
-        entry = {
-            "width": value.get("width"),
-            "height": value.get("height"),
-            "service_url": value.get("service_url"),
-            "verified_direct_width": value.get("verified_direct_width"),
-            "verified_direct_height": value.get("verified_direct_height"),
-            "verified_direct_ts": int(value.get("verified_direct_ts") or value.get("updated_ts") or now_ts),
-            "last_access_ts": int(value.get("last_access_ts") or value.get("updated_ts") or now_ts),
-            "updated_ts": int(value.get("updated_ts") or value.get("last_access_ts") or now_ts),
-        }
-        normalized[page_key] = entry
-    return normalized
-
-
-def _prune_remote_cache(
-    cache: dict[str, dict],
-    *,
-    max_bytes: int,
-    retention_hours: int,
-    max_items: int,
-) -> dict[str, dict]:
-    now_ts = int(time.time())
-    min_ts = now_ts - (int(retention_hours) * 3600)
-
-    kept = {
-        key: value
-        for key, value in cache.items()
-        if int(value.get("last_access_ts") or value.get("updated_ts") or 0) >= min_ts
-    }
-    if len(kept) > max_items:
-        ordered = sorted(
-            kept.items(),
-            key=lambda item: int(item[1].get("last_access_ts") or item[1].get("updated_ts") or 0),
-            reverse=True,
-        )
-        kept = dict(ordered[:max_items])
 
-    if _cache_payload_size(kept) <= max_bytes:
-        return kept
 
-    ordered_oldest = sorted(
-        kept.items(),
-        key=lambda item: int(item[1].get("last_access_ts") or item[1].get("updated_ts") or 0),
-    )
-    current_size = _cache_payload_size(kept)
-    for page_key, _entry in ordered_oldest:
-        entry_size = len(json.dumps({page_key: _entry}))
-        kept.pop(page_key, None)
-        current_size -= entry_size
-        if current_size <= max_bytes:
-            break
-    return kept
+def _save_remote_cache(doc_id: str, remote_cache: dict[str, dict], cm) -> None:
+    """Batch-upsert the touched entries and apply TTL/LRU caps in SQL."""
+    max_bytes, retention_hours, max_items = _remote_cache_limits(cm)
+    try:
+        vault = VaultManager()
+        vault.upsert_remote_page_dims(doc_id, remote_cache)
+        vault.prune_remote_page_dims(
+            doc_id,
+            retention_hours=retention_hours,
+            max_items=max_items,
+            max_bytes=max_bytes,
+        )
+    except Exception:
+        logger.debug("Unable to persist remote dimension cache for %s", doc_id, exc_info=True)
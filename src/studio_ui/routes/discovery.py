@@ -21,6 +21,9 @@ def setup_discovery_routes(app):
     app.post("/api/discovery/add_to_library")(discovery_handlers.add_to_library)
     app.post("/api/discovery/add_and_download")(discovery_handlers.add_and_download)
     app.post("/api/discovery/probe_manifest")(discovery_handlers.probe_manifest)
+    app.get("/api/discovery/federated_stream")(discovery_handlers.federated_stream)
+    app.post("/api/discovery/bulk_import")(discovery_handlers.bulk_import)
+    app.get("/api/discovery/bulk_import/status")(discovery_handlers.bulk_import_status)
     app.post("/api/discovery/load_more")(discovery_handlers.load_more_results)
     app.post("/api/library/add_prefetch_light")(discovery_handlers.add_to_library)
     app.get("/api/discovery/pdf_capability")(discovery_handlers.pdf_capability)
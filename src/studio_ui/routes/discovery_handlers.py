@@ -4,37 +4,55 @@ Handlers are top-level functions so `setup_discovery_routes` can remain
 very small and satisfy ruff's complexity check.
 """
 
+import json
+import re
 import time
-from urllib.parse import unquote
+from urllib.parse import unquote, urlencode
 
 from fasthtml.common import Request
+from starlette.responses import StreamingResponse
 
 from studio_ui.common.toasts import build_toast
 from studio_ui.components.discovery import (
     discovery_content,
+    federated_status_text,
     render_download_manager,
     render_download_status,
+    render_federated_cards_html,
+    render_federated_results_shell,
     render_feedback_message,
     render_pdf_capability_badge,
     render_preview,
     render_search_results_list,
 )
+from studio_ui.components.discovery_bulk_import import render_bulk_import_status
 from studio_ui.components.layout import base_layout
-from studio_ui.routes.discovery_helpers import analyze_manifest, start_downloader_thread
-from studio_ui.routes.discovery_persistence import (
+from studio_ui.library_options import FEDERATED_LIBRARY_VALUE
+from studio_ui.routes.discovery_helpers import start_downloader_thread
+from universal_iiif_core.bulk_import import (
+    import_journal_path,
+    load_import_report,
+    parse_import_text,
+    start_bulk_import,
+    summarize_report,
+)
+from universal_iiif_core.config_manager import get_config_manager
+from universal_iiif_core.discovery import federated_providers
+from universal_iiif_core.discovery.saved_entries import (
+    analyze_manifest,
     find_manuscript_by_id_and_library,
     is_manuscript_complete,
     persist_prefetch_light,
     resolve_saved_entry_title,
     upsert_saved_entry,
 )
-from universal_iiif_core.config_manager import get_config_manager
 from universal_iiif_core.iiif_logic import total_canvases
 from universal_iiif_core.jobs import job_manager
 from universal_iiif_core.logger import get_logger
 from universal_iiif_core.providers import is_known_provider
-from universal_iiif_core.resolvers.discovery import resolve_provider_input
+from universal_iiif_core.resolvers.discovery import federated_search, prefetch_search_page, resolve_provider_input
 from universal_iiif_core.resolvers.manifest_fetch import fetch_manifest_dict
+from universal_iiif_core.resolvers.manifest_stream import read_manifest_header
 from universal_iiif_core.services.storage.vault_manager import VaultManager
 
 logger = get_logger(__name__)
@@ -214,17 +232,86 @@ def _quick_manifest_has_native_pdf(manifest_url: str) -> bool:
     if cached and cached[0] > now:
         return bool(cached[1])
 
-    manifest = fetch_manifest_dict(clean_url, retries=1)
-    has_pdf = bool(isinstance(manifest, dict) and _has_native_pdf_rendering(manifest))
+    header = read_manifest_header(clean_url, ("rendering",), count_canvases=False, retries=1)
+    has_pdf = bool(header is not None and _has_native_pdf_rendering(header.fields))
     _pdf_capability_cache[clean_url] = (now + _PDF_CAPABILITY_TTL_SECONDS, has_pdf)
     return has_pdf
 
 
+def _discovery_settings() -> dict:
+    discovery = get_config_manager().data.get("settings", {}).get("discovery", {})
+    return discovery if isinstance(discovery, dict) else {}
+
+
+def _prefetch_next_page(library: str, shelfmark: str, filters: dict, page: int, has_more: bool) -> None:
+    """Warm the search cache with the page a 'load more' click would request next."""
+    if not has_more or not _discovery_settings().get("prefetch_next_page", True):
+        return
+    prefetch_search_page(library, shelfmark, {**filters, "page": page + 1})
+
+
+def _federated_timeout_s() -> float:
+    try:
+        value = int(_discovery_settings().get("federated_timeout_s", 20))
+    except (TypeError, ValueError):
+        value = 20
+    return float(max(3, min(value, 120)))
+
+
+def _federated_search_shell(shelfmark: str):
+    query = shelfmark.strip()
+    providers = [(provider.key, provider.label) for provider in federated_providers()]
+    stream_url = f"/api/discovery/federated_stream?{urlencode({'q': query})}"
+    return render_federated_results_shell(query, providers, stream_url)
+
+
+def _federated_sse(event: str, payload: dict) -> str:
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def _iter_federated_events(query: str):
+    filters = {
+        "gallica_type": "all",
+        "ic_type": "all",
+        "max_results": _discovery_settings().get("max_results_per_provider", 20),
+    }
+    total = 0
+    for outcome in federated_search(query, filters=filters, deadline_s=_federated_timeout_s()):
+        total += len(outcome.results)
+        yield _federated_sse(
+            "provider",
+            {
+                "provider": outcome.provider.key,
+                "status": outcome.status,
+                "label": federated_status_text(outcome.status, len(outcome.results)),
+                "count": len(outcome.results),
+                "duplicates": outcome.duplicates,
+                "elapsed_s": round(outcome.elapsed_s, 2),
+                "html": render_federated_cards_html(outcome.results),
+            },
+        )
+    yield _federated_sse("done", {"count": total})
+
+
+def federated_stream(q: str = ""):
+    """Stream a federated search as SSE: one `provider` event per answer, then `done`."""
+    query = (q or "").strip()
+    logger.info("Federated search: %s", query)
+    return StreamingResponse(
+        _iter_federated_events(query),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 def resolve_manifest(library: str, shelfmark: str, gallica_type: str = "all", ic_type: str = "all"):
     """Resolve a shelfmark or URL and return a preview fragment."""
     try:
         if not shelfmark or not shelfmark.strip():
             return _with_feedback_toast("Input mancante", "Inserisci una segnatura o una parola chiave.", tone="danger")
+        if library == FEDERATED_LIBRARY_VALUE:
+            return _federated_search_shell(shelfmark)
         if not is_known_provider(library):
             raise ValueError("Biblioteca non valida.")
 
@@ -233,11 +320,8 @@ def resolve_manifest(library: str, shelfmark: str, gallica_type: str = "all", ic
         cm = get_config_manager()
         max_results = cm.data.get("settings", {}).get("discovery", {}).get("max_results_per_provider", 20)
 
-        resolution = resolve_provider_input(
-            library,
-            shelfmark,
-            filters={"gallica_type": gallica_type, "ic_type": ic_type, "max_results": max_results},
-        )
+        filters = {"gallica_type": gallica_type, "ic_type": ic_type, "max_results": max_results}
+        resolution = resolve_provider_input(library, shelfmark, filters=filters)
         provider = resolution.provider
 
         if resolution.status == "results":
@@ -249,6 +333,7 @@ def resolve_manifest(library: str, shelfmark: str, gallica_type: str = "all", ic
                 return render_preview(_build_item_preview_data(first, provider.key, pages=pages))
 
             has_more = _compute_has_more(provider, resolution.results, 1, max_results)
+            _prefetch_next_page(library, shelfmark, filters, 1, has_more)
             return render_search_results_list(
                 resolution.results,
                 pagination={
@@ -288,6 +373,52 @@ def resolve_manifest(library: str, shelfmark: str, gallica_type: str = "all", ic
         )
 
 
+_IMPORT_ID_RE = re.compile(r"[0-9a-f]{16}")
+
+
+def _bulk_import_status_fragment(job_id: str, import_id: str):
+    report = load_import_report(import_journal_path(import_id))
+    return render_bulk_import_status(
+        job_id=job_id,
+        import_id=import_id,
+        job=job_manager.get_job(job_id),
+        report=report,
+        counts=summarize_report(report),
+    )
+
+
+async def _read_import_upload(request: Request) -> tuple[str, bool | None]:
+    form = await request.form()
+    upload = form.get("import_file")
+    filename = str(getattr(upload, "filename", "") or "")
+    if filename and hasattr(upload, "read"):
+        raw = await upload.read()
+        return raw.decode("utf-8-sig", errors="replace"), True if filename.lower().endswith(".csv") else None
+    return str(form.get("import_text") or ""), None
+
+
+async def bulk_import(request: Request):
+    """Start a background import of an uploaded or pasted shelf list."""
+    text, csv_format = await _read_import_upload(request)
+    rows = parse_import_text(text, csv_format=csv_format)
+    if not rows:
+        return _with_feedback_toast("Elenco vuoto", "Carica un file TXT/CSV o incolla almeno un identificativo.")
+    job_id, import_id = start_bulk_import(rows)
+    logger.info("Bulk import %s started as job %s (%d rows)", import_id, job_id, len(rows))
+    return _with_toast(
+        _bulk_import_status_fragment(job_id, import_id),
+        f"Importazione avviata: {len(rows)} identificativi",
+        tone="success",
+    )
+
+
+def bulk_import_status(job_id: str = "", import_id: str = ""):
+    """Return the progress/report fragment of a bulk import."""
+    if not _IMPORT_ID_RE.fullmatch(import_id or ""):
+        return render_feedback_message("Importazione non trovata", tone="danger")
+    return _bulk_import_status_fragment(job_id, import_id)
+
+
 def probe_manifest(manifest_url: str, result_id: str = ""):
     """Validate a single IIIF manifest URL and return an HTML status fragment.
 
@@ -367,21 +498,14 @@ def load_more_results(
         max_results = cm.data.get("settings", {}).get("discovery", {}).get("max_results_per_provider", 20)
         page = max(1, int(page))
 
-        resolution = resolve_provider_input(
-            library,
-            shelfmark,
-            filters={
-                "gallica_type": gallica_type,
-                "ic_type": ic_type,
-                "max_results": max_results,
-                "page": page,
-            },
-        )
+        filters = {"gallica_type": gallica_type, "ic_type": ic_type, "max_results": max_results}
+        resolution = resolve_provider_input(library, shelfmark, filters={**filters, "page": page})
 
         if resolution.status != "results" or not resolution.results:
             return render_load_more_fragment([], has_more=False)
 
         has_more = _compute_has_more(resolution.provider, resolution.results, page, max_results)
+        _prefetch_next_page(library, shelfmark, filters, page, has_more)
         return render_load_more_fragment(
             resolution.results,
             has_more=has_more,
@@ -7,17 +7,13 @@ complexity checks remain satisfied.
 from __future__ import annotations
 
 import uuid
-from typing import Any
 from urllib.parse import unquote
 
 from universal_iiif_core.config_manager import get_config_manager
 from universal_iiif_core.jobs import job_manager
-from universal_iiif_core.library_catalog import parse_manifest_catalog
 from universal_iiif_core.logger import get_logger
 from universal_iiif_core.logic.downloader import IIIFDownloader
 from universal_iiif_core.network_policy import resolve_library_network_policy
-from universal_iiif_core.resolvers.manifest_fetch import fetch_manifest_dict
-from universal_iiif_core.resolvers.parsers import IIIFManifestParser
 from universal_iiif_core.services.storage.vault_manager import VaultManager
 from universal_iiif_core.utils import generate_job_id
 
@@ -31,69 +27,6 @@ def _normalize_download_job_origin(job_origin: str) -> str:
     return "library_download"
 
 
-def analyze_manifest(manifest_url: str) -> dict[str, Any]:
-    """Download and extract simple preview data from a manifest URL.
-
-    Returns a dict with keys: label, description, pages.
-    Raises exceptions on network / parsing errors so callers can handle them.
-    """
-    manifest_data = fetch_manifest_dict(manifest_url)
-    if not manifest_data:
-        raise ValueError("Manifest vuoto o irraggiungibile")
-
-    # Usa il parser centralizzato per metadati robusti
-    parser = IIIFManifestParser()
-    result = parser.parse_manifest(manifest_data, manifest_url=manifest_url)
-    catalog = parse_manifest_catalog(
-        manifest_data,
-        manifest_url=manifest_url,
-        doc_id=str(result.get("id") or ""),
-        enrich_external_reference=True,
-    )
-
-    # Calcolo pagine manuale se il parser non lo espone direttamente
-    # (IIIF v2 sequences o IIIF v3 items)
-    canvases = []
-    if "sequences" in manifest_data:
-        seq = manifest_data["sequences"][0] if manifest_data["sequences"] else {}
-        canvases = seq.get("canvases", [])
-    elif "items" in manifest_data:
-        canvases = manifest_data["items"]
-    rendering = manifest_data.get("rendering") or []
-    if isinstance(rendering, dict):
-        rendering = [rendering]
-    has_native_pdf = False
-    for item in rendering:
-        if not isinstance(item, dict):
-            continue
-        fmt = str(item.get("format") or "").lower()
-        url = str(item.get("@id") or item.get("id") or "").lower()
-        if fmt == "application/pdf" or url.endswith(".pdf"):
-            has_native_pdf = True
-            break
-
-    return {
-        "label": catalog.get("label") or result.get("title", "Senza Titolo"),
-        "description": catalog.get("description") or result.get("description", ""),
-        "pages": len(canvases),
-        "thumbnail": result.get("thumbnail"),
-        "has_native_pdf": has_native_pdf,
-        "catalog_title": catalog.get("catalog_title") or result.get("title", "Senza Titolo"),
-        "author": catalog.get("author") or result.get("author", ""),
-        "publisher": catalog.get("publisher") or result.get("publisher", ""),
-        "attribution": catalog.get("attribution") or "",
-        "shelfmark": catalog.get("shelfmark") or "",
-        "date_label": catalog.get("date_label") or "",
-        "language_label": catalog.get("language_label") or "",
-        "source_detail_url": catalog.get("source_detail_url") or "",
-        "reference_text": catalog.get("reference_text") or "",
-        "item_type": catalog.get("item_type") or "non classificato",
-        "item_type_confidence": float(catalog.get("item_type_confidence") or 0.0),
-        "item_type_reason": catalog.get("item_type_reason") or "",
-        "metadata_json": catalog.get("metadata_json") or "{}",
-    }
-
-
 def start_downloader_thread(
     manifest_url: str,
     doc_id: str,
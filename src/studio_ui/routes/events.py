@@ -0,0 +1,8 @@
+"""Live event stream routes registration."""
+
+from studio_ui.routes import events_handlers
+
+
+def setup_event_routes(app):
+    """Register the Server-Sent Events endpoint."""
+    app.get("/api/events")(events_handlers.stream_events)
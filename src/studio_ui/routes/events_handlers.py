@@ -0,0 +1,68 @@
+"""Server-Sent Events endpoint over the in-process event bus.
+
+Each client subscribes to a set of topics and receives one ``event: <topic>``
+message per changed entity. Pending events are coalesced per entity by the
+subscription, so a slow tab only gets the latest job, OCR or export state.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+from fasthtml.common import Request
+from starlette.responses import StreamingResponse
+
+from universal_iiif_core.event_bus import TOPIC_DOCS, TOPIC_EXPORT, TOPIC_JOBS, TOPIC_OCR, BusEvent, get_event_bus
+from universal_iiif_core.logger import get_logger
+
+logger = get_logger(__name__)
+
+_KNOWN_TOPICS = (TOPIC_JOBS, TOPIC_OCR, TOPIC_EXPORT, TOPIC_DOCS)
+_POLL_INTERVAL_S = 0.25
+_HEARTBEAT_S = 15.0
+_RETRY_MS = 5000
+
+
+def _parse_topics(raw: str) -> tuple[str, ...]:
+    requested = {part.strip().lower() for part in str(raw or "").split(",") if part.strip()}
+    topics = tuple(topic for topic in _KNOWN_TOPICS if topic in requested)
+    return topics or _KNOWN_TOPICS
+
+
+def format_sse(event: BusEvent) -> str:
+    """Serialize one bus event as an SSE message."""
+    data = json.dumps({"key": event.key, **event.payload}, ensure_ascii=False, separators=(",", ":"))
+    return f"id: {event.seq}\nevent: {event.topic}\ndata: {data}\n\n"
+
+
+async def _event_stream(request: Request, topics: tuple[str, ...]):
+    subscription = get_event_bus().subscribe(topics)
+    last_write = time.monotonic()
+    try:
+        yield f"retry: {_RETRY_MS}\nevent: ready\ndata: {{}}\n\n"
+        while not await request.is_disconnected():
+            # Non-blocking drain: waiting on the subscription would pin one
+            # executor thread per open tab.
+            events = subscription.get(timeout=0)
+            if events:
+                yield "".join(format_sse(event) for event in events)
+                last_write = time.monotonic()
+            elif time.monotonic() - last_write >= _HEARTBEAT_S:
+                yield ": keepalive\n\n"
+                last_write = time.monotonic()
+            await asyncio.sleep(_POLL_INTERVAL_S)
+    finally:
+        subscription.close()
+
+
+async def stream_events(request: Request, topics: str = ""):
+    """Stream job, OCR, export and document revision changes to the browser."""
+    selected = _parse_topics(topics)
+    logger.debug("Live events subscriber connected (topics=%s)", ",".join(selected))
+    return StreamingResponse(
+        _event_stream(request, selected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -10,12 +10,13 @@ from typing import Any
 from urllib.parse import quote
 
 from fasthtml.common import Request, Response
-from starlette.responses import FileResponse
+from starlette.responses import FileResponse, StreamingResponse
 
 from studio_ui.common.toasts import build_toast
 from studio_ui.components.export import render_export_jobs_panel, render_export_page
 from studio_ui.components.layout import base_layout
 from universal_iiif_core.config_manager import get_config_manager
+from universal_iiif_core.export_studio import clean_filename
 from universal_iiif_core.logger import get_logger
 from universal_iiif_core.services.export.service import (
     ExportCancelledError,
@@ -27,6 +28,7 @@ from universal_iiif_core.services.export.service import (
     output_kind_for_format,
     parse_items_csv,
     parse_page_selection,
+    stream_selected_images_zip,
 )
 from universal_iiif_core.services.storage.vault_manager import VaultManager
 
@@ -408,3 +410,25 @@ def download_export(job_id: str):
         media_type = "text/markdown"
 
     return FileResponse(str(artifact), media_type=media_type, filename=artifact.name)
+
+
+def stream_images_zip(doc_id: str = "", library: str = "", selection_mode: str = "all", selected_pages: str = ""):
+    """Stream a ZIP of the selected local scans of one item while it is being built.
+
+    Unlike a `zip_images` export job, nothing is written to the exports dir and
+    the download starts with the first page.
+    """
+    doc = str(doc_id or "").strip()
+    lib = str(library or "").strip()
+    if not doc or not lib or not _item_exists(doc, lib):
+        return Response("404 Not Found", status_code=404)
+    try:
+        chunks = stream_selected_images_zip(doc, lib, selection_mode, selected_pages)
+    except (FileNotFoundError, ValueError) as exc:
+        return Response(str(exc), status_code=400)
+    filename = f"{clean_filename(doc)}_images.zip"
+    return StreamingResponse(
+        chunks,
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -22,7 +22,15 @@ from studio_ui.routes.library_query import (
     _safe_catalog_title,
 )
 from universal_iiif_core.config_manager import get_config_manager
-from universal_iiif_core.library_catalog import infer_item_type, normalize_item_type, parse_manifest_catalog
+from universal_iiif_core.doc_revisions import bump_document_revision
+from universal_iiif_core.exceptions import DatabaseError
+from universal_iiif_core.jobs import job_manager
+from universal_iiif_core.library_catalog import (
+    infer_item_type,
+    infer_item_types,
+    normalize_item_type,
+    parse_manifest_catalog,
+)
 from universal_iiif_core.logger import get_logger
 from universal_iiif_core.resolvers.manifest_fetch import fetch_manifest_dict
 from universal_iiif_core.services.ocr.storage import OCRStorage
@@ -146,7 +154,10 @@ def library_page(
     sort_by: str = "",
 ):
     """Render the Local Library page (full page or HTMX fragment)."""
-    VaultManager().normalize_asset_states(limit=500)
+    try:
+        VaultManager().normalize_asset_states(limit=500)
+    except DatabaseError:
+        logger.warning("Library state normalization skipped", exc_info=True)
     content = _render_page_fragment(
         view=view or "grid",
         q=q or "",
@@ -245,6 +256,7 @@ def library_cleanup_partial(
             local_optimized=0,
             local_optimization_meta_json=None,
         )
+        bump_document_revision(doc_id)
         return _refresh_response(
             message=f"Pulizia parziale completata ({removed} pagine rimosse).",
             tone="success",
@@ -708,19 +720,7 @@ def library_reclassify(
     doc_id = _decode(doc_id)
     library = _decode(library)
     manuscript = VaultManager().get_manuscript(doc_id) or {}
-    metadata_map: dict[str, str] = {}
-    raw_metadata = str(manuscript.get("metadata_json") or "").strip()
-    if raw_metadata:
-        try:
-            parsed = json.loads(raw_metadata)
-            if isinstance(parsed, dict):
-                metadata_map = {str(k): str(v) for k, v in parsed.items()}
-        except Exception:
-            metadata_map = {}
-
-    label = _safe_catalog_title(manuscript)
-    description = str(manuscript.get("reference_text") or manuscript.get("title") or "")
-    item_type, confidence, reason = infer_item_type(label, description, metadata_map)
+    item_type, confidence, reason = _infer_row_item_type(manuscript)
 
     VaultManager().upsert_manuscript(
         doc_id,
@@ -743,6 +743,70 @@ def library_reclassify(
     )
 
 
+def _metadata_map(row: dict) -> dict[str, str]:
+    try:
+        parsed = json.loads(str(row.get("metadata_json") or "").strip() or "{}")
+    except Exception:
+        return {}
+    return {str(k): str(v) for k, v in parsed.items()} if isinstance(parsed, dict) else {}
+
+
+def _classification_input(row: dict) -> tuple[str, str, dict[str, str]]:
+    label = _safe_catalog_title(row)
+    description = str(row.get("reference_text") or row.get("title") or "")
+    return label, description, _metadata_map(row)
+
+
+def _infer_row_item_type(row: dict) -> tuple[str, float, str]:
+    return infer_item_type(*_classification_input(row))
+
+
+def _auto_item_type_updates(rows: list[dict]) -> list[dict | None]:
+    """Return, per row, the automatic category columns that changed; manual overrides are kept."""
+    auto_rows = [row for row in rows if str(row.get("item_type_source") or "auto") != "manual"]
+    inferred = iter(infer_item_types(_classification_input(row) for row in auto_rows))
+    results: list[dict | None] = []
+    for row in rows:
+        if str(row.get("item_type_source") or "auto") == "manual":
+            results.append(None)
+            continue
+        item_type, confidence, reason = next(inferred)
+        updates = {
+            "item_type": normalize_item_type(item_type),
+            "item_type_source": "auto",
+            "item_type_confidence": confidence,
+            "item_type_reason": reason,
+        }
+        results.append(None if all(row.get(key) == value for key, value in updates.items()) else updates)
+    return results
+
+
+def library_maintenance_task(action: str, *, progress_callback=None, should_cancel=None) -> int:
+    """JobManager task body for library-wide maintenance; returns the number of rows changed."""
+    vm = VaultManager()
+    if action == "reclassify":
+        updated = vm.bulk_update_manuscripts(
+            _auto_item_type_updates, batched=True, progress_callback=progress_callback, should_cancel=should_cancel
+        )
+    elif action == "normalize_states":
+        updated = vm.normalize_asset_states(
+            limit=None, progress_callback=progress_callback, should_cancel=should_cancel
+        )
+    else:
+        raise ValueError(f"Unknown library maintenance action: {action}")
+    logger.info("Library maintenance %s updated %d records", action, updated)
+    return updated
+
+
+def start_library_maintenance(action: str) -> tuple[str, bool]:
+    """Submit a `library_maintenance` job; return `(job_id, started)`, reusing a running one for `action`."""
+    for job_id, info in job_manager.list_jobs(active_only=True).items():
+        if info.get("type") == "library_maintenance" and tuple(info.get("args") or ()) == (action,):
+            return job_id, False
+    job_id = job_manager.submit_job(library_maintenance_task, args=(action,), job_type="library_maintenance")
+    return job_id, True
+
+
 def library_reclassify_all(
     view: str = "grid",
     q: str = "",
@@ -753,35 +817,11 @@ def library_reclassify_all(
     action_required: str = "0",
     sort_by: str = "",
 ):
-    """Recalculate automatic category for all manuscripts not manually overridden."""
-    vm = VaultManager()
-    docs = vm.get_all_manuscripts()
-    updated = 0
-    for doc in docs:
-        if str(doc.get("item_type_source") or "auto") == "manual":
-            continue
-        label = _safe_catalog_title(doc)
-        description = str(doc.get("reference_text") or doc.get("title") or "")
-        metadata_map: dict[str, str] = {}
-        try:
-            parsed = json.loads(str(doc.get("metadata_json") or "{}"))
-            if isinstance(parsed, dict):
-                metadata_map = {str(k): str(v) for k, v in parsed.items()}
-        except Exception:
-            metadata_map = {}
-        item_type, confidence, reason = infer_item_type(label, description, metadata_map)
-        vm.upsert_manuscript(
-            str(doc.get("id") or ""),
-            item_type=item_type,
-            item_type_source="auto",
-            item_type_confidence=confidence,
-            item_type_reason=reason,
-        )
-        updated += 1
-
+    """Start a background recalculation of the automatic category of every manuscript."""
+    _job_id, started = start_library_maintenance("reclassify")
     return _refresh_response(
-        message=f"Riclassificazione completata ({updated} elementi).",
-        tone="success",
+        message="Riclassificazione avviata in background." if started else "Riclassificazione già in corso.",
+        tone="info",
         view=view,
         q=q,
         state=state,
@@ -803,11 +843,11 @@ def library_normalize_states(
     action_required: str = "0",
     sort_by: str = "",
 ):
-    """Run a normalization pass for legacy/inconsistent state records."""
-    updated = VaultManager().normalize_asset_states(limit=1000)
+    """Start a background normalization pass over every legacy/inconsistent state record."""
+    _job_id, started = start_library_maintenance("normalize_states")
     return _refresh_response(
-        message=f"Normalizzazione stati completata ({updated} record aggiornati).",
-        tone="success",
+        message="Normalizzazione stati avviata in background." if started else "Normalizzazione stati già in corso.",
+        tone="info",
         view=view,
         q=q,
         state=state,
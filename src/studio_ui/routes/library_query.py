@@ -9,12 +9,12 @@ from urllib.parse import quote, unquote
 
 from studio_ui.common.library_constants import to_optional_bool
 from studio_ui.common.page_inventory import resolve_page_inventory
-from studio_ui.common.title_utils import resolve_preferred_title
 from universal_iiif_core.config_manager import get_config_manager
 from universal_iiif_core.library_catalog import ITEM_TYPES, normalize_item_type
 from universal_iiif_core.logger import get_logger
 from universal_iiif_core.resolvers.parsers import IIIFManifestParser
 from universal_iiif_core.services.storage.vault_manager import VaultManager
+from universal_iiif_core.title_utils import resolve_preferred_title
 
 logger = get_logger(__name__)
 
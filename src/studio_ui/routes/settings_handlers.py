@@ -252,6 +252,23 @@ def _postprocess_discovery_settings(settings_node: dict[str, Any]) -> None:
     except (TypeError, ValueError):
         val = 20
     discovery["max_results_per_provider"] = max(1, min(val, 50))
+    try:
+        timeout_s = int(discovery.get("federated_timeout_s", 20))
+    except (TypeError, ValueError):
+        timeout_s = 20
+    discovery["federated_timeout_s"] = max(3, min(timeout_s, 120))
+    for key, default, lower, upper in (
+        ("search_cache_ttl_s", 600, 0, 86400),
+        ("search_cache_max_entries", 128, 0, 2000),
+        ("bulk_import_workers", 4, 1, 16),
+        ("harvest_max_manifests", 500, 0, 100000),
+        ("iccu_manifest_cache_ttl_hours", 168, 0, 8760),
+    ):
+        try:
+            value = int(discovery.get(key, default))
+        except (TypeError, ValueError):
+            value = default
+        discovery[key] = max(lower, min(value, upper))
 
 
 def _postprocess_storage_settings(settings_node: dict[str, Any]) -> None:
@@ -27,10 +27,11 @@ from studio_ui.components.studio.export import (
 from studio_ui.components.studio.history import history_tab_content
 from studio_ui.components.studio.transcription import transcription_tab_content
 from studio_ui.config import get_api_key, get_snippets_dir
-from studio_ui.ocr_state import OCR_JOBS_STATE, get_ocr_job_state, is_ocr_job_running
+from studio_ui.ocr_state import OCR_JOBS_STATE, get_ocr_job_state, is_ocr_job_running, set_ocr_job_state
 from studio_ui.pages.studio import studio_layout
 from studio_ui.routes import export_handlers as export_monitor_handlers
 from studio_ui.routes.discovery_helpers import start_downloader_thread
+from universal_iiif_core.doc_revisions import document_revision_token, get_document_revisions
 from universal_iiif_core.jobs import job_manager
 from universal_iiif_core.logger import get_logger
 from universal_iiif_core.services.export import list_item_pdf_files
@@ -249,6 +250,11 @@ def get_studio_export_pdf_list(doc_id: str, library: str):
     )
 
 
+def _thumbs_need_live_updates(thumb_render_state: dict, thumb_state: dict) -> bool:
+    """Keep the live poller on while page jobs run or remote size probes are still pending."""
+    return bool(thumb_render_state["has_active_page_actions"]) or bool(thumb_state.get("remote_probes_pending"))
+
+
 def get_studio_export_thumbs(
     doc_id: str,
     library: str,
@@ -257,6 +263,7 @@ def get_studio_export_thumbs(
 ):
     """Return one thumbnails page slice for Studio Export tab."""
     doc_id, library = unquote(doc_id), unquote(library)
+    revision = document_revision_token(doc_id)
     thumb_render_state = _resolve_export_thumb_render_state(doc_id=doc_id, library=library)
     thumb_state = _build_export_thumbnail_slice(
         doc_id,
@@ -277,7 +284,8 @@ def get_studio_export_thumbs(
         total_pages=int(thumb_state.get("total_pages") or 0),
         page_size=int(thumb_state.get("page_size") or _thumb_page_size(doc_id=doc_id)),
         page_size_options=_thumb_page_size_options(),
-        has_active_page_actions=bool(thumb_render_state["has_active_page_actions"]),
+        has_active_page_actions=_thumbs_need_live_updates(thumb_render_state, thumb_state),
+        revision=revision,
     )
 
 
@@ -331,9 +339,21 @@ def get_studio_export_thumbs_live(
     library: str,
     thumb_page: int = 1,
     page_size: int = 0,
+    rev: str = "",
 ):
-    """Return out-of-band updates for visible thumbnail cards and poller state."""
+    """Return out-of-band updates for visible thumbnail cards and poller state.
+
+    `rev` is the revision token the client last rendered. When it is still
+    current the response is an empty 204; otherwise only cards of pages bumped
+    since then are rebuilt (every card when the token is unknown).
+    """
     doc_id, library = unquote(doc_id), unquote(library)
+    revisions = get_document_revisions()
+    # Read the token before rendering: a bump that lands mid-render must trigger another pass.
+    revision = revisions.token(doc_id)
+    if rev and rev == revision:
+        return Response(status_code=204)
+    changed_pages = revisions.changed_pages(doc_id, rev) if rev else None
     thumb_render_state = _resolve_export_thumb_render_state(doc_id=doc_id, library=library)
     thumb_state = _build_export_thumbnail_slice(
         doc_id,
@@ -344,6 +364,7 @@ def get_studio_export_thumbs_live(
         page_feedback_by_num=thumb_render_state["resolved_highres_feedback_by_num"],
         stitch_feedback_by_num=thumb_render_state["resolved_stitch_feedback_by_num"],
         optimize_feedback_by_num=thumb_render_state["resolved_opt_feedback_by_num"],
+        only_pages=changed_pages,
     )
     fragments = [
         render_export_thumbnail_card(
@@ -372,8 +393,9 @@ def get_studio_export_thumbs_live(
             library=library,
             thumb_page=int(thumb_state.get("thumb_page") or 1),
             page_size=int(thumb_state.get("page_size") or _thumb_page_size(doc_id=doc_id)),
-            has_active_page_actions=bool(thumb_render_state["has_active_page_actions"]),
+            has_active_page_actions=_thumbs_need_live_updates(thumb_render_state, thumb_state),
             hx_swap_oob="outerHTML:#studio-export-live-state-poller",
+            revision=revision,
         )
     )
     return fragments
@@ -780,10 +802,7 @@ def run_ocr_async(doc_id: str, library: str, page: int, engine: str, model: str
     doc_id, library = unquote(doc_id), unquote(library)
     logger.debug("🔓 [API] Unquoted: doc=%s lib=%s", doc_id, library)
     page_idx = int(page)
-    OCR_JOBS_STATE[(doc_id, page_idx)] = {
-        "status": "running",
-        "timestamp": time.time(),
-    }
+    set_ocr_job_state(doc_id, page_idx, "running")
 
     def _ocr_worker():
         try:
@@ -797,11 +816,7 @@ def run_ocr_async(doc_id: str, library: str, page: int, engine: str, model: str
 
             if not image_path.exists():
                 logger.error("❌ Image not found for OCR: %s", image_path)
-                OCR_JOBS_STATE[(doc_id, page_idx)] = {
-                    "status": "error",
-                    "message": f"Immagine non trovata: {image_path.name}",
-                    "timestamp": time.time(),
-                }
+                set_ocr_job_state(doc_id, page_idx, "error", f"Immagine non trovata: {image_path.name}")
                 return
 
             with Image.open(str(image_path)) as img:
@@ -822,28 +837,16 @@ def run_ocr_async(doc_id: str, library: str, page: int, engine: str, model: str
 
             if res.get("error"):
                 logger.error("❌ OCR Error for %s p%s: %s", doc_id, page_idx, res["error"])
-                OCR_JOBS_STATE[(doc_id, page_idx)] = {
-                    "status": "error",
-                    "message": str(res["error"]),
-                    "timestamp": time.time(),
-                }
+                set_ocr_job_state(doc_id, page_idx, "error", str(res["error"]))
             else:
                 storage.save_transcription(doc_id, page_idx, res, library)
                 logger.info("✅ Async OCR success & auto-saved: %s p%s", doc_id, page_idx)
-                OCR_JOBS_STATE[(doc_id, page_idx)] = {
-                    "status": "completed",
-                    "message": f"OCR completato e salvato (pag. {page_idx}).",
-                    "timestamp": time.time(),
-                }
+                set_ocr_job_state(doc_id, page_idx, "completed", f"OCR completato e salvato (pag. {page_idx}).")
 
         except Exception as e:
             err_msg = str(e)
             logger.exception("💥 Critical Failure in Async OCR worker for %s p%s", doc_id, page_idx)
-            OCR_JOBS_STATE[(doc_id, page_idx)] = {
-                "status": "error",
-                "message": f"Critical Error: {err_msg}",
-                "timestamp": time.time(),
-            }
+            set_ocr_job_state(doc_id, page_idx, "error", f"Critical Error: {err_msg}")
 
     def _ocr_task(progress_callback=None, **_kwargs):
         _ocr_worker()
@@ -79,6 +79,25 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Explicitly generate a PDF from the downloaded images",
     )
 
+    parser.add_argument(
+        "--import",
+        dest="import_file",
+        metavar="FILE",
+        help="Add every shelfmark/ID/URL listed in a TXT or CSV file to the library (resumable)",
+    )
+    parser.add_argument(
+        "--harvest",
+        metavar="LIBRARY",
+        help="Index a provider's IIIF collections/sitemaps for offline search (resumable)",
+    )
+    parser.add_argument(
+        "--harvest-url",
+        action="append",
+        default=[],
+        metavar="URL",
+        help="Collection or sitemap URL to harvest instead of the configured sources (repeatable)",
+    )
+
     # DB Management commands
     parser.add_argument("--list", action="store_true", help="List all manuscripts in the database")
     parser.add_argument("--info", metavar="ID", help="Show detailed info for a manuscript")
@@ -224,6 +243,80 @@ def _handle_delete_job(job_id: str) -> None:
                 conn.close()
 
 
+def _handle_import(path: str) -> None:
+    from universal_iiif_core.bulk_import import (
+        import_journal_path,
+        load_import_report,
+        read_import_file,
+        start_bulk_import,
+        summarize_report,
+    )
+
+    try:
+        rows = read_import_file(path)
+    except OSError as e:
+        print(f"❌ Cannot read import file: {e}")
+        sys.exit(1)
+    if not rows:
+        print(f"⚠️  No identifiers found in {path}")
+        sys.exit(1)
+
+    job_id, import_id = start_bulk_import(rows)
+    print(f"📥 Importing {len(rows)} identifiers (job {job_id}, report {import_journal_path(import_id)})")
+    job = _wait_for_job(job_id, "\n⏹️  Stopping import; run the same command again to resume.")
+
+    counts = summarize_report(load_import_report(import_journal_path(import_id)))
+    print(f"\n✅ Imported: {counts['imported']}  ❔ Not found: {counts['not_found']}  ❌ Errors: {counts['error']}")
+    if job.get("status") == "failed":
+        print(f"❌ Import failed: {job.get('error')}")
+        sys.exit(1)
+
+
+def _handle_harvest(library: str, urls: list[str]) -> None:
+    from universal_iiif_core.discovery.harvester import harvest_sources, start_catalog_harvest
+    from universal_iiif_core.providers import get_provider
+
+    provider = get_provider(library, fallback="Unknown")
+    if provider.key == "Unknown":
+        print(f"❌ Unknown library: {library}")
+        sys.exit(1)
+    if not urls and not harvest_sources(provider.key):
+        print(f"⚠️  No harvest sources for {provider.key}: pass --harvest-url or set settings.discovery.harvest_sources")
+        sys.exit(1)
+
+    job_id = start_catalog_harvest(provider.key, urls)
+    print(f"🗂️  Harvesting {provider.key} (job {job_id})")
+    job = _wait_for_job(job_id, "\n⏹️  Stopping harvest; run the same command again to resume.")
+
+    if job.get("status") == "failed":
+        print(f"\n❌ Harvest failed: {job.get('error')}")
+        sys.exit(1)
+    summary = job.get("result") or {}
+    print(
+        f"\n✅ Indexed: {summary.get('indexed', 0)}  📄 New manifests: {summary.get('manifests', 0)}  "
+        f"🔁 Unchanged lists: {summary.get('not_modified', 0)}  ❌ Errors: {summary.get('errors', 0)}"
+    )
+
+
+def _wait_for_job(job_id: str, stop_message: str) -> dict:
+    """Print a job's progress until it ends; Ctrl+C cancels it. Return the final job record."""
+    import time
+
+    from universal_iiif_core.jobs import job_manager
+
+    terminal = {"completed", "failed", "cancelled", "paused"}
+    try:
+        while (job := job_manager.get_job(job_id) or {}).get("status") not in terminal:
+            print(f"\r⏳ {job.get('message') or 'Starting...'}", end="", flush=True)
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print(stop_message)
+        job_manager.request_cancel(job_id)
+        while (job_manager.get_job(job_id) or {}).get("status") not in terminal:
+            time.sleep(0.5)
+    return job_manager.get_job(job_id) or {}
+
+
 def _resolve_download_args(args: argparse.Namespace):
     if not args.url:
         url, out_name, ocr_model = wizard_mode()
@@ -261,6 +354,12 @@ def main():
 
     if _handle_db_commands(args):
         sys.exit(0)
+    if args.import_file:
+        _handle_import(args.import_file)
+        sys.exit(0)
+    if args.harvest:
+        _handle_harvest(args.harvest, args.harvest_url)
+        sys.exit(0)
 
     url, out_name, workers, clean, prefer_images, ocr_model, create_pdf = _resolve_download_args(args)
 
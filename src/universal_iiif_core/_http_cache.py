@@ -0,0 +1,328 @@
+"""On-disk HTTP cache for JSON resources with Cache-Control and conditional GET support.
+
+Used by `HTTPClient.get_json` to avoid refetching manifests, IIIF `info.json`
+documents and search API payloads that rarely change. Each entry is stored as
+two files under the cache root (`<key>.body` + `<key>.meta.json`) so that the
+metadata can be read and refreshed without touching the payload bytes.
+
+Freshness follows a pragmatic subset of RFC 9111:
+- `no-store` responses are never written
+- `max-age` (or `Expires`) defines freshness, capped by `max_ttl_s`
+- `no-cache` entries are stored but always revalidated
+- without explicit freshness, `default_ttl_s` is used
+- stale entries carrying `ETag` / `Last-Modified` are revalidated with
+  `If-None-Match` / `If-Modified-Since`
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+@dataclass
+class HTTPCacheEntry:
+    """Metadata for one cached response (the body lives in a sibling file)."""
+
+    url: str
+    stored_ts: float
+    expires_ts: float
+    etag: str = ""
+    last_modified: str = ""
+    content_type: str = ""
+    encoding: str = ""
+    size: int = 0
+    must_revalidate: bool = False
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Return True when the entry can be served without contacting the origin."""
+        return (now if now is not None else time.time()) < self.expires_ts
+
+    def has_validators(self) -> bool:
+        """Return True when a conditional GET is possible."""
+        return bool(self.etag or self.last_modified)
+
+
+def parse_cache_control(header_value: str | None) -> dict[str, str | None]:
+    """Parse a `Cache-Control` header into a lowercase directive map."""
+    directives: dict[str, str | None] = {}
+    for raw in str(header_value or "").split(","):
+        token = raw.strip()
+        if not token:
+            continue
+        name, sep, value = token.partition("=")
+        directives[name.strip().lower()] = value.strip().strip('"') if sep else None
+    return directives
+
+
+def _parse_http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class HTTPCache:
+    """Thread-safe, size-capped on-disk cache for GET responses.
+
+    Eviction is least-recently-used based on the metadata file mtime, which is
+    touched on every hit. The running byte total is tracked in memory and only
+    recomputed from disk at startup.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl_s: int = 3600,
+        max_ttl_s: int = 7 * 86400,
+    ) -> None:
+        """Initialize the cache under `root` (created lazily)."""
+        self.root = Path(root)
+        self.configure(max_bytes=max_bytes, default_ttl_s=default_ttl_s, max_ttl_s=max_ttl_s)
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+
+    def configure(self, *, max_bytes: int, default_ttl_s: int, max_ttl_s: int) -> None:
+        """Apply size and TTL limits; a lower `max_bytes` takes effect at the next store."""
+        self.max_bytes = max(0, int(max_bytes))
+        self.default_ttl_s = max(0, int(default_ttl_s))
+        self.max_ttl_s = max(self.default_ttl_s, int(max_ttl_s))
+
+    # ------------------------------------------------------------------
+    # Keys & paths
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(url: str, accept: str | None = None) -> str:
+        """Return the storage key for a URL (+ Accept header variant)."""
+        raw = f"{url}\n{accept or ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.meta.json"
+
+    def _body_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.body"
+
+    # ------------------------------------------------------------------
+    # Read side
+    # ------------------------------------------------------------------
+
+    def lookup(self, key: str) -> HTTPCacheEntry | None:
+        """Return the entry metadata for `key`, or None when absent/corrupt."""
+        meta_path = self._meta_path(key)
+        try:
+            payload = json.loads(meta_path.read_text(encoding="utf-8"))
+            entry = HTTPCacheEntry(**payload)
+        except (OSError, ValueError, TypeError):
+            return None
+        if not self._body_path(key).exists():
+            return None
+        return entry
+
+    def read_body(self, key: str) -> bytes | None:
+        """Return cached body bytes and mark the entry as recently used."""
+        try:
+            body = self._body_path(key).read_bytes()
+        except OSError:
+            return None
+        with suppress(OSError):
+            self._meta_path(key).touch()
+        return body
+
+    def to_response(self, entry: HTTPCacheEntry, body: bytes) -> requests.Response:
+        """Build a synthetic 200 `requests.Response` from a cached entry."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = entry.url
+        response._content = body
+        headers: CaseInsensitiveDict[str] = CaseInsensitiveDict()
+        if entry.content_type:
+            headers["Content-Type"] = entry.content_type
+        if entry.etag:
+            headers["ETag"] = entry.etag
+        if entry.last_modified:
+            headers["Last-Modified"] = entry.last_modified
+        response.headers = headers
+        response.encoding = entry.encoding or None
+        return response
+
+    @staticmethod
+    def conditional_headers(entry: HTTPCacheEntry | None) -> dict[str, str]:
+        """Return `If-None-Match` / `If-Modified-Since` headers for revalidation."""
+        if entry is None:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    # ------------------------------------------------------------------
+    # Write side
+    # ------------------------------------------------------------------
+
+    def _freshness_lifetime(self, headers: Any, now: float) -> tuple[float, bool] | None:
+        """Return `(lifetime_s, must_revalidate)` or None when the response must not be stored."""
+        directives = parse_cache_control(headers.get("Cache-Control"))
+        if "no-store" in directives:
+            return None
+        must_revalidate = "must-revalidate" in directives
+        if "no-cache" in directives:
+            return 0.0, True
+
+        lifetime: float | None = None
+        max_age = directives.get("max-age")
+        if max_age is not None:
+            with suppress(TypeError, ValueError):
+                lifetime = max(0.0, float(max_age))
+        if lifetime is None:
+            expires_ts = _parse_http_date(headers.get("Expires"))
+            if expires_ts is not None:
+                date_ts = _parse_http_date(headers.get("Date")) or now
+                lifetime = max(0.0, expires_ts - date_ts)
+        if lifetime is None:
+            lifetime = float(self.default_ttl_s)
+            last_modified_ts = _parse_http_date(headers.get("Last-Modified"))
+            if last_modified_ts is not None and now > last_modified_ts:
+                # Heuristic freshness (RFC 9111 §4.2.2): 10% of the document age.
+                lifetime = min(lifetime, (now - last_modified_ts) * 0.1)
+        return min(lifetime, float(self.max_ttl_s)), must_revalidate
+
+    def store(self, key: str, response: requests.Response) -> HTTPCacheEntry | None:
+        """Persist a 200 response when its headers allow caching."""
+        body = response.content or b""
+        if response.status_code != 200 or not body or self.max_bytes <= 0:
+            return None
+        if len(body) > self.max_bytes:
+            return None
+        now = time.time()
+        freshness = self._freshness_lifetime(response.headers, now)
+        if freshness is None:
+            self.invalidate(key)
+            return None
+        lifetime, must_revalidate = freshness
+        entry = HTTPCacheEntry(
+            url=str(response.url or ""),
+            stored_ts=now,
+            expires_ts=now + lifetime,
+            etag=str(response.headers.get("ETag") or ""),
+            last_modified=str(response.headers.get("Last-Modified") or ""),
+            content_type=str(response.headers.get("Content-Type") or ""),
+            encoding=str(response.encoding or ""),
+            size=len(body),
+            must_revalidate=must_revalidate,
+        )
+        with self._lock:
+            previous = self.lookup(key)
+            try:
+                body_path = self._body_path(key)
+                body_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_body = body_path.with_suffix(".tmp")
+                tmp_body.write_bytes(body)
+                tmp_body.replace(body_path)
+                self._write_meta(key, entry)
+            except OSError:
+                return None
+            self._adjust_total(entry.size - (previous.size if previous else 0))
+            self._evict_if_needed()
+        return entry
+
+    def refresh(self, key: str, entry: HTTPCacheEntry, response: requests.Response) -> HTTPCacheEntry:
+        """Extend freshness of `entry` after a `304 Not Modified` revalidation."""
+        now = time.time()
+        freshness = self._freshness_lifetime(response.headers, now)
+        lifetime, must_revalidate = freshness if freshness is not None else (0.0, True)
+        entry.stored_ts = now
+        entry.expires_ts = now + lifetime
+        entry.must_revalidate = must_revalidate
+        entry.etag = str(response.headers.get("ETag") or entry.etag)
+        entry.last_modified = str(response.headers.get("Last-Modified") or entry.last_modified)
+        with self._lock, suppress(OSError):
+            self._write_meta(key, entry)
+        return entry
+
+    def invalidate(self, key: str) -> None:
+        """Remove one entry from disk."""
+        with self._lock:
+            previous = self.lookup(key)
+            for path in (self._meta_path(key), self._body_path(key)):
+                with suppress(OSError):
+                    path.unlink()
+            if previous:
+                self._adjust_total(-previous.size)
+
+    def _write_meta(self, key: str, entry: HTTPCacheEntry) -> None:
+        meta_path = self._meta_path(key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_meta = meta_path.with_suffix(".tmp")
+        tmp_meta.write_text(json.dumps(asdict(entry), ensure_ascii=False), encoding="utf-8")
+        tmp_meta.replace(meta_path)
+
+    # ------------------------------------------------------------------
+    # Size accounting & eviction (callers hold self._lock)
+    # ------------------------------------------------------------------
+
+    def _adjust_total(self, delta: int) -> None:
+        if self._total_bytes is None:
+            self._total_bytes = self._scan_total_bytes()
+        else:
+            self._total_bytes = max(0, self._total_bytes + int(delta))
+
+    def _scan_total_bytes(self) -> int:
+        total = 0
+        for body in self.root.glob("*/*.body"):
+            with suppress(OSError):
+                total += body.stat().st_size
+        return total
+
+    def _evict_if_needed(self) -> None:
+        if self._total_bytes is None or self._total_bytes <= self.max_bytes:
+            return
+        candidates: list[tuple[float, Path]] = []
+        for meta in self.root.glob("*/*.meta.json"):
+            with suppress(OSError):
+                candidates.append((meta.stat().st_mtime, meta))
+        candidates.sort()
+        for _mtime, meta in candidates:
+            if self._total_bytes <= self.max_bytes:
+                break
+            key = meta.name[: -len(".meta.json")]
+            body = self._body_path(key)
+            size = 0
+            with suppress(OSError):
+                size = body.stat().st_size
+            for path in (meta, body):
+                with suppress(OSError):
+                    path.unlink()
+            self._total_bytes = max(0, self._total_bytes - size)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            for path in list(self.root.glob("*/*")):
+                with suppress(OSError):
+                    path.unlink()
+            self._total_bytes = 0
+
+    def size_bytes(self) -> int:
+        """Return the current on-disk payload size."""
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            return self._total_bytes
@@ -0,0 +1,443 @@
+"""Bulk import of shelfmark, ID and URL lists into the library.
+
+A shelf list (one identifier per line, or a CSV with an identifier column and
+an optional library column) is resolved through the provider registry and
+prepared concurrently: manifest and preview fetches go through the shared
+`HTTPClient`, whose per-host semaphores and rate limits keep a large list
+within each library's limits. Vault writes are serialized on the calling
+thread and applied in batches, so worker threads never contend for SQLite.
+
+Every processed line is appended to a JSON Lines journal, one record per
+line, so each flush costs only the lines it adds. Running the same list again
+skips the lines already imported, so a cancelled or crashed import resumes
+where it stopped, and the journal doubles as the per-item report (the last
+record of a line wins).
+
+`start_bulk_import` submits a list as one `bulk_import` JobManager job whose
+per-item work is what "Aggiungi in Libreria" does for a single Discovery
+result; both the web UI and `scriptoria-cli --import` use it.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import re
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+from .config_manager import get_config_manager
+from .discovery.saved_entries import (
+    analyze_manifest,
+    persist_prefetch_light,
+    resolve_saved_entry_title,
+    upsert_saved_entries,
+)
+from .jobs import job_manager
+from .logger import get_logger
+from .providers import get_provider, resolve_with_provider
+from .resolvers.manifest_fetch import fetch_manifest_dict
+
+logger = get_logger(__name__)
+
+ImportStatus = Literal["imported", "not_found", "error"]
+
+DEFAULT_WORKERS = 4
+DEFAULT_BATCH_SIZE = 25
+MAX_IMPORT_ROWS = 20000
+
+_IDENTIFIER_COLUMNS = ("identifier", "id", "shelfmark", "segnatura", "url", "manifest", "manifest_url")
+_LIBRARY_COLUMNS = ("library", "biblioteca", "provider")
+
+PrepareEntryFn = Callable[[str, str, str], dict[str, Any]]
+PersistBatchFn = Callable[[list[dict[str, Any]]], None]
+ResolveRowFn = Callable[["ImportRow"], tuple[str | None, str | None, str]]
+
+
+@dataclass(frozen=True)
+class ImportRow:
+    """One identifier read from an import list."""
+
+    line: int
+    identifier: str
+    library: str = ""
+
+    @property
+    def key(self) -> str:
+        """Return the journal key of this row."""
+        return f"{self.line}:{self.library}:{self.identifier}"
+
+
+@dataclass
+class ImportOutcome:
+    """Per-item result recorded in the import report."""
+
+    line: int
+    identifier: str
+    library: str
+    status: ImportStatus
+    doc_id: str = ""
+    manifest_url: str = ""
+    message: str = ""
+
+
+def _pick_column(header: list[str], names: tuple[str, ...]) -> int | None:
+    lowered = [cell.strip().lower() for cell in header]
+    for name in names:
+        if name in lowered:
+            return lowered.index(name)
+    return None
+
+
+def _parse_csv_rows(text: str) -> list[ImportRow]:
+    try:
+        dialect = csv.Sniffer().sniff(text[:4096], delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    records = list(csv.reader(io.StringIO(text), dialect))
+    if not records:
+        return []
+    id_col = _pick_column(records[0], _IDENTIFIER_COLUMNS)
+    lib_col = _pick_column(records[0], _LIBRARY_COLUMNS)
+    start = 1 if id_col is not None or lib_col is not None else 0
+    id_col = 0 if id_col is None else id_col
+    if lib_col is None and start == 0 and max(len(record) for record in records) > 1:
+        lib_col = 1
+    rows: list[ImportRow] = []
+    for index, record in enumerate(records[start:], start=start + 1):
+        identifier = record[id_col].strip() if id_col < len(record) else ""
+        if not identifier or identifier.startswith("#"):
+            continue
+        library = record[lib_col].strip() if lib_col is not None and lib_col < len(record) else ""
+        rows.append(ImportRow(line=index, identifier=identifier, library=library))
+    return rows
+
+
+def _has_csv_header(first_line: str) -> bool:
+    cells = [cell.strip().strip('"').lower() for cell in re.split(r"[,;\t]", first_line)]
+    return len(cells) > 1 and any(cell in _IDENTIFIER_COLUMNS + _LIBRARY_COLUMNS for cell in cells)
+
+
+def parse_import_text(text: str, *, csv_format: bool | None = None) -> list[ImportRow]:
+    """Parse an import list.
+
+    Args:
+        text: File contents. Plain text holds one identifier per line; `#` starts a comment line.
+        csv_format: Force CSV parsing on or off; by default CSV is assumed only when the first line is a
+            header naming an identifier or library column, so identifiers containing commas stay whole.
+    """
+    clean = (text or "").lstrip("\ufeff")
+    first_line = next((line for line in clean.splitlines() if line.strip()), "")
+    if csv_format is None:
+        csv_format = _has_csv_header(first_line)
+    if csv_format:
+        rows = _parse_csv_rows(clean)
+    else:
+        rows = [
+            ImportRow(line=index, identifier=line.strip())
+            for index, line in enumerate(clean.splitlines(), start=1)
+            if line.strip() and not line.strip().startswith("#")
+        ]
+    return rows[:MAX_IMPORT_ROWS]
+
+
+def read_import_file(path: str | Path) -> list[ImportRow]:
+    """Read and parse an import list from disk (`.csv` files are always parsed as CSV)."""
+    source = Path(path)
+    text = source.read_text(encoding="utf-8-sig", errors="replace")
+    return parse_import_text(text, csv_format=True if source.suffix.lower() == ".csv" else None)
+
+
+def import_id_for(rows: Iterable[ImportRow]) -> str:
+    """Return a stable id for an import list, so re-running the same list resumes it."""
+    digest = hashlib.sha256()
+    for row in rows:
+        digest.update(f"{row.key}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def import_journal_path(import_id: str) -> Path:
+    """Return where the journal of one import list is stored."""
+    return get_config_manager().get_temp_dir() / "_cache" / "bulk_import" / f"{import_id}.jsonl"
+
+
+def load_import_report(journal_path: Path) -> dict[str, Any]:
+    """Fold the journal of an import into `{"total", "updated_at", "items"}` (empty when not started yet)."""
+    report: dict[str, Any] = {"items": {}}
+    path = Path(journal_path)
+    try:
+        with path.open(encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # a line cut short by a crash mid-write
+                if not isinstance(record, dict):
+                    continue
+                if "key" in record:
+                    report["items"][str(record.pop("key"))] = record
+                elif "total" in record:
+                    report["total"] = int(record.get("total") or 0)
+        report["updated_at"] = path.stat().st_mtime
+    except OSError:
+        return {"items": {}}
+    return report
+
+
+def summarize_report(report: dict[str, Any]) -> dict[str, int]:
+    """Count journal items by status."""
+    counts = {"imported": 0, "not_found": 0, "error": 0}
+    for item in (report.get("items") or {}).values():
+        status = str(item.get("status") or "")
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+def resolve_import_row(row: ImportRow) -> tuple[str | None, str | None, str]:
+    """Resolve one row into `(manifest_url, doc_id, library)` via the provider registry."""
+    if row.library:
+        from .resolvers.discovery import resolve_shelfmark
+
+        provider = get_provider(row.library, fallback="Unknown")
+        manifest_url, doc_id = resolve_shelfmark(provider.key, row.identifier)
+        return manifest_url, doc_id, provider.key
+    manifest_url, doc_id, provider = resolve_with_provider(row.identifier)
+    return manifest_url, doc_id, provider.key
+
+
+class _Journal:
+    def __init__(self, path: Path, total: int) -> None:
+        self.path = Path(path)
+        self.report = load_import_report(self.path)
+        self.report["total"] = total
+        self._append([{"total": total, "started_at": time.time()}])
+
+    def done(self, row: ImportRow) -> bool:
+        item = self.report["items"].get(row.key)
+        return bool(item) and item.get("status") == "imported"
+
+    def record(self, processed: list[tuple[ImportRow, ImportOutcome]]) -> None:
+        records = []
+        for row, outcome in processed:
+            item = asdict(outcome)
+            self.report["items"][row.key] = item
+            records.append({"key": row.key, **item})
+        self._append(records)
+
+    def _append(self, records: list[dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+
+
+class BulkImport:
+    """Resolve, prepare and persist an import list; see the module docstring.
+
+    Args:
+        rows: Parsed import list.
+        prepare_entry_fn: Called on worker threads with `(manifest_url, doc_id, library)`; fetches
+            whatever the entry needs and returns the payload handed to `persist_batch_fn`.
+        persist_batch_fn: Called on the calling thread with up to `batch_size` prepared payloads.
+        journal_path: JSON Lines journal / report location.
+        workers: Concurrent resolutions and preparations.
+        batch_size: Prepared payloads per persist call (and journal write).
+        resolve_row_fn: Row resolver, `resolve_import_row` by default.
+        progress_callback: `(done, total, message)` reporter.
+        should_cancel: Polled between items; a cancelled import stops submitting and flushes what finished.
+    """
+
+    def __init__(
+        self,
+        rows: list[ImportRow],
+        *,
+        prepare_entry_fn: PrepareEntryFn,
+        persist_batch_fn: PersistBatchFn,
+        journal_path: Path,
+        workers: int = DEFAULT_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        resolve_row_fn: ResolveRowFn = resolve_import_row,
+        progress_callback: Callable[..., Any] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+    ) -> None:
+        """Initialize the import; nothing runs until `run()`."""
+        self.rows = list(rows)
+        self.prepare_entry_fn = prepare_entry_fn
+        self.persist_batch_fn = persist_batch_fn
+        self.journal = _Journal(journal_path, len(self.rows))
+        self.workers = max(1, int(workers))
+        self.batch_size = max(1, int(batch_size))
+        self.resolve_row_fn = resolve_row_fn
+        self.progress_callback = progress_callback
+        self.should_cancel = should_cancel or (lambda: False)
+        self._processed = 0
+        self._buffer: list[tuple[ImportRow, ImportOutcome, dict[str, Any] | None]] = []
+
+    def run(self) -> dict[str, Any]:
+        """Process every row not yet imported and return the report summary."""
+        todo = [row for row in self.rows if not self.journal.done(row)]
+        self._processed = len(self.rows) - len(todo)
+        self._report_progress()
+        cancelled = False
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bulk-import") as executor:
+            pending: set[Future] = set()
+            queue = iter(todo)
+            while True:
+                if self.should_cancel():
+                    cancelled = True
+                while not cancelled and len(pending) < self.workers * 2 and (row := next(queue, None)) is not None:
+                    pending.add(executor.submit(self._process_row, row))
+                if not pending:
+                    break
+                done, pending = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._buffer.append(future.result())
+                    self._processed += 1
+                while len(self._buffer) >= self.batch_size:
+                    self._flush()
+                self._report_progress()
+        while self._buffer:
+            self._flush()
+        summary = {
+            "journal": str(self.journal.path),
+            "total": len(self.rows),
+            "cancelled": cancelled,
+            **summarize_report(self.journal.report),
+        }
+        logger.info("Bulk import finished: %s", summary)
+        return summary
+
+    def _process_row(self, row: ImportRow) -> tuple[ImportRow, ImportOutcome, dict[str, Any] | None]:
+        outcome = ImportOutcome(line=row.line, identifier=row.identifier, library=row.library, status="error")
+        try:
+            manifest_url, doc_id, library = self.resolve_row_fn(row)
+            outcome.library = library
+            if not manifest_url:
+                outcome.status = "not_found"
+                outcome.message = "Nessun manifest trovato per questo identificativo."
+                return row, outcome, None
+            outcome.manifest_url = manifest_url
+            outcome.doc_id = str(doc_id or "")
+            entry = self.prepare_entry_fn(manifest_url, outcome.doc_id, library)
+        except Exception as exc:
+            logger.warning("Bulk import of %r (line %s) failed: %s", row.identifier, row.line, exc)
+            outcome.message = str(exc)[:300]
+            return row, outcome, None
+        outcome.status = "imported"
+        return row, outcome, entry
+
+    def _flush(self) -> None:
+        batch, self._buffer = self._buffer[: self.batch_size], self._buffer[self.batch_size :]
+        entries = [entry for _row, outcome, entry in batch if outcome.status == "imported" and entry is not None]
+        if entries:
+            try:
+                self.persist_batch_fn(entries)
+            except Exception as exc:
+                logger.exception("Bulk import batch of %d entries could not be saved", len(entries))
+                for _row, outcome, entry in batch:
+                    if entry is not None:
+                        outcome.status = "error"
+                        outcome.message = f"Salvataggio fallito: {str(exc)[:200]}"
+        self.journal.record([(row, outcome) for row, outcome, _entry in batch])
+
+    def _report_progress(self) -> None:
+        if self.progress_callback is None:
+            return
+        total = len(self.rows)
+        self.progress_callback(self._processed, total, f"Importati {self._processed}/{total}")
+
+
+def run_bulk_import(rows: list[ImportRow], **options: Any) -> dict[str, Any]:
+    """Run a `BulkImport` over `rows`; `options` are the `BulkImport` keyword arguments."""
+    return BulkImport(rows, **options).run()
+
+
+def bulk_import_workers() -> int:
+    """Return the configured number of concurrent import workers."""
+    try:
+        value = int(get_config_manager().get_setting("discovery.bulk_import_workers", DEFAULT_WORKERS))
+    except (TypeError, ValueError):
+        value = DEFAULT_WORKERS
+    return max(1, min(value, 16))
+
+
+def prepare_saved_entry(manifest_url: str, doc_id: str, library: str) -> dict[str, Any]:
+    """Fetch manifest data and local prefetch files for one entry; return one `upsert_saved_entries` entry."""
+    if not doc_id:
+        raise ValueError("Impossibile determinare l'ID del documento.")
+    info = analyze_manifest(manifest_url)
+    preferred_title = resolve_saved_entry_title(info, doc_id)
+    pages = int(info.get("pages", 0) or 0)
+    manifest_cached, prefetch_thumb = persist_prefetch_light(
+        manifest_url,
+        doc_id,
+        library,
+        title=preferred_title,
+        description=str(info.get("description") or ""),
+        pages=pages,
+        thumbnail_url=str(info.get("thumbnail") or ""),
+        get_json_fn=fetch_manifest_dict,
+    )
+    return {
+        "manifest_url": manifest_url,
+        "doc_id": doc_id,
+        "library": library,
+        "label": info.get("label", doc_id),
+        "description": info.get("description", ""),
+        "pages": pages,
+        "has_native_pdf": info.get("has_native_pdf"),
+        "catalog_title": info.get("catalog_title", ""),
+        "author": info.get("author", ""),
+        "publisher": info.get("publisher", ""),
+        "attribution": info.get("attribution", ""),
+        "shelfmark": info.get("shelfmark", ""),
+        "date_label": info.get("date_label", ""),
+        "language_label": info.get("language_label", ""),
+        "source_detail_url": info.get("source_detail_url", ""),
+        "reference_text": str(info.get("reference_text") or "").strip(),
+        "item_type": info.get("item_type", "non classificato"),
+        "item_type_confidence": float(info.get("item_type_confidence", 0.0) or 0.0),
+        "item_type_reason": info.get("item_type_reason", ""),
+        "metadata_json": info.get("metadata_json", "{}"),
+        "manifest_local_available": manifest_cached,
+        "thumbnail_url": prefetch_thumb,
+        "preferred_title": preferred_title,
+    }
+
+
+def persist_saved_entries(entries: list[dict[str, Any]]) -> None:
+    """Upsert a batch of prepared entries into the vault in one transaction."""
+    upsert_saved_entries(entries)
+
+
+def bulk_import_task(rows: list[ImportRow], *, import_id: str, progress_callback=None, should_cancel=None):
+    """JobManager task body for one import list."""
+    return run_bulk_import(
+        rows,
+        prepare_entry_fn=prepare_saved_entry,
+        persist_batch_fn=persist_saved_entries,
+        journal_path=import_journal_path(import_id),
+        workers=bulk_import_workers(),
+        progress_callback=progress_callback,
+        should_cancel=should_cancel,
+    )
+
+
+def start_bulk_import(rows: list[ImportRow]) -> tuple[str, str]:
+    """Submit `rows` as a background `bulk_import` job; return `(job_id, import_id)`."""
+    import_id = import_id_for(rows)
+    for job_id, info in job_manager.list_jobs(active_only=True).items():
+        if info.get("type") == "bulk_import" and (info.get("kwargs") or {}).get("import_id") == import_id:
+            return job_id, import_id
+    job_id = job_manager.submit_job(
+        bulk_import_task,
+        args=(rows,),
+        kwargs={"import_id": import_id},
+        job_type="bulk_import",
+    )
+    return job_id, import_id
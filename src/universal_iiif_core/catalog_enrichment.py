@@ -0,0 +1,152 @@
+"""Cached, deferred enrichment of catalog metadata from library detail pages.
+
+Many manifests only carry a shelfmark; the human reference ("Dante, Commedia")
+lives on the library's HTML detail page. Scraping that page is slow and
+unrelated to fetching scans, so downloads record the manifest-only catalog
+immediately and hand the scrape to `CatalogEnrichmentQueue`, which fills the
+reference text into the vault and `metadata.json` when the page arrives.
+
+Scraped fields are kept per detail-page URL under
+`<temp>/_cache/catalog_pages/<key[:2]>/<key>.json`, together with the fetch
+time, so re-downloading, re-analysing or previewing the same item never
+scrapes the page again while the entry is fresh. Failed fetches are not
+cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TTL_DAYS = 30
+_QUEUE_WORKERS = 2
+
+EnrichmentTask = Callable[[], None]
+
+
+class CatalogPageCache:
+    """Per-URL JSON store of fields scraped from external catalog pages."""
+
+    def __init__(self, root: Path, *, ttl_s: float) -> None:
+        """Initialize the cache under `root` (created lazily); `ttl_s <= 0` disables it."""
+        self.root = Path(root)
+        self.ttl_s = float(ttl_s)
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        """Return the cached fields for `url` when present and fresh."""
+        if self.ttl_s <= 0 or not url:
+            return None
+        try:
+            payload = json.loads(self._path(url).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("url") != url:
+            return None
+        if time.time() - float(payload.get("fetched_at") or 0) > self.ttl_s:
+            return None
+        return {
+            "reference_text": str(payload.get("reference_text") or ""),
+            "external_fields": dict(payload.get("external_fields") or {}),
+        }
+
+    def put(self, url: str, data: dict[str, Any]) -> None:
+        """Store scraped fields for `url` with the current fetch time."""
+        if self.ttl_s <= 0 or not url:
+            return
+        path = self._path(url)
+        payload = {
+            "url": url,
+            "fetched_at": time.time(),
+            "reference_text": str(data.get("reference_text") or ""),
+            "external_fields": dict(data.get("external_fields") or {}),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(path)
+        except OSError:
+            logger.debug("Catalog page cache write failed for %s", url, exc_info=True)
+
+
+def get_catalog_page_cache() -> CatalogPageCache:
+    """Return the cache configured by `settings.library.catalog_cache_ttl_days` (0 disables)."""
+    from .config_manager import get_config_manager
+
+    cm = get_config_manager()
+    try:
+        ttl_days = float(cm.get_setting("library.catalog_cache_ttl_days", DEFAULT_TTL_DAYS))
+    except (TypeError, ValueError):
+        ttl_days = DEFAULT_TTL_DAYS
+    return CatalogPageCache(cm.get_temp_dir() / "_cache" / "catalog_pages", ttl_s=ttl_days * 86400)
+
+
+class CatalogEnrichmentQueue:
+    """Background runner for catalog enrichment, one pending task per key."""
+
+    def __init__(self, *, workers: int = _QUEUE_WORKERS) -> None:
+        """Initialize an idle queue; worker threads start with the first task."""
+        self._workers = max(1, int(workers))
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+
+    def submit(self, key: str, task: EnrichmentTask) -> bool:
+        """Run `task` in the background unless a task for `key` is already waiting or running."""
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="catalog-enrich")
+            self._executor.submit(self._run, key, task)
+        return True
+
+    def _run(self, key: str, task: EnrichmentTask) -> None:
+        try:
+            task()
+        except Exception:
+            logger.warning("Catalog enrichment failed for %s", key, exc_info=True)
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def wait_idle(self, timeout: float = 10.0) -> bool:
+        """Block until no task is pending (used by tests and shutdown paths)."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                if not self._pending:
+                    return True
+            time.sleep(0.02)
+        return False
+
+
+_QUEUE = CatalogEnrichmentQueue()
+
+
+def get_enrichment_queue() -> CatalogEnrichmentQueue:
+    """Return the process-wide enrichment queue."""
+    return _QUEUE
+
+
+def schedule_catalog_enrichment(key: str, task: EnrichmentTask) -> bool:
+    """Queue one enrichment task on the shared queue; see `CatalogEnrichmentQueue.submit`."""
+    with suppress(RuntimeError):
+        return _QUEUE.submit(key, task)
+    return False
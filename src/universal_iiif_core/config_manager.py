@@ -55,6 +55,7 @@ DEFAULT_CONFIG_JSON: dict[str, Any] = {
         },
         "library": {
             "default_mode": "operativa",
+            "catalog_cache_ttl_days": 30,
         },
         "ui": {
             "theme_preset": "rosewater",
@@ -74,6 +75,8 @@ DEFAULT_CONFIG_JSON: dict[str, Any] = {
             "stitch_mode_default": "auto_fallback",
             "iiif_quality": "default",
             "probe_remote_max_resolution": True,
+            "remote_probe_max_workers": 6,
+            "remote_probe_inline_wait_ms": 1500,
             "tile_stitch_max_ram_gb": 2,
             "local_optimize": {
                 "max_long_edge_px": 2600,
@@ -87,6 +90,9 @@ DEFAULT_CONFIG_JSON: dict[str, Any] = {
         "pdf": {
             "viewer_dpi": 150,
             "viewer_jpeg_quality": 95,
+            "raster_workers": 0,
+            "extract_embedded_images": True,
+            "native_download_segments": 4,
             "prefer_native_pdf": True,
             "create_pdf_from_images": False,
             "export": {
@@ -95,6 +101,11 @@ DEFAULT_CONFIG_JSON: dict[str, Any] = {
                 "include_cover": True,
                 "include_colophon": True,
                 "description_rows": 3,
+                "encode_workers": 0,
+                "page_cache_max_bytes": 536870912,
+                "assembly_chunk_pages": 100,
+                "save_garbage": 0,
+                "batch_item_workers": 2,
             },
             "cover": {
                 "logo_path": "",
@@ -237,6 +248,15 @@ DEFAULT_CONFIG_JSON: dict[str, Any] = {
         "network": DEFAULT_NETWORK_SETTINGS,
         "discovery": {
             "max_results_per_provider": 20,
+            "federated_timeout_s": 20,
+            "search_cache_ttl_s": 600,
+            "search_cache_max_entries": 128,
+            "prefetch_next_page": True,
+            "bulk_import_workers": 4,
+            "local_index_enabled": True,
+            "harvest_sources": {},
+            "harvest_max_manifests": 500,
+            "iccu_manifest_cache_ttl_hours": 168,
         },
     },
 }
@@ -227,15 +227,28 @@ def _validate_semantics(data: dict[str, Any], issues: list[ConfigValidationIssue
     _validate_int_range(data, issues, "settings.network.download.default_retry_max_attempts", 1, 10)
     _validate_float_range(data, issues, "settings.network.download.default_backoff_base_s", 1.0, 600.0)
     _validate_float_range(data, issues, "settings.network.download.default_backoff_cap_s", 5.0, 3600.0)
+    _validate_int_range(data, issues, "settings.network.http_cache.max_bytes", 1024 * 1024, 4 * 1024**3)
+    _validate_int_range(data, issues, "settings.network.http_cache.default_ttl_s", 0, 30 * 86400)
+    _validate_int_range(data, issues, "settings.network.http_cache.max_ttl_s", 60, 365 * 86400)
+    _validate_int_range(data, issues, "settings.library.catalog_cache_ttl_days", 0, 365)
     _validate_int_range(data, issues, "settings.ui.items_per_page", 1, 200)
     _validate_int_range(data, issues, "settings.ui.toast_duration", 500, 15000)
     _validate_int_range(data, issues, "settings.ui.studio_recent_max_items", 1, 20)
     _validate_int_range(data, issues, "settings.ui.polling.download_manager_interval_seconds", 1, 30)
     _validate_int_range(data, issues, "settings.ui.polling.download_status_interval_seconds", 1, 30)
     _validate_float_range(data, issues, "settings.images.tile_stitch_max_ram_gb", 0.1, 64.0)
+    _validate_int_range(data, issues, "settings.images.remote_probe_max_workers", 1, 32)
+    _validate_int_range(data, issues, "settings.images.remote_probe_inline_wait_ms", 0, 30000)
     _validate_int_range(data, issues, "settings.images.local_optimize.max_long_edge_px", 512, 12000)
     _validate_int_range(data, issues, "settings.images.local_optimize.jpeg_quality", 10, 100)
     _validate_int_range(data, issues, "settings.pdf.viewer_jpeg_quality", 10, 100)
+    _validate_int_range(data, issues, "settings.pdf.raster_workers", 0, 16)
+    _validate_int_range(data, issues, "settings.pdf.native_download_segments", 1, 16)
+    _validate_int_range(data, issues, "settings.pdf.export.encode_workers", 0, 16)
+    _validate_int_range(data, issues, "settings.pdf.export.page_cache_max_bytes", 0, 20 * 1024**3)
+    _validate_int_range(data, issues, "settings.pdf.export.assembly_chunk_pages", 0, 10000)
+    _validate_int_range(data, issues, "settings.pdf.export.save_garbage", 0, 4)
+    _validate_int_range(data, issues, "settings.pdf.export.batch_item_workers", 1, 8)
     _validate_int_range(data, issues, "settings.thumbnails.page_size", 1, 120)
     _validate_int_range(data, issues, "settings.thumbnails.max_long_edge_px", 64, 2000)
     _validate_int_range(data, issues, "settings.thumbnails.jpeg_quality", 10, 100)
@@ -1,8 +1,12 @@
 from .contracts import ProviderResolution, ResolutionStatus
+from .federated import FederatedOutcome, federated_providers, iter_federated_search
 from .orchestrator import resolve_provider_input
 
 __all__ = [
+    "FederatedOutcome",
     "ProviderResolution",
     "ResolutionStatus",
+    "federated_providers",
+    "iter_federated_search",
     "resolve_provider_input",
 ]
@@ -0,0 +1,125 @@
+"""Federated discovery search: one query fanned out to every searchable provider.
+
+Providers are queried concurrently and their outcomes are yielded as soon as
+each one answers, so a slow catalogue never holds back the fast ones. Results
+are de-duplicated across providers by manifest URL (first answer wins).
+Providers still running when the deadline expires are reported as timed out;
+their threads are abandoned and end with their own HTTP timeouts.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from universal_iiif_core.logger import get_logger
+from universal_iiif_core.providers import IIIFProvider, iter_providers
+from universal_iiif_core.resolvers.models import SearchResult
+
+from .orchestrator import ProviderSearchWithProviderFn
+
+logger = get_logger(__name__)
+
+FederatedStatus = Literal["results", "empty", "timeout", "error"]
+
+DEFAULT_DEADLINE_S = 20.0
+
+
+@dataclass
+class FederatedOutcome:
+    """What one provider contributed to a federated search."""
+
+    provider: IIIFProvider
+    status: FederatedStatus
+    results: list[SearchResult] = field(default_factory=list)
+    duplicates: int = 0
+    elapsed_s: float = 0.0
+    error: str = ""
+
+
+def federated_providers() -> list[IIIFProvider]:
+    """Return the providers taking part in a federated search, in UI order."""
+    return [provider for provider in iter_providers(include_generic=False) if provider.supports_search()]
+
+
+def manifest_dedupe_key(result: SearchResult) -> str:
+    """Return the key identifying the same document across providers."""
+    manifest = str(result.get("manifest") or "").strip()
+    if manifest:
+        normalized = manifest.split("#", 1)[0].rstrip("/").lower()
+        return normalized.removeprefix("https://").removeprefix("http://")
+    return f"{result.get('library') or ''}:{result.get('id') or ''}"
+
+
+class _Deduper:
+    def __init__(self) -> None:
+        self._seen: set[str] = set()
+
+    def filter(self, results: list[SearchResult]) -> tuple[list[SearchResult], int]:
+        fresh: list[SearchResult] = []
+        for result in results:
+            key = manifest_dedupe_key(result)
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            fresh.append(result)
+        return fresh, len(results) - len(fresh)
+
+
+def iter_federated_search(
+    query: str,
+    *,
+    search_with_provider_fn: ProviderSearchWithProviderFn,
+    filters: dict[str, Any] | None = None,
+    providers: list[IIIFProvider] | None = None,
+    deadline_s: float = DEFAULT_DEADLINE_S,
+) -> Iterator[FederatedOutcome]:
+    """Yield one `FederatedOutcome` per provider, in the order providers answer.
+
+    Every provider starts immediately and must answer within `deadline_s`
+    seconds of the search start; later answers are dropped.
+    """
+    text = (query or "").strip()
+    selected = list(providers if providers is not None else federated_providers())
+    if not text or not selected:
+        return
+    payload = dict(filters or {})
+    deduper = _Deduper()
+    started = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=len(selected), thread_name_prefix="federated-search")
+    try:
+        pending: dict[Future, IIIFProvider] = {
+            executor.submit(search_with_provider_fn, provider, text, dict(payload)): provider for provider in selected
+        }
+        while pending:
+            remaining = deadline_s - (time.monotonic() - started)
+            if remaining <= 0:
+                break
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                provider = pending.pop(future)
+                yield _outcome_for(provider, future, deduper, time.monotonic() - started)
+        for provider in pending.values():
+            logger.info("Federated search: %s did not answer within %.0fs", provider.key, deadline_s)
+            yield FederatedOutcome(provider=provider, status="timeout", elapsed_s=deadline_s)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _outcome_for(provider: IIIFProvider, future: Future, deduper: _Deduper, elapsed_s: float) -> FederatedOutcome:
+    try:
+        results = list(future.result() or [])
+    except Exception as exc:
+        logger.warning("Federated search: %s failed: %s", provider.key, exc)
+        return FederatedOutcome(provider=provider, status="error", elapsed_s=elapsed_s, error=str(exc)[:200])
+    fresh, duplicates = deduper.filter(results)
+    return FederatedOutcome(
+        provider=provider,
+        status="results" if fresh else "empty",
+        results=fresh,
+        duplicates=duplicates,
+        elapsed_s=elapsed_s,
+    )
@@ -0,0 +1,366 @@
+"""Incremental harvester that fills the local catalog index from provider listings.
+
+A harvest walks the IIIF Collections (Presentation 2 and 3, paged or not) and
+XML sitemaps configured for a provider in `settings.discovery.harvest_sources`,
+records every manifest they list, then reads the header of the manifests that
+are still missing shelfmark, date and language.
+
+Every document is tracked in the index's `harvest_state` table:
+
+- an interrupted harvest resumes from the documents still pending;
+- a new pass revalidates each known document with `If-None-Match` /
+  `If-Modified-Since`, so unchanged listings cost a 304 and nothing else;
+- manifests whose header was already read are never fetched again.
+
+All requests go through the shared HTTP client, so provider rate limits and
+per-host concurrency apply as for any other download.
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import requests
+from defusedxml import ElementTree as DefusedET
+
+from universal_iiif_core.discovery.local_index import HarvestDocument, IndexRecord, LocalCatalogIndex, get_local_index
+from universal_iiif_core.http_client import get_http_client
+from universal_iiif_core.library_catalog import flatten_iiif_value, parse_manifest_catalog
+from universal_iiif_core.logger import get_logger
+from universal_iiif_core.logic.download_helpers import derive_identifier
+from universal_iiif_core.providers import get_provider
+from universal_iiif_core.resolvers.manifest_stream import ManifestHeader, read_manifest_header
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_MANIFESTS = 500
+_HEADER_WORKERS = 4
+_HEADER_BATCH = 50
+_INDEX_FIELDS = ("@id", "id", "label", "title", "description", "metadata", "thumbnail", "seeAlso")
+_COLLECTION_TYPES = {"sc:Collection", "Collection"}
+_MANIFEST_TYPES = {"sc:Manifest", "Manifest"}
+
+# sitemaps.org caps a sitemap at 50 MB uncompressed; `.xml.gz` bodies are inflated up to that.
+_MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+_GZIP_MAGIC = b"\x1f\x8b"
+
+ManifestRef = tuple[str, str, str]
+
+
+def _node_id(node: dict[str, Any]) -> str:
+    return str(node.get("@id") or node.get("id") or "").strip()
+
+
+def _node_type(node: dict[str, Any]) -> str:
+    return str(node.get("@type") or node.get("type") or "")
+
+
+def _thumbnail_url(value: Any) -> str:
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    if isinstance(value, dict):
+        return _node_id(value)
+    return str(value or "").strip()
+
+
+def parse_collection(document: dict[str, Any]) -> tuple[list[str], list[ManifestRef]]:
+    """Split a IIIF Collection into child collection URLs and `(url, label, thumbnail)` manifest refs.
+
+    Handles Presentation 2 `collections` / `manifests` / `members`, Presentation 3 `items`, and
+    the `first` / `next` links of paged collections.
+    """
+    children: list[str] = []
+    manifests: list[ManifestRef] = []
+    nodes: list[tuple[Any, str]] = [(node, "sc:Collection") for node in document.get("collections") or []]
+    nodes += [(node, "sc:Manifest") for node in document.get("manifests") or []]
+    nodes += [(node, "") for key in ("members", "items") for node in document.get(key) or []]
+    for node, implied_type in nodes:
+        if not isinstance(node, dict) or not _node_id(node):
+            continue
+        node_type = _node_type(node) or implied_type
+        if node_type in _COLLECTION_TYPES:
+            children.append(_node_id(node))
+        elif node_type in _MANIFEST_TYPES:
+            label = flatten_iiif_value(node.get("label") or node.get("title"))
+            manifests.append((_node_id(node), label, _thumbnail_url(node.get("thumbnail"))))
+    for key in ("first", "next"):
+        link = document.get(key)
+        link_url = _node_id(link) if isinstance(link, dict) else str(link or "").strip()
+        if link_url and link_url != _node_id(document):
+            children.append(link_url)
+    return children, manifests
+
+
+def _inflate_sitemap(body: bytes) -> bytes:
+    """Decompress a gzipped (`.xml.gz`) sitemap body; plain XML is returned unchanged."""
+    if not body.startswith(_GZIP_MAGIC):
+        return body
+    inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    data = inflater.decompress(body, _MAX_SITEMAP_BYTES + 1)
+    if len(data) > _MAX_SITEMAP_BYTES:
+        raise ValueError(f"Sitemap exceeds {_MAX_SITEMAP_BYTES} bytes once decompressed")
+    return data
+
+
+def parse_sitemap(body: bytes) -> tuple[list[str], list[str]]:
+    """Return `(child sitemap URLs, page URLs)` from a sitemap or sitemap index, gzipped or not."""
+    root = DefusedET.fromstring(_inflate_sitemap(body))
+    locs = [
+        (element.text or "").strip()
+        for element in root.iter()
+        if element.tag.rsplit("}", 1)[-1] == "loc" and (element.text or "").strip()
+    ]
+    if root.tag.rsplit("}", 1)[-1] == "sitemapindex":
+        return locs, []
+    return [], locs
+
+
+def document_kind(url: str) -> str:
+    """Guess whether a configured source is a sitemap or a IIIF Collection."""
+    lowered = url.lower().split("?", 1)[0]
+    return "sitemap" if lowered.endswith((".xml", ".xml.gz")) or "sitemap" in lowered else "collection"
+
+
+class CatalogHarvester:
+    """Harvest one provider's listings into a `LocalCatalogIndex`; see the module docstring.
+
+    Args:
+        provider_key: Provider registry key the harvested records belong to.
+        sources: Collection and sitemap URLs to start from.
+        index: Target index, the shared one by default.
+        max_manifests: Upper bound on manifest headers read per run (0 skips the header phase).
+        progress_callback: `(done, total, message)` reporter.
+        should_cancel: Polled between documents and header batches.
+    """
+
+    def __init__(
+        self,
+        provider_key: str,
+        sources: list[str],
+        *,
+        index: LocalCatalogIndex | None = None,
+        max_manifests: int = DEFAULT_MAX_MANIFESTS,
+        progress_callback: Callable[..., Any] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+    ) -> None:
+        """Initialize the harvester; nothing is fetched until `run()`."""
+        self.provider = get_provider(provider_key)
+        self.sources = [str(url).strip() for url in sources if str(url or "").strip()]
+        self.index = index or get_local_index()
+        self.max_manifests = max(0, int(max_manifests))
+        self.progress_callback = progress_callback
+        self.should_cancel = should_cancel or (lambda: False)
+        self.stats = {"documents": 0, "not_modified": 0, "errors": 0, "manifests": 0, "headers": 0}
+
+    def run(self) -> dict[str, Any]:
+        """Walk the listings, then read missing manifest headers; return the run summary."""
+        key = self.provider.key
+        resumed = self.index.start_harvest(key, [(url, document_kind(url)) for url in self.sources])
+        cancelled = False
+        while (document := self.index.next_document(key)) is not None:
+            if self.should_cancel():
+                cancelled = True
+                break
+            self._harvest_document(document)
+            done = self.stats["documents"] + self.stats["not_modified"] + self.stats["errors"]
+            self._report(done, done + self.index.pending_documents(key), f"Elenchi letti: {done}")
+        if not cancelled:
+            cancelled = self._read_headers()
+        summary = {
+            "library": key,
+            "resumed": resumed,
+            "cancelled": cancelled,
+            "indexed": self.index.count(key),
+            **self.stats,
+        }
+        logger.info("Catalog harvest finished: %s", summary)
+        return summary
+
+    def _report(self, done: int, total: int, message: str) -> None:
+        if self.progress_callback is not None:
+            self.progress_callback(done, max(total, done), message)
+
+    def _harvest_document(self, document: HarvestDocument) -> None:
+        key = self.provider.key
+        headers = {}
+        if document.etag:
+            headers["If-None-Match"] = document.etag
+        if document.last_modified:
+            headers["If-Modified-Since"] = document.last_modified
+        try:
+            response = get_http_client().get(document.url, headers=headers or None)
+            if response.status_code == 304:
+                self.stats["not_modified"] += 1
+                self.index.finish_document(key, document.url)
+                return
+            if response.status_code != 200:
+                raise requests.HTTPError(f"HTTP {response.status_code}")
+            if document.kind == "sitemap":
+                children, manifests = self._parse_sitemap_document(response.content)
+            else:
+                children, manifests = parse_collection(json.loads(response.content))
+        except Exception as exc:
+            logger.warning("Harvest of %s failed: %s", document.url, exc)
+            self.stats["errors"] += 1
+            self.index.finish_document(key, document.url, error=str(exc) or type(exc).__name__)
+            return
+        self.index.enqueue(key, [(url, document.kind) for url in children])
+        self.stats["manifests"] += self.index.add_references(self._references(manifests))
+        self.stats["documents"] += 1
+        self.index.finish_document(
+            key,
+            document.url,
+            etag=response.headers.get("ETag") or "",
+            last_modified=response.headers.get("Last-Modified") or "",
+        )
+
+    def _parse_sitemap_document(self, body: bytes) -> tuple[list[str], list[ManifestRef]]:
+        children, pages = parse_sitemap(body)
+        return children, [(url, "", "") for url in map(self._manifest_for_page, pages) if url]
+
+    def _manifest_for_page(self, page_url: str) -> str:
+        """Map a sitemap entry to a manifest URL: directly, or through the provider's resolver."""
+        lowered = page_url.lower().split("?", 1)[0]
+        if "manifest" in lowered or lowered.endswith(".json"):
+            return page_url
+        resolver = self.provider.resolver()
+        try:
+            if resolver.can_resolve(page_url):
+                manifest_url, _doc_id = resolver.get_manifest_url(page_url)
+                return str(manifest_url or "")
+        except Exception:
+            logger.debug("Sitemap entry %s could not be resolved", page_url, exc_info=True)
+        return ""
+
+    def _references(self, manifests: list[ManifestRef]) -> Iterator[IndexRecord]:
+        for url, label, thumbnail in manifests:
+            yield IndexRecord(
+                provider=self.provider.key,
+                manifest_url=url,
+                doc_id=derive_identifier(url, None, self.provider.key, None),
+                label=label,
+                thumbnail=thumbnail,
+            )
+
+    def _read_headers(self) -> bool:
+        """Fill header fields for up to `max_manifests` records; return True when cancelled."""
+        after_rowid = 0
+        with ThreadPoolExecutor(max_workers=_HEADER_WORKERS, thread_name_prefix="catalog-harvest") as executor:
+            while self.stats["headers"] < self.max_manifests:
+                if self.should_cancel():
+                    return True
+                limit = min(_HEADER_BATCH, self.max_manifests - self.stats["headers"])
+                batch = self.index.records_missing_header(self.provider.key, after_rowid=after_rowid, limit=limit)
+                if not batch:
+                    break
+                after_rowid = batch[-1][0]
+                for record in executor.map(self._indexed_header, [record for _rowid, record in batch]):
+                    if record is not None:
+                        self.index.set_header(record)
+                        self.stats["headers"] += 1
+                headers_read = self.stats["headers"]
+                self._report(headers_read, self.max_manifests, f"Manifest indicizzati: {headers_read}")
+        return False
+
+    def _indexed_header(self, record: IndexRecord) -> IndexRecord | None:
+        header = read_manifest_header(
+            record.manifest_url,
+            _INDEX_FIELDS,
+            count_canvases=False,
+            stop_when=_header_ready,
+        )
+        if header is None:
+            return None
+        catalog = parse_manifest_catalog(header.as_manifest(), record.manifest_url, record.doc_id)
+        return IndexRecord(
+            provider=record.provider,
+            manifest_url=record.manifest_url,
+            doc_id=record.doc_id,
+            label=str(catalog.get("catalog_title") or catalog.get("label") or record.label),
+            shelfmark=str(catalog.get("shelfmark") or ""),
+            date_label=str(catalog.get("date_label") or ""),
+            language_label=str(catalog.get("language_label") or ""),
+            thumbnail=_thumbnail_url(header.fields.get("thumbnail")) or record.thumbnail,
+        )
+
+
+def _header_ready(header: ManifestHeader) -> bool:
+    """Stop at the canvas list: descriptive fields precede it in practically every manifest."""
+    return set(_INDEX_FIELDS).issubset(header.fields) or bool({"items", "sequences"} & header.keys)
+
+
+def harvest_sources(provider_key: str) -> list[str]:
+    """Return the configured harvest URLs of a provider."""
+    from universal_iiif_core.config_manager import get_config_manager
+
+    sources = get_config_manager().get_setting("discovery.harvest_sources", {}) or {}
+    urls = sources.get(get_provider(provider_key).key) if isinstance(sources, dict) else None
+    if isinstance(urls, str):
+        urls = [urls]
+    return [str(url) for url in urls or [] if str(url or "").strip()]
+
+
+def harvest_max_manifests() -> int:
+    """Return the configured per-run bound on manifest headers."""
+    from universal_iiif_core.config_manager import get_config_manager
+
+    try:
+        value = int(get_config_manager().get_setting("discovery.harvest_max_manifests", DEFAULT_MAX_MANIFESTS))
+    except (TypeError, ValueError):
+        value = DEFAULT_MAX_MANIFESTS
+    return max(0, value)
+
+
+def run_catalog_harvest(
+    library: str,
+    urls: list[str] | None = None,
+    *,
+    progress_callback: Callable[..., Any] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
+) -> dict[str, Any]:
+    """Harvest `library` from `urls`, or from its configured sources; JobManager task body.
+
+    Raises:
+        ValueError: When no source URL is given or configured for the provider.
+    """
+    sources = list(urls or []) or harvest_sources(library)
+    if not sources:
+        raise ValueError(f"Nessuna sorgente di indicizzazione configurata per {library}.")
+    return CatalogHarvester(
+        library,
+        sources,
+        max_manifests=harvest_max_manifests(),
+        progress_callback=progress_callback,
+        should_cancel=should_cancel,
+    ).run()
+
+
+def start_catalog_harvest(library: str, urls: list[str] | None = None) -> str:
+    """Submit a background `catalog_harvest` job, reusing the running one for the same provider."""
+    from universal_iiif_core.jobs import job_manager
+
+    key = get_provider(library).key
+    for job_id, info in job_manager.list_jobs(active_only=True).items():
+        if info.get("type") == "catalog_harvest" and (info.get("args") or (None,))[0] == key:
+            return job_id
+    return job_manager.submit_job(
+        run_catalog_harvest,
+        args=(key,),
+        kwargs={"urls": list(urls or [])},
+        job_type="catalog_harvest",
+    )
+
+
+__all__ = [
+    "CatalogHarvester",
+    "document_kind",
+    "harvest_sources",
+    "parse_collection",
+    "parse_sitemap",
+    "run_catalog_harvest",
+    "start_catalog_harvest",
+]
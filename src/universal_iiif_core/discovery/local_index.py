@@ -0,0 +1,402 @@
+"""Local SQLite/FTS5 catalog index filled by the collection harvester.
+
+Live provider searches are remote calls (several of them HTML scrapes), so
+they are slow, rate-limited and unavailable offline. `CatalogHarvester`
+copies what providers publish in their IIIF Collections and sitemaps into
+this index; `search_local_index` answers a provider query from it in a few
+milliseconds and returns None for a miss, letting the provider registry fall
+back to the live search. Until a provider's harvest is complete its local
+hits are only merged into the live results, never substituted for them.
+
+The index is derived data: it lives under `<temp>/_cache/` next to the other
+caches and can be rebuilt at any time by harvesting again. The same database
+keeps the harvest queue (`harvest_state`), which is what makes a harvest
+resumable and lets unchanged documents be revalidated with conditional GETs.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from universal_iiif_core.discovery.search_adapters import _max_results_from_payload, _page_from_payload
+from universal_iiif_core.logger import get_logger
+from universal_iiif_core.resolvers.models import SearchResult
+
+logger = get_logger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    provider TEXT NOT NULL,
+    manifest_url TEXT NOT NULL,
+    doc_id TEXT NOT NULL DEFAULT '',
+    label TEXT NOT NULL DEFAULT '',
+    shelfmark TEXT NOT NULL DEFAULT '',
+    date_label TEXT NOT NULL DEFAULT '',
+    language_label TEXT NOT NULL DEFAULT '',
+    thumbnail TEXT NOT NULL DEFAULT '',
+    needs_header INTEGER NOT NULL DEFAULT 1,
+    updated_at REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (provider, manifest_url)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS records_fts USING fts5(
+    label, shelfmark, date_label, language_label,
+    content='records', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS records_ai AFTER INSERT ON records BEGIN
+    INSERT INTO records_fts(rowid, label, shelfmark, date_label, language_label)
+    VALUES (new.rowid, new.label, new.shelfmark, new.date_label, new.language_label);
+END;
+CREATE TRIGGER IF NOT EXISTS records_ad AFTER DELETE ON records BEGIN
+    INSERT INTO records_fts(records_fts, rowid, label, shelfmark, date_label, language_label)
+    VALUES ('delete', old.rowid, old.label, old.shelfmark, old.date_label, old.language_label);
+END;
+CREATE TRIGGER IF NOT EXISTS records_au AFTER UPDATE ON records BEGIN
+    INSERT INTO records_fts(records_fts, rowid, label, shelfmark, date_label, language_label)
+    VALUES ('delete', old.rowid, old.label, old.shelfmark, old.date_label, old.language_label);
+    INSERT INTO records_fts(rowid, label, shelfmark, date_label, language_label)
+    VALUES (new.rowid, new.label, new.shelfmark, new.date_label, new.language_label);
+END;
+CREATE TABLE IF NOT EXISTS harvest_state (
+    provider TEXT NOT NULL,
+    url TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    etag TEXT NOT NULL DEFAULT '',
+    last_modified TEXT NOT NULL DEFAULT '',
+    fetched_at REAL NOT NULL DEFAULT 0,
+    error TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (provider, url)
+);
+"""
+
+
+@dataclass(frozen=True)
+class IndexRecord:
+    """One manifest known to the local index."""
+
+    provider: str
+    manifest_url: str
+    doc_id: str = ""
+    label: str = ""
+    shelfmark: str = ""
+    date_label: str = ""
+    language_label: str = ""
+    thumbnail: str = ""
+
+
+@dataclass(frozen=True)
+class HarvestDocument:
+    """A queued Collection or sitemap document with its last validators."""
+
+    url: str
+    kind: str
+    etag: str = ""
+    last_modified: str = ""
+
+
+def build_fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, as a prefix."""
+    tokens = _TOKEN_RE.findall(str(text or ""))
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+class LocalCatalogIndex:
+    """SQLite store of harvested manifest records and of the harvest queue."""
+
+    def __init__(self, db_path: Path | str) -> None:
+        """Open (and create when missing) the index at `db_path`."""
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    # -- records -----------------------------------------------------------
+
+    def add_references(self, records: Iterable[IndexRecord]) -> int:
+        """Insert manifests listed by a Collection or sitemap; known manifests keep their header data."""
+        rows = [(r.provider, r.manifest_url, r.doc_id, r.label, r.shelfmark, r.thumbnail, time.time()) for r in records]
+        if not rows:
+            return 0
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                """
+                INSERT INTO records (provider, manifest_url, doc_id, label, shelfmark, thumbnail, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(provider, manifest_url) DO UPDATE SET
+                    label = CASE WHEN records.needs_header = 1 AND excluded.label != ''
+                        THEN excluded.label ELSE records.label END,
+                    thumbnail = CASE WHEN records.thumbnail = '' THEN excluded.thumbnail ELSE records.thumbnail END
+                """,
+                rows,
+            )
+            return conn.total_changes - before
+
+    def set_header(self, record: IndexRecord) -> None:
+        """Store the fields read from a manifest header and mark the record complete."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE records SET doc_id = ?, label = ?, shelfmark = ?, date_label = ?, language_label = ?,
+                    thumbnail = CASE WHEN ? != '' THEN ? ELSE thumbnail END, needs_header = 0, updated_at = ?
+                WHERE provider = ? AND manifest_url = ?
+                """,
+                (
+                    record.doc_id,
+                    record.label,
+                    record.shelfmark,
+                    record.date_label,
+                    record.language_label,
+                    record.thumbnail,
+                    record.thumbnail,
+                    time.time(),
+                    record.provider,
+                    record.manifest_url,
+                ),
+            )
+
+    def records_missing_header(self, provider: str, *, after_rowid: int = 0, limit: int = 100) -> list[tuple]:
+        """Return `(rowid, IndexRecord)` pairs still lacking header fields, in insertion order."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT rowid, * FROM records WHERE provider = ? AND needs_header = 1 AND rowid > ?
+                ORDER BY rowid LIMIT ?
+                """,
+                (provider, after_rowid, limit),
+            ).fetchall()
+        return [(row["rowid"], _record_from_row(row)) for row in rows]
+
+    def count(self, provider: str | None = None) -> int:
+        """Return the number of indexed manifests, for one provider or overall."""
+        with self._connect() as conn:
+            if provider:
+                return conn.execute("SELECT COUNT(*) FROM records WHERE provider = ?", (provider,)).fetchone()[0]
+            return conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def search(self, provider: str, query: str, *, limit: int = 20, offset: int = 0) -> tuple[list[IndexRecord], int]:
+        """Return one page of records matching `query` for `provider`, and the total match count."""
+        fts_query = build_fts_query(query)
+        if not fts_query:
+            return [], 0
+        with self._connect() as conn:
+            try:
+                total = conn.execute(
+                    """
+                    SELECT COUNT(*) FROM records_fts JOIN records ON records.rowid = records_fts.rowid
+                    WHERE records_fts MATCH ? AND records.provider = ?
+                    """,
+                    (fts_query, provider),
+                ).fetchone()[0]
+                if not total:
+                    return [], 0
+                rows = conn.execute(
+                    """
+                    SELECT records.* FROM records_fts JOIN records ON records.rowid = records_fts.rowid
+                    WHERE records_fts MATCH ? AND records.provider = ?
+                    ORDER BY bm25(records_fts, 4.0, 8.0, 1.0, 1.0), records.label LIMIT ? OFFSET ?
+                    """,
+                    (fts_query, provider, limit, offset),
+                ).fetchall()
+            except sqlite3.OperationalError:
+                logger.debug("Local index query failed for %r", query, exc_info=True)
+                return [], 0
+        return [_record_from_row(row) for row in rows], int(total)
+
+    # -- harvest queue -----------------------------------------------------
+
+    def start_harvest(self, provider: str, roots: Iterable[tuple[str, str]]) -> bool:
+        """Queue `roots` (`(url, kind)` pairs); return True when an interrupted harvest is resumed instead.
+
+        A new pass re-queues every document seen by earlier passes, so each one is revalidated.
+        """
+        with self._connect() as conn:
+            resumed = bool(
+                conn.execute(
+                    "SELECT 1 FROM harvest_state WHERE provider = ? AND status = 'pending' LIMIT 1", (provider,)
+                ).fetchone()
+            )
+            if not resumed:
+                conn.execute("UPDATE harvest_state SET status = 'pending' WHERE provider = ?", (provider,))
+        self.enqueue(provider, roots)
+        return resumed
+
+    def enqueue(self, provider: str, documents: Iterable[tuple[str, str]]) -> None:
+        """Queue documents not already known to this provider's harvest."""
+        rows = [(provider, url, kind) for url, kind in documents if url]
+        if rows:
+            with self._connect() as conn:
+                conn.executemany("INSERT OR IGNORE INTO harvest_state (provider, url, kind) VALUES (?, ?, ?)", rows)
+
+    def next_document(self, provider: str) -> HarvestDocument | None:
+        """Return the next pending document of a harvest, or None when the pass is finished."""
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT url, kind, etag, last_modified FROM harvest_state
+                WHERE provider = ? AND status = 'pending' ORDER BY rowid LIMIT 1
+                """,
+                (provider,),
+            ).fetchone()
+        if row is None:
+            return None
+        return HarvestDocument(row["url"], row["kind"], row["etag"], row["last_modified"])
+
+    def finish_document(
+        self, provider: str, url: str, *, etag: str | None = None, last_modified: str | None = None, error: str = ""
+    ) -> None:
+        """Mark a document processed; validators are kept unless new ones are given."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE harvest_state SET status = ?, etag = COALESCE(?, etag),
+                    last_modified = COALESCE(?, last_modified), fetched_at = ?, error = ?
+                WHERE provider = ? AND url = ?
+                """,
+                ("error" if error else "done", etag, last_modified, time.time(), error[:300], provider, url),
+            )
+
+    def pending_documents(self, provider: str) -> int:
+        """Return how many documents of the current pass are still queued."""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM harvest_state WHERE provider = ? AND status = 'pending'", (provider,)
+            ).fetchone()[0]
+
+    def harvest_complete(self, provider: str) -> bool:
+        """Return True when a harvest of `provider` finished with nothing pending, failed or header-less.
+
+        Only then does the index hold everything the provider publishes; a partial index
+        (interrupted pass, failed documents, `harvest_max_manifests` reached) is not
+        authoritative for a search.
+        """
+        with self._connect() as conn:
+            states = dict(
+                conn.execute(
+                    "SELECT status, COUNT(*) FROM harvest_state WHERE provider = ? GROUP BY status", (provider,)
+                ).fetchall()
+            )
+            if not states or set(states) != {"done"}:
+                return False
+            return not conn.execute(
+                "SELECT 1 FROM records WHERE provider = ? AND needs_header = 1 LIMIT 1", (provider,)
+            ).fetchone()
+
+
+def _record_from_row(row: sqlite3.Row) -> IndexRecord:
+    return IndexRecord(
+        provider=row["provider"],
+        manifest_url=row["manifest_url"],
+        doc_id=row["doc_id"],
+        label=row["label"],
+        shelfmark=row["shelfmark"],
+        date_label=row["date_label"],
+        language_label=row["language_label"],
+        thumbnail=row["thumbnail"],
+    )
+
+
+def local_index_path() -> Path:
+    """Return where the local catalog index is stored."""
+    from universal_iiif_core.config_manager import get_config_manager
+
+    return get_config_manager().get_temp_dir() / "_cache" / "catalog_index.sqlite"
+
+
+_INDEXES: dict[Path, LocalCatalogIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_local_index() -> LocalCatalogIndex:
+    """Return the index for the configured temp directory, opening it once."""
+    path = local_index_path()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(path)
+        if index is None:
+            index = _INDEXES[path] = LocalCatalogIndex(path)
+    return index
+
+
+def _to_search_result(record: IndexRecord, total_pages: int) -> SearchResult:
+    result: SearchResult = {
+        "id": record.doc_id or record.manifest_url,
+        "title": record.label or record.shelfmark or record.doc_id,
+        "manifest": record.manifest_url,
+        "thumbnail": record.thumbnail,
+        "thumb": record.thumbnail,
+        "library": record.provider,
+        "raw": {"_source": "local_index", "shelfmark": record.shelfmark, "_search_total_pages": total_pages},
+    }
+    if record.date_label:
+        result["date"] = record.date_label
+    if record.language_label:
+        result["language"] = record.language_label
+    return result
+
+
+def search_local_index(
+    provider_key: str, query: str, payload: dict[str, Any]
+) -> tuple[list[SearchResult], bool] | None:
+    """Answer one provider search page from the local index; None means "not indexed, search live".
+
+    Returns the page and whether it is authoritative, i.e. the provider's harvest is
+    complete (see `LocalCatalogIndex.harvest_complete`). Non-authoritative pages must be
+    merged with the live results rather than replace them.
+
+    `payload` is the search-handler payload (`max_results`, `page`, provider filters). Provider
+    filters other than "all" cannot be evaluated locally, so those searches always go live.
+    """
+    from universal_iiif_core.config_manager import get_config_manager
+
+    if not get_config_manager().get_setting("discovery.local_index_enabled", True):
+        return None
+    if any(str(value or "all") != "all" for key, value in payload.items() if key.endswith("_type")):
+        return None
+    if not local_index_path().exists():
+        return None
+    index = get_local_index()
+    max_results = _max_results_from_payload(payload)
+    offset = (_page_from_payload(payload) - 1) * max_results
+    records, total = index.search(provider_key, query, limit=max_results, offset=offset)
+    if not total:
+        return None
+    total_pages = math.ceil(total / max_results)
+    return [_to_search_result(record, total_pages) for record in records], index.harvest_complete(provider_key)
+
+
+def merge_with_live(live: list[SearchResult], local: list[SearchResult]) -> list[SearchResult]:
+    """Append the local results the live page does not already contain (by manifest URL or id).
+
+    Live results come first, so pagination keeps following the live provider.
+    """
+    seen = {key for item in live for key in (item.get("manifest"), item.get("id")) if key}
+    extra = [item for item in local if not ({item.get("manifest"), item.get("id")} & seen)]
+    return [*live, *extra]
+
+
+__all__ = [
+    "HarvestDocument",
+    "IndexRecord",
+    "LocalCatalogIndex",
+    "build_fts_query",
+    "get_local_index",
+    "local_index_path",
+    "merge_with_live",
+    "search_local_index",
+]
@@ -1,4 +1,9 @@
-"""Persistence and prefetch helpers for Discovery handlers."""
+"""Save discovery results into the library without downloading their scans.
+
+Shared by the Discovery "Aggiungi in Libreria" actions and by bulk imports:
+manifest analysis, a light local prefetch (metadata, manifest, preview image)
+and the vault upsert that keeps any existing download state.
+"""
 
 from __future__ import annotations
 
@@ -8,17 +13,76 @@ from io import BytesIO
 from pathlib import Path
 from typing import Any
 
-from studio_ui.common.title_utils import resolve_preferred_title
-from universal_iiif_core.config_manager import get_config_manager
-from universal_iiif_core.http_client import get_http_client
-from universal_iiif_core.logger import get_logger
-from universal_iiif_core.resolvers.parsers import IIIFManifestParser
-from universal_iiif_core.services.storage.vault_manager import VaultManager
-from universal_iiif_core.utils import save_json
+from ..config_manager import get_config_manager
+from ..http_client import get_http_client
+from ..library_catalog import parse_manifest_catalog
+from ..logger import get_logger
+from ..resolvers.manifest_stream import read_manifest_header
+from ..resolvers.parsers import IIIFManifestParser
+from ..services.storage.vault_manager import VaultManager
+from ..title_utils import resolve_preferred_title
+from ..utils import save_json
 
 logger = get_logger(__name__)
 
 
+def analyze_manifest(manifest_url: str) -> dict[str, Any]:
+    """Download and extract simple preview data from a manifest URL.
+
+    Returns a dict with keys: label, description, pages.
+    Raises exceptions on network / parsing errors so callers can handle them.
+    The manifest is streamed: only its top-level fields and first canvas are decoded.
+    """
+    header = read_manifest_header(manifest_url)
+    if header is None or not header.keys:
+        raise ValueError("Manifest vuoto o irraggiungibile")
+    manifest_data = header.as_manifest()
+
+    # Usa il parser centralizzato per metadati robusti
+    parser = IIIFManifestParser()
+    result = parser.parse_manifest(manifest_data, manifest_url=manifest_url)
+    catalog = parse_manifest_catalog(
+        manifest_data,
+        manifest_url=manifest_url,
+        doc_id=str(result.get("id") or ""),
+        enrich_external_reference=True,
+    )
+
+    rendering = manifest_data.get("rendering") or []
+    if isinstance(rendering, dict):
+        rendering = [rendering]
+    has_native_pdf = False
+    for item in rendering:
+        if not isinstance(item, dict):
+            continue
+        fmt = str(item.get("format") or "").lower()
+        url = str(item.get("@id") or item.get("id") or "").lower()
+        if fmt == "application/pdf" or url.endswith(".pdf"):
+            has_native_pdf = True
+            break
+
+    return {
+        "label": catalog.get("label") or result.get("title", "Senza Titolo"),
+        "description": catalog.get("description") or result.get("description", ""),
+        "pages": header.canvas_count,
+        "thumbnail": result.get("thumbnail"),
+        "has_native_pdf": has_native_pdf,
+        "catalog_title": catalog.get("catalog_title") or result.get("title", "Senza Titolo"),
+        "author": catalog.get("author") or result.get("author", ""),
+        "publisher": catalog.get("publisher") or result.get("publisher", ""),
+        "attribution": catalog.get("attribution") or "",
+        "shelfmark": catalog.get("shelfmark") or "",
+        "date_label": catalog.get("date_label") or "",
+        "language_label": catalog.get("language_label") or "",
+        "source_detail_url": catalog.get("source_detail_url") or "",
+        "reference_text": catalog.get("reference_text") or "",
+        "item_type": catalog.get("item_type") or "non classificato",
+        "item_type_confidence": float(catalog.get("item_type_confidence") or 0.0),
+        "item_type_reason": catalog.get("item_type_reason") or "",
+        "metadata_json": catalog.get("metadata_json") or "{}",
+    }
+
+
 def downloads_doc_path(library: str, doc_id: str) -> Path:
     """Resolve a document path under configured downloads root with traversal guard."""
     root = get_config_manager().get_downloads_dir().resolve()
@@ -37,14 +101,12 @@ def find_manuscript_by_id_and_library(doc_id: str, library: str) -> dict | None:
     if not target_id or not target_library:
         return None
 
-    vm = VaultManager()
-    for row in vm.get_all_manuscripts():
-        if str(row.get("id") or "").strip() == target_id and str(row.get("library") or "").strip() == target_library:
-            return row
+    return _same_library_row(VaultManager().get_manuscript(target_id), target_library)
 
-    fallback = vm.get_manuscript(target_id) or {}
-    if str(fallback.get("library") or "").strip() == target_library:
-        return fallback
+
+def _same_library_row(row: dict | None, library: str) -> dict | None:
+    if row and str(row.get("library") or "").strip() == str(library or "").strip():
+        return row
     return None
 
 
@@ -87,10 +149,11 @@ def resolve_saved_entry_title(info: dict, doc_id: str, *, result_title: str = ""
     return preferred or clean_result_title or clean_doc_id or "Senza Titolo"
 
 
-def upsert_saved_entry(
+def saved_entry_fields(
     manifest_url: str,
     doc_id: str,
     library: str,
+    existing: dict | None,
     *,
     label: str = "",
     description: str = "",
@@ -112,8 +175,11 @@ def upsert_saved_entry(
     manifest_local_available: bool = False,
     thumbnail_url: str = "",
     preferred_title: str = "",
-) -> None:
-    """Create or update a saved discovery entry preserving existing runtime state flags."""
+) -> dict[str, Any]:
+    """Return the manuscript columns of a saved discovery entry, preserving the runtime state of `existing`.
+
+    `existing` is the current row of the same document and library, or None.
+    """
     entry_label = (
         str(preferred_title or "").strip()
         or str(label or "").strip()
@@ -122,8 +188,7 @@ def upsert_saved_entry(
         or "Senza Titolo"
     )
     total = int(pages or 0)
-    v = VaultManager()
-    existing = find_manuscript_by_id_and_library(doc_id, library) or {}
+    existing = existing or {}
     existing_status = str(existing.get("status") or "").strip().lower()
     existing_asset_state = str(existing.get("asset_state") or "").strip().lower()
     known_states = {"saved", "partial", "complete", "downloading", "running", "queued", "error"}
@@ -140,8 +205,7 @@ def upsert_saved_entry(
     catalog_title_to_store = str(catalog_title or "").strip() or entry_label
     if str(preferred_title or "").strip():
         catalog_title_to_store = str(preferred_title).strip()
-    v.upsert_manuscript(
-        doc_id,
+    return dict(
         display_title=entry_label,
         title=entry_label,
         catalog_title=catalog_title_to_store,
@@ -176,6 +240,33 @@ def upsert_saved_entry(
     )
 
 
+def upsert_saved_entry(manifest_url: str, doc_id: str, library: str, **fields: Any) -> None:
+    """Create or update a saved discovery entry preserving existing runtime state flags.
+
+    `fields` are the keyword arguments of `saved_entry_fields`.
+    """
+    existing = find_manuscript_by_id_and_library(doc_id, library)
+    VaultManager().upsert_manuscript(doc_id, **saved_entry_fields(manifest_url, doc_id, library, existing, **fields))
+
+
+def upsert_saved_entries(entries: list[dict[str, Any]]) -> int:
+    """Create or update many saved entries in one vault transaction; return the rows written.
+
+    Each entry holds `manifest_url`, `doc_id`, `library` and the `saved_entry_fields` keyword
+    arguments. Existing rows are looked up once for the whole batch; a repeated `doc_id` keeps
+    its last entry.
+    """
+    by_id = {str(entry["doc_id"]): dict(entry) for entry in entries}
+
+    def _fields(doc_id: str, existing: dict[str, Any] | None) -> dict[str, Any]:
+        payload = dict(by_id[doc_id])
+        manifest_url, library = payload.pop("manifest_url"), payload.pop("library")
+        payload.pop("doc_id")
+        return saved_entry_fields(manifest_url, doc_id, library, _same_library_row(existing, library), **payload)
+
+    return VaultManager().bulk_upsert_manuscripts(list(by_id), _fields)
+
+
 def _thumbnail_url_from_manifest(manifest_payload: dict, *, manifest_url: str = "", doc_id: str = "") -> str:
     if not isinstance(manifest_payload, dict):
         return ""
@@ -0,0 +1,153 @@
+"""In-memory TTL/LRU cache of provider search results, with next-page prefetch.
+
+Curating a collection repeats the same searches over and over, and "load more"
+used to re-query the remote catalogue for every page. Entries are keyed by
+provider, normalized query and filters (which carry the page number and page
+size), so identical searches and already-seen pages are served locally.
+
+`prefetch` loads a page in the background; a lookup for a key whose prefetch
+is still running waits for it instead of issuing a second remote request.
+Empty result lists are not cached: search modules swallow upstream errors and
+return `[]`, and a transient failure should not stick for the whole TTL.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from universal_iiif_core.logger import get_logger
+from universal_iiif_core.resolvers.models import SearchResult
+
+logger = get_logger(__name__)
+
+DEFAULT_TTL_S = 600
+DEFAULT_MAX_ENTRIES = 128
+_PREFETCH_WORKERS = 2
+
+SearchLoader = Callable[[], list[SearchResult]]
+
+
+def make_search_key(provider_key: str, query: str, filters: dict[str, Any] | None = None) -> str:
+    """Return the cache key of one provider search page."""
+    normalized = " ".join(str(query or "").split()).casefold()
+    payload = json.dumps(dict(filters or {}), sort_keys=True, default=str, separators=(",", ":"))
+    return f"{provider_key}\n{normalized}\n{payload}"
+
+
+class SearchResultCache:
+    """Thread-safe search result cache bounded by age and entry count."""
+
+    def __init__(self, *, ttl_s: float = DEFAULT_TTL_S, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize an empty cache; `ttl_s <= 0` or `max_entries <= 0` disables it."""
+        self.ttl_s = float(ttl_s)
+        self.max_entries = int(max_entries)
+        self._entries: OrderedDict[str, tuple[float, list[SearchResult]]] = OrderedDict()
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether lookups and stores are active."""
+        return self.ttl_s > 0 and self.max_entries > 0
+
+    def get(self, key: str) -> list[SearchResult] | None:
+        """Return a copy of the cached results for `key`, or None when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, results = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(results)
+
+    def put(self, key: str, results: list[SearchResult]) -> None:
+        """Store `results` under `key`, evicting the least recently used entries."""
+        if not self.enabled or not results:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_s, copy.deepcopy(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: str, loader: SearchLoader) -> list[SearchResult]:
+        """Return cached results for `key`, joining a running prefetch or calling `loader`."""
+        if not self.enabled:
+            return loader()
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        with self._lock:
+            pending = self._inflight.get(key)
+        if pending is not None:
+            try:
+                return copy.deepcopy(pending.result())
+            except Exception:
+                logger.debug("Search prefetch failed, loading %r again", key, exc_info=True)
+        results = loader()
+        self.put(key, results)
+        return results
+
+    def prefetch(self, key: str, loader: SearchLoader) -> bool:
+        """Load `key` in the background unless it is cached or already loading."""
+        if not self.enabled:
+            return False
+        with self._lock:
+            if key in self._inflight:
+                return False
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS, thread_name_prefix="search-prefetch")
+            future = self._executor.submit(self._run_prefetch, key, loader)
+            self._inflight[key] = future
+        return True
+
+    def _run_prefetch(self, key: str, loader: SearchLoader) -> list[SearchResult]:
+        try:
+            results = loader()
+            self.put(key, results)
+            return results
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, expired ones included."""
+        with self._lock:
+            return len(self._entries)
+
+
+_SEARCH_CACHE = SearchResultCache()
+
+
+def get_search_cache() -> SearchResultCache:
+    """Return the shared cache, configured from `settings.discovery.search_cache_*`."""
+    from universal_iiif_core.config_manager import get_config_manager
+
+    discovery = get_config_manager().get_setting("discovery", {})
+    if not isinstance(discovery, dict):
+        discovery = {}
+    try:
+        _SEARCH_CACHE.ttl_s = float(discovery.get("search_cache_ttl_s", DEFAULT_TTL_S))
+        _SEARCH_CACHE.max_entries = int(discovery.get("search_cache_max_entries", DEFAULT_MAX_ENTRIES))
+    except (TypeError, ValueError):
+        _SEARCH_CACHE.ttl_s, _SEARCH_CACHE.max_entries = DEFAULT_TTL_S, DEFAULT_MAX_ENTRIES
+    return _SEARCH_CACHE
@@ -0,0 +1,121 @@
+"""Per-document revision counters for conditional live-state rendering.
+
+Producers that change what a document looks like in the UI (page downloads,
+local optimisation, page-job progress, exports) bump the document revision,
+optionally naming the pages they touched. Live endpoints hand the client an
+opaque token and, on the next poll, can skip rendering entirely when the
+token is current or re-render only the pages bumped since.
+
+Tokens embed a per-process epoch, so a restart invalidates every token that
+was issued before it instead of comparing unrelated counters.
+"""
+
+from __future__ import annotations
+
+import secrets
+import threading
+from collections.abc import Iterable
+
+from .event_bus import TOPIC_DOCS, publish_event
+
+_MAX_TRACKED_DOCS = 512
+_MAX_TRACKED_PAGES = 4096
+
+
+class DocumentRevisions:
+    """Thread-safe registry of document and page revisions."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry with a fresh epoch."""
+        self.epoch = secrets.token_hex(4)
+        self._lock = threading.Lock()
+        self._doc_rev: dict[str, int] = {}
+        self._doc_wide_rev: dict[str, int] = {}
+        self._page_rev: dict[str, dict[int, int]] = {}
+
+    def bump(self, doc_id: str, pages: Iterable[int] | None = None) -> int:
+        """Advance the revision of `doc_id` and return it.
+
+        `pages=None` marks every page as changed; an iterable marks only those
+        pages (an empty one changes document-level state such as exports).
+        """
+        key = str(doc_id or "").strip()
+        if not key:
+            return 0
+        with self._lock:
+            rev = self._doc_rev.get(key, 0) + 1
+            self._doc_rev.pop(key, None)
+            self._doc_rev[key] = rev
+            if pages is None:
+                self._doc_wide_rev[key] = rev
+                self._page_rev.pop(key, None)
+            else:
+                page_revs = self._page_rev.setdefault(key, {})
+                for page in pages:
+                    page_revs[int(page)] = rev
+                if len(page_revs) > _MAX_TRACKED_PAGES:
+                    # Forgetting pages is only safe as a document-wide change.
+                    self._doc_wide_rev[key] = rev
+                    page_revs.clear()
+            self._evict_locked()
+            return rev
+
+    def _evict_locked(self) -> None:
+        while len(self._doc_rev) > _MAX_TRACKED_DOCS:
+            oldest = next(iter(self._doc_rev))
+            self._doc_rev.pop(oldest, None)
+            self._doc_wide_rev.pop(oldest, None)
+            self._page_rev.pop(oldest, None)
+
+    def token(self, doc_id: str) -> str:
+        """Return the opaque revision token for `doc_id`."""
+        with self._lock:
+            return f"{self.epoch}-{self._doc_rev.get(str(doc_id or '').strip(), 0)}"
+
+    def _parse_token(self, token: str) -> int | None:
+        epoch, _, raw_rev = str(token or "").partition("-")
+        if epoch != self.epoch:
+            return None
+        try:
+            return int(raw_rev)
+        except ValueError:
+            return None
+
+    def changed_pages(self, doc_id: str, token: str) -> set[int] | None:
+        """Return the pages of `doc_id` bumped since `token`.
+
+        Returns None when the token is unknown or predates a document-wide
+        change, meaning the caller must treat every page as changed.
+        """
+        since = self._parse_token(token)
+        if since is None:
+            return None
+        key = str(doc_id or "").strip()
+        with self._lock:
+            if self._doc_rev.get(key, 0) < since:
+                return None
+            if self._doc_wide_rev.get(key, 0) > since:
+                return None
+            return {page for page, rev in self._page_rev.get(key, {}).items() if rev > since}
+
+
+_REVISIONS = DocumentRevisions()
+
+
+def get_document_revisions() -> DocumentRevisions:
+    """Return the process-wide revision registry."""
+    return _REVISIONS
+
+
+def bump_document_revision(doc_id: str, pages: Iterable[int] | None = None) -> int:
+    """Bump the shared revision of `doc_id` (see `DocumentRevisions.bump`) and announce it on the event bus."""
+    rev = _REVISIONS.bump(doc_id, pages)
+    if rev:
+        key = str(doc_id).strip()
+        publish_event(TOPIC_DOCS, f"doc:{key}", {"doc_id": key, "rev": rev})
+    return rev
+
+
+def document_revision_token(doc_id: str) -> str:
+    """Return the shared revision token of `doc_id`."""
+    return _REVISIONS.token(doc_id)
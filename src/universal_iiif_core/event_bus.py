@@ -0,0 +1,147 @@
+"""In-process publish/subscribe bus for live job, OCR and export state.
+
+Producers (`JobManager`, OCR workers, export job updates) publish small state
+snapshots keyed by entity (e.g. ``job:<id>``); document revision bumps are
+published as ``doc:<id>``. The bus drops snapshots that
+are identical to the last one published for the same key, and each
+subscription coalesces pending events per key, so a slow client only receives
+the latest state of every entity instead of a backlog of intermediate steps.
+
+The Studio UI exposes the bus as a Server-Sent Events stream; HTMX polling
+remains the fallback when the stream is unavailable.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+TOPIC_JOBS = "jobs"
+TOPIC_OCR = "ocr"
+TOPIC_EXPORT = "export"
+TOPIC_DOCS = "docs"
+
+_MAX_TRACKED_KEYS = 2048
+
+
+@dataclass(frozen=True)
+class BusEvent:
+    """One published state change."""
+
+    seq: int
+    topic: str
+    key: str
+    payload: dict[str, Any] = field(default_factory=dict)
+
+
+class EventSubscription:
+    """Per-client queue that keeps only the newest pending event per key."""
+
+    def __init__(self, bus: EventBus, topics: Iterable[str]):
+        """Create a subscription for `topics` (empty means every topic)."""
+        self._bus = bus
+        self.topics = frozenset(str(t).strip() for t in topics if str(t).strip())
+        self._pending: OrderedDict[str, BusEvent] = OrderedDict()
+        self._cond = threading.Condition()
+        self.closed = False
+
+    def accepts(self, topic: str) -> bool:
+        """Return True when this subscription listens to `topic`."""
+        return not self.topics or topic in self.topics
+
+    def _push(self, event: BusEvent) -> None:
+        with self._cond:
+            if self.closed:
+                return
+            self._pending.pop(event.key, None)
+            self._pending[event.key] = event
+            self._cond.notify_all()
+
+    def get(self, timeout: float | None = None) -> list[BusEvent]:
+        """Wait up to `timeout` seconds and return all pending events (possibly none)."""
+        with self._cond:
+            if not self._pending and not self.closed:
+                self._cond.wait(timeout)
+            events = list(self._pending.values())
+            self._pending.clear()
+            return events
+
+    def close(self) -> None:
+        """Detach from the bus and wake any waiting reader."""
+        self._bus.unsubscribe(self)
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+class EventBus:
+    """Thread-safe fan-out of state snapshots to live subscriptions."""
+
+    def __init__(self) -> None:
+        """Initialize an empty bus."""
+        self._lock = threading.Lock()
+        self._subscriptions: set[EventSubscription] = set()
+        self._last_payloads: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._seq = itertools.count(1)
+
+    def subscribe(self, topics: Iterable[str] = ()) -> EventSubscription:
+        """Register and return a new subscription."""
+        subscription = EventSubscription(self, topics)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Remove a subscription (idempotent)."""
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        """Return the number of live subscriptions."""
+        with self._lock:
+            return len(self._subscriptions)
+
+    def publish(self, topic: str, key: str, payload: dict[str, Any]) -> bool:
+        """Publish a state snapshot; return False when it equals the previous one for `key`."""
+        with self._lock:
+            if self._last_payloads.get(key) == payload:
+                return False
+            self._last_payloads.pop(key, None)
+            self._last_payloads[key] = dict(payload)
+            while len(self._last_payloads) > _MAX_TRACKED_KEYS:
+                self._last_payloads.popitem(last=False)
+            event = BusEvent(seq=next(self._seq), topic=topic, key=key, payload=dict(payload))
+            targets = [sub for sub in self._subscriptions if sub.accepts(topic)]
+        for subscription in targets:
+            subscription._push(event)
+        return True
+
+
+_EVENT_BUS: EventBus | None = None
+_EVENT_BUS_LOCK = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    """Return the process-wide event bus."""
+    global _EVENT_BUS
+    if _EVENT_BUS is None:
+        with _EVENT_BUS_LOCK:
+            if _EVENT_BUS is None:
+                _EVENT_BUS = EventBus()
+    return _EVENT_BUS
+
+
+def publish_event(topic: str, key: str, payload: dict[str, Any]) -> None:
+    """Publish on the shared bus, never raising into the producer."""
+    try:
+        get_event_bus().publish(topic, key, payload)
+    except Exception:  # pragma: no cover - defensive boundary for worker threads
+        logger.debug("Event publish failed for %s/%s", topic, key, exc_info=True)
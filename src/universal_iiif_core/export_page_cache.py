@@ -0,0 +1,164 @@
+"""Content-addressed on-disk cache of encoded export page images.
+
+`build_professional_pdf` re-encodes every selected scan to the compression
+profile of the export. Entries here are keyed by the SHA-256 of the source
+scan bytes plus the encoding parameters (long edge, JPEG quality, colour
+space), so regenerating a PDF with a different cover or an overlapping page
+range, or exporting the same pages from a fresh high-res staging directory,
+reuses the earlier encodes instead of decoding and compressing again.
+
+Entries live under `<temp>/_cache/export_pages/<key[:2]>/<key>.jpg`. The
+total size is capped and eviction is least-recently-used by file mtime, which
+is touched on every hit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from contextlib import suppress
+from pathlib import Path
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def content_hash(data: bytes) -> str:
+    """Return the content address of source scan bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ExportPageCache:
+    """Thread-safe, size-capped LRU cache of encoded page bytes."""
+
+    def __init__(self, root: Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initialize the cache under `root` (created lazily)."""
+        self.root = Path(root)
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+
+    @staticmethod
+    def make_key(source_hash: str, max_long_edge_px: int | None, jpeg_quality: int, colorspace: str) -> str:
+        """Return the storage key for one source scan encoded with the given parameters."""
+        raw = f"{source_hash}\n{int(max_long_edge_px or 0)}\n{int(jpeg_quality)}\n{colorspace}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.jpg"
+
+    def get(self, key: str) -> bytes | None:
+        """Return cached bytes for `key` and mark the entry as recently used."""
+        if self.max_bytes <= 0:
+            return None
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        with suppress(OSError):
+            path.touch()
+        return data or None
+
+    def put(self, key: str, data: bytes) -> bool:
+        """Store encoded bytes for `key`; return False when caching is disabled or fails."""
+        if not data or self.max_bytes <= 0 or len(data) > self.max_bytes:
+            return False
+        path = self._path(key)
+        with self._lock:
+            previous = 0
+            with suppress(OSError):
+                previous = path.stat().st_size
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+                tmp.write_bytes(data)
+                tmp.replace(path)
+            except OSError:
+                logger.debug("Export page cache write failed for %s", key, exc_info=True)
+                return False
+            self._adjust_total(len(data) - previous)
+            self._evict_if_needed()
+        return True
+
+    # ------------------------------------------------------------------
+    # Size accounting & eviction (callers hold self._lock)
+    # ------------------------------------------------------------------
+
+    def _adjust_total(self, delta: int) -> None:
+        if self._total_bytes is None:
+            self._total_bytes = self._scan_total_bytes()
+        else:
+            self._total_bytes = max(0, self._total_bytes + int(delta))
+
+    def _scan_total_bytes(self) -> int:
+        total = 0
+        for entry in self.root.glob("*/*.jpg"):
+            with suppress(OSError):
+                total += entry.stat().st_size
+        return total
+
+    def _evict_if_needed(self) -> None:
+        if self._total_bytes is None or self._total_bytes <= self.max_bytes:
+            return
+        candidates: list[tuple[float, int, Path]] = []
+        for entry in self.root.glob("*/*.jpg"):
+            with suppress(OSError):
+                stat = entry.stat()
+                candidates.append((stat.st_mtime, stat.st_size, entry))
+        candidates.sort()
+        for _mtime, size, entry in candidates:
+            if self._total_bytes <= self.max_bytes:
+                break
+            with suppress(OSError):
+                entry.unlink()
+                self._total_bytes = max(0, self._total_bytes - size)
+
+    def size_bytes(self) -> int:
+        """Return the current on-disk payload size."""
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            return self._total_bytes
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            for entry in list(self.root.glob("*/*")):
+                with suppress(OSError):
+                    entry.unlink()
+            self._total_bytes = 0
+
+
+_PAGE_CACHE: ExportPageCache | None = None
+_PAGE_CACHE_LOCK = threading.Lock()
+
+
+def export_page_cache_dir() -> Path:
+    """Return the on-disk location of the export page cache."""
+    from .config_manager import get_config_manager
+
+    return get_config_manager().get_temp_dir() / "_cache" / "export_pages"
+
+
+def get_export_page_cache() -> ExportPageCache | None:
+    """Return the shared cache configured by `settings.pdf.export.page_cache_max_bytes` (0 disables)."""
+    global _PAGE_CACHE
+    from .config_manager import get_config_manager
+
+    try:
+        max_bytes = int(get_config_manager().get_setting("pdf.export.page_cache_max_bytes", DEFAULT_MAX_BYTES))
+    except (TypeError, ValueError):
+        max_bytes = DEFAULT_MAX_BYTES
+    if max_bytes <= 0:
+        return None
+    with _PAGE_CACHE_LOCK:
+        root = export_page_cache_dir()
+        if _PAGE_CACHE is None or _PAGE_CACHE.root != root:
+            _PAGE_CACHE = ExportPageCache(root, max_bytes=max_bytes)
+        else:
+            _PAGE_CACHE.max_bytes = max_bytes
+        return _PAGE_CACHE
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+import os
 import re
+import threading
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
@@ -12,6 +17,12 @@ from typing import Any
 import pymupdf as fitz
 from PIL import Image as PILImage
 
+from .export_page_cache import ExportPageCache, content_hash
+from .logger import get_logger
+from .pdf_utils import ChunkedPdfWriter
+
+logger = get_logger(__name__)
+
 
 @dataclass(frozen=True)
 class CompressionProfile:
@@ -32,6 +43,26 @@ COMPRESSION_PROFILES: dict[str, CompressionProfile] = {
 _A4_W = 595
 _A4_H = 842
 
+_MAX_ENCODE_WORKERS = 16
+# Encoded pages allowed to wait in the reorder buffer, per encode worker.
+_REORDER_BUFFER_PER_WORKER = 2
+
+# IJG (libjpeg) reference luminance table at quality 50, used to estimate scan quality.
+_IJG_LUMA_TABLE = (
+    16, 11, 10, 16, 24, 40, 51, 61, 12, 12, 14, 19, 26, 58, 60, 55,
+    14, 13, 16, 24, 40, 57, 69, 56, 14, 17, 22, 29, 51, 87, 80, 62,
+    18, 22, 37, 56, 68, 109, 103, 77, 24, 35, 55, 64, 81, 104, 113, 92,
+    49, 64, 78, 87, 103, 121, 120, 101, 72, 92, 95, 98, 112, 100, 103, 99,
+)  # fmt: skip
+_PASSTHROUGH_MODES = frozenset({"RGB", "L"})
+# Left inset of text lines, in units of font size (matches `TextWriter.fill_textbox`).
+_TEXT_BOX_INDENT = 0.2
+# Colour space of re-encoded pages; part of the export page cache key.
+_ENCODED_COLORSPACE = "RGB"
+# PyMuPDF is not thread-safe: concurrent exports (batch items) take turns on every
+# document/font operation, while page encoding (PIL only) stays outside the lock.
+_FITZ_LOCK = threading.RLock()
+
 
 def _truncate(s: str, max_len: int) -> str:
     s = (s or "").strip()
@@ -79,10 +110,11 @@ def _encode_jpeg_bytes(img: PILImage.Image, quality: int) -> bytes:
     return buf.getvalue()
 
 
-def _prepare_image_bytes(image_path: Path, profile: CompressionProfile) -> tuple[bytes, tuple[int, int]]:
-    with PILImage.open(str(image_path)) as img:
-        if img.mode != "RGB":
-            img = img.convert("RGB")
+def _prepare_image_bytes(image_path: Path | BytesIO, profile: CompressionProfile) -> tuple[bytes, tuple[int, int]]:
+    source = str(image_path) if isinstance(image_path, Path) else image_path
+    with PILImage.open(source) as img:
+        if img.mode != _ENCODED_COLORSPACE:
+            img = img.convert(_ENCODED_COLORSPACE)
 
         if profile.max_long_edge_px:
             w, h = img.size
@@ -96,6 +128,146 @@ def _prepare_image_bytes(image_path: Path, profile: CompressionProfile) -> tuple
         return raw, img.size
 
 
+def resolve_encode_workers(configured: int | None = None) -> int:
+    """Return the page-encoding worker count; `0`/None means one per core, capped at 4."""
+    try:
+        value = int(configured or 0)
+    except (TypeError, ValueError):
+        value = 0
+    if value > 0:
+        return min(value, _MAX_ENCODE_WORKERS)
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+@dataclass(frozen=True)
+class _EncodedPage:
+    """Image bytes ready to embed plus the figures reported in the colophon."""
+
+    data: bytes
+    original_bytes: int
+    passthrough: bool = False
+    cached: bool = False
+
+
+@dataclass
+class _ScanPagesSummary:
+    """Totals of the scan pages written into the PDF."""
+
+    original_bytes_total: int = 0
+    encoded_bytes_total: int = 0
+    images_added: int = 0
+    passthrough_pages: int = 0
+    cached_pages: int = 0
+
+
+def _estimate_jpeg_quality(quantization: dict[int, Any] | None) -> int | None:
+    """Estimate the IJG quality factor (1-100) from the luminance quantization table."""
+    if not quantization or 0 not in quantization:
+        return None
+    table = list(quantization[0])
+    if len(table) != len(_IJG_LUMA_TABLE):
+        return None
+    # Sums are order-independent, so zigzag vs natural table order does not matter.
+    scale = sum(table) * 100.0 / sum(_IJG_LUMA_TABLE)
+    quality = 5000.0 / scale if scale > 100 else (200.0 - scale) / 2.0
+    return max(1, min(100, round(quality)))
+
+
+def _jpeg_passthrough_allowed(image_path: Path, profile: CompressionProfile) -> bool:
+    """Return True when the original JPEG already satisfies `profile` and can be embedded as-is.
+
+    Only the header is inspected (Pillow opens lazily): the file must be an RGB
+    or grayscale JPEG (baseline or progressive, both valid DCT streams in PDF),
+    fit within `max_long_edge_px`, and have an estimated quality not above the
+    profile quality, so re-encoding could only lose detail without saving space.
+    """
+    try:
+        with PILImage.open(str(image_path)) as img:
+            if img.format != "JPEG" or img.mode not in _PASSTHROUGH_MODES:
+                return False
+            if profile.max_long_edge_px and max(img.size) > profile.max_long_edge_px:
+                return False
+            quality = _estimate_jpeg_quality(getattr(img, "quantization", None))
+    except (OSError, ValueError, PILImage.DecompressionBombError):
+        return False
+    return quality is not None and quality <= profile.jpeg_quality
+
+
+def _encode_scan_page(
+    image_path: Path,
+    profile: CompressionProfile,
+    page_cache: ExportPageCache | None = None,
+) -> _EncodedPage | None:
+    """Return the bytes to embed for one scan, or None when missing.
+
+    The original JPEG is embedded when it already meets `profile`; otherwise
+    the re-encoded bytes come from `page_cache` when the same source content
+    was encoded with the same parameters before.
+    """
+    if not image_path.exists():
+        return None
+    if _jpeg_passthrough_allowed(image_path, profile):
+        with contextlib.suppress(OSError):
+            raw = image_path.read_bytes()
+            return _EncodedPage(data=raw, original_bytes=len(raw), passthrough=True)
+    if page_cache is None:
+        img_bytes, _ = _prepare_image_bytes(image_path, profile)
+        original_bytes = 0
+        with contextlib.suppress(OSError):
+            original_bytes = int(image_path.stat().st_size)
+        return _EncodedPage(data=img_bytes, original_bytes=original_bytes)
+
+    raw = image_path.read_bytes()
+    key = page_cache.make_key(content_hash(raw), profile.max_long_edge_px, profile.jpeg_quality, _ENCODED_COLORSPACE)
+    cached = page_cache.get(key)
+    if cached is not None:
+        return _EncodedPage(data=cached, original_bytes=len(raw), cached=True)
+    img_bytes, _ = _prepare_image_bytes(BytesIO(raw), profile)
+    page_cache.put(key, img_bytes)
+    return _EncodedPage(data=img_bytes, original_bytes=len(raw))
+
+
+def _iter_encoded_pages(
+    scans_dir: Path,
+    selected_pages: list[int],
+    profile: CompressionProfile,
+    workers: int,
+    page_cache: ExportPageCache | None = None,
+) -> Iterator[tuple[int, _EncodedPage | None]]:
+    """Yield `(page_idx, encoded)` in selection order.
+
+    With more than one worker, pages are encoded concurrently (Pillow releases
+    the GIL while decoding, resampling and encoding) and at most
+    `workers * _REORDER_BUFFER_PER_WORKER` pages are in flight, so memory stays
+    bounded while the single PDF writer consumes them in page order. Closing the
+    iterator early cancels the pages not yet started.
+    """
+    jobs = ((page_idx, scans_dir / f"pag_{page_idx - 1:04d}.jpg") for page_idx in selected_pages)
+    if workers <= 1 or len(selected_pages) <= 1:
+        for page_idx, img_path in jobs:
+            yield page_idx, _encode_scan_page(img_path, profile, page_cache)
+        return
+
+    window: deque[tuple[int, Future]] = deque()
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pdf-encode")
+    try:
+
+        def _submit_next() -> None:
+            job = next(jobs, None)
+            if job is not None:
+                window.append((job[0], executor.submit(_encode_scan_page, job[1], profile, page_cache)))
+
+        for _ in range(workers * _REORDER_BUFFER_PER_WORKER):
+            _submit_next()
+        while window:
+            page_idx, future = window.popleft()
+            encoded = future.result()
+            _submit_next()
+            yield page_idx, encoded
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def _add_cover_page(  # noqa: C901
     doc: fitz.Document,
     title: str,
@@ -235,6 +407,7 @@ def _add_colophon_page(
     images_added: int,
     original_bytes_total: int,
     encoded_bytes_total: int,
+    passthrough_pages: int = 0,
 ) -> None:
     page = doc.new_page(width=_A4_W, height=_A4_H)
     rect = page.rect
@@ -258,6 +431,7 @@ def _add_colophon_page(
         f"Modalità trascrizione: {mode}",
         f"Pagine richieste: {selected_pages_count}",
         f"Immagini inserite: {images_added}",
+        f"Immagini originali senza ricodifica: {passthrough_pages}",
         f"Dimensione scans (totale): {_mb(original_bytes_total)} MB",
         f"Dimensione immagini (post): {_mb(encoded_bytes_total)} MB",
     ]
@@ -329,56 +503,106 @@ def _add_image_page(
         tw.write_text(page, color=(0, 0, 0), render_mode=3)
 
 
-def _fits_text_in_box(box_rect: fitz.Rect, text: str, font: fitz.Font, fontsize: float) -> bool:
-    """Return True if the supplied text fits inside the provided rectangle."""
-    rect = fitz.Rect(box_rect)
-    tw = fitz.TextWriter(rect)
-    try:
-        tw.fill_textbox(
-            rect,
-            text,
-            font=font,
-            fontsize=fontsize,
-            align=0,
-            warn=False,
-        )
-        return True
-    except ValueError:
-        return False
-
-
-def _split_chunk_at_boundary(text: str, length: int) -> tuple[str, str]:
-    if length >= len(text):
-        return text, ""
-    cutoff = text.rfind("\n", 0, length)
-    if cutoff >= 0:
-        return text[: cutoff + 1], text[cutoff + 1 :]
-    cutoff = text.rfind(" ", 0, length)
-    if cutoff >= 0:
-        return text[: cutoff + 1], text[cutoff + 1 :]
-    return text[:length], text[length:]
-
-
-def _slice_transcription_text(text: str, box_rect: fitz.Rect, font: fitz.Font, fontsize: float) -> tuple[str, str]:
-    if not text:
-        return "", ""
-    low, high, best = 1, len(text), 0
-    while low <= high:
-        mid = (low + high) // 2
-        candidate = text[:mid]
-        if _fits_text_in_box(box_rect, candidate, font, fontsize):
-            best = mid
-            low = mid + 1
-        else:
-            high = mid - 1
-
-    if best == 0:
-        best = min(1, len(text))
-
-    chunk, remainder = _split_chunk_at_boundary(text, best)
-    if not chunk:
-        chunk, remainder = text[0], text[1:]
-    return chunk, remainder
+class _FontMetrics:
+    """Per-character advance widths of one font at one size, measured once and cached."""
+
+    def __init__(self, fontname: str, fontsize: float) -> None:
+        self.font = fitz.Font(fontname)
+        self.fontsize = float(fontsize)
+        self.line_height = self.fontsize * _line_height_factor(self.font)
+        self.ascent = self.fontsize * self.font.ascender
+        self._advances: dict[str, float] = {}
+
+    def width(self, text: str) -> float:
+        advances = self._advances
+        total = 0.0
+        for ch in text:
+            advance = advances.get(ch)
+            if advance is None:
+                advance = advances[ch] = self.font.text_length(ch, fontsize=self.fontsize)
+            total += advance
+        return total
+
+
+def _line_height_factor(font: fitz.Font) -> float:
+    # Same rule as `TextWriter.fill_textbox`, so pages look as they did before.
+    spread = font.ascender - font.descender
+    return 1.2 if spread <= 1 else spread
+
+
+# Shared across threads: only use the returned font while holding `_FITZ_LOCK`.
+@functools.lru_cache(maxsize=8)
+def _font_metrics(fontname: str, fontsize: float) -> _FontMetrics:
+    return _FontMetrics(fontname, fontsize)
+
+
+def _break_long_word(word: str, max_width: float, metrics: _FontMetrics) -> list[str]:
+    pieces: list[str] = []
+    current, current_width = "", 0.0
+    for ch in word:
+        advance = metrics.width(ch)
+        if current and current_width + advance > max_width:
+            pieces.append(current)
+            current, current_width = "", 0.0
+        current += ch
+        current_width += advance
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _wrap_paragraph(paragraph: str, max_width: float, metrics: _FontMetrics) -> list[str]:
+    if not paragraph.strip(" "):
+        return [""]
+    space = metrics.width(" ")
+    lines: list[str] = []
+    current: list[str] = []
+    current_width = 0.0
+    for raw_word in paragraph.split(" "):
+        word_width = metrics.width(raw_word)
+        pieces = [raw_word] if word_width <= max_width else _break_long_word(raw_word, max_width, metrics)
+        for word in pieces:
+            width = word_width if len(pieces) == 1 else metrics.width(word)
+            needed = width if not current else current_width + space + width
+            if current and needed > max_width:
+                lines.append(" ".join(current))
+                current, current_width = [word], width
+            else:
+                current.append(word)
+                current_width = needed
+    if current:
+        lines.append(" ".join(current))
+    return lines
+
+
+def _wrap_text_lines(text: str, max_width: float, metrics: _FontMetrics) -> list[str]:
+    """Greedy line breaking of `text` in one pass over cached glyph advances."""
+    lines: list[str] = []
+    for paragraph in text.splitlines():
+        lines.extend(_wrap_paragraph(paragraph, max_width, metrics))
+    return lines
+
+
+def _lines_per_box(box: fitz.Rect, metrics: _FontMetrics) -> int:
+    return max(1, int((box.height - metrics.ascent) / metrics.line_height) + 1)
+
+
+def _write_text_lines(
+    page: fitz.Page,
+    box: fitz.Rect,
+    lines: list[str],
+    metrics: _FontMetrics,
+    color: tuple[float, float, float],
+) -> None:
+    """Emit pre-wrapped `lines` into `box` with a single TextWriter."""
+    tw = fitz.TextWriter(page.rect)
+    x = box.x0 + metrics.fontsize * _TEXT_BOX_INDENT
+    baseline = box.y0 + metrics.ascent
+    for line in lines:
+        if line:
+            tw.append(fitz.Point(x, baseline), line, font=metrics.font, fontsize=metrics.fontsize)
+        baseline += metrics.line_height
+    tw.write_text(page, color=color, render_mode=0)
 
 
 def _add_transcription_page(
@@ -391,13 +615,13 @@ def _add_transcription_page(
         # Keep the page intentionally minimal to avoid confusion.
         return
 
-    font = fitz.Font("helv")
-    fontsize = 11
+    metrics = _font_metrics("helv", 11)
     margin = 54
-    remaining = text
+    text_width = _A4_W - 2 * margin - metrics.fontsize * _TEXT_BOX_INDENT
+    lines = _wrap_text_lines(text, text_width, metrics)
     page_index = 0
 
-    while remaining:
+    while lines:
         page = doc.new_page(width=_A4_W, height=_A4_H)
         rect = page.rect
         content_top = 92 if include_header and page_index == 0 else 60
@@ -429,20 +653,9 @@ def _add_transcription_page(
             )
 
         text_area = fitz.Rect(margin, content_top, rect.width - margin, rect.height - margin)
-        chunk, remaining = _slice_transcription_text(remaining, fitz.Rect(text_area), font, fontsize)
-        if not chunk:
-            break
-
-        tw = fitz.TextWriter(rect)
-        tw.fill_textbox(
-            text_area,
-            chunk,
-            font=font,
-            fontsize=fontsize,
-            align=0,
-            warn=False,
-        )
-        tw.write_text(page, color=(0.12, 0.12, 0.12), render_mode=0)
+        capacity = _lines_per_box(text_area, metrics)
+        page_lines, lines = lines[:capacity], lines[capacity:]
+        _write_text_lines(page, text_area, page_lines, metrics, color=(0.12, 0.12, 0.12))
 
         page_index += 1
 
@@ -477,66 +690,80 @@ def _resolve_compression_profile(
 
 def _append_selected_scan_pages(
     *,
-    doc: fitz.Document,
+    writer: ChunkedPdfWriter,
     scans_dir: Path,
     selected_pages: list[int],
     trans_map: dict[int, str],
     mode: str,
     profile: CompressionProfile,
     progress_callback: Callable[[int, int], None] | None,
-) -> tuple[int, int, int]:
-    """Append selected page images (and optional transcription pages) to output PDF."""
-    original_bytes_total = 0
-    encoded_bytes_total = 0
-    images_added = 0
+    encode_workers: int = 1,
+    page_cache: ExportPageCache | None = None,
+) -> _ScanPagesSummary:
+    """Append selected page images (and optional transcription pages) to output PDF.
+
+    Page images are encoded by `_iter_encoded_pages`; this function is the
+    single consumer that writes them into `writer.doc` in selection order,
+    letting the writer flush completed chunks to disk. An exception raised by
+    `progress_callback` (e.g. a cancellation) stops the encoders before
+    propagating.
+    """
+    summary = _ScanPagesSummary()
     total_pages_to_process = len(selected_pages)
 
-    for idx, page_idx in enumerate(selected_pages):
-        if progress_callback:
-            progress_callback(idx, total_pages_to_process)
-
-        img_path = scans_dir / f"pag_{page_idx - 1:04d}.jpg"
-        if not img_path.exists():
-            continue
-
-        img_bytes, _ = _prepare_image_bytes(img_path, profile)
-        with contextlib.suppress(OSError):
-            original_bytes_total += int(img_path.stat().st_size)
-
-        encoded_bytes_total += len(img_bytes)
-        images_added += 1
-
-        page_text = trans_map.get(page_idx, "")
-        page_label = f"Pag. {page_idx}"
-
-        if mode == "Testo a fronte":
-            _add_image_page(
-                doc,
-                img_bytes=img_bytes,
-                visible_text="",
-                searchable_text="",
-                mode="Solo immagini",
-                page_label=page_label,
-            )
-            _add_transcription_page(
-                doc,
-                text=page_text,
-                page_label=f"Trascrizione · Pag. {page_idx}",
-                include_header=True,
-            )
-            continue
-
-        searchable_text = page_text if mode == "PDF Ricercabile" else ""
+    encoded_pages = _iter_encoded_pages(scans_dir, selected_pages, profile, encode_workers, page_cache)
+    with contextlib.closing(encoded_pages):
+        for idx, (page_idx, encoded) in enumerate(encoded_pages):
+            if progress_callback:
+                progress_callback(idx, total_pages_to_process)
+            if encoded is None:
+                continue
+            summary.original_bytes_total += encoded.original_bytes
+            summary.encoded_bytes_total += len(encoded.data)
+            summary.images_added += 1
+            summary.passthrough_pages += int(encoded.passthrough)
+            summary.cached_pages += int(encoded.cached)
+            with _FITZ_LOCK:
+                _write_scan_page(
+                    writer.doc,
+                    img_bytes=encoded.data,
+                    page_idx=page_idx,
+                    page_text=trans_map.get(page_idx, ""),
+                    mode=mode,
+                )
+                writer.page_added()
+
+    return summary
+
+
+def _write_scan_page(doc: fitz.Document, *, img_bytes: bytes, page_idx: int, page_text: str, mode: str) -> None:
+    page_label = f"Pag. {page_idx}"
+    if mode == "Testo a fronte":
         _add_image_page(
             doc,
             img_bytes=img_bytes,
             visible_text="",
-            searchable_text=searchable_text,
-            mode=mode,
+            searchable_text="",
+            mode="Solo immagini",
             page_label=page_label,
         )
+        _add_transcription_page(
+            doc,
+            text=page_text,
+            page_label=f"Trascrizione · Pag. {page_idx}",
+            include_header=True,
+        )
+        return
 
-    return original_bytes_total, encoded_bytes_total, images_added
+    searchable_text = page_text if mode == "PDF Ricercabile" else ""
+    _add_image_page(
+        doc,
+        img_bytes=img_bytes,
+        visible_text="",
+        searchable_text=searchable_text,
+        mode=mode,
+        page_label=page_label,
+    )
 
 
 def build_professional_pdf(
@@ -559,10 +786,24 @@ def build_professional_pdf(
     image_dir: Path | None = None,
     image_max_long_edge_px: int | None = None,
     image_jpeg_quality: int | None = None,
+    encode_workers: int = 1,
+    page_cache: ExportPageCache | None = None,
+    chunk_pages: int = 0,
+    garbage: int = 4,
 ) -> Path:
     """Assemble [Cover] + [Selected Pages] + [Colophon] into a single PDF.
 
-    Page indices are 1-based.
+    Page indices are 1-based. Scans that are already JPEGs within the profile
+    limits are embedded unchanged; the others are re-encoded, concurrently when
+    `encode_workers` > 1 (see `resolve_encode_workers`), or reused from
+    `page_cache` when the same scan content was encoded with the same profile.
+
+    `chunk_pages` > 0 flushes the document to disk every that many scan pages
+    so peak memory stays bounded for very large exports; `garbage` is the
+    PyMuPDF garbage-collection level of the final save (see `ChunkedPdfWriter`).
+
+    Safe to call from several threads: PyMuPDF work is serialized on
+    `_FITZ_LOCK`, page encoding is not.
     """
     profile = _resolve_compression_profile(
         compression=compression,
@@ -578,42 +819,52 @@ def build_professional_pdf(
     if not selected_pages:
         raise ValueError("Nessuna pagina selezionata")
 
-    doc = fitz.open()
+    with _FITZ_LOCK:
+        writer = ChunkedPdfWriter(output_path, chunk_pages=chunk_pages, garbage=garbage)
     try:
         if include_cover:
-            _add_cover_page(
-                doc,
-                cover_title,
-                cover_curator,
-                cover_description,
-                manifest_meta or {},
-                logo_bytes=cover_logo_bytes,
-            )
-
-        original_bytes_total, encoded_bytes_total, images_added = _append_selected_scan_pages(
-            doc=doc,
+            with _FITZ_LOCK:
+                _add_cover_page(
+                    writer.doc,
+                    cover_title,
+                    cover_curator,
+                    cover_description,
+                    manifest_meta or {},
+                    logo_bytes=cover_logo_bytes,
+                )
+
+        summary = _append_selected_scan_pages(
+            writer=writer,
             scans_dir=scans_dir,
             selected_pages=selected_pages,
             trans_map=trans_map,
             mode=mode,
             profile=profile,
             progress_callback=progress_callback,
+            encode_workers=encode_workers,
+            page_cache=page_cache,
+        )
+        logger.debug(
+            "PDF pages: %d images, %d embedded unchanged, %d from page cache",
+            summary.images_added,
+            summary.passthrough_pages,
+            summary.cached_pages,
         )
 
-        if include_colophon:
-            _add_colophon_page(
-                doc,
-                source_url=source_url,
-                profile=profile,
-                mode=mode,
-                selected_pages_count=len(selected_pages),
-                images_added=images_added,
-                original_bytes_total=original_bytes_total,
-                encoded_bytes_total=encoded_bytes_total,
-            )
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        doc.save(str(output_path), garbage=4, deflate=True)
-        return output_path
+        with _FITZ_LOCK:
+            if include_colophon:
+                _add_colophon_page(
+                    writer.doc,
+                    source_url=source_url,
+                    profile=profile,
+                    mode=mode,
+                    selected_pages_count=len(selected_pages),
+                    images_added=summary.images_added,
+                    original_bytes_total=summary.original_bytes_total,
+                    encoded_bytes_total=summary.encoded_bytes_total,
+                    passthrough_pages=summary.passthrough_pages,
+                )
+            return writer.finish()
     finally:
-        doc.close()
+        with _FITZ_LOCK:
+            writer.close()
@@ -5,6 +5,7 @@ This module provides a thread-safe HTTP client that consolidates:
 - Automatic retry with exponential backoff
 - Per-host rate limiting via HostRateLimiter
 - Per-host concurrency limits via threading.Semaphore
+- On-disk JSON response cache with ETag/Last-Modified revalidation
 - Unified error handling and metrics collection
 
 Design principle: Every setting supports 3-level hierarchy:
@@ -19,8 +20,9 @@ import json
 import logging
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
@@ -28,6 +30,7 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ._http_cache import HTTPCache
 from ._rate_limiter import get_host_limiter
 from .network_policy import normalize_library_key
 from .utils import DEFAULT_HEADERS
@@ -43,6 +46,12 @@ class HTTPMetrics:
     retry_count: int = 0
     rate_limit_hits: int = 0
     timeout_count: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_revalidations: int = 0
+    cache_stale_served: int = 0
+    cache_bytes_served: int = 0
+    cache_bytes_stored: int = 0
     response_times: list[float] = field(default_factory=list)
     per_host_stats: dict[str, dict[str, Any]] = field(default_factory=dict)
 
@@ -62,6 +71,12 @@ class HTTPMetrics:
             "retry_count": self.retry_count,
             "rate_limit_hits": self.rate_limit_hits,
             "timeout_count": self.timeout_count,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_revalidations": self.cache_revalidations,
+            "cache_stale_served": self.cache_stale_served,
+            "cache_bytes_served": self.cache_bytes_served,
+            "cache_bytes_stored": self.cache_bytes_stored,
             "avg_response_time_ms": round(self.avg_response_time_ms, 2),
             "per_host_stats": self.per_host_stats,
         }
@@ -74,7 +89,14 @@ class HTTPClient:
     policy resolution: parameter > library > host > global.
     """
 
-    def __init__(self, network_policy: dict[str, Any], logger: logging.Logger | None = None):
+    def __init__(
+        self,
+        network_policy: dict[str, Any],
+        logger: logging.Logger | None = None,
+        *,
+        cache_dir: Path | None = None,
+        cache: HTTPCache | None = None,
+    ):
         """Initialize HTTP client from network policy.
 
         Args:
@@ -88,6 +110,11 @@ class HTTPClient:
                     }
                 }
             logger: Optional logger instance
+            cache_dir: Optional directory for the JSON response cache. The cache
+                is active only when set and `network_policy["http_cache"]["enabled"]`
+                is true.
+            cache: Existing response cache to use instead of creating one from
+                `cache_dir`, so several clients share one size budget.
         """
         self.network_policy = network_policy
         self.global_policy = network_policy.get("global", {})
@@ -101,6 +128,14 @@ class HTTPClient:
         self.semaphore_lock = threading.Lock()
         self.metrics = HTTPMetrics()
         self.metrics_lock = threading.Lock()
+        self.cache = cache if cache is not None else self._create_cache(cache_dir)
+
+    def _create_cache(self, cache_dir: Path | None) -> HTTPCache | None:
+        """Create the JSON response cache from `network_policy["http_cache"]`."""
+        limits = _http_cache_limits(self.network_policy)
+        if cache_dir is None or limits is None:
+            return None
+        return HTTPCache(Path(cache_dir), **limits)
 
     def _create_session(self) -> requests.Session:
         """Create requests.Session with default configuration."""
@@ -226,10 +261,30 @@ class HTTPClient:
         """Get current HTTP metrics for diagnostics.
 
         Returns:
-            Dict with metrics including per-host breakdown
+            Dict with metrics including per-host breakdown and JSON cache counters
         """
         with self.metrics_lock:
-            return self.metrics.to_dict()
+            metrics = self.metrics.to_dict()
+        if self.cache is not None:
+            metrics["cache_size_bytes"] = self.cache.size_bytes()
+        return metrics
+
+    def _record_cache_event(self, event: str, size: int = 0) -> None:
+        """Update cache counters (`hit`, `miss`, `revalidated`, `stale`, `stored`)."""
+        with self.metrics_lock:
+            if event == "hit":
+                self.metrics.cache_hits += 1
+                self.metrics.cache_bytes_served += size
+            elif event == "miss":
+                self.metrics.cache_misses += 1
+            elif event == "revalidated":
+                self.metrics.cache_revalidations += 1
+                self.metrics.cache_bytes_served += size
+            elif event == "stale":
+                self.metrics.cache_stale_served += 1
+                self.metrics.cache_bytes_served += size
+            elif event == "stored":
+                self.metrics.cache_bytes_stored += size
 
     def reset_metrics(self) -> None:
         """Reset metrics counters."""
@@ -833,11 +888,13 @@ class HTTPClient:
         timeout: tuple[int, int] | None = None,
         retries: int | None = None,
         headers: dict[str, str] | None = None,
+        use_cache: bool = True,
         **kwargs,
     ) -> dict[str, Any] | list[Any] | None:
         """GET JSON with automatic parsing and fallback handling.
 
         Wraps get() with JSON-specific parsing logic including:
+        - On-disk caching with conditional revalidation (when enabled)
         - Brotli decompression support
         - BOM removal
         - UTF-8 fallback decoding
@@ -849,6 +906,7 @@ class HTTPClient:
             timeout: Override timeout
             retries: Override retry attempts
             headers: Additional headers
+            use_cache: Set to False to bypass the JSON response cache
             **kwargs: Additional arguments passed to get()
 
         Returns:
@@ -857,7 +915,13 @@ class HTTPClient:
         Examples:
             >>> client.get_json("https://example.com/manifest.json")
             >>> client.get_json("https://api.example.com/data", library_name="gallica")
+            >>> client.get_json("https://example.com/search?q=x", use_cache=False)
         """
+        cache = self.cache if use_cache else None
+        if cache is not None:
+            return self._get_json_cached(
+                cache, url, library_name=library_name, timeout=timeout, retries=retries, headers=headers, **kwargs
+            )
         try:
             response = self.get(
                 url,
@@ -867,24 +931,156 @@ class HTTPClient:
                 headers=headers,
                 **kwargs,
             )
+        except requests.RequestException as e:
+            self.logger.error(f"Failed to fetch JSON from {url}: {e}")
+            return None
+        return self._parse_json_response(response, url)
 
-            # Handle empty response
-            if not response.content:
-                self.logger.warning(f"Empty response from {url}")
-                return None
-
-            # Try standard JSON parsing first
-            try:
-                return response.json()
-            except ValueError:
-                # JSON parse failed, try fallbacks
-                self.logger.debug(f"Direct JSON parse failed for {url}, trying fallbacks")
-                return self._handle_json_fallback(response)
+    def _get_json_cached(
+        self,
+        cache: HTTPCache,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        **kwargs,
+    ) -> dict[str, Any] | list[Any] | None:
+        """Serve get_json() through the on-disk cache, revalidating stale entries."""
+        cache_key = self._cache_key(url, headers, kwargs.get("params"))
+        entry = cache.lookup(cache_key)
+        if entry is not None and entry.is_fresh():
+            body = cache.read_body(cache_key)
+            if body is not None:
+                self._record_cache_event("hit", len(body))
+                return self._parse_json_response(cache.to_response(entry, body), url)
+        if entry is not None and entry.has_validators():
+            headers = {**(headers or {}), **cache.conditional_headers(entry)}
 
+        try:
+            response = self.get(url, headers=headers, **kwargs)
         except requests.RequestException as e:
+            stale = self._serve_stale(cache, cache_key, entry, url)
+            if stale is not None:
+                return stale
             self.logger.error(f"Failed to fetch JSON from {url}: {e}")
             return None
 
+        if response.status_code == 304 and entry is not None:
+            body = cache.read_body(cache_key)
+            if body is not None:
+                cache.refresh(cache_key, entry, response)
+                self._record_cache_event("revalidated", len(body))
+                return self._parse_json_response(cache.to_response(entry, body), url)
+        self._record_cache_event("miss")
+
+        payload = self._parse_json_response(response, url)
+        if payload is not None:
+            stored = cache.store(cache_key, response)
+            if stored is not None:
+                self._record_cache_event("stored", stored.size)
+        return payload
+
+    @staticmethod
+    def _cache_key(url: str, headers: dict[str, str] | None, params: Any = None) -> str:
+        """Return the cache key for a JSON GET (full URL + Accept variant)."""
+        full_url = url
+        if params:
+            full_url = requests.Request("GET", url, params=params).prepare().url or url
+        accept = ""
+        for key, value in (headers or {}).items():
+            if str(key).lower() == "accept":
+                accept = str(value)
+        return HTTPCache.make_key(full_url, accept)
+
+    def _serve_stale(
+        self,
+        cache: HTTPCache,
+        cache_key: str,
+        entry: Any,
+        url: str,
+    ) -> dict[str, Any] | list[Any] | None:
+        """Return a stale cached payload after a network failure, when allowed."""
+        if entry is None or entry.must_revalidate:
+            return None
+        body = cache.read_body(cache_key)
+        if body is None:
+            return None
+        self.logger.warning(f"Serving stale cached JSON for {url} after network failure")
+        self._record_cache_event("stale", len(body))
+        return self._parse_json_response(cache.to_response(entry, body), url)
+
+    def _fresh_cached_body(self, cache: HTTPCache | None, cache_key: str) -> bytes | None:
+        entry = cache.lookup(cache_key) if cache is not None else None
+        if entry is None or not entry.is_fresh():
+            return None
+        body = cache.read_body(cache_key)
+        if body is not None:
+            self._record_cache_event("hit", len(body))
+        return body
+
+    def iter_json_body(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        chunk_size: int = 64 * 1024,
+        cache_max_bytes: int = 4 * 1024 * 1024,
+        **kwargs,
+    ) -> Iterator[bytes]:
+        """Yield the body of a JSON resource in chunks, for incremental parsers.
+
+        A fresh `get_json` cache entry is served without touching the network. Otherwise
+        the response is streamed; when it is read to the end and is at most
+        `cache_max_bytes` long it is stored in the JSON cache, so a later `get_json` of
+        the same URL is a hit. Larger bodies are never held in memory. Closing the
+        generator early closes the connection.
+
+        Raises:
+            requests.RequestException: When the request fails or returns a non-200 status.
+        """
+        cache = self.cache
+        cache_key = self._cache_key(url, headers, kwargs.get("params"))
+        body = self._fresh_cached_body(cache, cache_key)
+        if body is not None:
+            for start in range(0, len(body), chunk_size):
+                yield body[start : start + chunk_size]
+            return
+
+        response = self.get(url, headers=headers, stream=True, **kwargs)
+        try:
+            if response.status_code != 200:
+                raise requests.HTTPError(f"HTTP {response.status_code} for {url}", response=response)
+            tee: bytearray | None = bytearray() if cache is not None else None
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if not chunk:
+                    continue
+                if tee is not None:
+                    tee.extend(chunk)
+                    if len(tee) > cache_max_bytes:
+                        tee = None
+                yield chunk
+            if tee:
+                response._content = bytes(tee)
+                stored = cache.store(cache_key, response)
+                if stored is not None:
+                    self._record_cache_event("stored", stored.size)
+        finally:
+            response.close()
+
+    def _parse_json_response(self, response: requests.Response, url: str) -> dict[str, Any] | list[Any] | None:
+        """Parse a JSON body with the fallbacks used by get_json()."""
+        # Handle empty response
+        if not response.content:
+            self.logger.warning(f"Empty response from {url}")
+            return None
+
+        # Try standard JSON parsing first
+        try:
+            return response.json()
+        except ValueError:
+            # JSON parse failed, try fallbacks
+            self.logger.debug(f"Direct JSON parse failed for {url}, trying fallbacks")
+            return self._handle_json_fallback(response)
+
     def _handle_json_fallback(self, response: requests.Response) -> dict[str, Any] | list[Any] | None:
         """Handle edge cases for JSON parsing.
 
@@ -926,8 +1122,42 @@ class HTTPClient:
             return None
 
 
+def _http_cache_limits(network_policy: dict[str, Any]) -> dict[str, int] | None:
+    """Return the `HTTPCache` limits of `network_policy["http_cache"]`, or None when caching is off."""
+    cache_policy = network_policy.get("http_cache")
+    if not isinstance(cache_policy, dict) or not cache_policy.get("enabled", False):
+        return None
+    return {
+        "max_bytes": int(cache_policy.get("max_bytes", 64 * 1024 * 1024)),
+        "default_ttl_s": int(cache_policy.get("default_ttl_s", 3600)),
+        "max_ttl_s": int(cache_policy.get("max_ttl_s", 7 * 86400)),
+    }
+
+
 _http_client_lock = threading.Lock()
 _http_client_instance: HTTPClient | None = None
+_http_cache_lock = threading.Lock()
+_http_cache_instance: HTTPCache | None = None
+
+
+def get_http_cache(network_policy: dict[str, Any]) -> HTTPCache | None:
+    """Return the process-wide JSON response cache, or None when `http_cache` is disabled.
+
+    Every application HTTPClient (the shared one and the discovery search one)
+    uses this instance, so `max_bytes` and LRU eviction cover all cached
+    responses together. Limits are refreshed from `network_policy` on each call.
+    """
+    global _http_cache_instance
+    limits = _http_cache_limits(network_policy)
+    if limits is None:
+        return None
+    root = http_cache_dir()
+    with _http_cache_lock:
+        if _http_cache_instance is None or _http_cache_instance.root != root:
+            _http_cache_instance = HTTPCache(root, **limits)
+        else:
+            _http_cache_instance.configure(**limits)
+        return _http_cache_instance
 
 
 def get_http_client() -> HTTPClient:
@@ -943,10 +1173,17 @@ def get_http_client() -> HTTPClient:
 
                 cm = get_config_manager()
                 network_policy = cm.data.get("settings", {}).get("network", {})
-                _http_client_instance = HTTPClient(network_policy=network_policy)
+                _http_client_instance = HTTPClient(network_policy=network_policy, cache=get_http_cache(network_policy))
     return _http_client_instance
 
 
+def http_cache_dir() -> Path:
+    """Return the on-disk location of the shared JSON response cache."""
+    from .config_manager import get_config_manager
+
+    return get_config_manager().get_temp_dir() / "_cache" / "http"
+
+
 def reset_http_client() -> None:
     """Invalidate the cached HTTPClient so the next call rebuilds it.
 
@@ -7,7 +7,7 @@ from typing import Any
 
 from PIL import Image
 
-from .http_client import HTTPClient
+from .http_client import HTTPClient, get_http_client
 from .logic.downloader import CanvasServiceLocator
 
 
@@ -47,7 +47,8 @@ def probe_remote_max_dimensions(
 ) -> tuple[int | None, int | None, str | None]:
     """Return `(width, height, service_base)` from remote IIIF info.json for one page.
 
-    If http_client is not provided, creates a temporary one with default settings.
+    If http_client is not provided, the shared client is used so repeated probes
+    are served from its JSON response cache.
     """
     base = _service_base_for_page(manifest, page_num_1_based)
     if not base:
@@ -55,13 +56,8 @@ def probe_remote_max_dimensions(
 
     info_url = base.rstrip("/") + "/info.json"
 
-    # Create temporary client if none provided
     if http_client is None:
-        from .config_manager import get_config_manager
-
-        cm = get_config_manager()
-        network_policy = cm.data.get("settings", {}).get("network", {})
-        http_client = HTTPClient(network_policy=network_policy)
+        http_client = get_http_client()
 
     try:
         t = max(3, int(timeout_s))
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from .config_manager import get_config_manager
+from .event_bus import TOPIC_JOBS, publish_event
 from .exceptions import DatabaseError
 from .logger import get_logger
 from .network_policy import resolve_global_max_concurrent_jobs
@@ -55,8 +56,37 @@ class JobManager:
             self._enqueue_download_job(job_id, db_job_id)
         else:
             self._start_job_thread(job_id)
+        self._publish_job_events([job_id])
         return job_id
 
+    def _publish_job_events(self, job_ids: list[str]) -> None:
+        """Push the current snapshot of `job_ids` to live UI subscribers."""
+        snapshots: list[dict[str, Any]] = []
+        with self._lock:
+            for jid in job_ids:
+                info = self._jobs.get(jid)
+                if not info:
+                    continue
+                snapshots.append(
+                    {
+                        "job_id": jid,
+                        "db_job_id": info.get("db_job_id") or jid,
+                        "job_type": info.get("type") or "generic",
+                        "status": info.get("status") or "",
+                        "progress": round(float(info.get("progress") or 0.0), 2),
+                        "current": int(info.get("current") or 0),
+                        "total": int(info.get("total") or 0),
+                        "queue_position": int(info.get("queue_position") or 0),
+                    }
+                )
+        for snapshot in snapshots:
+            # Keyed by the vault id the UI renders, so each card can match its own events.
+            publish_event(TOPIC_JOBS, f"job:{snapshot['db_job_id']}", snapshot)
+
+    def _all_job_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._jobs)
+
     def _register_pending_job(
         self,
         job_id: str,
@@ -248,6 +278,8 @@ class JobManager:
         with self._lock:
             self._active_downloads.discard(job_id)
             self._dispatch_queued_downloads_locked()
+        # Queue positions of the remaining downloads may have shifted.
+        self._publish_job_events(self._all_job_ids())
 
     def _inject_worker_callbacks(
         self,
@@ -269,6 +301,8 @@ class JobManager:
                     job_id,
                     progress=progress_ratio,
                     message=msg or f"Processing {current}/{total}",
+                    current=current,
+                    total=total,
                 )
             except Exception:
                 logger.debug("Failed to update in-memory job progress for %s", job_id, exc_info=True)
@@ -288,6 +322,7 @@ class JobManager:
         with self._lock:
             self._jobs[job_id]["status"] = "running"
             self._jobs[job_id]["queue_position"] = 0
+        self._publish_job_events([job_id])
 
         if job_type != "download":
             return
@@ -308,6 +343,7 @@ class JobManager:
             self._jobs[job_id]["progress"] = 1.0
             self._jobs[job_id]["message"] = "Done"
             self._jobs[job_id]["result"] = result
+        self._publish_job_events([job_id])
 
     def _mark_stopped(self, job_id: str, job_type: str, db_job_id: str | None) -> None:
         with self._lock:
@@ -330,6 +366,7 @@ class JobManager:
             self._jobs[job_id]["status"] = target_status
             self._jobs[job_id]["message"] = target_message
             self._jobs[job_id]["error"] = None
+        self._publish_job_events([job_id])
 
     def _mark_failure(self, job_id: str, exc: Exception, job_type: str, db_job_id: str | None) -> None:
         logger.exception("Job %s failed", job_id)
@@ -347,6 +384,7 @@ class JobManager:
             self._jobs[job_id]["status"] = "failed"
             self._jobs[job_id]["error"] = error_text
             self._jobs[job_id]["message"] = message_text
+        self._publish_job_events([job_id])
 
     # --- DB helper methods to keep complexity low ---
     @staticmethod
@@ -633,6 +671,8 @@ class JobManager:
                 self._update_db_safe(db_id, status="cancelled", error=None)
             except DatabaseError:
                 logger.debug("Failed to mark queued job cancelled: %s", db_id, exc_info=True)
+        if found:
+            self._publish_job_events(self._all_job_ids())
         return found
 
     def _target_job_ids_locked(self, id_or_db_id: str) -> list[str]:
@@ -724,6 +764,7 @@ class JobManager:
                     self._pause_snapshot_locked(info, db_id, to_mark_pausing, to_mark_paused)
 
         self._apply_pause_status_updates(to_mark_pausing, to_mark_paused, self._update_db_safe)
+        self._publish_job_events(target_job_ids)
         return bool(to_mark_pausing or to_mark_paused)
 
     def prioritize_download(self, id_or_db_id: str) -> bool:
@@ -762,7 +803,7 @@ class JobManager:
         with self._lock:
             return self._jobs.get(job_id)
 
-    def update_job(self, job_id: str, status=None, progress=None, message=None):
+    def update_job(self, job_id: str, status=None, progress=None, message=None, current=None, total=None):
         """Update one of the tracked job fields."""
         with self._lock:
             if job_id in self._jobs:
@@ -772,6 +813,10 @@ class JobManager:
                     self._jobs[job_id]["progress"] = progress
                 if message:
                     self._jobs[job_id]["message"] = message
+                if current is not None and total is not None:
+                    self._jobs[job_id]["current"] = int(current or 0)
+                    self._jobs[job_id]["total"] = int(total or 0)
+        self._publish_job_events([job_id])
 
     def list_jobs(self, active_only=False):
         """List all tracked jobs, optionally filtering to active work."""
@@ -16,17 +16,18 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from .._rate_limiter import get_host_limiter
+from ..catalog_enrichment import get_catalog_page_cache, schedule_catalog_enrichment
 from ..config_manager import get_config_manager
 from ..http_client import HTTPClient, get_http_client
 from ..iiif_tiles import stitch_iiif_tiles_to_jpeg
 from ..image_settings import normalize_stitch_mode, resolve_download_strategy
-from ..library_catalog import parse_manifest_catalog
+from ..library_catalog import external_enrichment_url, parse_manifest_catalog
 from ..logger import get_download_logger
 from ..network_policy import resolve_library_network_policy
 from ..pdf_utils import convert_pdf_to_images  # noqa: F401 - preserved for monkeypatch compatibility in tests
 from ..resolvers.mag_parser import fetch_and_convert, is_iccu_magparser_url
 from ..services.storage.vault_manager import VaultManager
-from ..utils import DEFAULT_HEADERS, ensure_dir, save_json
+from ..utils import DEFAULT_HEADERS, ensure_dir, load_json, save_json
 from .download_helpers import derive_identifier
 
 SECURE_RANDOM = SystemRandom()
@@ -301,7 +302,7 @@ class IIIFDownloader:
 
         # load manifest and derive human label (for display, NOT for storage)
         if is_iccu_magparser_url(manifest_url):
-            self.manifest = fetch_and_convert(manifest_url)
+            self.manifest = fetch_and_convert(manifest_url, refresh=self.force_redownload)
         else:
             self.manifest = get_http_client().get_json(manifest_url) or {}
         # ICCU records often declare more pages than are actually served —
@@ -482,16 +483,34 @@ class IIIFDownloader:
         return self._host_limiter.wait_turn(window_s=window_s, max_requests=max_requests, should_cancel=should_cancel)
 
     def extract_metadata(self):
-        """Extract and save basic metadata from the manifest."""
-        catalog = parse_manifest_catalog(self.manifest, self.manifest_url, self.ms_id, enrich_external_reference=True)
-        display_title = str(catalog.get("catalog_title") or self.label)
+        """Extract and save basic metadata from the manifest.
+
+        The external catalog page is only read here when the catalog page cache already holds it;
+        otherwise the manifest-only catalog is saved and the scrape runs on the enrichment queue,
+        so page downloads never wait on the library's HTML catalog.
+        """
+        catalog = self._parse_catalog(enrich=False)
+        enrich_url = external_enrichment_url(catalog)
+        if enrich_url and get_catalog_page_cache().get(enrich_url) is not None:
+            catalog = self._parse_catalog(enrich=True)
+            enrich_url = ""
+        self._save_catalog_metadata(catalog)
+        save_json(self.manifest_path, self.manifest)
+        self._upsert_catalog(catalog, manifest_local_available=1)
+        if enrich_url:
+            schedule_catalog_enrichment(self.ms_id, lambda: self._apply_external_catalog(catalog))
+
+    def _parse_catalog(self, *, enrich: bool) -> dict[str, Any]:
+        return parse_manifest_catalog(self.manifest, self.manifest_url, self.ms_id, enrich_external_reference=enrich)
+
+    def _save_catalog_metadata(self, catalog: dict[str, Any], download_date: str | None = None) -> None:
         metadata = {
             "id": self.ms_id,
-            "title": display_title,
+            "title": str(catalog.get("catalog_title") or self.label),
             "attribution": self.manifest.get("attribution"),
             "description": self.manifest.get("description"),
             "manifest_url": self.manifest_url,
-            "download_date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "download_date": download_date or time.strftime("%Y-%m-%d %H:%M:%S"),
             "shelfmark": catalog.get("shelfmark"),
             "date_label": catalog.get("date_label"),
             "language_label": catalog.get("language_label"),
@@ -503,7 +522,19 @@ class IIIFDownloader:
             "metadata_map": catalog.get("metadata_map", {}),
         }
         save_json(self.meta_path, metadata)
-        save_json(self.manifest_path, self.manifest)
+
+    def _upsert_catalog(self, catalog: dict[str, Any], *, keep_item_type: bool = False, **extra: Any) -> None:
+        display_title = str(catalog.get("catalog_title") or self.label)
+        item_type_fields = (
+            {}
+            if keep_item_type
+            else {
+                "item_type": str(catalog.get("item_type") or "non classificato"),
+                "item_type_source": "auto",
+                "item_type_confidence": float(catalog.get("item_type_confidence") or 0.0),
+                "item_type_reason": str(catalog.get("item_type_reason") or ""),
+            }
+        )
         self.vault.upsert_manuscript(
             self.ms_id,
             display_title=display_title,
@@ -514,14 +545,24 @@ class IIIFDownloader:
             language_label=str(catalog.get("language_label") or ""),
             source_detail_url=str(catalog.get("source_detail_url") or ""),
             reference_text=str(catalog.get("reference_text") or ""),
-            item_type=str(catalog.get("item_type") or "non classificato"),
-            item_type_source="auto",
-            item_type_confidence=float(catalog.get("item_type_confidence") or 0.0),
-            item_type_reason=str(catalog.get("item_type_reason") or ""),
             metadata_json=str(catalog.get("metadata_json") or "{}"),
-            manifest_local_available=1,
+            **item_type_fields,
+            **extra,
         )
 
+    def _apply_external_catalog(self, base_catalog: dict[str, Any]) -> None:
+        """Enrichment queue task: scrape the catalog page and update metadata.json and the vault."""
+        catalog = self._parse_catalog(enrich=True)
+        if catalog == base_catalog or not self.meta_path.exists():
+            return
+        previous = load_json(self.meta_path) or {}
+        self._save_catalog_metadata(catalog, download_date=previous.get("download_date"))
+        row = self.vault.get_manuscript(self.ms_id)
+        if row is None:
+            return
+        self._upsert_catalog(catalog, keep_item_type=row.get("item_type_source") == "manual")
+        self.logger.info(f"Catalog metadata enriched from {catalog.get('source_detail_url')}")
+
     def get_canvases(self):
         """Retrieve the list of canvases from the manifest."""
         sequences = self.manifest.get("sequences", [])
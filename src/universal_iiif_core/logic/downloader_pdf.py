@@ -11,7 +11,12 @@ from requests import RequestException
 from tqdm import tqdm
 
 from ..config_manager import get_config_manager
-from ..export_studio import build_professional_pdf
+from ..doc_revisions import bump_document_revision
+from ..exceptions import DownloadError
+from ..export_page_cache import get_export_page_cache
+from ..export_studio import build_professional_pdf, resolve_encode_workers
+from ..pdf_utils import RasterizedPage, resolve_raster_workers
+from ..range_download import download_file
 from ..utils import load_json
 
 
@@ -57,6 +62,10 @@ def create_pdf(self, files=None):
                 source_url=self.manifest_url,
                 cover_logo_bytes=logo_bytes,
                 progress_callback=update_progress,
+                encode_workers=resolve_encode_workers(cm.get_setting("pdf.export.encode_workers", 0)),
+                page_cache=get_export_page_cache(),
+                chunk_pages=int(cm.get_setting("pdf.export.assembly_chunk_pages", 100) or 0),
+                garbage=int(cm.get_setting("pdf.export.save_garbage", 0) or 0),
             )
 
         self.logger.info(f"PDF Generated successfully: {output_path}")
@@ -85,17 +94,37 @@ def _load_logo_bytes(self, logo_path):
         return None
 
 
+def _native_pdf_request_options(self) -> dict[str, Any]:
+    """Carry the viewer pre-warm state (Referer/Origin, cookies) of the legacy session over to HTTPClient."""
+    session = getattr(self, "session", None)
+    if session is None:
+        return {}
+    headers = {key: session.headers[key] for key in ("Referer", "Origin") if key in session.headers}
+    return {"headers": headers or None, "cookies": session.cookies}
+
+
 def download_native_pdf(self, pdf_url: str) -> bool:
-    """Download a PDF advertised in the IIIF manifest rendering section."""
+    """Download a PDF advertised in the IIIF manifest rendering section.
+
+    Large files are fetched as parallel byte ranges when the server allows it
+    and resume from the partial-file journal after an interrupted attempt.
+    """
     try:
-        with self.session.get(pdf_url, stream=True, timeout=getattr(self, "_request_timeout", (10, 60))) as r:
-            r.raise_for_status()
-            with self.output_path.open("wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+        segments = int(self.cm.get_setting("pdf.native_download_segments", 4) or 1)
+    except (TypeError, ValueError):
+        segments = 4
+    try:
+        download_file(
+            self.http_client,
+            pdf_url,
+            self.output_path,
+            segments=segments,
+            library_name=getattr(self, "library_key", None),
+            timeout=getattr(self, "_request_timeout", (10, 60)),
+            **self._native_pdf_request_options(),
+        )
         return True
-    except (RequestException, OSError):
+    except (DownloadError, RequestException, OSError):
         self.logger.debug("Native PDF download failed", exc_info=True)
         return False
 
@@ -127,19 +156,27 @@ def _extract_pages_from_pdf(
     self._clear_existing_scans()
     viewer_dpi = int(self.cm.get_setting("pdf.viewer_dpi", 150) or 150)
     viewer_quality = int(self.cm.get_setting("pdf.viewer_jpeg_quality", 95) or 95)
+    rasterized: list[RasterizedPage] = []
+    self._rasterized_pages = None
     ok, message = downloader_module.convert_pdf_to_images(
         pdf_path=pdf_path,
         output_dir=self.scans_dir,
         progress_callback=progress_callback,
         dpi=viewer_dpi,
         jpeg_quality=viewer_quality,
+        workers=resolve_raster_workers(self.cm.get_setting("pdf.raster_workers", 0)),
+        pages_out=rasterized,
+        passthrough_images=bool(self.cm.get_setting("pdf.extract_embedded_images", True)),
     )
     if ok:
+        self._rasterized_pages = rasterized or None
         self.logger.info("Native PDF extraction completed: %s", message)
-        return True
-    self.logger.warning("Native PDF extraction failed: %s", message)
-    self._clear_existing_scans()
-    return False
+    else:
+        self.logger.warning("Native PDF extraction failed: %s", message)
+        self._clear_existing_scans()
+    # Every scan was replaced (or removed), so the whole document changed.
+    bump_document_revision(getattr(self, "ms_id", ""))
+    return ok
 
 
 def _clear_existing_scans(self) -> None:
@@ -148,23 +185,34 @@ def _clear_existing_scans(self) -> None:
             scan_file.unlink()
 
 
+def _scan_stat_entry(index: int, filename: str, source_label: str, size_bytes: int, width: int, height: int):
+    return {
+        "page_index": index,
+        "filename": filename,
+        "original_url": source_label,
+        "thumbnail_url": None,
+        "size_bytes": size_bytes,
+        "width": width,
+        "height": height,
+        "resolution_category": "High" if width > 2500 else "Medium",
+    }
+
+
 def _collect_scan_stats(self, source_label: str) -> list[dict[str, Any]]:
+    rasterized = getattr(self, "_rasterized_pages", None)
+    if rasterized:
+        # The rasterizer already measured every file it wrote; no need to reopen them.
+        return [
+            _scan_stat_entry(index, page.filename, source_label, page.size_bytes, page.width, page.height)
+            for index, page in enumerate(rasterized)
+        ]
     page_stats: list[dict[str, Any]] = []
     for index, image_path in enumerate(sorted(self.scans_dir.glob("pag_*.jpg"))):
         try:
             with Image.open(image_path) as img:
                 width, height = img.size
             page_stats.append(
-                {
-                    "page_index": index,
-                    "filename": image_path.name,
-                    "original_url": source_label,
-                    "thumbnail_url": None,
-                    "size_bytes": image_path.stat().st_size,
-                    "width": width,
-                    "height": height,
-                    "resolution_category": "High" if width > 2500 else "Medium",
-                }
+                _scan_stat_entry(index, image_path.name, source_label, image_path.stat().st_size, width, height)
             )
         except Exception:
             self.logger.debug("Failed to collect scan stats for %s", image_path, exc_info=True)
@@ -214,6 +262,7 @@ def attach_pdf_methods(cls) -> None:
     cls.create_pdf = create_pdf
     cls._determine_pdf_output_path = _determine_pdf_output_path
     cls._load_logo_bytes = _load_logo_bytes
+    cls._native_pdf_request_options = _native_pdf_request_options
     cls.download_native_pdf = download_native_pdf
     cls._should_prefer_native_pdf = _should_prefer_native_pdf
     cls._should_create_pdf_from_images = _should_create_pdf_from_images
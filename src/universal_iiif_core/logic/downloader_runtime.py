@@ -10,6 +10,7 @@ from pathlib import Path
 
 from tqdm import tqdm
 
+from ..doc_revisions import bump_document_revision
 from ..utils import clean_dir, load_json, save_json
 from .downloader import PageDownloader
 
@@ -352,6 +353,7 @@ def _finalize_downloads(self, valid):
             shutil.copy2(str(staged_file), str(dest))
         with suppress(OSError):
             staged_file.unlink()
+    bump_document_revision(getattr(self, "ms_id", ""), validated_pages)
 
     try:
         clean_dir(self.temp_dir)
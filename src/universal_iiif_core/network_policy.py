@@ -60,6 +60,12 @@ DEFAULT_NETWORK_SETTINGS: dict[str, Any] = {
         "default_backoff_cap_s": 300.0,
         "respect_retry_after": True,
     },
+    "http_cache": {
+        "enabled": True,
+        "max_bytes": 67108864,
+        "default_ttl_s": 3600,
+        "max_ttl_s": 604800,
+    },
     "libraries": {
         "gallica": {
             "enabled": True,
@@ -348,6 +354,34 @@ def _normalize_download_node(download_node: dict[str, Any]) -> dict[str, Any]:
     return normalized
 
 
+def _normalize_http_cache_node(cache_node: dict[str, Any]) -> dict[str, Any]:
+    defaults = DEFAULT_NETWORK_SETTINGS["http_cache"]
+    normalized = {
+        "enabled": _as_bool(cache_node.get("enabled"), bool(defaults["enabled"])),
+        "max_bytes": _as_int(
+            cache_node.get("max_bytes", defaults["max_bytes"]),
+            defaults["max_bytes"],
+            min_value=1024 * 1024,
+            max_value=4 * 1024**3,
+        ),
+        "default_ttl_s": _as_int(
+            cache_node.get("default_ttl_s", defaults["default_ttl_s"]),
+            defaults["default_ttl_s"],
+            min_value=0,
+            max_value=30 * 86400,
+        ),
+        "max_ttl_s": _as_int(
+            cache_node.get("max_ttl_s", defaults["max_ttl_s"]),
+            defaults["max_ttl_s"],
+            min_value=60,
+            max_value=365 * 86400,
+        ),
+    }
+    if normalized["max_ttl_s"] < normalized["default_ttl_s"]:
+        normalized["max_ttl_s"] = normalized["default_ttl_s"]
+    return normalized
+
+
 def _normalize_library_node(library_key: str, library_node: dict[str, Any]) -> dict[str, Any]:
     defaults = _dict_or_empty(DEFAULT_NETWORK_SETTINGS["libraries"].get(library_key))
     merged = deepcopy(defaults)
@@ -451,6 +485,7 @@ def normalize_network_settings(settings_node: dict[str, Any]) -> None:
     network = ensure_network_defaults(settings_node)
     network["global"] = _normalize_global_node(_dict_or_empty(network.get("global")))
     network["download"] = _normalize_download_node(_dict_or_empty(network.get("download")))
+    network["http_cache"] = _normalize_http_cache_node(_dict_or_empty(network.get("http_cache")))
 
     libraries_raw = _dict_or_empty(network.get("libraries"))
     normalized_libraries: dict[str, dict[str, Any]] = {}
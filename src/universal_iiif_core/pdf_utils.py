@@ -1,3 +1,9 @@
+import io
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
 
 import pymupdf as fitz  # PyMuPDF
@@ -81,32 +87,297 @@ def load_pdf_page(
         return (None, str(exc)) if return_error else None
 
 
-def generate_pdf_from_images(image_paths, output_path):
-    """Combine a list of image paths into a single PDF."""
+class ChunkedPdfWriter:
+    """Build a PDF whose in-memory footprint is bounded by `chunk_pages`.
+
+    Pages are created on `writer.doc`. After every `chunk_pages` calls to
+    `page_added()` the pages written so far are flushed to a `.part` file next
+    to the output (first a full save, then incremental appends) and the
+    document is reopened from disk, so image streams of flushed pages are no
+    longer held in memory. `chunk_pages=0` keeps the whole document in memory
+    and saves it once.
+
+    `garbage` is forwarded to the final `save` (0 = fastest, 4 = full object
+    deduplication). With chunking, a non-zero level costs one extra rewrite of
+    the assembled file, which is still streamed object by object.
+
+    Always pair with `close()` (e.g. in a `finally`) to release the document
+    and drop the partial file when the build is aborted.
+    """
+
+    def __init__(self, output_path: Path, *, chunk_pages: int = 0, garbage: int = 0) -> None:
+        """Prepare an empty document that will be saved to `output_path`."""
+        self.output_path = Path(output_path)
+        self.chunk_pages = max(0, int(chunk_pages or 0))
+        self.garbage = max(0, min(int(garbage or 0), 4))
+        self.doc = fitz.open()
+        self._part_path = self.output_path.with_name(f"{self.output_path.name}.part")
+        self._pending_pages = 0
+        self._flushed = False
+
+    def page_added(self, count: int = 1) -> None:
+        """Record pages written on `doc` and flush them once a chunk is complete."""
+        self._pending_pages += count
+        if self.chunk_pages and self._pending_pages >= self.chunk_pages:
+            self._flush()
+
+    def _save_incremental(self) -> None:
+        self.doc.save(str(self._part_path), incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP, deflate=True)
+
+    def _flush(self) -> None:
+        if self._flushed:
+            self._save_incremental()
+        else:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            self.doc.save(str(self._part_path), deflate=True)
+            self._flushed = True
+        self.doc.close()
+        self.doc = fitz.open(str(self._part_path))
+        self._pending_pages = 0
+
+    def finish(self) -> Path:
+        """Write the final PDF to `output_path` and close the document."""
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self._flushed:
+            self.doc.save(str(self.output_path), garbage=self.garbage, deflate=True)
+        else:
+            # Pages added after the last flush (e.g. a colophon) are appended unconditionally.
+            self._save_incremental()
+            if self.garbage:
+                self.doc.save(str(self.output_path), garbage=self.garbage, deflate=True)
+        self.doc.close()
+        if self._flushed:
+            if self.garbage:
+                self._part_path.unlink(missing_ok=True)
+            else:
+                self._part_path.replace(self.output_path)
+        return self.output_path
+
+    def close(self) -> None:
+        """Close the document and remove any leftover partial file."""
+        if not self.doc.is_closed:
+            self.doc.close()
+        self._part_path.unlink(missing_ok=True)
+
+
+def generate_pdf_from_images(image_paths, output_path, chunk_pages: int = 50):
+    """Combine a list of image paths into a single PDF, one page per image.
+
+    Images are embedded one at a time (JPEG files as-is) and flushed to disk
+    every `chunk_pages` pages, so memory does not grow with the page count.
+    """
+    writer = ChunkedPdfWriter(Path(output_path), chunk_pages=chunk_pages)
+    pages_added = 0
     try:
-        images = []
         for p in image_paths:
-            if Path(p).exists():
-                with PILImage.open(p) as img:
-                    if img.mode != "RGB":
-                        img = img.convert("RGB")
-                    # Copy image data to prevent closing before save
-                    img_copy = img.copy()
-                    images.append(img_copy)
-
-        if images:
-            try:
-                images[0].save(output_path, save_all=True, append_images=images[1:])
-                return True, f"PDF creato con successo: {output_path}"
-            finally:
-                # Close all image copies
-                for img in images:
-                    img.close()
-
-        return False, "Nessuna immagine valida trovata."
+            if not Path(p).exists():
+                continue
+            with PILImage.open(p) as img:
+                width, height = img.size
+            page = writer.doc.new_page(width=width, height=height)
+            page.insert_image(page.rect, filename=str(p))
+            writer.page_added()
+            pages_added += 1
+
+        if not pages_added:
+            return False, "Nessuna immagine valida trovata."
+        writer.finish()
+        return True, f"PDF creato con successo: {output_path}"
     except Exception as e:
         logger.error("Error creating PDF: %s", e)
         return False, str(e)
+    finally:
+        writer.close()
+
+
+_MAX_RASTER_WORKERS = 16
+_RASTER_CHUNK_MAX_PAGES = 16
+# Below this many pages a process pool costs more than it saves.
+_MIN_PAGES_FOR_PROCESS_POOL = 8
+
+
+@dataclass(frozen=True)
+class RasterizedPage:
+    """One page written by `convert_pdf_to_images`, with the figures the scan stats need."""
+
+    page_index: int
+    filename: str
+    width: int
+    height: int
+    size_bytes: int
+    passthrough: bool = False
+
+
+def resolve_raster_workers(configured: int | None = None) -> int:
+    """Return the rasterization process count; `0`/None means one per core, capped at 4."""
+    try:
+        value = int(configured or 0)
+    except (TypeError, ValueError):
+        value = 0
+    if value > 0:
+        return min(value, _MAX_RASTER_WORKERS)
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def _raster_filename(page_index: int) -> str:
+    return f"pag_{page_index:04d}.jpg"
+
+
+def _single_full_page_image(page: fitz.Page) -> int | None:
+    """Return the xref of the only image on `page` when it fills the page upright and nothing visible overlays it."""
+    if page.rotation or len(page.get_images(full=True)) != 1:
+        return None
+    placements = page.get_image_info(xrefs=True)
+    if len(placements) != 1:
+        return None
+    info = placements[0]
+    a, b, c, d, _e, _f = info["transform"]
+    if b or c or a <= 0 or d <= 0 or info.get("has-mask") or info.get("colorspace") not in (1, 3):
+        return None
+    page_rect = page.rect
+    tolerance = 0.01 * max(page_rect.width, page_rect.height)
+    bbox = fitz.Rect(info["bbox"])
+    if any(abs(edge) > tolerance for edge in (bbox.x0 - page_rect.x0, bbox.y0 - page_rect.y0)):
+        return None
+    if any(abs(edge) > tolerance for edge in (bbox.x1 - page_rect.x1, bbox.y1 - page_rect.y1)):
+        return None
+    # Invisible text (render mode 3, e.g. an OCR layer) is allowed; visible text or vector art is not.
+    if page.get_drawings() or any(span.get("type") != 3 for span in page.get_texttrace()):
+        return None
+    return int(info["xref"])
+
+
+def _embedded_jpeg(doc: fitz.Document, xref: int) -> tuple[bytes, int, int] | None:
+    """Return the raw JPEG stream of image `xref` with its size, when it can be used as a file unchanged."""
+    if doc.xref_get_key(xref, "Filter") != ("name", "/DCTDecode"):
+        return None
+    if doc.xref_get_key(xref, "Decode")[0] != "null":
+        return None
+    data = doc.xref_stream_raw(xref)
+    try:
+        with PILImage.open(io.BytesIO(data)) as img:
+            if img.format != "JPEG" or img.mode not in ("RGB", "L"):
+                return None
+            # PDF renderers ignore EXIF orientation, image viewers would not.
+            if img.getexif().get(0x0112, 1) != 1:
+                return None
+            width, height = img.size
+    except Exception:
+        return None
+    return data, width, height
+
+
+def _write_raster_pages(
+    doc: fitz.Document,
+    start: int,
+    stop: int,
+    out_dir: Path,
+    dpi: int,
+    jpeg_quality: int,
+    on_page: Callable[[int], None] | None = None,
+    passthrough_images: bool = False,
+) -> list[RasterizedPage]:
+    pages: list[RasterizedPage] = []
+    for page_index in range(start, stop):
+        page = doc.load_page(page_index)
+        out_path = out_dir / _raster_filename(page_index)
+        xref = _single_full_page_image(page) if passthrough_images else None
+        embedded = _embedded_jpeg(doc, xref) if xref else None
+        if embedded:
+            data, width, height = embedded
+            out_path.write_bytes(data)
+            pages.append(RasterizedPage(page_index, out_path.name, width, height, len(data), passthrough=True))
+        else:
+            img = _render_page_to_pil(page, dpi=dpi)
+            img.save(str(out_path), "JPEG", quality=jpeg_quality)
+            pages.append(RasterizedPage(page_index, out_path.name, img.width, img.height, out_path.stat().st_size))
+        if on_page:
+            on_page(page_index + 1)
+    return pages
+
+
+def _rasterize_page_range(
+    pdf_path: str,
+    start: int,
+    stop: int,
+    output_dir: str,
+    dpi: int,
+    jpeg_quality: int,
+    password: str | None,
+    passthrough_images: bool = False,
+) -> list[RasterizedPage]:
+    """Render pages `start..stop-1` in a worker process, which opens its own copy of the document."""
+    doc = _open_pdf_document(pdf_path, password=password)
+    try:
+        return _write_raster_pages(
+            doc, start, stop, Path(output_dir), dpi, jpeg_quality, passthrough_images=passthrough_images
+        )
+    finally:
+        doc.close()
+
+
+def _raster_process_context():
+    """Return the multiprocessing context for raster workers.
+
+    Workers are never forked from the caller: the Studio renders PDFs from
+    JobManager threads, and a forked child would inherit their held locks,
+    SQLite handles and the server event loop. `forkserver` starts children
+    from a single-threaded server process; platforms without it (Windows) use
+    `spawn`. Both re-import the entry module (`studio_app`) in a fresh
+    interpreter, so that module must stay free of startup side effects.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _raster_chunks(total_pages: int, workers: int) -> list[tuple[int, int]]:
+    # Several chunks per worker keep progress granular and balance uneven pages.
+    size = max(1, min(_RASTER_CHUNK_MAX_PAGES, -(-total_pages // (workers * 4))))
+    return [(start, min(start + size, total_pages)) for start in range(0, total_pages, size)]
+
+
+def _rasterize_in_processes(
+    pdf_path: str,
+    total_pages: int,
+    output_dir: str,
+    dpi: int,
+    jpeg_quality: int,
+    password: str | None,
+    workers: int,
+    progress_callback=None,
+    passthrough_images: bool = False,
+) -> list[RasterizedPage]:
+    """Render all pages across worker processes."""
+    context = _raster_process_context()
+    pages: list[RasterizedPage] = []
+    chunks = _raster_chunks(total_pages, workers)
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=context)
+    try:
+        pending: set[Future] = {
+            executor.submit(
+                _rasterize_page_range,
+                pdf_path,
+                start,
+                stop,
+                output_dir,
+                dpi,
+                jpeg_quality,
+                password,
+                passthrough_images,
+            )
+            for start, stop in chunks
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pages.extend(future.result())
+            if progress_callback:
+                progress_callback(len(pages), total_pages)
+    finally:
+        # A failed chunk or a cancelling callback drops the chunks not started yet.
+        executor.shutdown(wait=True, cancel_futures=True)
+    pages.sort(key=lambda page: page.page_index)
+    return pages
 
 
 def convert_pdf_to_images(
@@ -116,11 +387,23 @@ def convert_pdf_to_images(
     dpi: int = 300,
     jpeg_quality: int = 90,
     password: str | None = None,
+    workers: int = 1,
+    pages_out: list[RasterizedPage] | None = None,
+    passthrough_images: bool = False,
 ):
     """Convert a PDF into a series of JPG images in `output_dir`.
 
     - DPI is configurable (default 300, good for OCR).
     - Detects password-protected PDFs and returns a user-friendly message.
+    - With `workers > 1`, page ranges are rendered by that many worker
+      processes, each opening the PDF independently (PyMuPDF renders on one
+      thread per process, so threads would not help).
+    - With `passthrough_images`, a page that is just one upright full-page
+      JPEG (the usual shape of scanned library PDFs) is written as the
+      embedded stream byte for byte, at its native resolution and without
+      re-encoding; other pages are rendered at `dpi`.
+    - `pages_out`, when given, receives one `RasterizedPage` per written file,
+      in page order, so callers need not reopen the images for their size.
     """
     try:
         out_dir = Path(output_dir)
@@ -134,19 +417,34 @@ def convert_pdf_to_images(
 
             jpeg_quality = int(jpeg_quality or 90)
             jpeg_quality = max(30, min(jpeg_quality, 95))
+            workers = max(1, min(int(workers or 1), _MAX_RASTER_WORKERS, total_pages))
 
-            for page_number in range(total_pages):
-                page = doc.load_page(page_number)
-                img = _render_page_to_pil(page, dpi=dpi)
-                out_name = f"pag_{page_number:04d}.jpg"
-                img.save(str(out_dir / out_name), "JPEG", quality=jpeg_quality)
-
-                if progress_callback:
-                    progress_callback(page_number + 1, total_pages)
-
-            return True, f"Estratte {total_pages} pagine."
+            if workers > 1 and total_pages >= _MIN_PAGES_FOR_PROCESS_POOL and isinstance(pdf_path, (str, Path)):
+                pages = _rasterize_in_processes(
+                    str(pdf_path),
+                    total_pages,
+                    str(out_dir),
+                    dpi,
+                    jpeg_quality,
+                    password,
+                    workers,
+                    progress_callback,
+                    passthrough_images,
+                )
+            else:
+                on_page = (lambda done: progress_callback(done, total_pages)) if progress_callback else None
+                pages = _write_raster_pages(
+                    doc, 0, total_pages, out_dir, dpi, jpeg_quality, on_page, passthrough_images=passthrough_images
+                )
         finally:
             doc.close()
+
+        if pages_out is not None:
+            pages_out.extend(pages)
+        extracted = sum(1 for page in pages if page.passthrough)
+        if extracted:
+            return True, f"Estratte {total_pages} pagine ({extracted} immagini originali senza ricodifica)."
+        return True, f"Estratte {total_pages} pagine."
     except PdfPasswordProtectedError as exc:
         logger.warning("Password-protected PDF blocked: %s", exc)
         return False, str(exc)
@@ -444,6 +444,28 @@ def _make_ic_adapter(fn: Callable[..., list[SearchResult]]) -> SearchHandlerFn:
     return _adapter
 
 
+def _make_local_first_adapter(provider_key: str, handler: SearchHandlerFn) -> SearchHandlerFn:
+    """Serve searches from the harvested local catalog index, falling back to `handler` on a miss.
+
+    Only a completely harvested provider is answered locally; for a partial harvest
+    the local hits are merged into the live results.
+    """
+    from universal_iiif_core.discovery.local_index import merge_with_live, search_local_index
+
+    def _adapter(query: str, payload: dict[str, Any]) -> list[SearchResult]:
+        try:
+            local = search_local_index(provider_key, query, payload)
+        except Exception:
+            logger.debug("Local catalog index lookup failed for %s", provider_key, exc_info=True)
+            local = None
+        if local is None:
+            return handler(query, payload)
+        results, complete = local
+        return results if complete else merge_with_live(handler(query, payload), results)
+
+    return _adapter
+
+
 _search_handlers_cache: types.MappingProxyType[str, SearchHandlerFn] | None = None
 
 
@@ -451,7 +473,9 @@ def get_search_handlers() -> types.MappingProxyType[str, SearchHandlerFn]:
     """Build the search-strategy dispatch dict from the provider registry.
 
     Search functions are lazy-imported from ``resolvers.discovery`` to avoid
-    circular imports at module load time.  The result is cached after first call.
+    circular imports at module load time.  Every handler consults the local
+    catalog index first (see ``discovery.local_index``) and searches live on a
+    miss.  The result is cached after first call.
     Returns a read-only mapping to prevent accidental mutation of the cache.
     """
     global _search_handlers_cache  # noqa: PLW0603
@@ -475,11 +499,12 @@ def get_search_handlers() -> types.MappingProxyType[str, SearchHandlerFn]:
             )
             continue
         if provider.search_strategy == "gallica":
-            handlers[provider.search_strategy] = _make_gallica_adapter(raw_fn)
+            handler = _make_gallica_adapter(raw_fn)
         elif provider.search_strategy == "internetculturale":
-            handlers[provider.search_strategy] = _make_ic_adapter(raw_fn)
+            handler = _make_ic_adapter(raw_fn)
         else:
-            handlers[provider.search_strategy] = _make_standard_adapter(raw_fn)
+            handler = _make_standard_adapter(raw_fn)
+        handlers[provider.search_strategy] = _make_local_first_adapter(provider.key, handler)
 
     _search_handlers_cache = types.MappingProxyType(handlers)
     return _search_handlers_cache
@@ -0,0 +1,360 @@
+"""Resumable, segmented downloads of large binary assets such as native PDFs.
+
+A first ranged request (`Range: bytes=0-0`) tells whether the server honours
+byte ranges and how large the file is. When it does, the file is split into
+segments fetched in parallel, each written at its own offset of a
+preallocated `<name>.part` file. Progress is recorded in a `<name>.part.json`
+journal, so an interrupted download resumes where every segment stopped, as
+long as the remote size and validator (`ETag`/`Last-Modified`) are unchanged.
+Servers without range support get a single streamed request.
+
+Every request goes through `HTTPClient` (per-library policy, retries with
+backoff, rate limiting, per-host concurrency). A body interrupted mid-stream
+is re-requested from the last written byte. The finished file is checked
+against the announced length and, when the server publishes one through
+`Repr-Digest`/`Digest` (or the caller passes it), against its SHA-256/MD5.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import re
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing, suppress
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from .exceptions import DownloadError
+from .http_client import HTTPClient
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+READ_CHUNK_BYTES = 1024 * 1024
+WRITE_BUFFER_BYTES = 8 * 1024 * 1024
+MIN_SEGMENT_BYTES = 8 * 1024 * 1024
+MAX_SEGMENTS = 16
+# Re-requests of one segment after its body was cut off mid-stream.
+MAX_STREAM_RESUMES = 5
+# Journal writes are throttled to one per this many bytes per segment.
+JOURNAL_EVERY_BYTES = 16 * 1024 * 1024
+
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)", re.IGNORECASE)
+_DIGEST_ALGORITHMS = {"sha-256": "sha256", "md5": "md5"}
+
+
+@dataclass
+class _Segment:
+    start: int
+    end: int
+    done: int = 0
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+    @property
+    def complete(self) -> bool:
+        return self.done >= self.length
+
+
+@dataclass(frozen=True)
+class _RemoteFile:
+    size: int | None
+    accepts_ranges: bool
+    validator: str
+    digest: tuple[str, str] | None
+
+
+def _parse_digest(headers: Any) -> tuple[str, str] | None:
+    """Return `(hashlib name, hex digest)` from `Repr-Digest` or `Digest` headers."""
+    repr_digest = str(headers.get("Repr-Digest") or "")
+    for item in repr_digest.split(","):
+        name, _, value = item.strip().partition("=")
+        algorithm = _DIGEST_ALGORITHMS.get(name.strip().lower())
+        if algorithm and value.startswith(":") and value.endswith(":"):
+            with suppress(ValueError):
+                return algorithm, base64.b64decode(value.strip(":")).hex()
+    for item in str(headers.get("Digest") or "").split(","):
+        name, _, value = item.strip().partition("=")
+        algorithm = _DIGEST_ALGORITHMS.get(name.strip().lower())
+        if algorithm and value:
+            with suppress(ValueError):
+                return algorithm, base64.b64decode(value).hex()
+    return None
+
+
+def _segments_for(size: int, count: int) -> list[_Segment]:
+    count = max(1, min(count, MAX_SEGMENTS, -(-size // MIN_SEGMENT_BYTES)))
+    step = -(-size // count)
+    return [_Segment(start, min(start + step, size) - 1) for start in range(0, size, step)]
+
+
+class RangeDownload:
+    """One resumable download of `url` to `dest`."""
+
+    def __init__(
+        self,
+        client: HTTPClient,
+        url: str,
+        dest: Path,
+        *,
+        segments: int = 4,
+        library_name: str | None = None,
+        timeout: tuple[int, int] | None = None,
+        headers: dict[str, str] | None = None,
+        cookies: Any = None,
+        expected_sha256: str | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+    ) -> None:
+        """Prepare the download; nothing is requested until `run()`."""
+        self.client = client
+        self.url = url
+        self.dest = Path(dest)
+        self.segment_count = max(1, int(segments or 1))
+        self.library_name = library_name
+        self.timeout = timeout
+        # Ranges address encoded bytes, so transparent compression is refused.
+        self.headers = {**(headers or {}), "Accept-Encoding": "identity"}
+        self.cookies = cookies
+        self.expected_sha256 = (expected_sha256 or "").strip().lower() or None
+        self.should_cancel = should_cancel
+        self.progress_callback = progress_callback
+        self.part_path = self.dest.with_name(f"{self.dest.name}.part")
+        self.journal_path = self.dest.with_name(f"{self.dest.name}.part.json")
+        self._lock = threading.Lock()
+        self._abort = threading.Event()
+        self._segments: list[_Segment] = []
+        self._remote: _RemoteFile | None = None
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def _get(self, range_header: str | None = None) -> requests.Response:
+        headers = dict(self.headers)
+        if range_header:
+            headers["Range"] = range_header
+        return self.client.get(
+            self.url,
+            library_name=self.library_name,
+            timeout=self.timeout,
+            stream=True,
+            headers=headers,
+            should_cancel=self.should_cancel,
+            cookies=self.cookies,
+        )
+
+    def _check_cancel(self) -> None:
+        if self._abort.is_set() or (self.should_cancel and self.should_cancel()):
+            raise DownloadError(f"Download cancelled: {self.url}")
+
+    def _probe(self) -> tuple[_RemoteFile, requests.Response]:
+        response = self._get("bytes=0-0")
+        headers = response.headers
+        validator = str(headers.get("ETag") or headers.get("Last-Modified") or "")
+        match = _CONTENT_RANGE_RE.match(str(headers.get("Content-Range") or ""))
+        if response.status_code == 206 and match and match.group(3) != "*":
+            remote = _RemoteFile(int(match.group(3)), True, validator, _parse_digest(headers))
+        else:
+            length = headers.get("Content-Length")
+            encoded = str(headers.get("Content-Encoding") or "identity").lower() != "identity"
+            size = int(length) if length and length.isdigit() and not encoded else None
+            remote = _RemoteFile(size, False, validator, _parse_digest(headers))
+        return remote, response
+
+    # ------------------------------------------------------------------
+    # Journal
+    # ------------------------------------------------------------------
+
+    def _load_journal(self, remote: _RemoteFile) -> list[_Segment] | None:
+        try:
+            data = json.loads(self.journal_path.read_text(encoding="utf-8"))
+            if data.get("url") != self.url or data.get("size") != remote.size:
+                return None
+            if data.get("validator") != remote.validator or self.part_path.stat().st_size != remote.size:
+                return None
+            return [_Segment(**item) for item in data.get("segments") or []] or None
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _save_journal(self, remote: _RemoteFile) -> None:
+        """Persist segment progress; `done` only ever counts bytes already flushed to the part file."""
+        with self._lock:
+            payload = {
+                "url": self.url,
+                "size": remote.size,
+                "validator": remote.validator,
+                "segments": [asdict(segment) for segment in self._segments],
+            }
+            tmp = self.journal_path.with_name(f"{self.journal_path.name}.tmp")
+            with suppress(OSError):
+                tmp.write_text(json.dumps(payload), encoding="utf-8")
+                tmp.replace(self.journal_path)
+
+    def _discard_partial(self) -> None:
+        self.part_path.unlink(missing_ok=True)
+        self.journal_path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Transfer
+    # ------------------------------------------------------------------
+
+    def _bytes_done(self) -> int:
+        with self._lock:
+            return sum(segment.done for segment in self._segments)
+
+    def _report(self) -> None:
+        if self.progress_callback:
+            self.progress_callback(self._bytes_done(), self._remote.size if self._remote else None)
+
+    def _commit(self, segment: _Segment, handle, written: int) -> None:
+        handle.flush()
+        with self._lock:
+            segment.done += written
+        self._save_journal(self._remote)
+        self._report()
+
+    def _copy_body(self, response: requests.Response, segment: _Segment, handle) -> None:
+        unsaved = 0
+        try:
+            for chunk in response.iter_content(chunk_size=READ_CHUNK_BYTES):
+                if not chunk:
+                    continue
+                self._check_cancel()
+                chunk = chunk[: segment.length - segment.done - unsaved]
+                handle.write(chunk)
+                unsaved += len(chunk)
+                if unsaved >= JOURNAL_EVERY_BYTES or segment.done + unsaved >= segment.length:
+                    self._commit(segment, handle, unsaved)
+                    unsaved = 0
+                if segment.complete:
+                    break
+        finally:
+            if unsaved:
+                self._commit(segment, handle, unsaved)
+
+    def _fetch_segment(self, segment: _Segment) -> None:
+        interruptions = 0
+        with self.part_path.open("r+b", buffering=WRITE_BUFFER_BYTES) as handle:
+            while not segment.complete:
+                self._check_cancel()
+                offset = segment.start + segment.done
+                with closing(self._get(f"bytes={offset}-{segment.end}")) as response:
+                    match = _CONTENT_RANGE_RE.match(str(response.headers.get("Content-Range") or ""))
+                    if response.status_code != 206 or not match or int(match.group(1)) != offset:
+                        raise DownloadError(f"Server ignored byte range {offset}-{segment.end} for {self.url}")
+                    handle.seek(offset)
+                    try:
+                        self._copy_body(response, segment, handle)
+                    except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as exc:
+                        logger.debug("Segment %s-%s of %s interrupted: %s", segment.start, segment.end, self.url, exc)
+                if not segment.complete:
+                    interruptions += 1
+                    if interruptions > MAX_STREAM_RESUMES:
+                        raise DownloadError(f"Byte range {offset}-{segment.end} of {self.url} kept being cut off")
+
+    def _run_ranged(self, remote: _RemoteFile) -> None:
+        segments = self._load_journal(remote)
+        if segments:
+            done = sum(segment.done for segment in segments)
+            logger.info("Resuming %s: %d/%d bytes already on disk", self.url, done, remote.size)
+        else:
+            self._discard_partial()
+            self.dest.parent.mkdir(parents=True, exist_ok=True)
+            with self.part_path.open("wb") as handle:
+                handle.truncate(remote.size)
+            segments = _segments_for(int(remote.size or 0), self.segment_count)
+        self._segments = segments
+        self._save_journal(remote)
+        pending = [segment for segment in segments if not segment.complete]
+        if not pending:
+            return
+        first_error: BaseException | None = None
+        try:
+            with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="range-download") as executor:
+                futures = [executor.submit(self._fetch_segment, segment) for segment in pending]
+                for future in as_completed(futures):
+                    if future.exception() is not None and first_error is None:
+                        # Stop the sibling segments; their progress is kept for the next attempt.
+                        first_error = future.exception()
+                        self._abort.set()
+        finally:
+            self._save_journal(remote)
+        if first_error is not None:
+            raise first_error
+
+    def _run_single(self, response: requests.Response, remote: _RemoteFile) -> None:
+        self._discard_partial()
+        self.dest.parent.mkdir(parents=True, exist_ok=True)
+        segment = _Segment(0, (remote.size or 0) - 1)
+        self._segments = [segment]
+        try:
+            with self.part_path.open("wb", buffering=WRITE_BUFFER_BYTES) as handle:
+                for chunk in response.iter_content(chunk_size=READ_CHUNK_BYTES):
+                    if chunk:
+                        self._check_cancel()
+                        handle.write(chunk)
+                        segment.done += len(chunk)
+            self._report()
+            if remote.size is not None and segment.done != remote.size:
+                raise DownloadError(f"Incomplete download of {self.url}: {segment.done}/{remote.size} bytes")
+        except BaseException:
+            # Without byte ranges there is nothing to resume from.
+            self.part_path.unlink(missing_ok=True)
+            raise
+
+    # ------------------------------------------------------------------
+    # Verification
+    # ------------------------------------------------------------------
+
+    def _verify(self, remote: _RemoteFile) -> None:
+        actual_size = self.part_path.stat().st_size
+        if remote.size is not None and actual_size != remote.size:
+            raise DownloadError(f"Size mismatch for {self.url}: {actual_size} != {remote.size}")
+        expected = ("sha256", self.expected_sha256) if self.expected_sha256 else remote.digest
+        if not expected:
+            return
+        algorithm, hex_digest = expected
+        hasher = hashlib.new(algorithm)
+        with self.part_path.open("rb") as handle:
+            while block := handle.read(WRITE_BUFFER_BYTES):
+                hasher.update(block)
+        if hasher.hexdigest() != hex_digest:
+            self._discard_partial()
+            raise DownloadError(f"Checksum mismatch for {self.url} ({algorithm})")
+
+    def run(self) -> Path:
+        """Download (or resume) the file and return `dest`.
+
+        Raises:
+            DownloadError: On cancellation, truncated transfers or checksum mismatch.
+            requests.RequestException: When the server keeps failing after the client retries.
+        """
+        remote, probe = self._probe()
+        self._remote = remote
+        try:
+            if remote.accepts_ranges and remote.size:
+                self._run_ranged(remote)
+            else:
+                logger.debug("No byte-range support for %s; downloading in one stream", self.url)
+                self._run_single(probe, remote)
+        finally:
+            probe.close()
+        self._verify(remote)
+        self.part_path.replace(self.dest)
+        self.journal_path.unlink(missing_ok=True)
+        return self.dest
+
+
+def download_file(client: HTTPClient, url: str, dest: Path, **options: Any) -> Path:
+    """Download `url` to `dest` with `RangeDownload` (see its keyword options)."""
+    return RangeDownload(client, url, dest, **options).run()
@@ -7,12 +7,15 @@ This module re-exports them so that existing callers (``providers.py``'s
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 import requests
 
 from ..discovery.contracts import ProviderResolution
+from ..discovery.federated import DEFAULT_DEADLINE_S, FederatedOutcome, iter_federated_search
 from ..discovery.orchestrator import resolve_provider_input as resolve_provider_input_orchestrated
+from ..discovery.search_cache import get_search_cache, make_search_key
 from ..exceptions import ResolverError
 from ..http_client import get_http_client
 from ..logger import get_logger
@@ -109,6 +112,30 @@ def _search_with_provider(
     return handler(text, payload)
 
 
+def _cached_search_with_provider(
+    provider: IIIFProvider,
+    query: str,
+    filters: dict[str, Any] | None = None,
+) -> list[SearchResult]:
+    key = make_search_key(provider.key, query, filters)
+    return get_search_cache().get_or_load(key, lambda: _search_with_provider(provider, query, filters))
+
+
+def prefetch_search_page(library: str, query: str, filters: dict[str, Any] | None = None) -> bool:
+    """Warm the search cache for one page of `library` results in the background.
+
+    `filters` must match what the later request will pass (page included) for
+    the prefetched page to be reused. Returns False when nothing was scheduled.
+    """
+    provider = get_provider(library, fallback="Unknown")
+    text = (query or "").strip()
+    if not text or not provider.supports_search():
+        return False
+    payload = dict(filters or {})
+    key = make_search_key(provider.key, text, payload)
+    return get_search_cache().prefetch(key, lambda: _search_with_provider(provider, text, payload))
+
+
 def _try_provider_direct_resolution(provider: IIIFProvider, text: str) -> tuple[str | None, str | None]:
     resolver = provider.resolver()
     if not resolver.can_resolve(text):
@@ -129,7 +156,22 @@ def resolve_provider_input(
         filters=filters,
         search_handlers=get_search_handlers(),
         resolve_shelfmark_fn=resolve_shelfmark,
-        search_with_provider_fn=_search_with_provider,
+        search_with_provider_fn=_cached_search_with_provider,
+    )
+
+
+def federated_search(
+    query: str,
+    *,
+    filters: dict[str, Any] | None = None,
+    deadline_s: float = DEFAULT_DEADLINE_S,
+) -> Iterator[FederatedOutcome]:
+    """Search every searchable provider concurrently, yielding outcomes as they arrive."""
+    return iter_federated_search(
+        query,
+        filters=filters,
+        deadline_s=deadline_s,
+        search_with_provider_fn=_cached_search_with_provider,
     )
 
 
@@ -161,7 +203,9 @@ __all__ = [
     "ProviderResolution",
     "TIMEOUT_SECONDS",
     "archive_manifest_is_usable",
+    "federated_search",
     "get_manifest_details",
+    "prefetch_search_page",
     "resolve_provider_input",
     "resolve_shelfmark",
     "search_archive_org",
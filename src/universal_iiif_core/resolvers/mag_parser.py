@@ -7,19 +7,33 @@ MAG = Metadati Amministrativi e Gestionali (ICCU standard for Italian digital li
 
 Image URL pattern (verified live):
   GET /jmms/thumbnail?type=normal&id={oai_id}&teca={teca}&page={1-based-n}
+
+Documents are paged through magparser's `offset`/`pag` parameters via the shared
+HTTPClient, and the converted manifest is cached under
+`<temp>/_cache/iccu_manifests/` keyed by OAI id and teca, for a configurable
+number of hours and at most `_CACHE_MAX_ENTRIES` items.
 """
 
 from __future__ import annotations
 
+import hashlib
+import io
+import json
 import re
+import threading
+import time
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from pathlib import Path
+from typing import Any, BinaryIO
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import defusedxml.ElementTree as SafeET
 import requests
 
+from ..http_client import HTTPClient, get_http_client
 from ..logger import get_logger
 
 logger = get_logger(__name__)
@@ -32,6 +46,24 @@ _VIEWER_PATH = "/jmms/iccuviewer/iccu.jsp"
 # Max pages to request in a single call — covers virtually all manuscripts.
 _MAX_PAGES_PER_CALL = 2000
 
+# Paged retrieval: pages per magparser request, and requests in flight at once.
+_CHUNK_PAGES = 500
+_PARALLEL_CHUNKS = 4
+
+# Converted-manifest cache: default lifetime and maximum number of cached items.
+_CACHE_TTL_HOURS = 168
+_CACHE_MAX_ENTRIES = 500
+
+_MAG_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/xml,application/xml,*/*",
+    "Referer": _IC_BASE,
+}
+
 # Namespace used in MAG XML
 _MAG_NS = {"mag": "urn:meta:internetculturale"}
 
@@ -77,14 +109,14 @@ class IccuMetadata:
         return ", ".join(parts)
 
 
-def build_magparser_url(oai_id: str, teca: str, max_pages: int = _MAX_PAGES_PER_CALL) -> str:
-    """Build the magparser API URL for a given OAI ID and teca identifier."""
+def build_magparser_url(oai_id: str, teca: str, max_pages: int = _MAX_PAGES_PER_CALL, offset: int = 0) -> str:
+    """Build the magparser API URL for a given OAI ID and teca identifier (`max_pages` from `offset`)."""
     params = urlencode(
         {
             "id": oai_id,
             "teca": teca,
             "mode": "all",
-            "offset": "0",
+            "offset": str(offset),
             "pag": str(max_pages),
         }
     )
@@ -332,43 +364,92 @@ def _build_iiif_v2_manifest(meta: IccuMetadata, pages: list[dict[str, Any]]) ->
     }
 
 
-def parse_mag_xml(xml_bytes: bytes) -> dict[str, Any]:
-    """Parse MAG XML bytes and return a IIIF v2 manifest dict.
+def _local_name(tag: str) -> str:
+    return tag.split("}", 1)[1] if "}" in tag else tag
+
+
+def _strip_namespaces(element: ET.Element) -> None:
+    for el in element.iter():
+        el.tag = _local_name(el.tag)
+
+
+def _page_entry(page: ET.Element) -> dict[str, Any] | None:
+    try:
+        return {
+            "idx": int(page.get("idx", 0)),
+            "name": page.get("name", ""),
+            "w": int(page.get("w", 0)) or 1000,
+            "h": int(page.get("h", 0)) or 1000,
+            "src": page.get("src", ""),
+        }
+    except (ValueError, TypeError):
+        return None
+
+
+# Element paths below the document root, namespaces stripped.
+_BIBINFO_PATH = ("bibinfo",)
+_PAGE_PATH = ("medias", "media", "pages", "page")
+
+
+class MagPageStream:
+    """Parse a MAG document incrementally, yielding its pages as they are read.
+
+    `metadata` is filled in as soon as `<bibinfo>` has been read, which in MAG
+    documents precedes `<medias>`. Consumed elements are detached from the tree,
+    so memory stays flat even for responses listing thousands of pages.
 
     Raises:
-        ValueError: if the XML is malformed or missing required structure.
+        ValueError: (while iterating) if the XML is malformed.
     """
-    try:
-        root = SafeET.fromstring(xml_bytes)
-    except ET.ParseError as exc:
-        raise ValueError(f"MAG XML parse error: {exc}") from exc
 
-    # Strip namespace for easier access
-    for el in root.iter():
-        if "}" in el.tag:
-            el.tag = el.tag.split("}", 1)[1]
+    def __init__(self, source: bytes | BinaryIO):
+        """Wrap raw XML bytes or a binary file-like object (e.g. a streamed response body)."""
+        self._source = io.BytesIO(source) if isinstance(source, bytes | bytearray) else source
+        self.metadata: IccuMetadata | None = None
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Yield page dicts (`idx`, `name`, `w`, `h`, `src`) in document order."""
+        path: list[str] = []
+        parents: list[ET.Element] = []
+        try:
+            for event, elem in SafeET.iterparse(self._source, events=("start", "end")):
+                if event == "start":
+                    path.append(_local_name(elem.tag))
+                    parents.append(elem)
+                    continue
+                location = tuple(path[1:])
+                path.pop()
+                parents.pop()
+                if location == _BIBINFO_PATH:
+                    _strip_namespaces(elem)
+                    self.metadata = _parse_bibinfo(elem)
+                elif location == _PAGE_PATH:
+                    if (entry := _page_entry(elem)) is not None:
+                        yield entry
+                else:
+                    continue
+                # Containers left behind only ever hold a few empty elements.
+                elem.clear()
+                parents[-1].remove(elem)
+        except ET.ParseError as exc:
+            raise ValueError(f"MAG XML parse error: {exc}") from exc
+
+
+def parse_mag_xml(xml_bytes: bytes | BinaryIO) -> dict[str, Any]:
+    """Parse MAG XML (bytes or a binary stream) and return a IIIF v2 manifest dict.
 
-    bibinfo = root.find("bibinfo")
-    if bibinfo is None:
-        raise ValueError("MAG XML missing <bibinfo> element")
+    Raises:
+        ValueError: if the XML is malformed or missing required structure.
+    """
+    stream = MagPageStream(xml_bytes)
+    pages = list(stream)
+    return _convert_pages(stream.metadata, pages)
 
-    meta = _parse_bibinfo(bibinfo)
 
-    pages: list[dict[str, Any]] = []
-    for media in root.findall("medias/media"):
-        for page in media.findall("pages/page"):
-            try:
-                pages.append(
-                    {
-                        "idx": int(page.get("idx", 0)),
-                        "name": page.get("name", ""),
-                        "w": int(page.get("w", 0)) or 1000,
-                        "h": int(page.get("h", 0)) or 1000,
-                        "src": page.get("src", ""),
-                    }
-                )
-            except (ValueError, TypeError):
-                continue
+def _convert_pages(meta: IccuMetadata | None, pages: list[dict[str, Any]]) -> dict[str, Any]:
+    """Build the manifest from parsed metadata and pages (in any order, unique by `idx`)."""
+    if meta is None:
+        raise ValueError("MAG XML missing <bibinfo> element")
 
     pages.sort(key=lambda p: p["idx"])
     meta.page_count = len(pages)
@@ -378,12 +459,176 @@ def parse_mag_xml(xml_bytes: bytes) -> dict[str, Any]:
     return _build_iiif_v2_manifest(meta, pages)
 
 
-def fetch_and_convert(magparser_url: str, session: requests.Session | None = None) -> dict[str, Any]:
+def iccu_manifest_cache_dir() -> Path:
+    """Return where converted ICCU manifests are cached, one JSON file per (OAI id, teca)."""
+    from ..config_manager import get_config_manager
+
+    return get_config_manager().get_temp_dir() / "_cache" / "iccu_manifests"
+
+
+def iccu_manifest_cache_ttl_s() -> float:
+    """Return the cache lifetime from `settings.discovery.iccu_manifest_cache_ttl_hours` (0 disables)."""
+    from ..config_manager import get_config_manager
+
+    try:
+        hours = float(get_config_manager().get_setting("discovery.iccu_manifest_cache_ttl_hours", _CACHE_TTL_HOURS))
+    except (TypeError, ValueError):
+        hours = _CACHE_TTL_HOURS
+    return max(0.0, hours) * 3600
+
+
+def _cache_path(oai_id: str, teca: str) -> Path:
+    key = hashlib.sha256(f"{teca}\n{oai_id}".encode()).hexdigest()
+    return iccu_manifest_cache_dir() / key[:2] / f"{key}.json"
+
+
+def _load_cached_manifest(oai_id: str, teca: str, ttl_s: float) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(_cache_path(oai_id, teca).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or (payload.get("oai_id"), payload.get("teca")) != (oai_id, teca):
+        return None
+    if time.time() - float(payload.get("fetched_at") or 0) > ttl_s:
+        return None
+    manifest = payload.get("manifest")
+    return manifest if isinstance(manifest, dict) else None
+
+
+def prune_iccu_manifest_cache(ttl_s: float, max_entries: int = _CACHE_MAX_ENTRIES) -> int:
+    """Delete cached manifests older than `ttl_s`, then the oldest beyond `max_entries`; return how many."""
+    entries: list[tuple[float, Path]] = []
+    for path in iccu_manifest_cache_dir().glob("*/*.json"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+    cutoff = time.time() - ttl_s
+    stale = [path for index, (mtime, path) in enumerate(entries) if mtime < cutoff or index >= max_entries]
+    removed = 0
+    for path in stale:
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def _store_cached_manifest(oai_id: str, teca: str, manifest: dict[str, Any], ttl_s: float) -> None:
+    path = _cache_path(oai_id, teca)
+    payload = {"oai_id": oai_id, "teca": teca, "fetched_at": time.time(), "manifest": manifest}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        logger.debug("ICCU manifest cache write failed for %s (%s)", oai_id, teca, exc_info=True)
+        return
+    prune_iccu_manifest_cache(ttl_s)
+
+
+def _fetch_mag_stream(client: HTTPClient, url: str) -> tuple[IccuMetadata | None, list[dict[str, Any]]]:
+    """GET one magparser document and parse it while it streams in."""
+    resp = client.get(url, headers=_MAG_HEADERS, library_name="internetculturale", stream=True)
+    try:
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+        stream = MagPageStream(resp.raw)
+        pages = list(stream)
+    finally:
+        resp.close()
+    return stream.metadata, pages
+
+
+def _fetch_mag_chunk(client: HTTPClient, oai_id: str, teca: str, offset: int) -> list[dict[str, Any]]:
+    url = build_magparser_url(oai_id, teca, max_pages=_CHUNK_PAGES, offset=offset)
+    return _fetch_mag_stream(client, url)[1]
+
+
+def _merge_pages(merged: dict[int, dict[str, Any]], pages: list[dict[str, Any]]) -> int:
+    """Add `pages` to `merged` by `idx`; return how many were new."""
+    before = len(merged)
+    for page in pages:
+        merged.setdefault(page["idx"], page)
+    return len(merged) - before
+
+
+def _fetch_remaining_chunks(client: HTTPClient, oai_id: str, teca: str, merged: dict[int, dict[str, Any]]) -> bool:
+    """Request the chunks after the first in parallel waves until one comes back short.
+
+    Returns:
+        False when `merged` may still miss pages at the end of the item.
+    """
+    offset = _CHUNK_PAGES
+    with ThreadPoolExecutor(max_workers=_PARALLEL_CHUNKS, thread_name_prefix="iccu-mag") as pool:
+        while True:
+            offsets = [offset + n * _CHUNK_PAGES for n in range(_PARALLEL_CHUNKS)]
+            chunks = list(pool.map(lambda start: _fetch_mag_chunk(client, oai_id, teca, start), offsets))
+            added = sum(_merge_pages(merged, pages) for pages in chunks)
+            if len(chunks[-1]) < _CHUNK_PAGES:
+                return True
+            if not added:
+                break
+            offset = offsets[-1] + _CHUNK_PAGES
+
+    # A full wave with no new pages means the endpoint ignored `offset`: asking again
+    # would loop forever, so fall back to the single large request used before paging.
+    logger.debug("ICCU magparser ignored offset for %s (%s); fetching in one call", oai_id, teca)
+    pages = _fetch_mag_stream(client, build_magparser_url(oai_id, teca, max_pages=_MAX_PAGES_PER_CALL))[1]
+    _merge_pages(merged, pages)
+    return len(pages) < _MAX_PAGES_PER_CALL
+
+
+def fetch_iccu_manifest(
+    oai_id: str, teca: str, *, client: HTTPClient | None = None, refresh: bool = False
+) -> dict[str, Any]:
+    """Return the IIIF v2 manifest of an Internet Culturale item, paging the magparser endpoint.
+
+    Pages are requested `_CHUNK_PAGES` at a time through the shared HTTPClient (pooling,
+    retries, rate limiting): the first chunk alone, which is the whole item for most
+    manuscripts, then the following chunks `_PARALLEL_CHUNKS` at a time, merged by page
+    `idx` as they arrive. The converted manifest is cached on disk for
+    `settings.discovery.iccu_manifest_cache_ttl_hours` (0 disables the cache), so
+    re-opening the item neither downloads nor converts the MAG XML again until the entry
+    expires or `refresh` is set. If the endpoint ignores `offset`, the item is fetched in
+    one `_MAX_PAGES_PER_CALL` request instead; a manifest that may be truncated is not cached.
+
+    Raises:
+        requests.RequestException: on network failure.
+        ValueError: on invalid XML or missing required fields.
+    """
+    ttl_s = iccu_manifest_cache_ttl_s()
+    if ttl_s > 0 and not refresh and (cached := _load_cached_manifest(oai_id, teca, ttl_s)) is not None:
+        return cached
+
+    client = client or get_http_client()
+    meta, first = _fetch_mag_stream(client, build_magparser_url(oai_id, teca, max_pages=_CHUNK_PAGES))
+    merged: dict[int, dict[str, Any]] = {}
+    _merge_pages(merged, first)
+    complete = True
+    if meta is not None and len(first) >= _CHUNK_PAGES:
+        complete = _fetch_remaining_chunks(client, oai_id, teca, merged)
+
+    manifest = _convert_pages(meta, list(merged.values()))
+    # A page list that may be cut short is served once but never cached.
+    if ttl_s > 0 and complete:
+        _store_cached_manifest(oai_id, teca, manifest, ttl_s)
+    return manifest
+
+
+def fetch_and_convert(magparser_url: str, *, client: HTTPClient | None = None, refresh: bool = False) -> dict[str, Any]:
     """Fetch a MAG XML document from Internet Culturale and convert to IIIF v2 manifest.
 
+    URLs carrying both `id` and `teca` go through `fetch_iccu_manifest` (paged, parallel,
+    cached); any other magparser URL is fetched once as-is.
+
     Args:
         magparser_url: Full URL to the IC magparser endpoint.
-        session: Optional requests session for connection reuse.
+        client: HTTPClient to use instead of the shared one.
+        refresh: Ignore the on-disk manifest cache and fetch the document again.
 
     Returns:
         IIIF v2 manifest dict.
@@ -392,21 +637,11 @@ def fetch_and_convert(magparser_url: str, session: requests.Session | None = Non
         requests.RequestException: on network failure.
         ValueError: on invalid XML or missing required fields.
     """
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/xml,application/xml,*/*",
-        "Referer": _IC_BASE,
-    }
-
-    requester = session or requests
-    resp = requester.get(magparser_url, headers=headers, timeout=(10, 30))
-    resp.raise_for_status()
+    oai_id, teca = extract_oai_and_teca_from_url(magparser_url)
+    if oai_id and teca:
+        return fetch_iccu_manifest(oai_id, teca, client=client, refresh=refresh)
 
-    return parse_mag_xml(resp.content)
+    return _convert_pages(*_fetch_mag_stream(client or get_http_client(), magparser_url))
 
 
 def is_iccu_magparser_url(url: str) -> bool:
@@ -455,11 +690,16 @@ def probe_magparser_url(url: str, session: requests.Session | None = None) -> bo
 
 __all__ = [
     "IccuMetadata",
+    "MagPageStream",
     "build_magparser_url",
     "build_thumbnail_url",
     "build_viewer_url",
     "extract_oai_and_teca_from_url",
     "fetch_and_convert",
+    "fetch_iccu_manifest",
+    "iccu_manifest_cache_dir",
+    "iccu_manifest_cache_ttl_s",
+    "prune_iccu_manifest_cache",
     "is_iccu_magparser_url",
     "parse_mag_xml",
     "probe_magparser_url",
@@ -22,7 +22,7 @@ def fetch_manifest_dict(url: str, **kwargs: Any) -> dict[str, Any] | None:
     - Everything else uses the shared HTTPClient JSON getter.
 
     Extra kwargs (e.g. ``retries``) are forwarded to ``get_json`` and ignored
-    for the MAG path, which has its own retry-free synchronous fetch.
+    for the MAG path, which pages the endpoint itself and caches the result.
     """
     clean = str(url or "").strip()
     if not clean:
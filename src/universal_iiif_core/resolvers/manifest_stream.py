@@ -0,0 +1,412 @@
+"""Incremental reader for the top-level fields of a IIIF manifest.
+
+Discovery previews and capability probes only need the label, metadata,
+`rendering` and the number of canvases, yet some Gallica and Archive.org
+manifests are tens of megabytes of canvas JSON. `ManifestHeaderScanner`
+walks the body chunk by chunk, decodes only the requested top-level values
+(plus the first canvas, for thumbnail fallbacks) and counts the canvases
+without keeping them, so memory stays flat whatever the manifest size.
+`read_manifest_header` stops downloading as soon as the requested fields are
+known.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import requests
+
+from ..http_client import get_http_client
+from ..logger import get_logger
+from .mag_parser import fetch_and_convert, is_iccu_magparser_url
+
+logger = get_logger(__name__)
+
+# Must cover every top-level key `library_catalog.parse_manifest_catalog` reads.
+HEADER_FIELDS = (
+    "@context",
+    "@id",
+    "id",
+    "@type",
+    "type",
+    "label",
+    "title",
+    "description",
+    "summary",
+    "metadata",
+    "attribution",
+    "requiredStatement",
+    "license",
+    "rights",
+    "logo",
+    "thumbnail",
+    "seeAlso",
+    "rendering",
+    "related",
+    "homepage",
+    "service",
+)
+
+_STRUCTURAL_RE = re.compile(r'[{}\[\]",]')
+_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+@dataclass
+class ManifestHeader:
+    """Top-level view of a manifest read by `ManifestHeaderScanner`.
+
+    Attributes:
+        fields: Decoded values of the requested top-level keys that were found.
+        keys: Every top-level key seen so far, requested or not.
+        canvas_count: Canvases in `items` (v3) or in the first sequence (v2).
+        first_canvas: The first canvas, decoded, when the scanner reached it.
+        complete: Whether the whole document was scanned.
+    """
+
+    fields: dict[str, Any] = field(default_factory=dict)
+    keys: set[str] = field(default_factory=set)
+    canvas_count: int = 0
+    first_canvas: dict[str, Any] | None = None
+    complete: bool = False
+
+    @property
+    def is_manifest(self) -> bool:
+        """Return whether the document looks like a IIIF manifest."""
+        if self.fields.get("type") == "Manifest" or self.fields.get("@type") == "sc:Manifest":
+            return True
+        return "items" in self.keys or "sequences" in self.keys
+
+    def as_manifest(self) -> dict[str, Any]:
+        """Return a manifest-shaped dict with the decoded fields and at most the first canvas.
+
+        Callers must use `canvas_count`, not the length of the returned canvas list.
+        """
+        manifest = dict(self.fields)
+        canvases = [self.first_canvas] if self.first_canvas is not None else []
+        if "sequences" in self.keys:
+            manifest["sequences"] = [{"canvases": canvases}]
+        elif "items" in self.keys:
+            manifest["items"] = canvases
+        return manifest
+
+
+@dataclass
+class _Frame:
+    kind: str
+    key: str = ""
+    expect_key: bool = True
+    count: int = 0
+    canvases: bool = False
+
+
+class ManifestHeaderScanner:
+    """Event-driven JSON scanner fed with text chunks; see the module docstring.
+
+    Args:
+        fields: Top-level keys to decode.
+        count_canvases: Keep scanning until the canvas list has been counted.
+        stop_when: Custom completion test, evaluated after every top-level event; replaces
+            the default "all fields found (and canvases counted)" rule.
+    """
+
+    def __init__(
+        self,
+        fields: Iterable[str] = HEADER_FIELDS,
+        *,
+        count_canvases: bool = True,
+        stop_when: Callable[[ManifestHeader], bool] | None = None,
+    ) -> None:
+        """Initialize an empty scanner."""
+        self.fields = frozenset(fields)
+        self.count_canvases = count_canvases
+        self.stop_when = stop_when
+        self.header = ManifestHeader()
+        self.done = False
+        self.invalid = False
+        self._buf = ""
+        self._pos = 0
+        self._stack: list[_Frame] = []
+        self._capture: tuple[str, int] | None = None
+        self._canvas_start: int | None = None
+        self._canvases_counted = False
+
+    def feed(self, text: str) -> bool:
+        """Scan one more chunk of the document; return True once no more input is needed."""
+        if self.done:
+            return True
+        self._buf += text
+        self._scan()
+        return self.done
+
+    def _scan(self) -> None:
+        buf, pos = self._buf, self._pos
+        while not self.done:
+            if self._skipping_canvases():
+                pos = self._skip_canvases(buf, pos)
+            match = _STRUCTURAL_RE.search(buf, pos)
+            index = match.start() if match is not None else len(buf)
+            if not self._stack and buf[pos:index].strip():
+                self._fail()
+                break
+            if match is None:
+                pos = index
+                break
+            char = match.group()
+            if char == '"':
+                string = _STRING_RE.match(buf, index)
+                if string is None:
+                    pos = index
+                    break
+                self._on_string(string.group(), index, string.end())
+                pos = string.end()
+                continue
+            if char in "{[":
+                self._on_open(char, index)
+            elif char in "}]":
+                self._on_close(index)
+            else:
+                self._on_comma(index)
+            pos = index + 1
+        self._compact(pos)
+
+    def _skipping_canvases(self) -> bool:
+        stack = self._stack
+        return bool(stack) and stack[-1].canvases and stack[-1].count > 0 and self._canvas_start is None
+
+    def _skip_canvases(self, buf: str, pos: int) -> int:
+        """Count the canvases after the first one, decoding each whole canvas with the C decoder.
+
+        Walking a canvas token by token dominates the scan of large manifests. A canvas that
+        is not complete in the buffer yet (or not valid JSON) is left to the regular scan.
+        """
+        frame = self._stack[-1]
+        while True:
+            pos = _WHITESPACE_RE.match(buf, pos).end()
+            if buf.startswith(",", pos):
+                pos += 1
+                continue
+            if not buf.startswith(("{", "["), pos):
+                return pos
+            try:
+                _value, end = _DECODER.raw_decode(buf, pos)
+            except ValueError:
+                return pos
+            frame.count += 1
+            self.header.canvas_count += 1
+            pos = end
+
+    def _compact(self, pos: int) -> None:
+        keep = pos
+        if self._capture is not None:
+            keep = min(keep, self._capture[1])
+        if self._canvas_start is not None:
+            keep = min(keep, self._canvas_start)
+        self._buf = self._buf[keep:]
+        self._pos = pos - keep
+        if self._capture is not None:
+            self._capture = (self._capture[0], self._capture[1] - keep)
+        if self._canvas_start is not None:
+            self._canvas_start -= keep
+
+    def _fail(self) -> None:
+        self.invalid = True
+        self.done = True
+
+    def _on_string(self, raw: str, start: int, end: int) -> None:
+        if not self._stack:
+            self._fail()
+            return
+        frame = self._stack[-1]
+        if frame.kind == "{" and frame.expect_key:
+            frame.key = json.loads(raw)
+            frame.expect_key = False
+            if len(self._stack) == 1:
+                self._on_root_key(frame.key, end)
+            return
+        self._on_value_start(start, '"')
+
+    def _on_root_key(self, key: str, value_start: int) -> None:
+        self.header.keys.add(key)
+        if key in self.fields and key not in self.header.fields:
+            self._capture = (key, value_start)
+        self._check_done()
+
+    def _on_value_start(self, index: int, char: str) -> None:
+        if not self._stack or self._stack[-1].kind != "[":
+            return
+        parent = self._stack[-1]
+        parent.count += 1
+        if parent.canvases:
+            self.header.canvas_count += 1
+            if parent.count == 1 and char == "{":
+                self._canvas_start = index
+
+    def _on_open(self, char: str, index: int) -> None:
+        if not self._stack and char != "{":
+            self._fail()
+            return
+        self._on_value_start(index, char)
+        frame = _Frame(kind=char)
+        self._stack.append(frame)
+        frame.canvases = char == "[" and self._at_canvas_list()
+
+    def _at_canvas_list(self) -> bool:
+        stack = self._stack
+        if len(stack) == 2:
+            return stack[0].key == "items"
+        return (
+            len(stack) == 4
+            and stack[0].key == "sequences"
+            and stack[1].kind == "["
+            and stack[1].count == 1
+            and stack[2].key == "canvases"
+        )
+
+    def _on_close(self, index: int) -> None:
+        if not self._stack:
+            self._fail()
+            return
+        if len(self._stack) == 1:
+            self._end_root_value(index)
+        frame = self._stack.pop()
+        if self._canvas_start is not None and self._stack and self._stack[-1].canvases:
+            self.header.first_canvas = self._decode(self._buf[self._canvas_start : index + 1])
+            self._canvas_start = None
+        if frame.canvases:
+            self._canvases_counted = True
+            self._check_done()
+        if not self._stack:
+            self.header.complete = True
+            self.done = True
+
+    def _on_comma(self, index: int) -> None:
+        if not self._stack:
+            return
+        frame = self._stack[-1]
+        if frame.kind == "{":
+            frame.expect_key = True
+            if len(self._stack) == 1:
+                self._end_root_value(index)
+
+    def _end_root_value(self, index: int) -> None:
+        if self._capture is None:
+            return
+        key, start = self._capture
+        self._capture = None
+        raw = self._buf[start:index].lstrip()
+        value = self._decode(raw[1:] if raw.startswith(":") else raw)
+        if value is not None:
+            self.header.fields[key] = value
+        self._check_done()
+
+    @staticmethod
+    def _decode(raw: str) -> Any:
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def _check_done(self) -> None:
+        if self.stop_when is not None:
+            self.done = self.done or bool(self.stop_when(self.header))
+            return
+        if self.fields.issubset(self.header.fields) and (self._canvases_counted or not self.count_canvases):
+            self.done = True
+
+
+def header_from_manifest(manifest: dict[str, Any], fields: Iterable[str] = HEADER_FIELDS) -> ManifestHeader:
+    """Build a `ManifestHeader` from an already decoded manifest."""
+    canvases: list[Any] = []
+    sequences = manifest.get("sequences")
+    if isinstance(sequences, list) and sequences and isinstance(sequences[0], dict):
+        canvases = sequences[0].get("canvases") or []
+    elif isinstance(manifest.get("items"), list):
+        canvases = manifest["items"]
+    first = canvases[0] if canvases and isinstance(canvases[0], dict) else None
+    return ManifestHeader(
+        fields={key: manifest[key] for key in fields if key in manifest},
+        keys=set(manifest),
+        canvas_count=len(canvases),
+        first_canvas=first,
+        complete=True,
+    )
+
+
+def scan_manifest_chunks(
+    chunks: Iterable[bytes],
+    fields: Iterable[str] = HEADER_FIELDS,
+    *,
+    count_canvases: bool = True,
+    stop_when: Callable[[ManifestHeader], bool] | None = None,
+) -> ManifestHeader | None:
+    """Scan a UTF-8 JSON byte stream; return None when it is not a JSON object."""
+    scanner = ManifestHeaderScanner(fields, count_canvases=count_canvases, stop_when=stop_when)
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    iterator = iter(chunks)
+    try:
+        for chunk in iterator:
+            if scanner.feed(decoder.decode(chunk)):
+                break
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+    if scanner.invalid or not scanner.header.keys:
+        return None
+    return scanner.header
+
+
+def read_manifest_header(
+    url: str,
+    fields: Iterable[str] = HEADER_FIELDS,
+    *,
+    count_canvases: bool = True,
+    stop_when: Callable[[ManifestHeader], bool] | None = None,
+    **kwargs: Any,
+) -> ManifestHeader | None:
+    """Fetch the header of the manifest at `url`, streaming the body.
+
+    ICCU MAG/XML endpoints are converted in full, as `fetch_manifest_dict` does. Extra kwargs
+    (`headers`, `timeout`, `retries`, ...) go to `HTTPClient.iter_json_body`.
+
+    Returns:
+        The header, or None when the manifest is unreachable or not a JSON object.
+    """
+    clean = str(url or "").strip()
+    if not clean:
+        return None
+    fields = tuple(fields)
+    if is_iccu_magparser_url(clean):
+        try:
+            manifest = fetch_and_convert(clean)
+        except Exception as exc:
+            logger.debug("MAG→IIIF conversion failed for %s: %s", clean, exc)
+            return None
+        return header_from_manifest(manifest, fields) if isinstance(manifest, dict) else None
+    try:
+        return scan_manifest_chunks(
+            get_http_client().iter_json_body(clean, **kwargs),
+            fields,
+            count_canvases=count_canvases,
+            stop_when=stop_when,
+        )
+    except requests.RequestException as exc:
+        logger.debug("Manifest header fetch failed for %s: %s", clean, exc)
+        return None
+
+
+__all__ = [
+    "HEADER_FIELDS",
+    "ManifestHeader",
+    "ManifestHeaderScanner",
+    "header_from_manifest",
+    "read_manifest_header",
+    "scan_manifest_chunks",
+]
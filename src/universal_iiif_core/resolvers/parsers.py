@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import io
 import xml.etree.ElementTree as ET
-from typing import Any, Final
+from collections.abc import Iterator
+from typing import Any, BinaryIO, Final
 
 from defusedxml import ElementTree as DefusedET
 
@@ -12,6 +14,7 @@ SRU_NS: Final = {
     "dc": "http://purl.org/dc/elements/1.1/",
     "oai_dc": "http://www.openarchives.org/OAI/2.0/oai_dc/",
 }
+_SRW_RECORD: Final = f"{{{SRU_NS['srw']}}}record"
 
 
 class GallicaXMLParser:
@@ -23,20 +26,45 @@ class GallicaXMLParser:
     """
 
     @classmethod
-    def parse_sru(cls, xml_bytes: bytes, resolver) -> list[SearchResult]:
+    def parse_sru(cls, xml_bytes: bytes | BinaryIO, resolver) -> list[SearchResult]:
         """Parse Gallica SRU XML bytes into a list of SearchResult entries."""
-        root = DefusedET.fromstring(xml_bytes)
+        return list(cls.iter_sru(xml_bytes, resolver))
 
-        records = root.findall(".//srw:record", SRU_NS)
-        if not records:
-            records = [elem for elem in root.iter() if elem.tag.endswith("record")]
-
-        results: list[SearchResult] = []
-        for rec in records:
-            if item := cls._parse_record(rec, resolver):
-                results.append(item)
-
-        return results
+    @classmethod
+    def iter_sru(cls, source: bytes | BinaryIO, resolver) -> Iterator[SearchResult]:
+        """Yield SearchResult entries while the SRU response is still being parsed.
+
+        Each `<srw:record>` is converted as soon as its end tag is read and then
+        detached from the tree, so memory stays flat however many records the
+        response holds. Responses without SRW records fall back to any element
+        whose tag ends in `record`, as before; those candidates are only known
+        to be needed once the whole document has been read, so they are kept
+        and yielded at the end, in document order.
+        """
+        stream = io.BytesIO(source) if isinstance(source, bytes | bytearray) else source
+        parents: list[ET.Element] = []
+        fallback: list[ET.Element] = []
+        seen_srw_record = False
+        for event, elem in DefusedET.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                parents.append(elem)
+                if elem.tag == _SRW_RECORD:
+                    seen_srw_record = True
+                    fallback.clear()
+                elif not seen_srw_record and elem.tag.endswith("record"):
+                    fallback.append(elem)
+                continue
+            parents.pop()
+            if elem.tag != _SRW_RECORD:
+                continue
+            if item := cls._parse_record(elem, resolver):
+                yield item
+            elem.clear()
+            if parents:
+                parents[-1].remove(elem)
+        for elem in fallback:
+            if item := cls._parse_record(elem, resolver):
+                yield item
 
     @classmethod
     def _parse_record(cls, record: ET.Element, resolver) -> SearchResult | None:
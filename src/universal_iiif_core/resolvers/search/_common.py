@@ -6,7 +6,7 @@ import re
 from typing import Any, Final
 
 from universal_iiif_core.config_manager import get_config_manager
-from universal_iiif_core.http_client import HTTPClient
+from universal_iiif_core.http_client import HTTPClient, get_http_cache
 from universal_iiif_core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -60,7 +60,7 @@ def get_search_http_client() -> HTTPClient:
     if _http_client_cache is None:
         cm = get_config_manager()
         network_policy = cm.data.get("settings", {}).get("network", {})
-        _http_client_cache = HTTPClient(network_policy=network_policy)
+        _http_client_cache = HTTPClient(network_policy=network_policy, cache=get_http_cache(network_policy))
     return _http_client_cache
 
 
@@ -9,6 +9,7 @@ from urllib.parse import quote, urlencode
 from universal_iiif_core.http_client import get_http_client
 from universal_iiif_core.logger import get_logger
 from universal_iiif_core.providers import get_provider
+from universal_iiif_core.resolvers.manifest_stream import read_manifest_header
 from universal_iiif_core.resolvers.models import SearchResult
 
 from ._common import _HTML_TAG_RE, _SPACE_RE, HTML_BROWSER_HEADERS
@@ -67,22 +68,23 @@ def search_archive_org(query: str, max_results: int = 20, page: int = 1) -> list
 
 
 def archive_manifest_is_usable(manifest_url: str) -> bool:
-    """Validate whether a IIIF manifest URL resolves to an actual manifest."""
-    payload = get_http_client().get_json(
+    """Validate whether a IIIF manifest URL resolves to an actual manifest.
+
+    Only the beginning of the body is read: the probe stops at the manifest type or canvas list.
+    """
+    header = read_manifest_header(
         manifest_url,
+        ("@type", "type"),
+        count_canvases=False,
+        stop_when=lambda header: header.is_manifest,
         headers={**HTML_BROWSER_HEADERS, "Accept": "application/json"},
         retries=0,
         timeout=(5, 8),
     )
-    if payload is None:
+    if header is None:
         logger.debug("Archive.org manifest probe failed for %s: empty payload", manifest_url)
         return False
-
-    if not isinstance(payload, dict):
-        return False
-    if payload.get("type") == "Manifest" or payload.get("@type") == "sc:Manifest":
-        return True
-    return "items" in payload or "sequences" in payload
+    return header.is_manifest
 
 
 def _build_archive_search_url(params: dict[str, Any]) -> str:
@@ -12,6 +12,7 @@ from .service import (
     output_kind_for_format,
     parse_items_csv,
     parse_page_selection,
+    stream_selected_images_zip,
 )
 
 __all__ = [
@@ -26,4 +27,5 @@ __all__ = [
     "output_kind_for_format",
     "parse_items_csv",
     "parse_page_selection",
+    "stream_selected_images_zip",
 ]
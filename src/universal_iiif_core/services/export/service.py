@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import threading
 import time
-import zipfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
@@ -10,7 +11,8 @@ from tempfile import mkdtemp
 from typing import Any
 
 from universal_iiif_core.config_manager import get_config_manager
-from universal_iiif_core.export_studio import build_professional_pdf, clean_filename
+from universal_iiif_core.export_page_cache import get_export_page_cache
+from universal_iiif_core.export_studio import build_professional_pdf, clean_filename, resolve_encode_workers
 from universal_iiif_core.http_client import get_http_client
 from universal_iiif_core.iiif_logic import total_canvases
 from universal_iiif_core.iiif_resolution import fetch_highres_page_image
@@ -18,9 +20,13 @@ from universal_iiif_core.logger import get_logger
 from universal_iiif_core.pdf_profiles import resolve_effective_profile
 from universal_iiif_core.services.ocr.storage import OCRStorage
 from universal_iiif_core.utils import load_json, save_json
+from universal_iiif_core.zip_stream import ZipEntry, iter_zip_stream, write_zip
 
 logger = get_logger(__name__)
 
+_MAX_BATCH_ITEM_WORKERS = 8
+_CANCEL_POLL_INTERVAL_S = 0.5
+
 
 class ExportFeatureNotAvailableError(ValueError):
     """Raised when a requested export capability is declared but disabled."""
@@ -286,17 +292,38 @@ def _mode_for_pdf(export_format: str) -> str:
     return mapping.get(export_format, "Solo immagini")
 
 
-def _zip_selected_images(scans_dir: Path, selected_pages: list[int], output_path: Path) -> Path:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(output_path, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
-        for page_idx in selected_pages:
-            image_name = f"pag_{page_idx - 1:04d}.jpg"
-            image_path = scans_dir / image_name
-            if not image_path.exists():
-                logger.debug("Skipping missing scan while creating ZIP: %s", image_path)
-                continue
-            archive.write(image_path, arcname=image_name)
-    return output_path
+def _selected_image_entries(scans_dir: Path, selected_pages: list[int]) -> list[ZipEntry]:
+    entries: list[ZipEntry] = []
+    for page_idx in selected_pages:
+        image_name = f"pag_{page_idx - 1:04d}.jpg"
+        entries.append((scans_dir / image_name, image_name))
+    return entries
+
+
+def _zip_selected_images(
+    scans_dir: Path,
+    selected_pages: list[int],
+    output_path: Path,
+    progress_callback: Callable[[int, int], None] | None = None,
+) -> Path:
+    return write_zip(_selected_image_entries(scans_dir, selected_pages), output_path, progress_callback)
+
+
+def stream_selected_images_zip(
+    doc_id: str,
+    library: str,
+    selection_mode: str = "all",
+    selected_pages_raw: str = "",
+) -> Iterator[bytes]:
+    """Return a byte iterator of a ZIP with the selected local scans of one item.
+
+    Pages are resolved (and validated) before the first chunk is produced, so
+    selection errors surface as exceptions instead of a truncated archive.
+    """
+    paths = OCRStorage().get_document_paths(doc_id, library)
+    scans_dir = Path(paths["scans"])
+    selected_pages = resolve_selected_pages(scans_dir, selection_mode, selected_pages_raw)
+    return iter_zip_stream(_selected_image_entries(scans_dir, selected_pages))
 
 
 def _timestamp() -> str:
@@ -355,10 +382,12 @@ def _materialize_highres_page(
 
     fetched = False
     if force_remote_refetch or not local_file.exists():
+        # The shared client keeps per-host concurrency limits global across concurrent batch items.
         ok, _message = fetch_highres_page_image(
             manifest,
             page,
             out_file,
+            http_client=get_http_client(),
             iiif_quality=iiif_quality,
         )
         fetched = bool(ok and out_file.exists())
@@ -533,6 +562,7 @@ def _export_single_item_to_output(
     force_remote_refetch: bool = False,
     cleanup_temp_after_export: bool = True,
     max_parallel_page_fetch: int = 2,
+    page_progress: Callable[[int, int], None] | None = None,
 ) -> Path:
     doc_id = str(item.get("doc_id") or "").strip()
     library = str(item.get("library") or "").strip()
@@ -570,7 +600,7 @@ def _export_single_item_to_output(
     )
 
     if export_format == "zip_images":
-        return _zip_selected_images(scans_dir, selected_pages, output_path)
+        return _zip_selected_images(scans_dir, selected_pages, output_path, page_progress)
 
     if export_format in {"pdf_images", "pdf_searchable", "pdf_facing"}:
         transcription = load_json(paths["transcription"]) or None
@@ -616,6 +646,11 @@ def _export_single_item_to_output(
                 image_dir=export_scans_dir,
                 image_max_long_edge_px=effective_max_edge,
                 image_jpeg_quality=effective_jpeg_quality,
+                progress_callback=page_progress,
+                encode_workers=resolve_encode_workers(cm.get_setting("pdf.export.encode_workers", 0)),
+                page_cache=get_export_page_cache(),
+                chunk_pages=int(cm.get_setting("pdf.export.assembly_chunk_pages", 100) or 0),
+                garbage=int(cm.get_setting("pdf.export.save_garbage", 0) or 0),
             )
         finally:
             if staging_dir and effective_cleanup:
@@ -698,11 +733,7 @@ def execute_single_item_export(
 
 
 def _bundle_outputs(outputs: list[Path], output_path: Path) -> Path:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(output_path, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
-        for artifact in outputs:
-            archive.write(artifact, arcname=artifact.name)
-    return output_path
+    return write_zip([(artifact, artifact.name) for artifact in outputs], output_path)
 
 
 def _is_cancelled(should_cancel: Any) -> bool:
@@ -764,6 +795,79 @@ def _execute_single_item_job(
     return output
 
 
+class _BatchProgress:
+    """Aggregate page progress of concurrently exported items and fan out cancellation.
+
+    The job callback keeps its item-based units (`completed items / total`);
+    it is invoked whenever an item completes or the overall percentage moves.
+    The user cancellation callback is polled at most every
+    `_CANCEL_POLL_INTERVAL_S`; once cancelled (or once an item fails), every
+    in-flight item stops at its next page.
+    """
+
+    def __init__(self, total_items: int, progress_callback: Any, should_cancel: Any) -> None:
+        """Track `total_items` items reporting to `progress_callback`."""
+        self.total_items = max(1, total_items)
+        self.cancel_event = threading.Event()
+        self._progress_callback = progress_callback
+        self._should_cancel = should_cancel
+        self._lock = threading.Lock()
+        self._fractions = [0.0] * self.total_items
+        self._completed = 0
+        self._last_percent = -1
+        self._last_cancel_poll = 0.0
+
+    def raise_if_cancelled(self) -> None:
+        """Raise `ExportCancelledError` when the job was cancelled or aborted."""
+        if not self.cancel_event.is_set():
+            now = time.monotonic()
+            with self._lock:
+                due = now - self._last_cancel_poll >= _CANCEL_POLL_INTERVAL_S
+                if due:
+                    self._last_cancel_poll = now
+            if due and _is_cancelled(self._should_cancel):
+                self.cancel_event.set()
+        if self.cancel_event.is_set():
+            raise ExportCancelledError("Export annullato dall'utente.")
+
+    def page_callback(self, item_index: int) -> Callable[[int, int], None]:
+        """Return the `build_professional_pdf` progress callback of one item."""
+
+        def _on_page(current: int, total: int) -> None:
+            self.raise_if_cancelled()
+            self._report(item_index, max(0, int(current)) / float(max(1, int(total))), completed=False)
+
+        return _on_page
+
+    def item_completed(self, item_index: int) -> None:
+        """Mark one item as exported."""
+        self._report(item_index, 1.0, completed=True)
+
+    def _report(self, item_index: int, fraction: float, *, completed: bool) -> None:
+        with self._lock:
+            self._fractions[item_index] = min(1.0, fraction)
+            if completed:
+                self._completed += 1
+            percent = int(sum(self._fractions) * 100 / self.total_items)
+            if not completed and percent == self._last_percent:
+                return
+            self._last_percent = percent
+            if self._progress_callback:
+                self._progress_callback(
+                    self._completed,
+                    self.total_items,
+                    f"Item {self._completed}/{self.total_items} completati ({percent}%)",
+                )
+
+
+def _resolve_batch_item_workers(total_items: int) -> int:
+    try:
+        configured = int(get_config_manager().get_setting("pdf.export.batch_item_workers", 2) or 1)
+    except (TypeError, ValueError):
+        configured = 1
+    return max(1, min(configured, _MAX_BATCH_ITEM_WORKERS, total_items))
+
+
 def _execute_batch_job(
     *,
     job_id: str,
@@ -787,23 +891,30 @@ def _execute_batch_job(
     cleanup_temp_after_export: bool,
     max_parallel_page_fetch: int,
 ) -> Path:
+    """Export every item on a worker pool and bundle the artifacts in item order.
+
+    The first failure or a user cancellation stops the items in flight at
+    their next page and skips the ones not yet started.
+    """
     out_dir = get_config_manager().get_exports_dir() / clean_filename(job_id)
     out_dir.mkdir(parents=True, exist_ok=True)
 
     total_items = len(items)
-    artifacts: list[Path] = []
-    for idx, item in enumerate(items, start=1):
-        if _is_cancelled(should_cancel):
-            raise ExportCancelledError("Export annullato dall'utente.")
-        if progress_callback:
-            progress_callback(idx - 1, total_items, f"Export item {idx}/{total_items}")
-
-        doc_id = str(item.get("doc_id") or f"item_{idx}")
+    progress = _BatchProgress(total_items, progress_callback, should_cancel)
+    progress.raise_if_cancelled()
+    if progress_callback:
+        progress_callback(0, total_items, f"Export item 0/{total_items}")
+
+    def _export_item(idx: int, item: dict[str, str]) -> Path:
+        progress.raise_if_cancelled()
+        doc_id = str(item.get("doc_id") or f"item_{idx + 1}")
+        # The item number keeps paths (and bundle arcnames) unique when a doc_id repeats
+        # or two ids clean to the same filename within the same second.
+        suffix = f"{_timestamp()}_{idx + 1:03d}"
         if export_format == "zip_images":
-            output_path = out_dir / f"{clean_filename(doc_id)}_images_{_timestamp()}.zip"
+            output_path = out_dir / f"{clean_filename(doc_id)}_images_{suffix}.zip"
         else:
-            output_path = out_dir / f"{clean_filename(doc_id)}_export_{_timestamp()}.pdf"
-
+            output_path = out_dir / f"{clean_filename(doc_id)}_export_{suffix}.pdf"
         artifact = _export_single_item_to_output(
             item=item,
             export_format=export_format,
@@ -823,16 +934,29 @@ def _execute_batch_job(
             force_remote_refetch=force_remote_refetch,
             cleanup_temp_after_export=cleanup_temp_after_export,
             max_parallel_page_fetch=max_parallel_page_fetch,
+            page_progress=progress.page_callback(idx),
         )
-        artifacts.append(artifact)
+        progress.item_completed(idx)
+        return artifact
 
-        if progress_callback:
-            progress_callback(idx, total_items, f"Item {idx}/{total_items} completato")
-
-    if not artifacts:
+    artifacts: list[Path | None] = [None] * total_items
+    workers = _resolve_batch_item_workers(total_items)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="export-item") as executor:
+        futures: dict[Future, int] = {executor.submit(_export_item, idx, item): idx for idx, item in enumerate(items)}
+        try:
+            for future in as_completed(futures):
+                artifacts[futures[future]] = future.result()
+        except BaseException:
+            progress.cancel_event.set()
+            for pending in futures:
+                pending.cancel()
+            raise
+
+    produced = [artifact for artifact in artifacts if artifact is not None]
+    if not produced:
         raise RuntimeError("Nessun file prodotto dall'export.")
     bundle_name = f"export_batch_{clean_filename(job_id)}_{_timestamp()}.zip"
-    return _bundle_outputs(artifacts, out_dir / bundle_name)
+    return _bundle_outputs(produced, out_dir / bundle_name)
 
 
 def execute_export_job(
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any
 
 from universal_iiif_core.config_manager import get_config_manager
+from universal_iiif_core.doc_revisions import bump_document_revision
 from universal_iiif_core.logger import get_logger
 from universal_iiif_core.services.ocr.storage import OCRStorage
 from universal_iiif_core.services.storage.vault_manager import VaultManager
@@ -223,6 +224,7 @@ def optimize_local_scans(
         local_scans_available=1 if has_local_scans else 0,
         read_source_mode="local" if has_local_scans else "remote",
     )
+    bump_document_revision(doc_id, [int(delta.get("page") or 0) for delta in page_deltas])
 
     tone = "success" if optimized_pages > 0 and errors == 0 else "warning" if optimized_pages > 0 else "danger"
     scope_label = "selezionate" if requested_pages else "totali"
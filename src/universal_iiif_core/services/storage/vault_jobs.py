@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import json
 import sqlite3
 from typing import Any
 
+from ...doc_revisions import bump_document_revision
+from ...event_bus import TOPIC_EXPORT, publish_event
 from ...exceptions import DatabaseError
 from ...logger import get_logger
 
@@ -81,6 +84,8 @@ def create_download_job(
             (job_id, doc_id, library, manifest_url, str(job_origin or "library_download").strip().lower()),
         )
         conn.commit()
+        # A job's state is document-level (poller, summary); no page card depends on it.
+        bump_document_revision(doc_id, pages=())
     finally:
         conn.close()
 
@@ -114,12 +119,18 @@ def update_download_job(
         params.append(job_id)
         cursor.execute(sql, tuple(params))
         progress_key = (current, total, status)
+        changed_doc_id = None
         cached = self._download_progress_cache.get(job_id)
+        # Progress ticks only move the job's counters; scans are bumped by the downloader once
+        # they are in scans/ (`_finalize_downloads` for canvas images, `_extract_pages_from_pdf`
+        # for native PDFs), so the job itself bumps the revision on status changes only.
+        status_changed = cached is None or cached[2] != status
         if cached != progress_key:
             try:
                 cursor.execute("SELECT doc_id FROM download_jobs WHERE job_id = ?", (job_id,))
                 row = cursor.fetchone()
                 doc_id = row[0] if row else None
+                changed_doc_id = doc_id
                 title = None
                 if doc_id:
                     try:
@@ -139,6 +150,8 @@ def update_download_job(
             finally:
                 self._download_progress_cache[job_id] = progress_key
         conn.commit()
+        if changed_doc_id and status_changed:
+            bump_document_revision(changed_doc_id, pages=())
     finally:
         conn.close()
 
@@ -316,6 +329,36 @@ def delete_download_job(self, job_id: str) -> bool:
         conn.close()
 
 
+def _publish_export_state(cursor: sqlite3.Cursor, job_id: str) -> None:
+    """Publish the current export job row on the live event bus."""
+    cursor.execute(
+        "SELECT status, current_step, total_steps, doc_ids_json, library FROM export_jobs WHERE job_id = ?",
+        (job_id,),
+    )
+    row = cursor.fetchone()
+    if not row:
+        return
+    try:
+        doc_ids = [str(doc) for doc in json.loads(row[3] or "[]")]
+    except (TypeError, ValueError):
+        doc_ids = []
+    for doc_id in doc_ids:
+        # Exports change document-level state (PDF inventory), not page cards.
+        bump_document_revision(doc_id, pages=())
+    publish_event(
+        TOPIC_EXPORT,
+        f"export:{job_id}",
+        {
+            "job_id": job_id,
+            "status": str(row[0] or ""),
+            "current_step": int(row[1] or 0),
+            "total_steps": int(row[2] or 0),
+            "doc_ids": doc_ids,
+            "library": str(row[4] or ""),
+        },
+    )
+
+
 def create_export_job(
     self,
     job_id: str,
@@ -363,6 +406,7 @@ def create_export_job(
             ),
         )
         conn.commit()
+        _publish_export_state(cursor, job_id)
     finally:
         conn.close()
 
@@ -409,6 +453,7 @@ def update_export_job(
         params.append(job_id)
         cursor.execute(sql, tuple(params))
         conn.commit()
+        _publish_export_state(cursor, job_id)
     finally:
         conn.close()
 
@@ -0,0 +1,221 @@
+"""Library-wide maintenance methods for VaultManager.
+
+Maintenance passes (state normalization, automatic reclassification) touch
+every manuscript row. Doing that through `upsert_manuscript` costs one
+connection, one SELECT and one commit per row. `bulk_update_manuscripts`
+instead works in batches: each batch is read, handed to the caller to compute
+the changed columns in Python and written with `executemany`, all inside one
+short write transaction. `bulk_upsert_manuscripts` does the same for imports
+that insert or refresh a known list of rows.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable
+from typing import Any
+
+from ...exceptions import DatabaseError
+from ...library_catalog import normalize_item_type
+from ...logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+ComputeUpdatesFn = Callable[[dict[str, Any]], dict[str, Any] | None]
+ComputeBatchUpdatesFn = Callable[[list[dict[str, Any]]], list[dict[str, Any] | None]]
+ComputeUpsertFn = Callable[[str, dict[str, Any] | None], dict[str, Any]]
+
+
+def _group_updates(
+    rows: list[dict[str, Any]],
+    results: list[dict[str, Any] | None],
+    columns: set[str],
+) -> dict[tuple[str, ...], list[tuple[Any, ...]]]:
+    """Group each row's valid updates by their sorted column set, as `executemany` parameters."""
+    grouped: dict[tuple[str, ...], list[tuple[Any, ...]]] = {}
+    for row, result in zip(rows, results, strict=True):
+        updates = {key: value for key, value in (result or {}).items() if key in columns}
+        if not updates:
+            continue
+        if "item_type" in updates:
+            updates["item_type"] = normalize_item_type(str(updates["item_type"] or ""))
+        key = tuple(sorted(updates))
+        grouped.setdefault(key, []).append((*(updates[column] for column in key), row["id"]))
+    return grouped
+
+
+def _update_batch(
+    conn: sqlite3.Connection,
+    ids: list[Any],
+    compute_updates: ComputeUpdatesFn | ComputeBatchUpdatesFn,
+    *,
+    batched: bool,
+    columns: set[str],
+) -> int:
+    """Read, compute and write one batch of rows inside a single write transaction."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        placeholders = ", ".join("?" for _ in ids)
+        fetched = conn.execute(f"SELECT * FROM manuscripts WHERE id IN ({placeholders})", ids).fetchall()  # noqa: S608
+        by_id = {row["id"]: dict(row) for row in fetched}
+        rows = [by_id[row_id] for row_id in ids if row_id in by_id]
+        results = compute_updates(rows) if batched else [compute_updates(row) for row in rows]
+        changed = 0
+        for key, params in _group_updates(rows, results, columns).items():
+            assignments = ", ".join(f"{column} = ?" for column in key)
+            conn.executemany(
+                f"UPDATE manuscripts SET {assignments}, updated_at = CURRENT_TIMESTAMP WHERE id = ?",  # noqa: S608
+                params,
+            )
+            changed += len(params)
+        conn.execute("COMMIT")
+        return changed
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def bulk_update_manuscripts(
+    self,
+    compute_updates: ComputeUpdatesFn | ComputeBatchUpdatesFn,
+    *,
+    batched: bool = False,
+    newest_first: bool = False,
+    limit: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress_callback: Callable[..., Any] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
+) -> int:
+    """Apply `compute_updates` to every manuscript row, batch by batch; return the rows changed.
+
+    Each batch is re-read, computed and written inside one `BEGIN IMMEDIATE` transaction,
+    so writers running meanwhile (download progress, asset state) are never overwritten
+    with values read before their update.
+
+    Args:
+        self: The VaultManager instance (this function is attached as a method).
+        compute_updates: Receives each row as a dict and returns the columns to change, or
+            None/empty to leave the row alone. Unknown columns are ignored and `item_type`
+            is normalized, as in `upsert_manuscript`.
+        batched: Call `compute_updates` once per batch with the list of rows; it must
+            return one result per row, in order.
+        newest_first: Visit rows by `updated_at` descending (the Library order) instead of insertion order.
+        limit: Visit at most this many rows.
+        batch_size: Rows read and written per transaction.
+        progress_callback: `(done, total, message)` reporter, called once per batch.
+        should_cancel: Polled once per batch; batches already written stay written.
+
+    Raises:
+        DatabaseError: When a batch cannot be written; that batch is rolled back.
+    """
+    columns = set(self._MANUSCRIPT_COLUMNS)
+    order = "updated_at DESC" if newest_first else "rowid"
+    row_limit = -1 if limit is None else max(1, int(limit))
+    size = max(1, batch_size)
+    conn = self._get_conn()
+    conn.isolation_level = None
+    conn.row_factory = sqlite3.Row
+    try:
+        # The visiting order is fixed up front: the writes below change `updated_at`.
+        ids = [
+            row[0]
+            for row in conn.execute(f"SELECT id FROM manuscripts ORDER BY {order} LIMIT ?", (row_limit,))  # noqa: S608
+        ]
+        total = len(ids)
+        changed = 0
+        for start in range(0, total, size):
+            changed += _update_batch(conn, ids[start : start + size], compute_updates, batched=batched, columns=columns)
+            done = min(start + size, total)
+            if progress_callback is not None:
+                progress_callback(done, total, f"Elementi verificati: {done}/{total}")
+            if should_cancel is not None and should_cancel():
+                break
+        return changed
+    except sqlite3.Error as exc:
+        logger.error("Bulk manuscript update failed: %s", exc)
+        raise DatabaseError(f"Bulk manuscript update failed: {exc}") from exc
+    finally:
+        conn.close()
+
+
+def _upsert_batch(self, conn: sqlite3.Connection, ids: list[str], compute_fields: ComputeUpsertFn) -> int:
+    """Read, compute and insert/update one batch of rows inside a single write transaction."""
+    columns = self._MANUSCRIPT_COLUMNS
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        placeholders = ", ".join("?" for _ in ids)
+        fetched = conn.execute(f"SELECT * FROM manuscripts WHERE id IN ({placeholders})", ids).fetchall()  # noqa: S608
+        existing_by_id = {row["id"]: dict(row) for row in fetched}
+        inserts: list[tuple[Any, ...]] = []
+        updates: list[tuple[Any, ...]] = []
+        for manuscript_id in ids:
+            existing = existing_by_id.get(manuscript_id)
+            fields = self._prepare_manuscript_updates(compute_fields(manuscript_id, existing) or {})
+            if existing is None:
+                inserts.append((manuscript_id, *(fields.get(column) for column in columns)))
+            else:
+                merged = self._merge_manuscript_updates(fields, existing)
+                updates.append((*(merged.get(column, existing.get(column)) for column in columns), manuscript_id))
+        if inserts:
+            conn.executemany(
+                f"INSERT INTO manuscripts (id, {', '.join(columns)}) VALUES ({', '.join('?' * (len(columns) + 1))})",  # noqa: S608
+                inserts,
+            )
+        if updates:
+            assignments = ", ".join(f"{column} = ?" for column in columns)
+            conn.executemany(
+                f"UPDATE manuscripts SET {assignments}, updated_at = CURRENT_TIMESTAMP WHERE id = ?",  # noqa: S608
+                updates,
+            )
+        conn.execute("COMMIT")
+        return len(inserts) + len(updates)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def bulk_upsert_manuscripts(
+    self,
+    ids: list[str],
+    compute_fields: ComputeUpsertFn,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Insert or update the manuscripts `ids`, batch by batch; return the rows written.
+
+    Each batch looks its existing rows up with one SELECT and is written with
+    `executemany` inside one `BEGIN IMMEDIATE` transaction, with the semantics of
+    `upsert_manuscript` (normalized library and item type, manual item types kept).
+
+    Args:
+        self: The VaultManager instance (this function is attached as a method).
+        ids: Manuscript ids to write; duplicates are written once.
+        compute_fields: Receives each id and its current row (None when new) and returns the columns to store.
+        batch_size: Rows read and written per transaction.
+
+    Raises:
+        DatabaseError: When a batch cannot be written; that batch is rolled back.
+    """
+    unique_ids = list(dict.fromkeys(str(manuscript_id) for manuscript_id in ids))
+    size = max(1, batch_size)
+    conn = self._get_conn()
+    conn.isolation_level = None
+    conn.row_factory = sqlite3.Row
+    try:
+        written = 0
+        for start in range(0, len(unique_ids), size):
+            written += _upsert_batch(self, conn, unique_ids[start : start + size], compute_fields)
+        return written
+    except sqlite3.Error as exc:
+        logger.error("Bulk manuscript upsert failed: %s", exc)
+        raise DatabaseError(f"Bulk manuscript upsert failed: {exc}") from exc
+    finally:
+        conn.close()
+
+
+def attach_maintenance_methods(cls) -> None:
+    """Attach the bulk-maintenance methods to `cls`."""
+    cls.bulk_update_manuscripts = bulk_update_manuscripts
+    cls.bulk_upsert_manuscripts = bulk_upsert_manuscripts
@@ -1,6 +1,7 @@
 import json
 import shutil
 import sqlite3
+from collections.abc import Callable
 from contextlib import suppress
 from datetime import datetime, timezone
 from pathlib import Path
@@ -20,6 +21,46 @@ _STUDIO_RECENTS_KEY = "studio.recent_contexts"
 class VaultManager:
     """Manages the storage and retrieval of manuscripts and image snippets using SQLite."""
 
+    # Writable `manuscripts` columns (everything except the id and the timestamps).
+    _MANUSCRIPT_COLUMNS = (
+        "display_title",
+        "title",
+        "catalog_title",
+        "library",
+        "manifest_url",
+        "local_path",
+        "status",
+        "total_canvases",
+        "downloaded_canvases",
+        "asset_state",
+        "has_native_pdf",
+        "pdf_local_available",
+        "manifest_local_available",
+        "local_scans_available",
+        "read_source_mode",
+        "local_optimized",
+        "local_optimization_meta_json",
+        "item_type",
+        "item_type_source",
+        "item_type_confidence",
+        "item_type_reason",
+        "missing_pages_json",
+        "author",
+        "description",
+        "publisher",
+        "attribution",
+        "thumbnail_url",
+        "shelfmark",
+        "date_label",
+        "language_label",
+        "source_detail_url",
+        "reference_text",
+        "user_notes",
+        "metadata_json",
+        "last_sync_at",
+        "error_log",
+    )
+
     def __init__(self, db_path: str = "data/vault.db"):
         """Initialize the VaultManager with the given database path.
 
@@ -194,6 +235,7 @@ class VaultManager:
         self._migrate_export_jobs_table(cursor)
         self._migrate_manuscript_ui_preferences_table(cursor)
         self._migrate_app_ui_preferences_table(cursor)
+        self._migrate_remote_page_dims_table(cursor)
 
         conn.commit()
         conn.close()
@@ -291,6 +333,24 @@ class VaultManager:
             )
         """)
 
+    def _migrate_remote_page_dims_table(self, cursor: sqlite3.Cursor) -> None:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS remote_page_dims (
+                doc_id TEXT NOT NULL,
+                page_num INTEGER NOT NULL,
+                declared_width INTEGER,
+                declared_height INTEGER,
+                service_url TEXT,
+                verified_width INTEGER,
+                verified_height INTEGER,
+                verified_ts INTEGER,
+                updated_ts INTEGER NOT NULL,
+                last_access_ts INTEGER NOT NULL,
+                PRIMARY KEY (doc_id, page_num)
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_remote_page_dims_access ON remote_page_dims (last_access_ts)")
+
     def _backfill_metadata_fields(self, cursor: sqlite3.Cursor) -> None:
         """Populate author/description/publisher from metadata_json for existing rows."""
         cursor.execute(
@@ -333,47 +393,9 @@ class VaultManager:
                 sql = "UPDATE manuscripts SET " + ", ".join(parts) + " WHERE id = ?"  # noqa: S608
                 cursor.execute(sql, values)
 
-    def upsert_manuscript(self, manuscript_id: str, **kwargs):
-        """Insert or update a manuscript record."""
-        valid_keys = (
-            "display_title",
-            "title",
-            "catalog_title",
-            "library",
-            "manifest_url",
-            "local_path",
-            "status",
-            "total_canvases",
-            "downloaded_canvases",
-            "asset_state",
-            "has_native_pdf",
-            "pdf_local_available",
-            "manifest_local_available",
-            "local_scans_available",
-            "read_source_mode",
-            "local_optimized",
-            "local_optimization_meta_json",
-            "item_type",
-            "item_type_source",
-            "item_type_confidence",
-            "item_type_reason",
-            "missing_pages_json",
-            "author",
-            "description",
-            "publisher",
-            "attribution",
-            "thumbnail_url",
-            "shelfmark",
-            "date_label",
-            "language_label",
-            "source_detail_url",
-            "reference_text",
-            "user_notes",
-            "metadata_json",
-            "last_sync_at",
-            "error_log",
-        )
-        updates = {k: v for k, v in kwargs.items() if k in valid_keys}
+    def _prepare_manuscript_updates(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Keep the known columns of `kwargs`, normalized as every manuscript write expects."""
+        updates = {k: v for k, v in kwargs.items() if k in self._MANUSCRIPT_COLUMNS}
 
         # Enforce library name standardization
         if updates.get("library") == "Vaticana (BAV)":
@@ -385,6 +407,27 @@ class VaultManager:
 
         if "item_type" in updates:
             updates["item_type"] = normalize_item_type(str(updates.get("item_type") or ""))
+        return updates
+
+    @staticmethod
+    def _merge_manuscript_updates(updates: dict[str, Any], existing_map: dict[str, Any]) -> dict[str, Any]:
+        """Return `updates` applied over an existing row; an automatic item type never replaces a manual one."""
+        updates = dict(updates)
+        if (
+            existing_map.get("item_type_source") == "manual"
+            and updates.get("item_type_source") == "auto"
+            and "item_type" in updates
+        ):
+            updates.pop("item_type", None)
+            updates.pop("item_type_confidence", None)
+            updates.pop("item_type_reason", None)
+            updates.pop("item_type_source", None)
+        return updates
+
+    def upsert_manuscript(self, manuscript_id: str, **kwargs):
+        """Insert or update a manuscript record."""
+        valid_keys = self._MANUSCRIPT_COLUMNS
+        updates = self._prepare_manuscript_updates(kwargs)
 
         if not updates:
             self.register_manuscript(manuscript_id)
@@ -403,18 +446,8 @@ class VaultManager:
                 insert_sql = f"INSERT INTO manuscripts ({', '.join(columns)}) VALUES ({placeholders})"  # noqa: S608
                 cursor.execute(insert_sql, values)
             else:
-                existing_columns = tuple(existing.keys())
-                existing_map = {column: existing[column] for column in existing_columns}
-                if (
-                    existing_map.get("item_type_source") == "manual"
-                    and updates.get("item_type_source") == "auto"
-                    and "item_type" in updates
-                ):
-                    updates.pop("item_type", None)
-                    updates.pop("item_type_confidence", None)
-                    updates.pop("item_type_reason", None)
-                    updates.pop("item_type_source", None)
-
+                existing_map = dict(existing)
+                updates = self._merge_manuscript_updates(updates, existing_map)
                 values = [updates.get(k, existing_map.get(k)) for k in valid_keys]
                 assignments = ", ".join(f"{key} = ?" for key in valid_keys)
                 update_sql = f"UPDATE manuscripts SET {assignments}, updated_at = CURRENT_TIMESTAMP WHERE id = ?"  # noqa: S608
@@ -459,10 +492,18 @@ class VaultManager:
                 logger.debug("Skipping malformed page filename while scanning %s: %s", directory, image.name)
         return pages
 
-    def normalize_asset_states(self, limit: int = 200) -> int:
-        """Backfill and normalize asset_state/item_type for existing rows."""
-        rows = self.get_all_manuscripts()[: max(1, limit)]
-        updated = 0
+    def normalize_asset_states(
+        self,
+        limit: int | None = 200,
+        *,
+        progress_callback: Callable[..., Any] | None = None,
+        should_cancel: Callable[[], bool] | None = None,
+    ) -> int:
+        """Backfill and normalize asset_state/item_type for the `limit` most recent rows (all when None).
+
+        Rows are read and the changed ones written in batched transactions
+        (see `bulk_update_manuscripts`).
+        """
         active_keys = {
             (
                 str(job.get("doc_id") or ""),
@@ -478,73 +519,81 @@ class VaultManager:
         except DatabaseError:
             temp_root = None
 
-        for row in rows:
-            manuscript_id = str(row.get("id") or "")
-            library = str(row.get("library") or "")
-            local_path_raw = str(row.get("local_path") or "").strip()
-            local_path = Path(local_path_raw) if local_path_raw else None
-            scans_dir = local_path / "scans" if local_path else None
-            scans_pages = self._scan_page_numbers(scans_dir)
-            temp_pages = self._scan_page_numbers((temp_root / manuscript_id) if temp_root and manuscript_id else None)
-            known_pages = scans_pages | temp_pages
-            scans_count = len(scans_pages)
-            local_scans_available = 1 if scans_count > 0 else 0
-            read_source_mode = "local" if scans_count > 0 else "remote"
-            total = int(row.get("total_canvases") or 0)
-            downloaded = max(int(row.get("downloaded_canvases") or 0), len(known_pages))
-            if total <= 0 and downloaded > 0:
-                total = downloaded
-            status = str(row.get("status") or "").lower()
-            asset_state = str(row.get("asset_state") or "").lower()
-            if status == "cancelling":
-                status = "running"
-            is_stale_running = (
-                status in {"queued", "running", "downloading", "pending"}
-                and (
-                    manuscript_id,
-                    library,
-                )
-                not in active_keys
-            )
-            if is_stale_running:
-                status = self._fallback_status_from_counts(total, downloaded)
-
-            target_state = self._compute_state(total, downloaded, status)
-            allowed_statuses = {"saved", "partial", "complete", "error", "downloading", "queued", "running"}
-            status_to_store = status if status in allowed_statuses else str(row.get("status") or "")
-            normalized_type = normalize_item_type(str(row.get("item_type") or ""))
-            missing_pages: list[int] = []
-            if total > 0 and known_pages:
-                missing_pages = [i for i in range(1, total + 1) if i not in known_pages]
-            elif total > 0 and downloaded < total:
-                missing_pages = [i for i in range(downloaded + 1, total + 1)] if downloaded > 0 else []
-            missing_pages_json = json.dumps(missing_pages)
-
-            if (
-                status_to_store == str(row.get("status") or "")
-                and target_state == asset_state
-                and total == int(row.get("total_canvases") or 0)
-                and downloaded == int(row.get("downloaded_canvases") or 0)
-                and normalized_type == str(row.get("item_type") or "")
-                and missing_pages_json == str(row.get("missing_pages_json") or "[]")
-                and int(row.get("local_scans_available") or 0) == local_scans_available
-                and str(row.get("read_source_mode") or "").strip().lower() == read_source_mode
-            ):
-                continue
+        return self.bulk_update_manuscripts(
+            lambda row: self._normalized_state_updates(row, active_keys, temp_root),
+            newest_first=True,
+            limit=None if limit is None else max(1, limit),
+            progress_callback=progress_callback,
+            should_cancel=should_cancel,
+        )
 
-            self.upsert_manuscript(
+    def _normalized_state_updates(
+        self, row: dict[str, Any], active_keys: set[tuple[str, str]], temp_root: Path | None
+    ) -> dict[str, Any] | None:
+        """Return the state columns `normalize_asset_states` would change for `row`, or None."""
+        manuscript_id = str(row.get("id") or "")
+        library = str(row.get("library") or "")
+        local_path_raw = str(row.get("local_path") or "").strip()
+        local_path = Path(local_path_raw) if local_path_raw else None
+        scans_dir = local_path / "scans" if local_path else None
+        scans_pages = self._scan_page_numbers(scans_dir)
+        temp_pages = self._scan_page_numbers((temp_root / manuscript_id) if temp_root and manuscript_id else None)
+        known_pages = scans_pages | temp_pages
+        scans_count = len(scans_pages)
+        local_scans_available = 1 if scans_count > 0 else 0
+        read_source_mode = "local" if scans_count > 0 else "remote"
+        total = int(row.get("total_canvases") or 0)
+        downloaded = max(int(row.get("downloaded_canvases") or 0), len(known_pages))
+        if total <= 0 and downloaded > 0:
+            total = downloaded
+        status = str(row.get("status") or "").lower()
+        asset_state = str(row.get("asset_state") or "").lower()
+        if status == "cancelling":
+            status = "running"
+        is_stale_running = (
+            status in {"queued", "running", "downloading", "pending"}
+            and (
                 manuscript_id,
-                status=status_to_store,
-                asset_state=target_state,
-                total_canvases=total,
-                downloaded_canvases=downloaded,
-                item_type=normalized_type,
-                missing_pages_json=missing_pages_json,
-                local_scans_available=local_scans_available,
-                read_source_mode=read_source_mode,
+                library,
             )
-            updated += 1
-        return updated
+            not in active_keys
+        )
+        if is_stale_running:
+            status = self._fallback_status_from_counts(total, downloaded)
+
+        target_state = self._compute_state(total, downloaded, status)
+        allowed_statuses = {"saved", "partial", "complete", "error", "downloading", "queued", "running"}
+        status_to_store = status if status in allowed_statuses else str(row.get("status") or "")
+        normalized_type = normalize_item_type(str(row.get("item_type") or ""))
+        missing_pages: list[int] = []
+        if total > 0 and known_pages:
+            missing_pages = [i for i in range(1, total + 1) if i not in known_pages]
+        elif total > 0 and downloaded < total:
+            missing_pages = [i for i in range(downloaded + 1, total + 1)] if downloaded > 0 else []
+        missing_pages_json = json.dumps(missing_pages)
+
+        if (
+            status_to_store == str(row.get("status") or "")
+            and target_state == asset_state
+            and total == int(row.get("total_canvases") or 0)
+            and downloaded == int(row.get("downloaded_canvases") or 0)
+            and normalized_type == str(row.get("item_type") or "")
+            and missing_pages_json == str(row.get("missing_pages_json") or "[]")
+            and int(row.get("local_scans_available") or 0) == local_scans_available
+            and str(row.get("read_source_mode") or "").strip().lower() == read_source_mode
+        ):
+            return None
+
+        return {
+            "status": status_to_store,
+            "asset_state": target_state,
+            "total_canvases": total,
+            "downloaded_canvases": downloaded,
+            "item_type": normalized_type,
+            "missing_pages_json": missing_pages_json,
+            "local_scans_available": local_scans_available,
+            "read_source_mode": read_source_mode,
+        }
 
     def get_all_manuscripts(self):
         """Returns all manuscripts from the database."""
@@ -831,6 +880,7 @@ class VaultManager:
 
             # 3a. Delete manuscript-scoped UI preferences.
             cursor.execute("DELETE FROM manuscript_ui_preferences WHERE manuscript_id = ?", (ms_id,))
+            cursor.execute("DELETE FROM remote_page_dims WHERE doc_id = ?", (ms_id,))
 
             # 3b. Remove historical download jobs for this manuscript to avoid stale
             # cards in the Download Manager after deletion from Library.
@@ -909,9 +959,13 @@ class VaultManager:
 
 
 from .vault_jobs import attach_job_methods  # noqa: E402
+from .vault_maintenance import attach_maintenance_methods  # noqa: E402
+from .vault_remote_dims import attach_remote_dims_methods  # noqa: E402
 from .vault_snippets import attach_snippet_methods  # noqa: E402
 
 attach_snippet_methods(VaultManager)
 attach_job_methods(VaultManager)
+attach_maintenance_methods(VaultManager)
+attach_remote_dims_methods(VaultManager)
 
 __all__ = ["VaultManager"]
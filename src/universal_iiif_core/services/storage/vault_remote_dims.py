@@ -0,0 +1,197 @@
+"""Remote page-dimension cache methods for VaultManager.
+
+Rows in `remote_page_dims` hold, per manuscript page, the IIIF-declared
+maximum size, the image service URL and the dimensions verified by a direct
+download. Lookups are restricted to the pages being rendered and writes are
+batched, so the cost of a thumbnail poll no longer grows with the manuscript.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from ...logger import get_logger
+
+logger = get_logger(__name__)
+
+# Fixed per-row overhead used to estimate the cache footprint for `max_bytes`.
+_ROW_OVERHEAD_BYTES = 96
+_SQLITE_MAX_PARAMS = 900
+
+
+def _opt_int(value: Any) -> int | None:
+    try:
+        number = int(value or 0)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def _row_to_entry(row: tuple) -> dict[str, Any]:
+    return {
+        "width": row[1],
+        "height": row[2],
+        "service_url": row[3],
+        "verified_direct_width": row[4],
+        "verified_direct_height": row[5],
+        "verified_direct_ts": row[6],
+        "updated_ts": row[7],
+        "last_access_ts": row[8],
+    }
+
+
+def get_remote_page_dims(self, doc_id: str, pages: list[int] | None = None) -> dict[str, dict[str, Any]]:
+    """Return cached remote dimensions for `doc_id`, keyed by 1-based page number (as string).
+
+    When `pages` is given only those rows are read (indexed lookup).
+    """
+    if not doc_id:
+        return {}
+    columns = (
+        "page_num, declared_width, declared_height, service_url, verified_width, verified_height, "
+        "verified_ts, updated_ts, last_access_ts"
+    )
+    conn = self._get_conn()
+    cursor = conn.cursor()
+    try:
+        rows: list[tuple] = []
+        if pages is None:
+            cursor.execute(f"SELECT {columns} FROM remote_page_dims WHERE doc_id = ?", (doc_id,))  # noqa: S608
+            rows = cursor.fetchall()
+        else:
+            wanted = sorted({int(p) for p in pages})
+            for start in range(0, len(wanted), _SQLITE_MAX_PARAMS):
+                chunk = wanted[start : start + _SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" for _ in chunk)
+                cursor.execute(
+                    f"SELECT {columns} FROM remote_page_dims WHERE doc_id = ? AND page_num IN ({placeholders})",  # noqa: S608
+                    (doc_id, *chunk),
+                )
+                rows.extend(cursor.fetchall())
+        return {str(row[0]): _row_to_entry(row) for row in rows}
+    finally:
+        conn.close()
+
+
+def upsert_remote_page_dims(self, doc_id: str, entries: dict[str, dict[str, Any]]) -> int:
+    """Insert or update many page entries in one transaction.
+
+    `entries` uses the same shape returned by `get_remote_page_dims`. Every
+    written row has its `last_access_ts` bumped, which drives LRU eviction.
+    Known dimensions are never cleared by an entry that omits them, so a
+    failed or late probe cannot erase an earlier result.
+    """
+    if not doc_id or not entries:
+        return 0
+    now_ts = int(time.time())
+    rows: list[tuple] = []
+    for page_key, entry in entries.items():
+        page_num = _opt_int(page_key)
+        if page_num is None or not isinstance(entry, dict):
+            continue
+        rows.append(
+            (
+                doc_id,
+                page_num,
+                _opt_int(entry.get("width")),
+                _opt_int(entry.get("height")),
+                str(entry.get("service_url") or "") or None,
+                _opt_int(entry.get("verified_direct_width")),
+                _opt_int(entry.get("verified_direct_height")),
+                _opt_int(entry.get("verified_direct_ts")),
+                int(entry.get("updated_ts") or now_ts),
+                now_ts,
+            )
+        )
+    if not rows:
+        return 0
+    conn = self._get_conn()
+    try:
+        conn.executemany(
+            """
+            INSERT INTO remote_page_dims (
+                doc_id, page_num, declared_width, declared_height, service_url,
+                verified_width, verified_height, verified_ts, updated_ts, last_access_ts
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(doc_id, page_num) DO UPDATE SET
+                declared_width = COALESCE(excluded.declared_width, declared_width),
+                declared_height = COALESCE(excluded.declared_height, declared_height),
+                service_url = COALESCE(excluded.service_url, service_url),
+                verified_width = COALESCE(excluded.verified_width, verified_width),
+                verified_height = COALESCE(excluded.verified_height, verified_height),
+                verified_ts = COALESCE(excluded.verified_ts, verified_ts),
+                updated_ts = excluded.updated_ts,
+                last_access_ts = excluded.last_access_ts
+            """,
+            rows,
+        )
+        conn.commit()
+        return len(rows)
+    finally:
+        conn.close()
+
+
+def prune_remote_page_dims(
+    self,
+    doc_id: str,
+    *,
+    retention_hours: int,
+    max_items: int,
+    max_bytes: int,
+) -> int:
+    """Evict expired rows globally, then least-recently-used rows of `doc_id` over the caps.
+
+    `max_bytes` is compared against an estimated row footprint (fixed overhead
+    plus the service URL length). Returns the number of deleted rows.
+    """
+    min_ts = int(time.time()) - max(1, int(retention_hours)) * 3600
+    conn = self._get_conn()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DELETE FROM remote_page_dims WHERE last_access_ts < ?", (min_ts,))
+        deleted = max(cursor.rowcount, 0)
+        cursor.execute(
+            """
+            DELETE FROM remote_page_dims
+            WHERE doc_id = ? AND page_num IN (
+                SELECT page_num FROM (
+                    SELECT
+                        page_num,
+                        ROW_NUMBER() OVER w AS rank,
+                        SUM(? + LENGTH(COALESCE(service_url, ''))) OVER w AS running_bytes
+                    FROM remote_page_dims
+                    WHERE doc_id = ?
+                    WINDOW w AS (ORDER BY last_access_ts DESC, page_num ASC)
+                )
+                WHERE rank > ? OR running_bytes > ?
+            )
+            """,
+            (doc_id, _ROW_OVERHEAD_BYTES, doc_id, max(1, int(max_items)), max(0, int(max_bytes))),
+        )
+        deleted += max(cursor.rowcount, 0)
+        conn.commit()
+        return deleted
+    finally:
+        conn.close()
+
+
+def delete_remote_page_dims(self, doc_id: str) -> int:
+    """Drop every cached dimension row for one manuscript."""
+    conn = self._get_conn()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DELETE FROM remote_page_dims WHERE doc_id = ?", (doc_id,))
+        conn.commit()
+        return max(cursor.rowcount, 0)
+    finally:
+        conn.close()
+
+
+def attach_remote_dims_methods(cls) -> None:
+    """Attach remote page-dimension cache methods to ``VaultManager``."""
+    cls.get_remote_page_dims = get_remote_page_dims
+    cls.upsert_remote_page_dims = upsert_remote_page_dims
+    cls.prune_remote_page_dims = prune_remote_page_dims
+    cls.delete_remote_page_dims = delete_remote_page_dims
@@ -1,4 +1,4 @@
-"""Shared title selection and truncation utilities for Studio UI."""
+"""Shared title selection and truncation utilities."""
 
 from __future__ import annotations
 
@@ -6,7 +6,7 @@ import re
 from collections.abc import Mapping
 from typing import Any
 
-from universal_iiif_core.library_catalog import is_generic_catalog_text
+from .library_catalog import is_generic_catalog_text
 
 DEFAULT_TITLE_MAX_LEN = 70
 DEFAULT_TITLE_SUFFIX = "[...]"
@@ -0,0 +1,109 @@
+"""ZIP archives for export artifacts, written to disk or streamed as they are built.
+
+Scans and PDFs are already compressed, so deflating them burns CPU for no
+size gain: such members are stored (`ZIP_STORED`) and everything else is
+deflated. Members larger than 4 GiB, or archives with more than 65535
+members, use the zip64 extensions.
+
+`iter_zip_stream` produces the archive as a sequence of byte chunks without
+ever seeking, using ZIP data descriptors, so it can back an HTTP streaming
+response: the download starts with the first member and no archive copy is
+written to the exports directory.
+"""
+
+from __future__ import annotations
+
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+STORED_SUFFIXES = frozenset({".jpg", ".jpeg", ".jp2", ".png", ".webp", ".gif", ".pdf", ".zip"})
+STREAM_CHUNK_BYTES = 1024 * 1024
+
+ZipEntry = tuple[Path, str]
+
+
+def compression_for(path: Path) -> int:
+    """Return the ZIP compression method for one member file."""
+    return zipfile.ZIP_STORED if Path(path).suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+
+
+def _zip_info(path: Path, arcname: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo.from_file(path, arcname=arcname)
+    info.compress_type = compression_for(path)
+    return info
+
+
+def write_zip(
+    entries: Iterable[ZipEntry],
+    output_path: Path,
+    progress_callback: Callable[[int, int], None] | None = None,
+) -> Path:
+    """Write `(path, arcname)` entries to `output_path`; missing files are skipped.
+
+    `progress_callback(done, total)` is called after each entry, so a raising
+    callback aborts the archive between members.
+    """
+    entries = list(entries)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(output_path, mode="w", allowZip64=True) as archive:
+        for done, (path, arcname) in enumerate(entries, start=1):
+            if path.is_file():
+                archive.write(path, arcname=arcname, compress_type=compression_for(path))
+            else:
+                logger.debug("Skipping missing file while creating ZIP: %s", path)
+            if progress_callback:
+                progress_callback(done, len(entries))
+    return output_path
+
+
+class _ChunkSink:
+    """Write-only, non-seekable file object collecting the bytes `ZipFile` emits."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip_stream(entries: Iterable[ZipEntry], chunk_size: int = STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+    """Yield the bytes of a ZIP archive of `(path, arcname)` entries while it is being built.
+
+    Missing files are skipped. Memory use is bounded by `chunk_size` plus the
+    central directory, independently of member sizes.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", allowZip64=True) as archive:
+        for path, arcname in entries:
+            if not path.is_file():
+                logger.debug("Skipping missing file while streaming ZIP: %s", path)
+                continue
+            info = _zip_info(path, arcname)
+            # `file_size` is known upfront, so zipfile picks zip64 headers for large members.
+            with path.open("rb") as src, archive.open(info, mode="w") as dest:
+                while chunk := src.read(chunk_size):
+                    dest.write(chunk)
+                    pending = sink.drain()
+                    if pending:
+                        yield pending
+            pending = sink.drain()
+            if pending:
+                yield pending
+    tail = sink.drain()
+    if tail:
+        yield tail
@@ -132,6 +132,21 @@ def _cleanup_local_paths(created_local_paths, tmp_root):
                 p.unlink()
 
 
+@pytest.fixture(autouse=True)
+def _isolated_search_cache():
+    """Start every test with an empty search cache and no background next-page prefetch."""
+    from universal_iiif_core.discovery.search_cache import get_search_cache
+
+    cm = _config_manager()
+    previous = cm.get_setting("discovery.prefetch_next_page")
+    cm.set_setting("discovery.prefetch_next_page", False)
+    cache = get_search_cache()
+    cache.clear()
+    yield
+    cache.clear()
+    cm.set_setting("discovery.prefetch_next_page", True if previous is None else previous)
+
+
 @pytest.fixture(autouse=True)
 def _auto_cleanup_database(monkeypatch, tmp_path):
     """Autouse fixture che intercetta la creazione di Job e Manoscritti.
@@ -0,0 +1,220 @@
+"""Tests for the resumable bulk shelf-list import pipeline."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from studio_ui.components.discovery_bulk_import import render_bulk_import_status
+from universal_iiif_core.bulk_import import (
+    ImportRow,
+    import_id_for,
+    load_import_report,
+    parse_import_text,
+    persist_saved_entries,
+    run_bulk_import,
+    summarize_report,
+)
+from universal_iiif_core.services.storage.vault_manager import VaultManager
+
+
+def test_parse_plain_text_skips_blank_and_comment_lines():
+    """Plain lists hold one identifier per line and keep source line numbers for the report."""
+    rows = parse_import_text("\ufeffVat.lat.3225\n\n# shelf 2\n  btv1b8470209d  \n")
+    assert rows == [ImportRow(1, "Vat.lat.3225"), ImportRow(4, "btv1b8470209d")]
+
+
+def test_parse_csv_uses_header_columns_and_library_hint():
+    """CSV headers select the identifier and library columns whatever their order."""
+    text = "library;segnatura;note\nVaticana;Vat.lat.3225;x\nGallica;btv1b8470209d;\n;;empty\n"
+    rows = parse_import_text(text)
+    assert rows == [ImportRow(2, "Vat.lat.3225", "Vaticana"), ImportRow(3, "btv1b8470209d", "Gallica")]
+
+
+def test_parse_headerless_csv_reads_identifier_then_library():
+    """Without a header the first column of a CSV file is the identifier and the second the library."""
+    rows = parse_import_text("Vat.lat.1,Vaticana\nVat.lat.2,Vaticana\n", csv_format=True)
+    assert [(row.identifier, row.library) for row in rows] == [("Vat.lat.1", "Vaticana"), ("Vat.lat.2", "Vaticana")]
+
+
+def test_plain_list_keeps_identifiers_with_delimiters_whole():
+    """Without a recognised header a delimiter inside an identifier does not switch to CSV."""
+    text = "https://example.org/iiif/a,b/manifest\nMs. 12; f. 3\n"
+    rows = parse_import_text(text)
+    assert [row.identifier for row in rows] == ["https://example.org/iiif/a,b/manifest", "Ms. 12; f. 3"]
+
+
+def _resolve(row: ImportRow):
+    if row.identifier.startswith("missing"):
+        return None, None, "Unknown"
+    return f"https://example.org/{row.identifier}/manifest.json", row.identifier, row.library or "Vaticana"
+
+
+def test_bulk_import_prepares_concurrently_and_persists_in_batches(tmp_path: Path):
+    """Items are prepared on several threads, persisted in batches and reported per line."""
+    rows = [ImportRow(index, f"ms-{index}") for index in range(1, 8)]
+    rows += [ImportRow(8, "missing-1"), ImportRow(9, "boom")]
+    threads: set[str] = set()
+    batches: list[list[str]] = []
+    progress: list[tuple[int, int]] = []
+
+    def _prepare(manifest_url, doc_id, library):
+        if doc_id == "boom":
+            raise ValueError("manifest non valido")
+        threads.add(threading.current_thread().name)
+        return {"doc_id": doc_id, "library": library, "manifest_url": manifest_url}
+
+    summary = run_bulk_import(
+        rows,
+        prepare_entry_fn=_prepare,
+        persist_batch_fn=lambda entries: batches.append([entry["doc_id"] for entry in entries]),
+        journal_path=tmp_path / "journal.jsonl",
+        workers=3,
+        batch_size=3,
+        resolve_row_fn=_resolve,
+        progress_callback=lambda done, total, _msg: progress.append((done, total)),
+    )
+
+    assert summary["imported"] == 7 and summary["not_found"] == 1 and summary["error"] == 1
+    assert sorted(doc for batch in batches for doc in batch) == sorted(f"ms-{index}" for index in range(1, 8))
+    assert all(len(batch) <= 3 for batch in batches)
+    assert all(name.startswith("bulk-import") for name in threads)
+    assert progress[-1] == (9, 9)
+    items = load_import_report(tmp_path / "journal.jsonl")["items"]
+    assert items["9::boom"]["message"] == "manifest non valido"
+    assert items["8::missing-1"]["status"] == "not_found"
+
+
+def test_bulk_import_resumes_and_retries_only_unfinished_lines(tmp_path: Path):
+    """A second run of the same list skips imported lines and retries failed or unreached ones."""
+    rows = [ImportRow(index, f"ms-{index}") for index in range(1, 6)]
+    journal = tmp_path / "journal.jsonl"
+    calls: list[str] = []
+    stop = threading.Event()
+
+    def _prepare_then_cancel(_manifest_url, doc_id, _library):
+        calls.append(doc_id)
+        stop.set()
+        if doc_id == "ms-1":
+            raise OSError("timeout")
+        return {"doc_id": doc_id}
+
+    first = run_bulk_import(
+        rows,
+        prepare_entry_fn=_prepare_then_cancel,
+        persist_batch_fn=lambda _entries: None,
+        journal_path=journal,
+        workers=1,
+        resolve_row_fn=_resolve,
+        should_cancel=stop.is_set,
+    )
+    assert first["cancelled"] is True
+    done_before = {item["identifier"] for item in load_import_report(journal)["items"].values()}
+    assert "ms-1" in done_before and len(done_before) < len(rows)
+
+    calls.clear()
+    second = run_bulk_import(
+        rows,
+        prepare_entry_fn=lambda _url, doc_id, _library: calls.append(doc_id) or {"doc_id": doc_id},
+        persist_batch_fn=lambda _entries: None,
+        journal_path=journal,
+        resolve_row_fn=_resolve,
+    )
+
+    assert "ms-1" in calls
+    assert not set(calls) & (done_before - {"ms-1"})
+    assert second["imported"] == 5 and second["cancelled"] is False
+    assert summarize_report(load_import_report(journal)) == {"imported": 5, "not_found": 0, "error": 0}
+
+
+def test_import_id_is_stable_for_the_same_list():
+    """Uploading the same list twice maps to the same journal."""
+    rows = parse_import_text("a\nb\n")
+    assert import_id_for(rows) == import_id_for(parse_import_text("a\nb\n"))
+    assert import_id_for(rows) != import_id_for(parse_import_text("a\nc\n"))
+
+
+def test_journal_appends_only_new_lines_per_flush(tmp_path: Path):
+    """Each flush appends its records instead of rewriting the whole report."""
+    journal = tmp_path / "journal.jsonl"
+    rows = [ImportRow(index, f"ms-{index}") for index in range(1, 7)]
+    snapshots: list[bytes] = []
+
+    def _persist(_entries):
+        snapshots.append(journal.read_bytes() if journal.exists() else b"")
+
+    run_bulk_import(
+        rows,
+        prepare_entry_fn=lambda _url, doc_id, _library: {"doc_id": doc_id},
+        persist_batch_fn=_persist,
+        journal_path=journal,
+        workers=1,
+        batch_size=2,
+        resolve_row_fn=_resolve,
+    )
+
+    final = journal.read_bytes()
+    assert all(final.startswith(snapshot) for snapshot in snapshots)
+    assert len(final.splitlines()) == 1 + len(rows)
+    report = load_import_report(journal)
+    assert report["total"] == 6 and summarize_report(report)["imported"] == 6
+
+
+def _saved_entry(doc_id: str, **extra) -> dict:
+    return {
+        "manifest_url": f"https://example.org/{doc_id}/manifest.json",
+        "doc_id": doc_id,
+        "library": "Gallica",
+        "label": f"Titolo {doc_id}",
+        "pages": 12,
+        "item_type": "manoscritto",
+        **extra,
+    }
+
+
+def test_persist_saved_entries_writes_a_batch_in_one_transaction(monkeypatch):
+    """A batch is looked up and written at once, keeping the download state of rows already in the library."""
+    vm = VaultManager()
+    vm.upsert_manuscript(
+        "DOC_OLD",
+        library="Gallica",
+        status="complete",
+        asset_state="complete",
+        downloaded_canvases=30,
+        total_canvases=30,
+        item_type="incunabolo",
+        item_type_source="manual",
+    )
+    statements: list[str] = []
+    original_get_conn = VaultManager._get_conn
+
+    def _traced_conn(self):
+        conn = original_get_conn(self)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    with monkeypatch.context() as patched:
+        patched.setattr(VaultManager, "_get_conn", _traced_conn)
+        for per_row in ("get_all_manuscripts", "get_manuscript", "upsert_manuscript"):
+            patched.setattr(VaultManager, per_row, lambda *_a, **_kw: (_ for _ in ()).throw(AssertionError))
+        persist_saved_entries([_saved_entry("DOC_NEW_1"), _saved_entry("DOC_OLD"), _saved_entry("DOC_NEW_2")])
+
+    assert statements.count("BEGIN IMMEDIATE") == 1
+    assert len([sql for sql in statements if sql.startswith("SELECT * FROM manuscripts")]) == 1
+    old = vm.get_manuscript("DOC_OLD")
+    assert (old["status"], old["downloaded_canvases"], old["total_canvases"]) == ("complete", 30, 30)
+    assert (old["item_type"], old["item_type_source"]) == ("incunabolo", "manual")
+    new = vm.get_manuscript("DOC_NEW_1")
+    assert (new["status"], new["total_canvases"], new["display_title"]) == ("saved", 12, "Titolo DOC_NEW_1")
+    assert vm.get_manuscript("DOC_NEW_2")["library"] == "Gallica"
+
+
+def test_bulk_import_status_refreshes_on_its_own_job_events():
+    """The running status fragment follows its job on the live stream instead of a fixed poll."""
+    fragment = repr(
+        render_bulk_import_status(
+            job_id="bulk1", import_id="imp", job={"status": "running"}, report={"items": {}}, counts={}
+        )
+    )
+    assert "studio-jobs[detail.key=='job:bulk1'] from:body" in fragment
+    assert "every 2s [!window.studioLiveEvents]" in fragment
@@ -0,0 +1,142 @@
+"""Tests for the catalog page cache and deferred catalog enrichment."""
+
+from __future__ import annotations
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+from universal_iiif_core import library_catalog
+from universal_iiif_core.catalog_enrichment import CatalogPageCache, get_enrichment_queue
+from universal_iiif_core.logic.downloader import IIIFDownloader
+
+DETAIL_URL = "https://digi.vatlib.it/mss/detail/Urb.lat.1231"
+MANIFEST = {
+    "label": "Urb.lat.1231",
+    "description": "",
+    "metadata": [{"label": "Shelfmark", "value": "Urb.lat.1231"}],
+    "seeAlso": [DETAIL_URL],
+}
+
+
+class _Response:
+    status_code = 200
+    text = "<html><head><title>DigiVatLib</title></head><body><h1>Orafo da Cremona, trattato</h1></body></html>"
+
+
+class _Client:
+    def __init__(self, *, status_code: int = 200, gate: threading.Event | None = None):
+        self.calls = 0
+        self.status_code = status_code
+        self.gate = gate
+
+    def get(self, *_args, **_kwargs):
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(5)
+        response = _Response()
+        response.status_code = self.status_code
+        return response
+
+
+def _use_client(monkeypatch, client: _Client) -> None:
+    monkeypatch.setattr("universal_iiif_core.library_catalog.get_http_client", lambda: client)
+
+
+def test_external_catalog_data_is_fetched_once_per_url(monkeypatch):
+    """A second lookup of the same page is served from the persistent cache."""
+    client = _Client()
+    _use_client(monkeypatch, client)
+
+    first = library_catalog.extract_external_catalog_data(DETAIL_URL)
+    second = library_catalog.extract_external_catalog_data(DETAIL_URL)
+
+    assert first["reference_text"].startswith("Orafo da Cremona")
+    assert second == first
+    assert client.calls == 1
+
+
+def test_failed_catalog_fetch_is_not_cached(monkeypatch):
+    """HTTP errors return empty data and are retried on the next lookup."""
+    client = _Client(status_code=503)
+    _use_client(monkeypatch, client)
+
+    assert library_catalog.extract_external_catalog_data(DETAIL_URL)["reference_text"] == ""
+    library_catalog.extract_external_catalog_data(DETAIL_URL)
+
+    assert client.calls == 2
+
+
+def test_catalog_page_cache_expires_and_can_be_disabled(tmp_path):
+    """Entries older than the TTL are ignored; a zero TTL never stores anything."""
+    data = {"reference_text": "Ref", "external_fields": {"date": "1450"}}
+    cache = CatalogPageCache(tmp_path, ttl_s=60)
+    cache.put(DETAIL_URL, data)
+    assert cache.get(DETAIL_URL) == data
+
+    path = next(tmp_path.rglob("*.json"))
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload["fetched_at"] -= 120
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    assert cache.get(DETAIL_URL) is None
+
+    disabled = CatalogPageCache(tmp_path / "off", ttl_s=0)
+    disabled.put(DETAIL_URL, data)
+    assert disabled.get(DETAIL_URL) is None
+    assert not (tmp_path / "off").exists()
+
+
+def _downloader_stub(tmp_path, vault) -> IIIFDownloader:
+    stub = object.__new__(IIIFDownloader)
+    stub.manifest = dict(MANIFEST)
+    stub.manifest_url = "https://digi.vatlib.it/iiif/MSS_Urb.lat.1231/manifest.json"
+    stub.ms_id = "MSS_Urb.lat.1231"
+    stub.label = "Urb.lat.1231"
+    stub.meta_path = tmp_path / "metadata.json"
+    stub.manifest_path = tmp_path / "manifest.json"
+    stub.vault = vault
+    stub.logger = MagicMock()
+    return stub
+
+
+def test_extract_metadata_defers_catalog_scrape_to_the_queue(monkeypatch, tmp_path):
+    """Metadata is saved before the catalog page arrives and enriched once it does."""
+    gate = threading.Event()
+    client = _Client(gate=gate)
+    _use_client(monkeypatch, client)
+    vault = MagicMock()
+    vault.get_manuscript.return_value = {"item_type_source": "manual"}
+    downloader = _downloader_stub(tmp_path, vault)
+
+    downloader.extract_metadata()
+
+    saved = json.loads(downloader.meta_path.read_text(encoding="utf-8"))
+    assert not str(saved["reference_text"]).startswith("Orafo")
+    assert vault.upsert_manuscript.call_count == 1
+
+    gate.set()
+    assert get_enrichment_queue().wait_idle(timeout=5)
+
+    enriched = json.loads(downloader.meta_path.read_text(encoding="utf-8"))
+    assert enriched["reference_text"].startswith("Orafo da Cremona")
+    assert enriched["download_date"] == saved["download_date"]
+    assert vault.upsert_manuscript.call_count == 2
+    update = vault.upsert_manuscript.call_args.kwargs
+    assert update["reference_text"].startswith("Orafo da Cremona")
+    assert "item_type" not in update
+
+
+def test_extract_metadata_uses_cached_catalog_page_inline(monkeypatch, tmp_path):
+    """A cached catalog page is applied immediately without queueing a scrape."""
+    client = _Client()
+    _use_client(monkeypatch, client)
+    library_catalog.extract_external_catalog_data(DETAIL_URL)
+    vault = MagicMock()
+    downloader = _downloader_stub(tmp_path, vault)
+
+    downloader.extract_metadata()
+
+    saved = json.loads(downloader.meta_path.read_text(encoding="utf-8"))
+    assert saved["reference_text"].startswith("Orafo da Cremona")
+    assert vault.upsert_manuscript.call_count == 1
+    assert client.calls == 1
@@ -228,3 +228,10 @@ def test_resolve_download_args_wizard_mode(monkeypatch):
     args = _build_parser().parse_args([])
     result = _resolve_download_args(args)
     assert result == ("https://wiz.com", "output.pdf", 4, False, False, "model.ml", False)
+
+
+def test_build_parser_import_file_option():
+    parser = _build_parser()
+    args = parser.parse_args(["--import", "shelf.csv"])
+    assert args.import_file == "shelf.csv"
+    assert args.url is None
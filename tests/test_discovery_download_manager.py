@@ -1,10 +1,10 @@
 import pytest
 
-from studio_ui.common.title_utils import truncate_title
 from studio_ui.routes import discovery_handlers, discovery_helpers
 from universal_iiif_core.config_manager import get_config_manager
 from universal_iiif_core.http_client import HTTPClient
 from universal_iiif_core.services.storage.vault_manager import VaultManager
+from universal_iiif_core.title_utils import truncate_title
 
 # Mark as slow (creates files, uses vault, mock downloads)
 pytestmark = pytest.mark.slow
@@ -186,13 +186,15 @@ def test_download_manager_polls_only_with_active_jobs():
     active_fragment = discovery_handlers.download_manager()
     active_text = repr(active_fragment)
     assert 'hx-get="/api/download_manager"' in active_text
-    assert 'hx-trigger="every 3s"' in active_text
+    assert "studio-jobs[detail.stateChanged] from:body delay:250ms" in active_text
+    assert 'data-live-key="job:poll_active_1"' in active_text
+    assert 'data-live-text="{current}/{total} ({percent}%)"' in active_text
 
     vm.update_download_job("poll_active_1", current=10, total=10, status="completed")
     idle_fragment = discovery_handlers.download_manager()
     idle_text = repr(idle_fragment)
     assert 'hx-get="/api/download_manager"' not in idle_text
-    assert 'hx-trigger="every 3s"' not in idle_text
+    assert "hx-trigger=" not in idle_text
 
 
 def test_download_manager_shows_live_progress_counts():
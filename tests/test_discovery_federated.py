@@ -0,0 +1,84 @@
+import threading
+import time
+
+from universal_iiif_core.discovery.federated import federated_providers, iter_federated_search, manifest_dedupe_key
+from universal_iiif_core.providers import get_provider
+
+
+def test_federated_providers_only_include_searchable_providers():
+    """Providers without a search strategy (e.g. direct-only ones) are never queried."""
+    providers = federated_providers()
+    assert providers
+    assert all(provider.supports_search() for provider in providers)
+    assert "Unknown" not in {provider.key for provider in providers}
+
+
+def test_federated_search_yields_in_answer_order_and_dedupes_manifests():
+    """Fast providers are yielded first; a manifest already shown is dropped from later answers."""
+    gallica, vatican, harvard = get_provider("Gallica"), get_provider("Vaticana"), get_provider("Harvard")
+    delays = {gallica.key: 0.2, vatican.key: 0.0, harvard.key: 0.1}
+    answers = {
+        gallica.key: [{"id": "G1", "manifest": "https://example.org/shared/manifest.json/"}],
+        vatican.key: [{"id": "V1", "manifest": "http://EXAMPLE.org/shared/manifest.json"}],
+        harvard.key: [{"id": "H1", "manifest": "https://example.org/h1.json"}],
+    }
+    seen_filters: list[dict] = []
+
+    def _search(provider, query, filters):
+        assert query == "dante"
+        seen_filters.append(filters)
+        time.sleep(delays[provider.key])
+        return answers[provider.key]
+
+    outcomes = list(
+        iter_federated_search(
+            " dante ",
+            filters={"max_results": 5},
+            providers=[gallica, vatican, harvard],
+            search_with_provider_fn=_search,
+        )
+    )
+
+    assert [outcome.provider.key for outcome in outcomes] == [vatican.key, harvard.key, gallica.key]
+    assert [outcome.status for outcome in outcomes] == ["results", "results", "empty"]
+    assert outcomes[2].duplicates == 1
+    assert all(filters == {"max_results": 5} for filters in seen_filters)
+
+
+def test_federated_search_reports_errors_and_timeouts_without_waiting():
+    """A failing provider is reported as an error and a hanging one as timed out at the deadline."""
+    gallica, vatican, harvard = get_provider("Gallica"), get_provider("Vaticana"), get_provider("Harvard")
+    release = threading.Event()
+
+    def _search(provider, _query, _filters):
+        if provider.key == vatican.key:
+            raise RuntimeError("upstream 503")
+        if provider.key == harvard.key:
+            release.wait(5)
+        return [{"id": "G1", "manifest": "https://example.org/g1.json"}]
+
+    started = time.monotonic()
+    try:
+        outcomes = {
+            outcome.provider.key: outcome
+            for outcome in iter_federated_search(
+                "dante",
+                providers=[gallica, vatican, harvard],
+                search_with_provider_fn=_search,
+                deadline_s=0.3,
+            )
+        }
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 2
+    assert outcomes[gallica.key].status == "results"
+    assert outcomes[vatican.key].status == "error"
+    assert "503" in outcomes[vatican.key].error
+    assert outcomes[harvard.key].status == "timeout"
+
+
+def test_manifest_dedupe_key_falls_back_to_library_and_id():
+    """Results without a manifest URL are keyed by provider library and identifier."""
+    assert manifest_dedupe_key({"library": "Gallica", "id": "X"}) == "Gallica:X"
+    assert manifest_dedupe_key({"manifest": "https://a.org/m.json#frag"}) == "a.org/m.json"
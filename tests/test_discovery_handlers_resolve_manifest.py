@@ -1,4 +1,11 @@
+import json
+
+import pytest
+from fasthtml.common import to_xml
+
+from studio_ui.library_options import FEDERATED_LIBRARY_VALUE
 from studio_ui.routes import discovery_handlers
+from universal_iiif_core.discovery import FederatedOutcome
 from universal_iiif_core.providers import get_provider
 from universal_iiif_core.resolvers.discovery import ProviderResolution
 
@@ -351,3 +358,98 @@ def test_resolve_manifest_heidelberg_consult_only_result_stays_in_results_list(m
     assert "Trovati 1 risultati" in result_str
     assert "Solo consultazione online" in result_str
     assert "search.cgi?query=dante" in result_str
+
+
+def test_resolve_manifest_federated_returns_streaming_shell(monkeypatch):
+    """Selecting every library renders the live results container wired to the SSE stream."""
+    monkeypatch.setattr(discovery_handlers, "resolve_provider_input", lambda *_args, **_kwargs: pytest.fail("unused"))
+
+    result = discovery_handlers.resolve_manifest(FEDERATED_LIBRARY_VALUE, "dante alighieri")
+    html = to_xml(result)
+
+    assert "/api/discovery/federated_stream?q=dante+alighieri" in html
+    assert 'data-federated-provider="Gallica"' in html
+    assert "discovery-results-cards" in html
+
+
+def test_federated_stream_emits_provider_events_then_done(monkeypatch):
+    """The stream sends one event per provider answer with rendered cards and a final summary."""
+    captured: dict = {}
+
+    def _federated_search(query, *, filters=None, deadline_s=20.0):
+        captured.update(query=query, filters=filters, deadline_s=deadline_s)
+        yield FederatedOutcome(
+            provider=get_provider("Gallica"),
+            status="results",
+            results=[{"id": "G1", "title": "Commedia", "manifest": "https://example.org/g1.json", "raw": {}}],
+        )
+        yield FederatedOutcome(provider=get_provider("Vaticana"), status="timeout")
+
+    monkeypatch.setattr(discovery_handlers, "federated_search", _federated_search)
+
+    events = list(discovery_handlers._iter_federated_events("dante"))
+
+    assert captured["query"] == "dante"
+    assert captured["filters"]["max_results"] == 20
+    assert 3 <= captured["deadline_s"] <= 120
+    assert len(events) == 3
+    first = json.loads(events[0].split("data: ", 1)[1])
+    assert events[0].startswith("event: provider\n")
+    assert first["provider"] == "Gallica" and first["count"] == 1
+    assert "Commedia" in first["html"]
+    assert json.loads(events[1].split("data: ", 1)[1])["status"] == "timeout"
+    assert events[2] == 'event: done\ndata: {"count":1}\n\n'
+
+
+def test_load_more_prefetches_following_page_when_more_are_available(monkeypatch):
+    """Rendering page N with more results available warms the cache for page N+1."""
+    from universal_iiif_core.config_manager import get_config_manager
+
+    get_config_manager().set_setting("discovery.prefetch_next_page", True)
+    monkeypatch.setattr(
+        discovery_handlers,
+        "resolve_provider_input",
+        lambda _library, _query, filters=None: ProviderResolution(
+            provider=get_provider("Gallica"),
+            status="results",
+            results=[{"id": f"P{i}", "title": f"T{i}", "manifest": f"u{i}", "raw": {}} for i in range(20)],
+        ),
+    )
+    prefetched = []
+    monkeypatch.setattr(
+        discovery_handlers,
+        "prefetch_search_page",
+        lambda library, query, filters: prefetched.append((library, query, filters)),
+    )
+
+    discovery_handlers.load_more_results("Gallica", "dante", page=2)
+
+    assert prefetched == [("Gallica", "dante", {"gallica_type": "all", "ic_type": "all", "max_results": 20, "page": 3})]
+
+
+def test_bulk_import_status_rejects_unknown_import_ids():
+    """Only journal ids generated by the importer are accepted, never arbitrary paths."""
+    result = discovery_handlers.bulk_import_status(job_id="x", import_id="../../etc/passwd")
+    assert "Importazione non trovata" in to_xml(result)
+
+
+def test_bulk_import_status_lists_problem_lines(tmp_path):
+    """The status fragment summarizes the journal and lists lines that were not imported."""
+    from universal_iiif_core.bulk_import import import_journal_path
+
+    journal = import_journal_path("0123456789abcdef")
+    journal.parent.mkdir(parents=True, exist_ok=True)
+    records = [
+        {"total": 2},
+        {"key": "1::a", "line": 1, "identifier": "a", "status": "error", "message": "timeout"},
+        {"key": "1::a", "line": 1, "identifier": "a", "status": "imported"},
+        {"key": "2::b", "line": 2, "identifier": "b", "status": "not_found", "message": "Nessun manifest"},
+    ]
+    journal.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+
+    html = to_xml(discovery_handlers.bulk_import_status(job_id="missing", import_id="0123456789abcdef"))
+
+    assert "terminata: 2/2" in html
+    assert "1 importati" in html and "1 non trovati" in html
+    assert "Nessun manifest" in html
+    assert "every 2s" not in html
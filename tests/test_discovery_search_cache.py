@@ -0,0 +1,90 @@
+import threading
+
+from universal_iiif_core.discovery import search_cache
+from universal_iiif_core.discovery.search_cache import SearchResultCache, make_search_key
+from universal_iiif_core.resolvers import discovery
+
+
+def test_search_key_normalizes_query_and_filter_order():
+    """Case, extra spaces and filter ordering do not split the cache."""
+    first = make_search_key("Gallica", "  Dante   Alighieri ", {"page": 2, "max_results": 20})
+    second = make_search_key("Gallica", "dante alighieri", {"max_results": 20, "page": 2})
+    assert first == second
+    assert first != make_search_key("Gallica", "dante alighieri", {"max_results": 20, "page": 3})
+
+
+def test_cache_expires_entries_and_evicts_least_recently_used(monkeypatch):
+    """Entries expire after the TTL and the oldest unused page is dropped at capacity."""
+    now = [1000.0]
+    monkeypatch.setattr(search_cache.time, "monotonic", lambda: now[0])
+    cache = SearchResultCache(ttl_s=60, max_entries=2)
+
+    cache.put("a", [{"id": "A"}])
+    cache.put("b", [{"id": "B"}])
+    assert cache.get("a") == [{"id": "A"}]
+    cache.put("c", [{"id": "C"}])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [{"id": "A"}]
+    now[0] += 61
+    assert cache.get("a") is None
+
+
+def test_cache_skips_empty_results_and_returns_copies():
+    """Empty answers are reloaded next time and callers cannot mutate stored results."""
+    cache = SearchResultCache()
+    calls = []
+
+    def _load():
+        calls.append(1)
+        return []
+
+    cache.get_or_load("k", _load)
+    cache.get_or_load("k", _load)
+    assert len(calls) == 2
+
+    cache.put("r", [{"id": "A", "raw": {}}])
+    cache.get("r")[0]["raw"]["x"] = 1
+    assert cache.get("r") == [{"id": "A", "raw": {}}]
+
+
+def test_lookup_joins_running_prefetch_instead_of_loading_twice():
+    """A request for a page being prefetched waits for that load and reuses its results."""
+    cache = SearchResultCache()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def _slow_load():
+        calls.append("prefetch")
+        started.set()
+        release.wait(5)
+        return [{"id": "P2"}]
+
+    assert cache.prefetch("page-2", _slow_load)
+    assert started.wait(5)
+    assert not cache.prefetch("page-2", _slow_load)
+    threading.Timer(0.05, release.set).start()
+
+    results = cache.get_or_load("page-2", lambda: calls.append("direct") or [])
+
+    assert results == [{"id": "P2"}]
+    assert calls == ["prefetch"]
+
+
+def test_resolve_provider_input_serves_repeated_searches_from_cache(monkeypatch):
+    """Identical searches reach the provider once; another page is a separate entry."""
+    calls = []
+
+    def _search(provider, query, filters=None):
+        calls.append((provider.key, query, dict(filters or {})))
+        return [{"id": f"R{len(calls)}", "manifest": f"https://example.org/{len(calls)}.json"}]
+
+    monkeypatch.setattr(discovery, "_search_with_provider", _search)
+
+    first = discovery.resolve_provider_input("Gallica", "dante", filters={"max_results": 20})
+    again = discovery.resolve_provider_input("Gallica", " Dante ", filters={"max_results": 20})
+    page_two = discovery.resolve_provider_input("Gallica", "dante", filters={"max_results": 20, "page": 2})
+
+    assert first.results == again.results
+    assert page_two.results[0]["id"] == "R2"
+    assert len(calls) == 2
@@ -0,0 +1,58 @@
+"""Tests for per-document revision counters."""
+
+from universal_iiif_core.doc_revisions import DocumentRevisions
+
+
+def test_page_bumps_are_reported_since_token():
+    revisions = DocumentRevisions()
+    token = revisions.token("DOC")
+
+    revisions.bump("DOC", [2, 5])
+    after_first = revisions.token("DOC")
+    revisions.bump("DOC", [7])
+
+    assert token != after_first
+    assert revisions.changed_pages("DOC", token) == {2, 5, 7}
+    assert revisions.changed_pages("DOC", after_first) == {7}
+    assert revisions.changed_pages("DOC", revisions.token("DOC")) == set()
+
+
+def test_document_level_bumps_without_pages_touch_no_cards():
+    revisions = DocumentRevisions()
+    token = revisions.token("DOC")
+
+    revisions.bump("DOC", pages=())
+
+    assert revisions.token("DOC") != token
+    assert revisions.changed_pages("DOC", token) == set()
+
+
+def test_doc_wide_bump_and_foreign_tokens_require_full_render():
+    revisions = DocumentRevisions()
+    token = revisions.token("DOC")
+    revisions.bump("DOC")
+
+    assert revisions.changed_pages("DOC", token) is None
+    assert revisions.changed_pages("DOC", "deadbeef-1") is None
+    assert revisions.changed_pages("DOC", "garbage") is None
+    assert revisions.changed_pages("DOC", f"{revisions.epoch}-99") is None
+
+
+def test_download_progress_ticks_do_not_invalidate_thumbnails(tmp_path):
+    """Only job status changes move the revision, and never as a page-wide change."""
+    from universal_iiif_core.doc_revisions import get_document_revisions
+    from universal_iiif_core.services.storage.vault_manager import VaultManager
+
+    vault = VaultManager(db_path=str(tmp_path / "vault.db"))
+    revisions = get_document_revisions()
+    vault.create_download_job("job-1", "DOC_REV", "Vaticana", "https://example.org/manifest")
+    vault.update_download_job("job-1", 1, 10, status="running")
+    token = revisions.token("DOC_REV")
+
+    for page in range(2, 6):
+        vault.update_download_job("job-1", page, 10, status="running")
+    assert revisions.token("DOC_REV") == token
+
+    vault.update_download_job("job-1", 10, 10, status="completed")
+    assert revisions.token("DOC_REV") != token
+    assert revisions.changed_pages("DOC_REV", token) == set()
@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 import universal_iiif_core.logic.downloader as downloader_module
+from universal_iiif_core.doc_revisions import get_document_revisions
 from universal_iiif_core.http_client import HTTPClient
 from universal_iiif_core.logic.downloader import IIIFDownloader
 
@@ -265,7 +266,9 @@ def test_extract_pages_from_pdf_uses_viewer_dpi(monkeypatch, tmp_path: Path):
 
     captured: dict[str, object] = {}
 
-    def _fake_convert_pdf_to_images(*, pdf_path, output_dir, progress_callback, dpi, jpeg_quality):
+    def _fake_convert_pdf_to_images(
+        *, pdf_path, output_dir, progress_callback, dpi, jpeg_quality, workers, pages_out, passthrough_images
+    ):
         captured["pdf_path"] = pdf_path
         captured["output_dir"] = output_dir
         captured["dpi"] = dpi
@@ -283,6 +286,31 @@ def test_extract_pages_from_pdf_uses_viewer_dpi(monkeypatch, tmp_path: Path):
     assert captured["jpeg_quality"] == 88
 
 
+@pytest.mark.parametrize("converted", [True, False])
+def test_extract_pages_from_pdf_bumps_the_document_revision(monkeypatch, tmp_path: Path, converted: bool):
+    """Native-PDF scans bypass `_finalize_downloads`, so the extraction itself announces the new pages."""
+    downloader = _build_downloader(
+        monkeypatch,
+        tmp_path,
+        _manifest_with_native_pdf(),
+        prefer_native_pdf=True,
+        create_pdf_from_images=False,
+    )
+    revisions = get_document_revisions()
+    token = revisions.token(downloader.ms_id)
+
+    def _fake_convert_pdf_to_images(*, output_dir, **_kwargs):
+        (output_dir / "pag_0000.jpg").write_bytes(b"fake-image")
+        assert revisions.token(downloader.ms_id) == token
+        return converted, "done"
+
+    monkeypatch.setattr(downloader_module, "convert_pdf_to_images", _fake_convert_pdf_to_images)
+
+    assert downloader._extract_pages_from_pdf(downloader.output_path) is converted
+    assert revisions.token(downloader.ms_id) != token
+    assert revisions.changed_pages(downloader.ms_id, token) is None
+
+
 def test_should_prefer_native_pdf_respects_prefer_images_flag(monkeypatch, tmp_path: Path):
     """CLI prefer-images must disable native PDF preference."""
     monkeypatch.setattr(HTTPClient, "get_json", lambda _self, _url, **_kw: _manifest_with_native_pdf())
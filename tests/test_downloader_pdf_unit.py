@@ -14,6 +14,7 @@ from universal_iiif_core.logic.downloader_pdf import (
     _should_create_pdf_from_images,
     _should_prefer_native_pdf,
 )
+from universal_iiif_core.pdf_utils import RasterizedPage
 
 
 def _make_downloader_stub(tmp_path: Path, **overrides):
@@ -134,3 +135,25 @@ def test_collect_scan_stats(tmp_path: Path):
     assert stats[0]["height"] == 2000
     assert stats[0]["resolution_category"] == "High"
     assert stats[0]["original_url"] == "https://example.com/scan"
+
+
+def test_collect_scan_stats_uses_rasterized_pages_without_reopening(tmp_path: Path):
+    """Stats reported by the rasterizer must be used as-is, even if the files are not readable images."""
+    stub = _make_downloader_stub(tmp_path)
+    (stub.scans_dir / "pag_0000.jpg").write_bytes(b"not an image")
+    stub._rasterized_pages = [RasterizedPage(0, "pag_0000.jpg", 2800, 4000, 12345)]
+
+    stats = _collect_scan_stats(stub, "https://example.com/doc.pdf (native-pdf)")
+
+    assert stats == [
+        {
+            "page_index": 0,
+            "filename": "pag_0000.jpg",
+            "original_url": "https://example.com/doc.pdf (native-pdf)",
+            "thumbnail_url": None,
+            "size_bytes": 12345,
+            "width": 2800,
+            "height": 4000,
+            "resolution_category": "High",
+        }
+    ]
@@ -0,0 +1,136 @@
+"""Tests for the live event bus and its SSE/HTMX integration."""
+
+import threading
+
+from studio_ui.common.polling import LIVE_EVENT_JOBS, build_live_trigger, get_live_throttle_ms
+from studio_ui.components.layout import base_layout
+from studio_ui.routes.events_handlers import _parse_topics, format_sse
+from universal_iiif_core.doc_revisions import bump_document_revision
+from universal_iiif_core.event_bus import TOPIC_DOCS, TOPIC_EXPORT, TOPIC_JOBS, TOPIC_OCR, EventBus, get_event_bus
+from universal_iiif_core.jobs import job_manager
+
+
+def test_publish_drops_unchanged_payloads():
+    bus = EventBus()
+    sub = bus.subscribe([TOPIC_JOBS])
+
+    assert bus.publish(TOPIC_JOBS, "job:1", {"progress": 0.5}) is True
+    assert bus.publish(TOPIC_JOBS, "job:1", {"progress": 0.5}) is False
+
+    events = sub.get(timeout=0)
+    assert [event.payload for event in events] == [{"progress": 0.5}]
+
+
+def test_subscription_coalesces_per_key_and_filters_topics():
+    bus = EventBus()
+    jobs_sub = bus.subscribe([TOPIC_JOBS])
+    all_sub = bus.subscribe()
+
+    for step in range(5):
+        bus.publish(TOPIC_JOBS, "job:1", {"progress": step})
+    bus.publish(TOPIC_JOBS, "job:2", {"progress": 1})
+    bus.publish(TOPIC_OCR, "ocr:DOC:1", {"status": "completed"})
+
+    jobs_events = jobs_sub.get(timeout=0)
+    assert [(event.key, event.payload) for event in jobs_events] == [
+        ("job:1", {"progress": 4}),
+        ("job:2", {"progress": 1}),
+    ]
+    assert {event.topic for event in all_sub.get(timeout=0)} == {TOPIC_JOBS, TOPIC_OCR}
+    assert jobs_sub.get(timeout=0) == []
+
+
+def test_close_unsubscribes_and_wakes_reader():
+    bus = EventBus()
+    sub = bus.subscribe([TOPIC_EXPORT])
+    result = {}
+    reader = threading.Thread(target=lambda: result.setdefault("events", sub.get(timeout=5)))
+    reader.start()
+
+    sub.close()
+    reader.join(timeout=2)
+
+    assert not reader.is_alive()
+    assert result["events"] == []
+    assert bus.subscriber_count() == 0
+    assert bus.publish(TOPIC_EXPORT, "export:1", {"status": "running"}) is True
+
+
+def test_job_manager_publishes_progress_snapshots():
+    sub = get_event_bus().subscribe([TOPIC_JOBS])
+    try:
+        job_id = "evt_job"
+        with job_manager._lock:
+            job_manager._jobs[job_id] = {"id": job_id, "type": "generic", "status": "running", "progress": 0.0}
+        job_manager.update_job(job_id, progress=0.25, message="page 1")
+        job_manager.update_job(job_id, progress=0.25, message="page 1")
+
+        events = [event for event in sub.get(timeout=0) if event.key == f"job:{job_id}"]
+        assert len(events) == 1
+        assert events[0].payload["progress"] == 0.25
+        assert events[0].payload["status"] == "running"
+    finally:
+        sub.close()
+        with job_manager._lock:
+            job_manager._jobs.pop("evt_job", None)
+
+
+def test_sse_format_and_topic_parsing():
+    bus = EventBus()
+    sub = bus.subscribe()
+    bus.publish(TOPIC_EXPORT, "export:abc", {"status": "completed"})
+    message = format_sse(sub.get(timeout=0)[0])
+
+    assert message.startswith("id: 1\nevent: export\n")
+    assert 'data: {"key":"export:abc","status":"completed"}' in message
+    assert message.endswith("\n\n")
+    assert _parse_topics("ocr, bogus") == (TOPIC_OCR,)
+    assert _parse_topics("") == (TOPIC_JOBS, TOPIC_OCR, TOPIC_EXPORT, TOPIC_DOCS)
+
+
+def test_live_trigger_polls_only_without_stream():
+    assert build_live_trigger(3, LIVE_EVENT_JOBS) == (
+        "every 3s [!window.studioLiveEvents], studio-jobs from:body delay:250ms"
+    )
+    assert build_live_trigger(12, "studio-export", on_load=True).startswith("load, every 12s [")
+
+
+def test_live_trigger_filters_on_own_entity_and_state_changes():
+    keyed = build_live_trigger(3, LIVE_EVENT_JOBS, match={"key": "job:it's"}, state_only=True)
+    assert keyed == (
+        "every 3s [!window.studioLiveEvents], studio-jobs[detail.stateChanged && detail.key=='job:it\\'s'] from:body"
+    )
+    assert "detail.page==4" in build_live_trigger(2, "studio-ocr", match={"doc_id": "D", "page": 4})
+
+
+def test_live_stream_is_throttled_no_faster_than_the_fallback_poll():
+    assert get_live_throttle_ms() >= 3000
+    page = repr(base_layout("t", "x"))
+    assert f"const THROTTLE_MS = {get_live_throttle_ms()};" in page
+    assert "topics=jobs,ocr,export,docs" in page
+
+
+def test_job_events_carry_page_counts_keyed_by_vault_job_id():
+    sub = get_event_bus().subscribe([TOPIC_JOBS])
+    try:
+        with job_manager._lock:
+            job_manager._jobs["evt_mem"] = {"id": "evt_mem", "type": "download", "status": "running"}
+            job_manager._jobs["evt_mem"]["db_job_id"] = "db9"
+        job_manager.update_job("evt_mem", progress=0.5, current=5, total=10)
+
+        events = [event for event in sub.get(timeout=0) if event.key == "job:db9"]
+        assert [(e.payload["current"], e.payload["total"]) for e in events] == [(5, 10)]
+    finally:
+        sub.close()
+        with job_manager._lock:
+            job_manager._jobs.pop("evt_mem", None)
+
+
+def test_document_revision_bumps_are_published():
+    sub = get_event_bus().subscribe([TOPIC_DOCS])
+    try:
+        rev = bump_document_revision("DOC_EVT", pages=[3])
+        events = sub.get(timeout=0)
+        assert [(e.key, e.payload) for e in events] == [("doc:DOC_EVT", {"doc_id": "DOC_EVT", "rev": rev})]
+    finally:
+        sub.close()
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import io
+import zipfile
+
 import pytest
 from PIL import Image
 
@@ -182,3 +186,32 @@ def test_reset_active_exports_marks_stale_jobs_terminal():
     assert updated >= 2
     assert (vm.get_export_job("exp_reset_queued") or {}).get("status") == "error"
     assert (vm.get_export_job("exp_reset_running") or {}).get("status") == "error"
+
+
+def test_stream_images_zip_streams_selected_scans_stored():
+    """Streaming ZIP route should emit selected JPEGs uncompressed without writing an export file."""
+    _seed_library_item("DOC_STREAM_ZIP", "Gallica", pages=4)
+    exports_before = set(get_config_manager().get_exports_dir().glob("**/*"))
+
+    response = export_handlers.stream_images_zip("DOC_STREAM_ZIP", "Gallica", "custom", "2-3")
+
+    async def _collect() -> bytes:
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    payload = asyncio.run(_collect())
+    assert response.media_type == "application/zip"
+    assert 'filename="DOC_STREAM_ZIP_images.zip"' in response.headers["content-disposition"]
+    with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+        infos = archive.infolist()
+        assert [info.filename for info in infos] == ["pag_0001.jpg", "pag_0002.jpg"]
+        assert {info.compress_type for info in infos} == {zipfile.ZIP_STORED}
+        assert archive.testzip() is None
+    assert set(get_config_manager().get_exports_dir().glob("**/*")) == exports_before
+
+
+def test_stream_images_zip_rejects_unknown_item_and_bad_selection():
+    """Unknown items return 404 and invalid selections 400 before streaming starts."""
+    _seed_library_item("DOC_STREAM_ZIP_BAD", "Gallica", pages=2)
+
+    assert export_handlers.stream_images_zip("MISSING", "Gallica").status_code == 404
+    assert export_handlers.stream_images_zip("DOC_STREAM_ZIP_BAD", "Gallica", "custom", "9").status_code == 400
@@ -0,0 +1,103 @@
+"""Tests for the content-addressed export page cache."""
+
+import os
+from pathlib import Path
+
+from PIL import Image
+
+import universal_iiif_core.export_studio as export_studio
+from universal_iiif_core.export_page_cache import ExportPageCache, content_hash, get_export_page_cache
+from universal_iiif_core.export_studio import build_professional_pdf
+
+
+def _write_scans(scans_dir: Path, count: int) -> None:
+    scans_dir.mkdir(parents=True, exist_ok=True)
+    for idx in range(count):
+        Image.new("RGB", (900, 1300), (idx * 20, 80, 160)).save(scans_dir / f"pag_{idx:04d}.jpg", quality=90)
+
+
+def _build(doc_dir: Path, out_path: Path, pages: list[int], cache: ExportPageCache, **kwargs) -> None:
+    build_professional_pdf(
+        doc_dir=doc_dir,
+        output_path=out_path,
+        selected_pages=pages,
+        cover_title="T",
+        cover_curator="",
+        cover_description=kwargs.pop("description", ""),
+        manifest_meta={},
+        transcription_json=None,
+        mode="Solo immagini",
+        compression="Standard",
+        source_url="",
+        page_cache=cache,
+        **kwargs,
+    )
+
+
+def test_key_depends_on_every_encoding_parameter():
+    base = ExportPageCache.make_key(content_hash(b"scan"), 2600, 82, "RGB")
+
+    assert base == ExportPageCache.make_key(content_hash(b"scan"), 2600, 82, "RGB")
+    assert base != ExportPageCache.make_key(content_hash(b"other"), 2600, 82, "RGB")
+    assert base != ExportPageCache.make_key(content_hash(b"scan"), 1500, 82, "RGB")
+    assert base != ExportPageCache.make_key(content_hash(b"scan"), 2600, 60, "RGB")
+    assert base != ExportPageCache.make_key(content_hash(b"scan"), 2600, 82, "L")
+
+
+def test_put_evicts_least_recently_used_entries(tmp_path):
+    cache = ExportPageCache(tmp_path / "cache", max_bytes=250)
+    for idx, key in enumerate(("aa01", "bb02")):
+        cache.put(key, bytes(100))
+        os.utime(cache._path(key), (1000 + idx, 1000 + idx))
+    cache.get("aa01")  # touched: now the most recently used entry
+    cache.put("cc03", bytes(100))
+
+    assert cache.get("bb02") is None
+    assert cache.get("aa01") == bytes(100)
+    assert cache.get("cc03") == bytes(100)
+    assert cache.size_bytes() == 200
+
+
+def test_rebuild_reuses_encoded_pages(tmp_path, monkeypatch):
+    doc_dir = tmp_path / "doc"
+    _write_scans(doc_dir / "scans", 4)
+    cache = ExportPageCache(tmp_path / "cache")
+    encodes: list[object] = []
+    original_prepare = export_studio._prepare_image_bytes
+
+    def _counting_prepare(source, profile):
+        encodes.append(source)
+        return original_prepare(source, profile)
+
+    monkeypatch.setattr(export_studio, "_prepare_image_bytes", _counting_prepare)
+
+    first = tmp_path / "first.pdf"
+    _build(doc_dir, first, [1, 2, 3], cache)
+    assert len(encodes) == 3
+
+    # Same pages from a copied (e.g. freshly staged) directory and a changed cover.
+    staged = tmp_path / "staged"
+    staged.mkdir()
+    for scan in (doc_dir / "scans").glob("*.jpg"):
+        (staged / scan.name).write_bytes(scan.read_bytes())
+    _build(doc_dir, tmp_path / "second.pdf", [2, 3, 4], cache, description="new", image_dir=staged)
+    assert len(encodes) == 4
+
+    _build(doc_dir, tmp_path / "light.pdf", [1], cache, image_max_long_edge_px=600)
+    assert len(encodes) == 5
+
+
+def test_shared_cache_follows_config(tmp_path):
+    from universal_iiif_core.config_manager import get_config_manager
+
+    cm = get_config_manager()
+    cm.set_setting("pdf.export.page_cache_max_bytes", 0)
+    try:
+        assert get_export_page_cache() is None
+        cm.set_setting("pdf.export.page_cache_max_bytes", 4096)
+        cache = get_export_page_cache()
+        assert cache is not None
+        assert cache.max_bytes == 4096
+        assert cache.root == cm.get_temp_dir() / "_cache" / "export_pages"
+    finally:
+        cm.set_setting("pdf.export.page_cache_max_bytes", 536870912)
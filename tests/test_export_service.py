@@ -10,6 +10,7 @@ from PIL import Image
 from universal_iiif_core.config_manager import get_config_manager
 from universal_iiif_core.http_client import HTTPClient
 from universal_iiif_core.services.export.service import (
+    ExportCancelledError,
     execute_export_job,
     parse_page_selection,
 )
@@ -113,8 +114,8 @@ def test_execute_export_job_remote_temp_works_without_local_scans(monkeypatch):
         encoding="utf-8",
     )
 
-    def _fake_fetch_highres_page_image(_manifest, page, out_file, iiif_quality="default"):
-        _ = iiif_quality
+    def _fake_fetch_highres_page_image(_manifest, page, out_file, http_client=None, iiif_quality="default"):
+        _ = (http_client, iiif_quality)
         Image.new("RGB", (120, 180), (240, 240, 240)).save(out_file, format="JPEG", quality=50)
         return True, f"page {page} ok"
 
@@ -170,3 +171,117 @@ def test_execute_export_job_remote_temp_custom_requires_manifest_or_local(monkey
             destination="local_filesystem",
             image_source_mode="remote_highres_temp",
         )
+
+
+def test_batch_export_runs_items_concurrently_in_item_order():
+    """Batch items run on the worker pool, report aggregated progress and bundle in item order."""
+    cm = get_config_manager()
+    cm.set_setting("pdf.export.batch_item_workers", 3)
+    doc_ids = ["DOC_BATCH_PAR_A", "DOC_BATCH_PAR_B", "DOC_BATCH_PAR_C"]
+    for doc_id in doc_ids:
+        _seed_document(doc_id, "Gallica", pages=3)
+    calls: list[tuple[int, int]] = []
+
+    try:
+        output = execute_export_job(
+            job_id="exp_pdf_batch_parallel",
+            items=[{"doc_id": doc_id, "library": "Gallica"} for doc_id in doc_ids],
+            export_format="pdf_images",
+            selection_mode="all",
+            selected_pages_raw="",
+            destination="local_filesystem",
+            progress_callback=lambda current, total, _msg: calls.append((current, total)),
+        )
+    finally:
+        cm.set_setting("pdf.export.batch_item_workers", 2)
+
+    with zipfile.ZipFile(output, "r") as archive:
+        names = archive.namelist()
+    assert [name.split("_export_")[0] for name in names] == doc_ids
+    assert calls[0] == (0, 3)
+    assert calls[-1] == (3, 3)
+    assert [current for current, _ in calls] == sorted(current for current, _ in calls)
+
+
+def test_batch_export_repeated_doc_id_keeps_every_artifact():
+    """Items sharing a doc_id export concurrently to distinct files and bundle entries."""
+    _seed_document("DOC_BATCH_DUP", "Gallica", pages=2)
+
+    output = execute_export_job(
+        job_id="exp_zip_batch_dup",
+        items=[{"doc_id": "DOC_BATCH_DUP", "library": "Gallica"}] * 3,
+        export_format="zip_images",
+        selection_mode="all",
+        selected_pages_raw="",
+        destination="local_filesystem",
+    )
+
+    with zipfile.ZipFile(output, "r") as archive:
+        names = archive.namelist()
+    assert len(names) == 3
+    assert len(set(names)) == 3
+    assert [name.rsplit("_", 1)[-1] for name in names] == ["001.zip", "002.zip", "003.zip"]
+
+
+def test_batch_export_cancellation_stops_all_items(monkeypatch):
+    """Cancelling a batch job stops in-flight items and produces no bundle."""
+    monkeypatch.setattr("universal_iiif_core.services.export.service._CANCEL_POLL_INTERVAL_S", 0.0)
+    doc_ids = ["DOC_BATCH_CANCEL_A", "DOC_BATCH_CANCEL_B"]
+    for doc_id in doc_ids:
+        _seed_document(doc_id, "Gallica", pages=4)
+    checks = {"count": 0}
+
+    def _should_cancel() -> bool:
+        checks["count"] += 1
+        return checks["count"] > 1
+
+    with pytest.raises(ExportCancelledError):
+        execute_export_job(
+            job_id="exp_pdf_batch_cancel",
+            items=[{"doc_id": doc_id, "library": "Gallica"} for doc_id in doc_ids],
+            export_format="pdf_images",
+            selection_mode="all",
+            selected_pages_raw="",
+            destination="local_filesystem",
+            should_cancel=_should_cancel,
+        )
+    out_dir = get_config_manager().get_exports_dir() / "exp_pdf_batch_cancel"
+    assert not list(out_dir.glob("*.zip"))
+
+
+def test_batch_zip_export_reports_and_cancels_per_page(monkeypatch):
+    """ZIP batch items report page progress and stop at the next page once cancelled."""
+    monkeypatch.setattr("universal_iiif_core.services.export.service._CANCEL_POLL_INTERVAL_S", 0.0)
+    doc_ids = ["DOC_BATCH_ZIP_PAGES_A", "DOC_BATCH_ZIP_PAGES_B"]
+    for doc_id in doc_ids:
+        _seed_document(doc_id, "Gallica", pages=4)
+    items = [{"doc_id": doc_id, "library": "Gallica"} for doc_id in doc_ids]
+    messages: list[str] = []
+
+    execute_export_job(
+        job_id="exp_zip_batch_pages",
+        items=items,
+        export_format="zip_images",
+        selection_mode="all",
+        selected_pages_raw="",
+        destination="local_filesystem",
+        progress_callback=lambda _current, _total, msg: messages.append(msg),
+    )
+    assert "Item 0/2 completati (12%)" in messages
+
+    checks = {"count": 0}
+
+    def _should_cancel() -> bool:
+        checks["count"] += 1
+        return checks["count"] > 2
+
+    with pytest.raises(ExportCancelledError):
+        execute_export_job(
+            job_id="exp_zip_batch_pages_cancel",
+            items=items,
+            export_format="zip_images",
+            selection_mode="all",
+            selected_pages_raw="",
+            destination="local_filesystem",
+            should_cancel=_should_cancel,
+        )
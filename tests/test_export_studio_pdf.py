@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
 import pymupdf as fitz
+import pytest
 from PIL import Image
 
 from universal_iiif_core.export_studio import build_professional_pdf
@@ -131,3 +133,247 @@ def test_generate_pdf_from_images_creates_pdf(tmp_path: Path):
     assert ok, msg
     assert out_pdf.exists(), "PDF file was not created"
     assert out_pdf.stat().st_size > 500, "PDF looks too small"
+
+
+def test_parallel_encoding_keeps_page_order_and_progress(tmp_path: Path) -> None:
+    """Concurrent page encoding must still write pages and report progress in selection order."""
+    doc_dir = tmp_path / "doc"
+    scans_dir = doc_dir / "scans"
+    sizes = [(400 + 40 * i, 600) for i in range(6)]
+    for i, size in enumerate(sizes):
+        _write_scan(scans_dir, i, size=size)
+
+    progress: list[tuple[int, int]] = []
+    out_path = tmp_path / "out.pdf"
+    build_professional_pdf(
+        doc_dir=doc_dir,
+        output_path=out_path,
+        selected_pages=[6, 2, 4, 1, 5, 3],
+        cover_title="T",
+        cover_curator="",
+        cover_description="",
+        manifest_meta={},
+        transcription_json=None,
+        mode="Solo immagini",
+        compression="High-Res",
+        source_url="",
+        include_cover=False,
+        include_colophon=False,
+        progress_callback=lambda current, total: progress.append((current, total)),
+        encode_workers=3,
+    )
+
+    assert progress == [(i, 6) for i in range(6)]
+    pdf = fitz.open(out_path)
+    try:
+        widths = [pdf[i].get_images(full=True)[0][2] for i in range(pdf.page_count)]
+        assert widths == [sizes[p - 1][0] for p in [6, 2, 4, 1, 5, 3]]
+    finally:
+        pdf.close()
+
+
+def test_cancel_from_progress_callback_stops_encoding(tmp_path: Path) -> None:
+    """An exception raised by the progress callback aborts the export and leaves no output."""
+    doc_dir = tmp_path / "doc"
+    scans_dir = doc_dir / "scans"
+    for i in range(12):
+        _write_scan(scans_dir, i)
+
+    def _cancel(current: int, _total: int) -> None:
+        if current == 2:
+            raise RuntimeError("cancelled")
+
+    out_path = tmp_path / "out.pdf"
+    with pytest.raises(RuntimeError, match="cancelled"):
+        build_professional_pdf(
+            doc_dir=doc_dir,
+            output_path=out_path,
+            selected_pages=list(range(1, 13)),
+            cover_title="T",
+            cover_curator="",
+            cover_description="",
+            manifest_meta={},
+            transcription_json=None,
+            mode="Solo immagini",
+            compression="Standard",
+            source_url="",
+            progress_callback=_cancel,
+            encode_workers=4,
+            chunk_pages=1,
+        )
+    assert not out_path.exists()
+    assert not (tmp_path / "out.pdf.part").exists()
+    assert not [t for t in threading.enumerate() if t.name.startswith("pdf-encode")]
+
+
+def test_jpeg_within_profile_is_embedded_without_reencoding(tmp_path: Path) -> None:
+    """Scans that already meet the profile keep their original bytes; the rest are re-encoded."""
+    doc_dir = tmp_path / "doc"
+    scans_dir = doc_dir / "scans"
+    small = _write_scan(scans_dir, 0, size=(800, 1200))
+    _write_scan(scans_dir, 1, size=(1200, 3000))
+    Image.new("RGB", (600, 900), (10, 20, 30)).save(scans_dir / "pag_0002.jpg", format="JPEG", quality=98)
+
+    out_path = tmp_path / "out.pdf"
+    build_professional_pdf(
+        doc_dir=doc_dir,
+        output_path=out_path,
+        selected_pages=[1, 2, 3],
+        cover_title="T",
+        cover_curator="",
+        cover_description="",
+        manifest_meta={},
+        transcription_json=None,
+        mode="Solo immagini",
+        compression="High-Res",
+        source_url="",
+        include_cover=False,
+        image_max_long_edge_px=2600,
+    )
+
+    pdf = fitz.open(out_path)
+    try:
+        embedded = [pdf.extract_image(pdf[i].get_images(full=True)[0][0])["image"] for i in range(3)]
+        assert embedded[0] == small.read_bytes()
+        assert embedded[1] != (scans_dir / "pag_0001.jpg").read_bytes()
+        assert embedded[2] != (scans_dir / "pag_0002.jpg").read_bytes()
+        assert "Immagini originali senza ricodifica: 1" in pdf[3].get_text("text")
+    finally:
+        pdf.close()
+
+
+def test_chunked_assembly_matches_in_memory_build(tmp_path: Path) -> None:
+    """Flushing every few pages to disk must produce the same pages as a single in-memory save."""
+    doc_dir = tmp_path / "doc"
+    scans_dir = doc_dir / "scans"
+    for i in range(7):
+        _write_scan(scans_dir, i, size=(300 + 20 * i, 500))
+    transcription = {"pages": [{"page_index": i, "full_text": f"Testo pagina {i}"} for i in range(1, 8)]}
+
+    outputs = {}
+    for chunk_pages, garbage in ((0, 4), (3, 0), (3, 4)):
+        out_path = tmp_path / f"out_{chunk_pages}_{garbage}.pdf"
+        build_professional_pdf(
+            doc_dir=doc_dir,
+            output_path=out_path,
+            selected_pages=list(range(1, 8)),
+            cover_title="T",
+            cover_curator="",
+            cover_description="",
+            manifest_meta={},
+            transcription_json=transcription,
+            mode="PDF Ricercabile",
+            compression="Standard",
+            source_url="",
+            chunk_pages=chunk_pages,
+            garbage=garbage,
+        )
+        pdf = fitz.open(out_path)
+        try:
+            outputs[(chunk_pages, garbage)] = [pdf[i].get_text("text") for i in range(pdf.page_count)]
+        finally:
+            pdf.close()
+
+    assert not list(tmp_path.glob("*.part"))
+    reference = outputs[(0, 4)]
+    assert len(reference) == 9
+    assert "Colophon" in reference[-1]
+    for pages in outputs.values():
+        assert len(pages) == len(reference)
+        assert all(f"Testo pagina {i}" in pages[i] for i in range(1, 8))
+
+
+def test_generate_pdf_from_images_flushes_chunks(tmp_path: Path) -> None:
+    """Chunked image-to-PDF conversion keeps every page in order."""
+    from universal_iiif_core.pdf_utils import generate_pdf_from_images
+
+    image_paths = [str(_write_scan(tmp_path / "images", i, size=(100 + i, 80))) for i in range(5)]
+    out_pdf = tmp_path / "out.pdf"
+
+    ok, msg = generate_pdf_from_images([*image_paths, str(tmp_path / "missing.jpg")], str(out_pdf), chunk_pages=2)
+
+    assert ok, msg
+    assert not (tmp_path / "out.pdf.part").exists()
+    pdf = fitz.open(out_pdf)
+    try:
+        assert [round(page.rect.width) for page in pdf] == [100, 101, 102, 103, 104]
+    finally:
+        pdf.close()
+
+
+def test_transcription_wrapping_matches_fill_textbox_layout() -> None:
+    """Cached-metrics line breaking must wrap and paginate like PyMuPDF's own textbox layout."""
+    from universal_iiif_core.export_studio import _font_metrics, _lines_per_box, _wrap_text_lines
+
+    metrics = _font_metrics("helv", 11)
+    box = fitz.Rect(54, 60, 595 - 54, 842 - 54)
+    text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 12 + "\n\n" + "X" * 400
+
+    page = fitz.open().new_page(width=595, height=842)
+    writer = fitz.TextWriter(page.rect)
+    writer.fill_textbox(box, text, font=fitz.Font("helv"), fontsize=11, warn=False)
+    writer.write_text(page)
+    expected = [line for line in page.get_text("text").splitlines() if line.strip()]
+
+    lines = _wrap_text_lines(text, box.width - 11 * 0.2, metrics)
+    assert [line for line in lines if line.strip()] == expected
+    assert all(metrics.width(line) <= box.width for line in lines)
+    assert _lines_per_box(box, metrics) == 48
+
+
+def test_concurrent_builds_never_overlap_pymupdf_work(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Two exports running at once take turns on PyMuPDF, which is not thread-safe."""
+    import time
+
+    from universal_iiif_core import export_studio
+
+    active = 0
+    overlaps: list[int] = []
+    guard = threading.Lock()
+    real_write = export_studio._write_scan_page
+
+    def _tracked_write(*args, **kwargs) -> None:
+        nonlocal active
+        with guard:
+            active += 1
+            overlaps.append(active)
+        time.sleep(0.005)
+        try:
+            real_write(*args, **kwargs)
+        finally:
+            with guard:
+                active -= 1
+
+    monkeypatch.setattr(export_studio, "_write_scan_page", _tracked_write)
+
+    def _build(name: str) -> None:
+        doc_dir = tmp_path / name
+        for i in range(6):
+            _write_scan(doc_dir / "scans", i, size=(200, 300))
+        build_professional_pdf(
+            doc_dir=doc_dir,
+            output_path=tmp_path / f"{name}.pdf",
+            selected_pages=list(range(1, 7)),
+            cover_title=name,
+            cover_curator="",
+            cover_description="",
+            manifest_meta={},
+            transcription_json={"pages": [{"page_index": 1, "full_text": "testo " * 200}]},
+            mode="Testo a fronte",
+            compression="Light",
+            source_url="",
+            encode_workers=2,
+        )
+
+    threads = [threading.Thread(target=_build, args=(f"doc_{n}",)) for n in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(overlaps) == 18
+    assert max(overlaps) == 1
+    for n in range(3):
+        with fitz.open(tmp_path / f"doc_{n}.pdf") as pdf:
+            # cover + 6 scans + transcription of page 1 + colophon
+            assert pdf.page_count == 9
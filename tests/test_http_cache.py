@@ -0,0 +1,167 @@
+"""Tests for the on-disk JSON HTTP cache and its HTTPClient integration."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+import requests
+
+from universal_iiif_core._http_cache import HTTPCache, parse_cache_control
+from universal_iiif_core.http_client import HTTPClient
+
+
+def _response(body: bytes = b'{"ok": true}', status: int = 200, **headers: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.url = "https://example.org/manifest.json"
+    response.headers.update(headers)
+    return response
+
+
+@pytest.fixture
+def cached_client(tmp_path):
+    """HTTPClient with the JSON cache enabled under tmp_path."""
+    policy = {
+        "global": {"connect_timeout_s": 5, "read_timeout_s": 5, "transport_retries": 0},
+        "download": {"default_retry_max_attempts": 1},
+        "http_cache": {"enabled": True, "max_bytes": 1024 * 1024, "default_ttl_s": 3600, "max_ttl_s": 86400},
+        "libraries": {},
+    }
+    return HTTPClient(policy, cache_dir=tmp_path / "http")
+
+
+class _FakeSession:
+    """Replay queued responses (the last one repeats) and record request headers."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls: list[dict] = []
+
+    def __call__(self, url, **kwargs):
+        self.calls.append(dict(kwargs.get("headers") or {}))
+        item = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+class TestCacheControl:
+    def test_parse_directives(self):
+        parsed = parse_cache_control('public, max-age=60, no-cache="set-cookie"')
+        assert parsed == {"public": None, "max-age": "60", "no-cache": "set-cookie"}
+
+    def test_max_age_capped_by_max_ttl(self, tmp_path):
+        cache = HTTPCache(tmp_path, default_ttl_s=10, max_ttl_s=100)
+        entry = cache.store("k" * 64, _response(**{"Cache-Control": "max-age=99999"}))
+        assert entry is not None
+        assert entry.expires_ts - entry.stored_ts == pytest.approx(100, abs=1)
+
+    def test_no_store_is_not_written(self, tmp_path):
+        cache = HTTPCache(tmp_path)
+        assert cache.store("a" * 64, _response(**{"Cache-Control": "no-store"})) is None
+        assert cache.lookup("a" * 64) is None
+
+    def test_no_cache_stored_but_stale(self, tmp_path):
+        cache = HTTPCache(tmp_path)
+        entry = cache.store("b" * 64, _response(**{"Cache-Control": "no-cache", "ETag": '"v1"'}))
+        assert entry is not None
+        assert not entry.is_fresh()
+        assert cache.conditional_headers(entry) == {"If-None-Match": '"v1"'}
+
+
+class TestEviction:
+    def test_lru_eviction_respects_max_bytes(self, tmp_path):
+        cache = HTTPCache(tmp_path, max_bytes=25)
+        cache.store("1" * 64, _response(b"x" * 10))
+        time.sleep(0.01)
+        cache.store("2" * 64, _response(b"y" * 10))
+        time.sleep(0.01)
+        cache.read_body("1" * 64)  # touch: "2" becomes least recently used
+        cache.store("3" * 64, _response(b"z" * 10))
+
+        assert cache.lookup("1" * 64) is not None
+        assert cache.lookup("2" * 64) is None
+        assert cache.lookup("3" * 64) is not None
+        assert cache.size_bytes() == 20
+
+
+class TestHTTPClientJsonCache:
+    def test_fresh_hit_skips_network(self, cached_client, monkeypatch):
+        session = _FakeSession(_response(b'{"a": 1}', **{"Cache-Control": "max-age=600"}))
+        monkeypatch.setattr(cached_client.session, "get", session)
+
+        assert cached_client.get_json("https://example.org/manifest.json") == {"a": 1}
+        assert cached_client.get_json("https://example.org/manifest.json") == {"a": 1}
+
+        assert len(session.calls) == 1
+        metrics = cached_client.get_metrics()
+        assert metrics["cache_hits"] == 1
+        assert metrics["cache_misses"] == 1
+        assert metrics["cache_bytes_served"] == len(b'{"a": 1}')
+        assert metrics["cache_size_bytes"] == len(b'{"a": 1}')
+
+    def test_stale_entry_revalidates_with_etag(self, cached_client, monkeypatch):
+        session = _FakeSession(
+            _response(b'{"v": 1}', **{"Cache-Control": "max-age=0", "ETag": '"abc"'}),
+            _response(b"", status=304, **{"Cache-Control": "max-age=600"}),
+        )
+        monkeypatch.setattr(cached_client.session, "get", session)
+
+        assert cached_client.get_json("https://example.org/info.json") == {"v": 1}
+        assert cached_client.get_json("https://example.org/info.json") == {"v": 1}
+
+        assert session.calls[1].get("If-None-Match") == '"abc"'
+        assert cached_client.get_metrics()["cache_revalidations"] == 1
+
+    def test_iter_json_body_stores_small_bodies_for_get_json(self, cached_client, monkeypatch):
+        response = _response(b'{"label": "x"}', **{"Cache-Control": "max-age=600"})
+        response._content_consumed = True
+        session = _FakeSession(response)
+        monkeypatch.setattr(cached_client.session, "get", session)
+
+        chunks = list(cached_client.iter_json_body("https://example.org/manifest.json", chunk_size=4))
+
+        assert b"".join(chunks) == b'{"label": "x"}'
+        assert cached_client.get_json("https://example.org/manifest.json") == {"label": "x"}
+        assert b"".join(cached_client.iter_json_body("https://example.org/manifest.json")) == b'{"label": "x"}'
+        assert len(session.calls) == 1
+
+    def test_stale_served_on_network_error(self, cached_client, monkeypatch):
+        session = _FakeSession(
+            _response(b'{"v": 2}', **{"Cache-Control": "max-age=0"}),
+            requests.ConnectionError("offline"),
+        )
+        monkeypatch.setattr(cached_client.session, "get", session)
+
+        assert cached_client.get_json("https://example.org/info.json") == {"v": 2}
+        assert cached_client.get_json("https://example.org/info.json", retries=1) == {"v": 2}
+        assert cached_client.get_metrics()["cache_stale_served"] == 1
+
+    def test_use_cache_false_bypasses_cache(self, cached_client, monkeypatch):
+        session = _FakeSession(_response(b'{"a": 1}'), _response(b'{"a": 2}'))
+        monkeypatch.setattr(cached_client.session, "get", session)
+
+        assert cached_client.get_json("https://example.org/search", use_cache=False) == {"a": 1}
+        assert cached_client.get_json("https://example.org/search", use_cache=False) == {"a": 2}
+        assert cached_client.get_metrics()["cache_misses"] == 0
+
+    def test_cache_disabled_without_cache_dir(self):
+        client = HTTPClient({"global": {}, "download": {}, "http_cache": {"enabled": True}, "libraries": {}})
+        assert client.cache is None
+
+
+def test_app_clients_share_one_response_cache(monkeypatch):
+    """The shared and the discovery-search HTTPClient use the same cache, so one size budget covers both."""
+    from universal_iiif_core import http_client
+    from universal_iiif_core.resolvers.search import _common
+
+    monkeypatch.setattr(http_client, "_http_client_instance", None)
+    monkeypatch.setattr(http_client, "_http_cache_instance", None)
+    monkeypatch.setattr(_common, "_http_client_cache", None)
+
+    shared = http_client.get_http_client().cache
+    assert shared is not None
+    assert _common.get_search_http_client().cache is shared
+    assert shared.root == http_client.http_cache_dir()
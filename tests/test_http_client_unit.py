@@ -34,6 +34,12 @@ class TestHTTPMetrics:
             "retry_count",
             "rate_limit_hits",
             "timeout_count",
+            "cache_hits",
+            "cache_misses",
+            "cache_revalidations",
+            "cache_stale_served",
+            "cache_bytes_served",
+            "cache_bytes_stored",
             "avg_response_time_ms",
             "per_host_stats",
         }
@@ -1,12 +1,20 @@
 """Unit tests for the Internet Culturale (ICCU) provider."""
 
+import io
+import os
 from pathlib import Path
+from time import time as real_time
 
+import pytest
+
+from universal_iiif_core.resolvers import mag_parser
 from universal_iiif_core.resolvers.internetculturale import InternetCulturaleResolver
 from universal_iiif_core.resolvers.mag_parser import (
+    MagPageStream,
     build_magparser_url,
     build_thumbnail_url,
     extract_oai_and_teca_from_url,
+    fetch_and_convert,
     is_iccu_magparser_url,
     parse_mag_xml,
     probe_magparser_url,
@@ -48,6 +56,126 @@ def test_parse_mag_xml_extracts_metadata_block():
     assert iccu["oai_id"].startswith("oai:teca.bmlonline.it")
 
 
+def test_mag_page_stream_yields_pages_after_bibinfo_from_a_file_object():
+    stream = MagPageStream(io.BytesIO(_fixture_bytes()))
+    pages = iter(stream)
+
+    first = next(pages)
+    assert stream.metadata is not None
+    assert stream.metadata.shelfmark == "Plutei 40.26"
+    assert (first["idx"], first["name"], first["w"]) == (0, "Carta 1r", 1600)
+    assert [page["idx"] for page in pages] == [1, 2]
+
+
+def test_parse_mag_xml_rejects_malformed_or_incomplete_xml():
+    with pytest.raises(ValueError, match="parse error"):
+        parse_mag_xml(b"<metadigit><bibinfo>")
+    with pytest.raises(ValueError, match="bibinfo"):
+        parse_mag_xml(b"<metadigit><medias/></metadigit>")
+
+
+class _PagedMagClient:
+    """HTTPClient stand-in serving a MAG document of `total` pages through offset/pag."""
+
+    def __init__(self, total: int, honour_offset: bool = True):
+        self.total = total
+        self.honour_offset = honour_offset
+        self.offsets: list[int] = []
+
+    def get(self, url, **_kwargs):
+        from urllib.parse import parse_qs, urlparse
+
+        qs = parse_qs(urlparse(url).query)
+        offset, count = int(qs["offset"][0]), int(qs["pag"][0])
+        self.offsets.append(offset)
+        if not self.honour_offset:
+            offset = 0
+        bibinfo = _fixture_bytes().split(b"<medias>")[0]
+        pages = b"".join(
+            b'<page idx="%d" name="c%d" w="10" h="20" src="x/%d.jpg"/>' % (i, i, i)
+            for i in range(offset, min(offset + count, self.total))
+        )
+        body = bibinfo + b"<medias><media><pages>" + pages + b"</pages></media></medias></metadigit>"
+
+        class _Resp:
+            raw = io.BytesIO(body)
+
+            def raise_for_status(self):
+                return None
+
+            def close(self):
+                return None
+
+        return _Resp()
+
+
+def test_fetch_and_convert_pages_in_parallel_chunks_and_caches(monkeypatch):
+    monkeypatch.setattr(mag_parser, "_CHUNK_PAGES", 2)
+    monkeypatch.setattr(mag_parser, "_PARALLEL_CHUNKS", 2)
+    client = _PagedMagClient(total=7)
+    url = build_magparser_url("oai:x:y", "marciana")
+
+    manifest = fetch_and_convert(url, client=client)
+
+    canvases = manifest["sequences"][0]["canvases"]
+    assert [c["label"] for c in canvases] == [f"c{i}" for i in range(7)]
+    assert sorted(client.offsets) == [0, 2, 4, 6, 8]
+
+    client.offsets.clear()
+    assert fetch_and_convert(url, client=client) == manifest
+    assert client.offsets == []
+    fetch_and_convert(url, client=client, refresh=True)
+    assert client.offsets[0] == 0
+
+
+def test_fetch_and_convert_falls_back_to_one_call_when_offset_is_ignored(monkeypatch):
+    monkeypatch.setattr(mag_parser, "_CHUNK_PAGES", 2)
+    monkeypatch.setattr(mag_parser, "_PARALLEL_CHUNKS", 2)
+    monkeypatch.setattr(mag_parser, "_MAX_PAGES_PER_CALL", 10)
+    client = _PagedMagClient(total=7, honour_offset=False)
+    url = build_magparser_url("oai:x:y", "marciana")
+
+    manifest = fetch_and_convert(url, client=client)
+
+    assert len(manifest["sequences"][0]["canvases"]) == 7
+    client.offsets.clear()
+    assert fetch_and_convert(url, client=client) == manifest
+    assert client.offsets == []
+
+
+def test_fetch_and_convert_does_not_cache_a_possibly_truncated_item(monkeypatch):
+    monkeypatch.setattr(mag_parser, "_CHUNK_PAGES", 2)
+    monkeypatch.setattr(mag_parser, "_PARALLEL_CHUNKS", 2)
+    monkeypatch.setattr(mag_parser, "_MAX_PAGES_PER_CALL", 10)
+    client = _PagedMagClient(total=12, honour_offset=False)
+    url = build_magparser_url("oai:x:y", "marciana")
+
+    assert len(fetch_and_convert(url, client=client)["sequences"][0]["canvases"]) == 10
+    client.offsets.clear()
+    fetch_and_convert(url, client=client)
+    assert client.offsets[0] == 0
+
+
+def test_iccu_manifest_cache_expires_and_prunes_old_entries(monkeypatch):
+    client = _PagedMagClient(total=1)
+    url = build_magparser_url("oai:x:y", "marciana")
+    fetch_and_convert(url, client=client)
+
+    with monkeypatch.context() as later:
+        later.setattr(mag_parser.time, "time", lambda: real_time() + 8 * 24 * 3600)
+        client.offsets.clear()
+        fetch_and_convert(url, client=client)
+    assert client.offsets == [0]
+
+    folder = mag_parser.iccu_manifest_cache_dir() / "ab"
+    folder.mkdir(parents=True, exist_ok=True)
+    for name, age_s in (("old", 7200), ("new", 60), ("newest", 0)):
+        (folder / f"{name}.json").write_text("{}", encoding="utf-8")
+        os.utime(folder / f"{name}.json", (real_time() - age_s, real_time() - age_s))
+    assert mag_parser.prune_iccu_manifest_cache(3600, max_entries=1) == 2
+    assert [path.name for path in folder.glob("*.json")] == ["newest.json"]
+
+
 def test_build_magparser_url_roundtrip():
     url = build_magparser_url("oai:x:y", "marciana", max_pages=10)
     oai, teca = extract_oai_and_teca_from_url(url)
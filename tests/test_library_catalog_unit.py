@@ -19,6 +19,40 @@ def test_infer_item_type_prefers_incunabolo():
     assert "incunab" in reason
 
 
+def _sequential_infer_item_type(label, description="", metadata=None):
+    """Reference implementation: the rule-by-rule, token-by-token substring scan."""
+    metadata = metadata or {}
+    keys = ("type", "genre", "format", "material", "description")
+    corpus = " ".join(c for c in (label, description, *(metadata.get(k, "") for k in keys)) if c).lower()
+    for item_type, tokens, confidence in library_catalog._TYPE_RULES:
+        for token in tokens:
+            if token in corpus:
+                return item_type, confidence, f"match:{token}"
+    return "non classificato", 0.2, "fallback:no-rule-match"
+
+
+def test_compiled_item_type_matcher_matches_sequential_rules():
+    """The compiled rule table and the batch classifier agree with the sequential rule scan."""
+    documents = [
+        ("Musica sacra", "", {}),
+        ("Atlante nautico", "printed edition", {"type": "map"}),
+        ("Ms. Urb.lat.1", "codex membranaceus", {"genre": "manuscript"}),
+        ("Gazzetta di Venezia", "", {"format": "periodical"}),
+        ("Collectanea", "", {"material": "carta"}),
+        ("Breviario", "", {}),
+        ("Corale", "incunabulum, musica", {}),
+        ("", "", {"description": "typographia antiqua"}),
+        ("ms ", "", {}),
+        ("Documenti vari", "raccolta di stampe", {"type": "print"}),
+    ]
+
+    expected = [_sequential_infer_item_type(*document) for document in documents]
+
+    assert [library_catalog.infer_item_type(*document) for document in documents] == expected
+    assert library_catalog.infer_item_types(documents) == expected
+    assert library_catalog.infer_item_types([]) == []
+
+
 def test_parse_manifest_catalog_extracts_see_also_reference(monkeypatch):
     """`seeAlso` detail pages should enrich reference text and catalog title."""
     manifest = {
@@ -45,7 +79,7 @@ def test_parse_manifest_catalog_extracts_see_also_reference(monkeypatch):
         def get(self, *_args, **_kwargs):
             return _MockResponse()
 
-    monkeypatch.setattr("universal_iiif_core.library_catalog.HTTPClient", _MockHTTPClient)
+    monkeypatch.setattr("universal_iiif_core.library_catalog.get_http_client", _MockHTTPClient)
 
     parsed = library_catalog.parse_manifest_catalog(
         manifest,
@@ -78,7 +112,7 @@ def test_parse_manifest_catalog_ignores_generic_site_title_for_catalog_title(mon
         def get(self, *_args, **_kwargs):
             return _MockResponse()
 
-    monkeypatch.setattr("universal_iiif_core.library_catalog.HTTPClient", _MockHTTPClient)
+    monkeypatch.setattr("universal_iiif_core.library_catalog.get_http_client", _MockHTTPClient)
 
     parsed = library_catalog.parse_manifest_catalog(
         manifest,
@@ -128,7 +162,7 @@ def test_parse_manifest_catalog_ignores_search_and_discover_placeholder(monkeypa
         def get(self, *_args, **_kwargs):
             return _MockResponse()
 
-    monkeypatch.setattr("universal_iiif_core.library_catalog.HTTPClient", _MockHTTPClient)
+    monkeypatch.setattr("universal_iiif_core.library_catalog.get_http_client", _MockHTTPClient)
 
     parsed = library_catalog.parse_manifest_catalog(
         manifest,
@@ -243,7 +277,7 @@ def test_parse_manifest_catalog_enrichment_merges_external_fields(monkeypatch):
         def get(self, *_args, **_kwargs):
             return _MockResponse()
 
-    monkeypatch.setattr("universal_iiif_core.library_catalog.HTTPClient", _MockHTTPClient)
+    monkeypatch.setattr("universal_iiif_core.library_catalog.get_http_client", _MockHTTPClient)
 
     parsed = library_catalog.parse_manifest_catalog(
         manifest,
@@ -281,7 +315,7 @@ def test_parse_manifest_catalog_extracts_vatican_bibliographic_references(monkey
         def get(self, *_args, **_kwargs):
             return _MockResponse()
 
-    monkeypatch.setattr("universal_iiif_core.library_catalog.HTTPClient", _MockHTTPClient)
+    monkeypatch.setattr("universal_iiif_core.library_catalog.get_http_client", _MockHTTPClient)
 
     parsed = library_catalog.parse_manifest_catalog(
         manifest,
@@ -324,7 +358,7 @@ def test_parse_manifest_catalog_extracts_vatican_bibliographic_references_from_d
         def get(self, *_args, **_kwargs):
             return _MockResponse()
 
-    monkeypatch.setattr("universal_iiif_core.library_catalog.HTTPClient", _MockHTTPClient)
+    monkeypatch.setattr("universal_iiif_core.library_catalog.get_http_client", _MockHTTPClient)
 
     parsed = library_catalog.parse_manifest_catalog(
         manifest,
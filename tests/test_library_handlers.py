@@ -298,3 +298,28 @@ def test_library_fragment_uses_config_default_mode_when_missing_mode():
         assert 'const DEFAULT_MODE = "archivio";' in rendered
     finally:
         cm.set_setting("library.default_mode", old_default_mode)
+
+
+def test_library_reclassify_all_runs_as_background_job(monkeypatch):
+    """Reclassification is submitted as one job and leaves manual categories alone."""
+    vm = VaultManager()
+    vm.upsert_manuscript("DOC_AUTO", title="Libro d'ore", item_type="non classificato", item_type_source="auto")
+    vm.upsert_manuscript("DOC_MANUAL", title="Libro d'ore", item_type="manoscritto", item_type_source="manual")
+    submitted = []
+
+    def _submit(task, args=(), kwargs=None, job_type="generic"):
+        submitted.append((task, args, job_type))
+        return "job-1"
+
+    monkeypatch.setattr(library_handlers.job_manager, "submit_job", _submit)
+    monkeypatch.setattr(library_handlers.job_manager, "list_jobs", lambda active_only=False: {})
+
+    result = library_handlers.library_reclassify_all()
+    assert "Riclassificazione avviata" in repr(result)
+    assert [(args, job_type) for _task, args, job_type in submitted] == [(("reclassify",), "library_maintenance")]
+
+    task = submitted[0][0]
+    assert task("reclassify") >= 1
+    assert vm.get_manuscript("DOC_MANUAL")["item_type"] == "manoscritto"
+    assert vm.get_manuscript("DOC_AUTO")["item_type_reason"]
+    assert task("reclassify") == 0
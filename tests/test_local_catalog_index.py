@@ -0,0 +1,205 @@
+"""Tests for the harvested local catalog index and its local-first search."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+
+from universal_iiif_core import providers
+from universal_iiif_core.config_manager import get_config_manager
+from universal_iiif_core.discovery import harvester
+from universal_iiif_core.discovery.harvester import CatalogHarvester, parse_collection, parse_sitemap
+from universal_iiif_core.discovery.local_index import (
+    IndexRecord,
+    LocalCatalogIndex,
+    get_local_index,
+    search_local_index,
+)
+from universal_iiif_core.resolvers.manifest_stream import header_from_manifest
+
+ROOT = "https://example.org/iiif/collection/top"
+CHILD = "https://example.org/iiif/collection/child"
+
+
+def _manifest_ref(index: int, label: str) -> dict:
+    return {"@id": f"https://example.org/iiif/ms{index}/manifest", "@type": "sc:Manifest", "label": label}
+
+
+COLLECTIONS = {
+    ROOT: {
+        "@id": ROOT,
+        "@type": "sc:Collection",
+        "collections": [{"@id": CHILD, "@type": "sc:Collection"}],
+        "manifests": [_manifest_ref(1, "Libro d'Ore")],
+    },
+    CHILD: {
+        "id": CHILD,
+        "type": "Collection",
+        "items": [
+            {"id": "https://example.org/iiif/ms2/manifest", "type": "Manifest", "label": {"it": ["Commedia di Dante"]}},
+            {"id": "https://example.org/iiif/ms3/manifest", "type": "Manifest", "label": {"it": ["Breviario"]}},
+        ],
+    },
+}
+
+
+class _Response:
+    def __init__(self, status_code: int, body: dict | None = None, etag: str = ""):
+        self.status_code = status_code
+        self.content = json.dumps(body or {}).encode("utf-8")
+        self.headers = {"ETag": etag} if etag else {}
+
+
+class _Client:
+    def __init__(self):
+        self.requests: list[tuple[str, dict]] = []
+
+    def get(self, url, headers=None, **_kwargs):
+        headers = dict(headers or {})
+        self.requests.append((url, headers))
+        etag = f'"{url.rsplit("/", 1)[-1]}"'
+        if headers.get("If-None-Match") == etag:
+            return _Response(304)
+        return _Response(200, COLLECTIONS[url], etag)
+
+
+def _use_client(monkeypatch, client: _Client) -> None:
+    monkeypatch.setattr(harvester, "get_http_client", lambda: client)
+
+
+def _fake_header(url, *_args, **_kwargs):
+    index = url.split("/ms", 1)[1].split("/", 1)[0]
+    return header_from_manifest(
+        {
+            "label": f"Manoscritto {index}",
+            "metadata": [
+                {"label": "Shelfmark", "value": f"Urb.lat.{index}"},
+                {"label": "Date", "value": "1450"},
+                {"label": "Language", "value": "Latino"},
+            ],
+        }
+    )
+
+
+def test_parse_collection_handles_v2_v3_and_paging():
+    """Child collections, manifests and `next` pages are all recognized."""
+    children, manifests = parse_collection({**COLLECTIONS[ROOT], "next": f"{ROOT}?page=2"})
+    assert children == [CHILD, f"{ROOT}?page=2"]
+    assert manifests == [("https://example.org/iiif/ms1/manifest", "Libro d'Ore", "")]
+
+    children, manifests = parse_collection(COLLECTIONS[CHILD])
+    assert children == []
+    assert [label for _url, label, _thumb in manifests] == ["Commedia di Dante", "Breviario"]
+
+
+def test_parse_sitemap_distinguishes_index_from_urlset():
+    """A sitemap index lists child sitemaps; a urlset lists pages."""
+    ns = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+    index = f"<sitemapindex {ns}><sitemap><loc>https://e.org/s1.xml</loc></sitemap></sitemapindex>"
+    urlset = f"<urlset {ns}><url><loc> https://e.org/iiif/a/manifest </loc></url></urlset>"
+
+    assert parse_sitemap(index.encode()) == (["https://e.org/s1.xml"], [])
+    assert parse_sitemap(urlset.encode()) == ([], ["https://e.org/iiif/a/manifest"])
+
+
+def test_parse_sitemap_reads_gzipped_sitemaps_within_the_size_cap(monkeypatch):
+    """`.xml.gz` bodies are inflated before parsing; oversized ones are rejected."""
+    ns = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+    urlset = f"<urlset {ns}><url><loc>https://e.org/iiif/a/manifest</loc></url></urlset>".encode()
+
+    assert harvester.document_kind("https://e.org/sitemap-1.xml.gz") == "sitemap"
+    assert parse_sitemap(gzip.compress(urlset)) == ([], ["https://e.org/iiif/a/manifest"])
+
+    monkeypatch.setattr(harvester, "_MAX_SITEMAP_BYTES", len(urlset) - 1)
+    with pytest.raises(ValueError, match="decompressed"):
+        parse_sitemap(gzip.compress(urlset))
+
+
+def test_harvest_resumes_and_revalidates_with_conditional_gets(monkeypatch, tmp_path):
+    """An interrupted run leaves documents pending; later passes send validators and accept 304s."""
+    client = _Client()
+    _use_client(monkeypatch, client)
+    monkeypatch.setattr(harvester, "read_manifest_header", _fake_header)
+    index = LocalCatalogIndex(tmp_path / "index.sqlite")
+    cancel_after_root = iter([False, True])
+
+    first = CatalogHarvester("Vaticana", [ROOT], index=index, should_cancel=lambda: next(cancel_after_root)).run()
+    assert first["cancelled"] is True
+    assert index.pending_documents("Vaticana") == 1
+
+    second = CatalogHarvester("Vaticana", [ROOT], index=index).run()
+    assert second["resumed"] is True
+    assert second["indexed"] == 3
+    assert second["headers"] == 3
+    assert [url for url, _headers in client.requests] == [ROOT, CHILD]
+
+    client.requests.clear()
+    third = CatalogHarvester("Vaticana", [ROOT], index=index).run()
+    assert third["not_modified"] == 2
+    assert third["headers"] == 0
+    assert all(headers.get("If-None-Match") for _url, headers in client.requests)
+
+    records, total = index.search("Vaticana", "urb 2")
+    assert total == 1
+    assert records[0].shelfmark == "Urb.lat.2"
+    assert records[0].language_label == "Latino"
+
+
+def test_fts_search_ignores_accents_and_matches_prefixes(tmp_path):
+    """Queries match word prefixes regardless of case and diacritics, per provider."""
+    index = LocalCatalogIndex(tmp_path / "index.sqlite")
+    index.add_references(
+        [
+            IndexRecord("Gallica", "https://g/1", label="Heures à l'usage de Rome"),
+            IndexRecord("Gallica", "https://g/2", label="Bréviaire"),
+            IndexRecord("Vaticana", "https://v/1", label="Breviarium"),
+        ]
+    )
+
+    records, total = index.search("Gallica", "brev")
+    assert (total, records[0].manifest_url) == (1, "https://g/2")
+    assert index.search("Gallica", "HEURES rom")[1] == 1
+    assert index.search("Gallica", '" OR *')[1] == 0
+
+
+def test_search_handlers_use_local_index_and_fall_back_to_live(monkeypatch):
+    """Complete harvests answer locally; partial ones merge into live results; misses go live."""
+    live_calls = []
+
+    def _live(query, payload):
+        live_calls.append((query, payload))
+        return [{"id": "live", "manifest": "https://live/1"}, {"id": "MSS_1", "manifest": "https://v/1"}]
+
+    index = get_local_index()
+    records = [IndexRecord("Vaticana", f"https://v/{n}", doc_id=f"MSS_{n}", label=f"Codice {n}") for n in range(3)]
+    index.add_references(records)
+    handler = providers._make_local_first_adapter("Vaticana", _live)
+
+    partial = handler("codice", {"max_results": 3})
+    assert [item["id"] for item in partial] == ["live", "MSS_1", "MSS_0", "MSS_2"]
+    assert len(live_calls) == 1
+
+    index.start_harvest("Vaticana", [(ROOT, "collection")])
+    index.finish_document("Vaticana", ROOT)
+    for record in records:
+        index.set_header(record)
+    assert index.harvest_complete("Vaticana")
+
+    page = handler("codice", {"max_results": 2, "page": 2})
+    assert [item["id"] for item in page] == ["MSS_2"]
+    assert page[0]["raw"]["_search_total_pages"] == 2
+    assert page[0]["raw"]["_source"] == "local_index"
+    assert len(live_calls) == 1
+
+    assert handler("assente", {})[0]["id"] == "live"
+    assert search_local_index("Vaticana", "codice", {"gallica_type": "manuscrit"}) is None
+
+    monkeypatch.setattr(
+        get_config_manager(),
+        "get_setting",
+        lambda key, default=None: False if key == "discovery.local_index_enabled" else default,
+    )
+    assert handler("codice", {})[0]["id"] == "live"
+    assert len(live_calls) == 3
@@ -0,0 +1,184 @@
+"""Tests for the streaming manifest header reader."""
+
+from __future__ import annotations
+
+import json
+import time
+
+from studio_ui.routes import discovery_handlers
+from universal_iiif_core.discovery import saved_entries
+from universal_iiif_core.http_client import HTTPClient
+from universal_iiif_core.library_catalog import parse_manifest_catalog
+from universal_iiif_core.resolvers.manifest_stream import (
+    ManifestHeaderScanner,
+    header_from_manifest,
+    read_manifest_header,
+    scan_manifest_chunks,
+)
+
+
+def _v2_manifest(pages: int = 300) -> dict:
+    return {
+        "@context": "http://iiif.io/api/presentation/2/context.json",
+        "@id": "https://example.org/iiif/ms1/manifest",
+        "@type": "sc:Manifest",
+        "label": 'Codice "A", {primo} [volume] \\ è',
+        "metadata": [{"label": "Shelfmark", "value": "Ms. 1"}],
+        "sequences": [
+            {
+                "canvases": [
+                    {
+                        "@id": f"https://example.org/iiif/ms1/canvas/{index}",
+                        "label": f"f. {index}r",
+                        "images": [{"resource": {"service": {"@id": f"https://example.org/iiif/ms1/p{index}"}}}],
+                    }
+                    for index in range(pages)
+                ]
+            },
+            {"canvases": [{"@id": "https://example.org/iiif/ms1/alt/0"}]},
+        ],
+        "rendering": {"format": "application/pdf", "@id": "https://example.org/ms1.pdf"},
+    }
+
+
+def _chunks(payload: dict, size: int) -> list[bytes]:
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return [body[start : start + size] for start in range(0, len(body), size)]
+
+
+def test_scanner_reads_header_fields_and_counts_v2_canvases_across_chunk_boundaries():
+    """Fields after the canvas list are still found; only the first sequence is counted."""
+    manifest = _v2_manifest()
+    for size in (3, 64, 4096):
+        header = scan_manifest_chunks(_chunks(manifest, size))
+
+        assert header is not None
+        assert header.complete
+        assert header.canvas_count == 300
+        assert header.fields["label"] == manifest["label"]
+        assert header.fields["metadata"] == manifest["metadata"]
+        assert header.fields["rendering"]["@id"].endswith(".pdf")
+        assert header.first_canvas == manifest["sequences"][0]["canvases"][0]
+
+
+def test_scanner_counts_v3_items_and_builds_manifest_shape():
+    """`as_manifest` keeps only the first canvas; `canvas_count` carries the page total."""
+    manifest = {
+        "type": "Manifest",
+        "id": "https://example.org/m3",
+        "label": {"it": ["Libro d'ore"]},
+        "items": [{"id": f"c{index}", "type": "Canvas", "items": [{"items": []}]} for index in range(12)],
+    }
+    header = scan_manifest_chunks(_chunks(manifest, 16))
+
+    assert header.canvas_count == 12
+    assert header.is_manifest
+    assert header.as_manifest()["items"] == [manifest["items"][0]]
+    assert header.as_manifest()["label"] == {"it": ["Libro d'ore"]}
+    assert header_from_manifest(manifest).canvas_count == 12
+
+
+def test_scanner_stops_reading_once_requested_fields_are_known():
+    """A field-only probe does not consume the canvas list that follows the field."""
+    manifest = {"rendering": [{"format": "application/pdf", "id": "x.pdf"}], **_v2_manifest(2000)}
+    chunks = _chunks(manifest, 256)
+    consumed = []
+
+    def _stream():
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    header = scan_manifest_chunks(_stream(), ("rendering",), count_canvases=False)
+
+    assert header.fields["rendering"] == manifest["rendering"]
+    assert not header.complete
+    assert len(consumed) < 3
+
+
+def test_scanner_counts_canvases_about_as_fast_as_json_loads():
+    """Timing guard: counting a large canvas list must not walk every canvas token in Python."""
+    manifest = _v2_manifest(15000)
+    chunks = _chunks(manifest, 65536)
+    body = b"".join(chunks)
+
+    def _best_of_three(fn) -> float:
+        timings = []
+        for _ in range(3):
+            started = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+    baseline = _best_of_three(lambda: json.loads(body))
+    scan = _best_of_three(lambda: scan_manifest_chunks(chunks))
+
+    assert scan_manifest_chunks(chunks).canvas_count == 15000
+    assert scan < baseline * 1.5
+
+
+def test_scanner_falls_back_to_token_scan_for_unusual_canvas_lists():
+    """Non-object entries and canvases split across chunks are still counted one by one."""
+    manifest = {"items": [{"id": "c0"}, "c1", {"id": "c2", "label": "[x]"}, ["c3"], {"id": "c4"}]}
+    for size in (1, 7, 4096):
+        header = scan_manifest_chunks(_chunks(manifest, size))
+
+        assert header.complete
+        assert header.canvas_count == 5
+        assert header.first_canvas == {"id": "c0"}
+
+
+def test_scanner_rejects_non_object_documents():
+    """HTML error pages and JSON arrays are not manifests."""
+    assert scan_manifest_chunks([b"<html><body>{oops}</body></html>"]) is None
+    assert scan_manifest_chunks([b"[1, 2, 3]"]) is None
+    assert scan_manifest_chunks([b"\xef\xbb\xbf {}"]) is None
+
+    scanner = ManifestHeaderScanner()
+    scanner.feed('  {"label": "ok", "n": 1, "flag": true}')
+    assert scanner.header.fields == {"label": "ok"}
+    assert scanner.header.keys == {"label", "n", "flag"}
+
+
+def test_read_manifest_header_and_analyze_manifest_use_the_stream(monkeypatch):
+    """Discovery analysis takes the page count from the streamed header."""
+    manifest = _v2_manifest(40)
+
+    def _fake_iter(_self, _url, **_kwargs):
+        yield from _chunks(manifest, 512)
+
+    def _no_full_fetch(*_args, **_kwargs):
+        raise AssertionError("the full manifest must not be decoded")
+
+    monkeypatch.setattr(HTTPClient, "iter_json_body", _fake_iter)
+    monkeypatch.setattr(HTTPClient, "get_json", _no_full_fetch)
+    monkeypatch.setattr(
+        "universal_iiif_core.library_catalog.extract_external_catalog_data",
+        lambda *_args, **_kwargs: {"reference_text": "", "external_fields": {}},
+    )
+
+    header = read_manifest_header("https://example.org/iiif/ms1/manifest")
+    assert header is not None and header.canvas_count == 40
+
+    info = saved_entries.analyze_manifest("https://example.org/iiif/ms1/manifest")
+    assert info["pages"] == 40
+    assert info["has_native_pdf"] is True
+    assert info["shelfmark"] == "Ms. 1"
+    assert discovery_handlers._quick_manifest_has_native_pdf("https://example.org/iiif/ms1/manifest") is True
+
+
+def test_streamed_header_keeps_every_key_the_catalog_parser_reads():
+    """Catalog links found only in related/homepage/service survive the header-only parse."""
+    manifest = {
+        **_v2_manifest(3),
+        "related": {"@id": "https://catalog.example.org/detail/ms-123", "format": "text/html"},
+        "homepage": [{"id": "https://library.example.org/item/ms-123", "type": "Text"}],
+        "service": {"@id": "https://catalog.example.org/record/ms-123", "profile": "catalog"},
+    }
+    header = scan_manifest_chunks(_chunks(manifest, 64))
+    assert header is not None
+
+    url = "https://example.org/iiif/ms1/manifest"
+    streamed = parse_manifest_catalog(header.as_manifest(), url, "ms-123")
+    assert streamed == parse_manifest_catalog(manifest, url, "ms-123")
+    assert streamed["source_detail_url"]
@@ -0,0 +1,170 @@
+"""Tests for native PDF rasterization into scans."""
+
+from __future__ import annotations
+
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pymupdf as fitz
+from PIL import Image
+
+from universal_iiif_core import pdf_utils
+from universal_iiif_core.pdf_utils import RasterizedPage, convert_pdf_to_images
+
+
+def _make_pdf(path: Path, pages: int) -> Path:
+    doc = fitz.open()
+    for index in range(pages):
+        page = doc.new_page(width=200 + index * 10, height=300)
+        page.insert_text((20, 40), f"Pagina {index + 1}")
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_convert_pdf_to_images_in_processes_matches_sequential(tmp_path: Path):
+    """Worker processes must write the same files, stats and progress as the in-process path."""
+    pdf_path = _make_pdf(tmp_path / "native.pdf", pages=10)
+    results: dict[int, tuple[list[RasterizedPage], list[tuple[int, int]]]] = {}
+    for workers in (1, 3):
+        pages: list[RasterizedPage] = []
+        progress: list[tuple[int, int]] = []
+        ok, message = convert_pdf_to_images(
+            pdf_path,
+            tmp_path / f"scans_{workers}",
+            progress_callback=lambda done, total, sink=progress: sink.append((done, total)),
+            dpi=72,
+            workers=workers,
+            pages_out=pages,
+        )
+        assert ok, message
+        results[workers] = (pages, progress)
+
+    sequential, parallel = results[1][0], results[3][0]
+    assert [page.filename for page in parallel] == [f"pag_{i:04d}.jpg" for i in range(10)]
+    assert [(p.width, p.height) for p in parallel] == [(p.width, p.height) for p in sequential]
+    for page in parallel:
+        path = tmp_path / "scans_3" / page.filename
+        assert page.size_bytes == path.stat().st_size
+        with Image.open(path) as img:
+            assert img.size == (page.width, page.height)
+    assert parallel[3].width == 230
+
+    parallel_progress = results[3][1]
+    assert parallel_progress[-1] == (10, 10)
+    assert [done for done, _ in parallel_progress] == sorted(done for done, _ in parallel_progress)
+
+
+def test_raster_workers_are_not_forked_from_the_caller():
+    """Worker processes must not inherit the threads and locks of the app that starts them."""
+    assert pdf_utils._raster_process_context().get_start_method() in {"forkserver", "spawn"}
+
+
+def test_convert_pdf_to_images_reports_worker_failure(tmp_path: Path):
+    """A progress callback that aborts must stop the conversion and surface the error."""
+    pdf_path = _make_pdf(tmp_path / "native.pdf", pages=12)
+
+    def _abort(_done, _total):
+        raise RuntimeError("cancelled")
+
+    ok, message = convert_pdf_to_images(pdf_path, tmp_path / "scans", progress_callback=_abort, dpi=72, workers=2)
+
+    assert ok is False
+    assert message == "cancelled"
+
+
+def _jpeg_bytes(size: tuple[int, int]) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (180, 120, 60)).save(buffer, "JPEG", quality=80)
+    return buffer.getvalue()
+
+
+def test_convert_pdf_to_images_passes_through_full_page_jpegs(tmp_path: Path):
+    """Single full-page JPEG pages are copied byte for byte; anything else is rendered."""
+    scan = _jpeg_bytes((900, 1350))
+    doc = fitz.open()
+    plain = doc.new_page(width=300, height=450)
+    plain.insert_image(plain.rect, stream=scan)
+    ocr_layer = doc.new_page(width=300, height=450)
+    ocr_layer.insert_image(ocr_layer.rect, stream=scan)
+    ocr_layer.insert_text((20, 40), "testo OCR", render_mode=3)
+    annotated = doc.new_page(width=300, height=450)
+    annotated.insert_image(annotated.rect, stream=scan)
+    annotated.insert_text((20, 40), "nota visibile")
+    margin = doc.new_page(width=300, height=450)
+    margin.insert_image(fitz.Rect(30, 30, 270, 420), stream=scan)
+    pdf_path = tmp_path / "scanned.pdf"
+    doc.save(str(pdf_path))
+    doc.close()
+
+    pages: list[RasterizedPage] = []
+    ok, message = convert_pdf_to_images(pdf_path, tmp_path / "scans", dpi=72, pages_out=pages, passthrough_images=True)
+
+    assert ok, message
+    assert [page.passthrough for page in pages] == [True, True, False, False]
+    assert (tmp_path / "scans" / "pag_0000.jpg").read_bytes() == scan
+    assert (pages[0].width, pages[0].height, pages[0].size_bytes) == (900, 1350, len(scan))
+    assert (pages[2].width, pages[2].height) == (300, 450)
+    assert "2 immagini originali" in message
+
+
+def test_convert_pdf_to_images_renders_everything_without_passthrough(tmp_path: Path):
+    """The fast path is opt-in: by default every page is rendered at the requested DPI."""
+    doc = fitz.open()
+    page = doc.new_page(width=300, height=450)
+    page.insert_image(page.rect, stream=_jpeg_bytes((900, 1350)))
+    pdf_path = tmp_path / "scanned.pdf"
+    doc.save(str(pdf_path))
+    doc.close()
+
+    pages: list[RasterizedPage] = []
+    ok, _message = convert_pdf_to_images(pdf_path, tmp_path / "scans", dpi=72, pages_out=pages)
+
+    assert ok
+    assert pages[0].passthrough is False
+    assert (pages[0].width, pages[0].height) == (300, 450)
+
+
+_ENTRY_SCRIPT = """
+import sys
+from pathlib import Path
+
+import pymupdf as fitz
+
+from studio_app import main  # noqa: F401  (imported like the iiif-studio console entry point)
+from universal_iiif_core.pdf_utils import convert_pdf_to_images
+from universal_iiif_core.services.storage.vault_manager import VaultManager
+
+if __name__ == "__main__":
+    vm = VaultManager()
+    vm.create_download_job("job-live", "DOC", "Test", "https://example.org/manifest.json")
+    vm.update_download_job("job-live", 1, 10, status="running")
+
+    doc = fitz.open()
+    for index in range(10):
+        doc.new_page(width=200, height=300).insert_text((20, 40), f"Pagina {index + 1}")
+    doc.save("native.pdf")
+    doc.close()
+
+    ok, message = convert_pdf_to_images(Path("native.pdf"), Path("scans"), dpi=72, workers=2)
+    assert ok, message
+    print(vm.get_download_job("job-live")["status"])
+"""
+
+
+def test_raster_pool_leaves_running_jobs_alone_when_started_from_the_app(tmp_path: Path):
+    """Worker start re-imports the app entry module; that must not reset live download jobs."""
+    script = tmp_path / "entry.py"
+    script.write_text(_ENTRY_SCRIPT, encoding="utf-8")
+    src_dir = Path(__file__).resolve().parents[1] / "src"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(src_dir), os.environ.get("PYTHONPATH")]))}
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, str(script)], cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "running"
@@ -0,0 +1,168 @@
+"""Tests for resumable, segmented downloads of large binary assets."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import re
+import threading
+from pathlib import Path
+
+import pytest
+import requests
+
+from universal_iiif_core import range_download
+from universal_iiif_core.exceptions import DownloadError
+from universal_iiif_core.range_download import download_file
+
+_URL = "https://example.org/native.pdf"
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, body: bytes, headers: dict[str, str], *, cut_after: int | None = None):
+        self.status_code = status_code
+        self.headers = headers
+        self._body = body
+        self._cut_after = cut_after
+
+    def iter_content(self, chunk_size: int = 1):
+        sent = 0
+        for start in range(0, len(self._body), 7):
+            if self._cut_after is not None and sent >= self._cut_after:
+                raise requests.exceptions.ChunkedEncodingError("connection broken")
+            chunk = self._body[start : start + 7]
+            sent += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        return None
+
+
+class _FakeRangeServer:
+    """Stand-in for `HTTPClient` serving one payload with optional byte-range support."""
+
+    def __init__(self, payload: bytes, *, ranges: bool = True, extra_headers: dict[str, str] | None = None):
+        self.payload = payload
+        self.ranges = ranges
+        self.extra_headers = extra_headers or {}
+        self.requested: list[str | None] = []
+        self.fail_from: int | None = None
+        self.cut_once: set[int] = set()
+        self._lock = threading.Lock()
+
+    def get(self, url, *, headers=None, stream=False, **_kwargs):
+        assert url == _URL and stream
+        assert headers["Accept-Encoding"] == "identity"
+        range_header = headers.get("Range")
+        with self._lock:
+            self.requested.append(range_header)
+        base = {"ETag": '"v1"', **self.extra_headers}
+        if not self.ranges or not range_header:
+            return _FakeResponse(200, self.payload, {**base, "Content-Length": str(len(self.payload))})
+        start, end = (int(value) for value in re.match(r"bytes=(\d+)-(\d+)", range_header).groups())
+        if self.fail_from is not None and start >= self.fail_from:
+            raise requests.ConnectionError("server went away")
+        body = self.payload[start : end + 1]
+        cut_after = None
+        with self._lock:
+            if start in self.cut_once:
+                self.cut_once.discard(start)
+                cut_after = len(body) // 2
+        content_range = f"bytes {start}-{start + len(body) - 1}/{len(self.payload)}"
+        return _FakeResponse(206, body, {**base, "Content-Range": content_range}, cut_after=cut_after)
+
+
+@pytest.fixture
+def small_segments(monkeypatch):
+    monkeypatch.setattr(range_download, "MIN_SEGMENT_BYTES", 100)
+    monkeypatch.setattr(range_download, "JOURNAL_EVERY_BYTES", 20)
+
+
+def _payload(size: int = 1000) -> bytes:
+    return bytes(index % 251 for index in range(size))
+
+
+def test_download_fetches_segments_in_parallel_and_verifies_digest(tmp_path: Path, small_segments):
+    """Ranges are split across segments, reassembled in place and checked against `Repr-Digest`."""
+    payload = _payload()
+    digest = base64.b64encode(hashlib.sha256(payload).digest()).decode()
+    server = _FakeRangeServer(payload, extra_headers={"Repr-Digest": f"sha-256=:{digest}:"})
+    dest = tmp_path / "native.pdf"
+
+    assert download_file(server, _URL, dest, segments=4) == dest
+
+    assert dest.read_bytes() == payload
+    assert server.requested[0] == "bytes=0-0"
+    assert sorted(server.requested[1:]) == ["bytes=0-249", "bytes=250-499", "bytes=500-749", "bytes=750-999"]
+    assert not dest.with_name("native.pdf.part").exists()
+    assert not dest.with_name("native.pdf.part.json").exists()
+
+
+def test_download_resumes_from_journal_after_failure(tmp_path: Path, small_segments):
+    """An interrupted download keeps its journal; the next attempt only requests missing bytes."""
+    payload = _payload()
+    dest = tmp_path / "native.pdf"
+    broken = _FakeRangeServer(payload)
+    broken.fail_from = 500
+
+    with pytest.raises(requests.ConnectionError):
+        download_file(broken, _URL, dest, segments=4)
+
+    journal = json.loads(dest.with_name("native.pdf.part.json").read_text(encoding="utf-8"))
+    segments = journal["segments"]
+    assert [segment["done"] for segment in segments[2:]] == [0, 0]
+
+    healthy = _FakeRangeServer(payload)
+    download_file(healthy, _URL, dest, segments=4)
+
+    assert dest.read_bytes() == payload
+    missing = [
+        f"bytes={segment['start'] + segment['done']}-{segment['end']}"
+        for segment in segments
+        if segment["done"] < segment["end"] - segment["start"] + 1
+    ]
+    assert sorted(healthy.requested[1:]) == sorted(missing)
+
+
+def test_download_rerequests_a_body_cut_off_mid_stream(tmp_path: Path, small_segments):
+    """A dropped connection inside a segment continues from the last written byte."""
+    payload = _payload()
+    server = _FakeRangeServer(payload)
+    server.cut_once = {250}
+    dest = tmp_path / "native.pdf"
+
+    download_file(server, _URL, dest, segments=4)
+
+    assert dest.read_bytes() == payload
+    follow_up = [header for header in server.requested[1:] if header.endswith("-499")]
+    assert follow_up[0] == "bytes=250-499"
+    assert len(follow_up) == 2
+    assert int(follow_up[1].split("=")[1].split("-")[0]) > 250
+
+
+def test_download_rejects_checksum_mismatch(tmp_path: Path, small_segments):
+    """A digest mismatch fails the download and drops the partial file."""
+    wrong = base64.b64encode(hashlib.sha256(b"other").digest()).decode()
+    server = _FakeRangeServer(_payload(), extra_headers={"Digest": f"SHA-256={wrong}"})
+    dest = tmp_path / "native.pdf"
+
+    with pytest.raises(DownloadError, match="Checksum mismatch"):
+        download_file(server, _URL, dest, segments=2)
+
+    assert not dest.exists()
+    assert not dest.with_name("native.pdf.part").exists()
+
+
+def test_download_without_range_support_streams_once(tmp_path: Path, small_segments):
+    """Servers ignoring `Range` are read from the probe response in a single stream."""
+    payload = _payload(300)
+    server = _FakeRangeServer(payload, ranges=False)
+    dest = tmp_path / "native.pdf"
+    progress: list[tuple[int, int | None]] = []
+
+    download_file(server, _URL, dest, segments=4, progress_callback=lambda done, total: progress.append((done, total)))
+
+    assert dest.read_bytes() == payload
+    assert server.requested == ["bytes=0-0"]
+    assert progress[-1] == (300, 300)
@@ -123,3 +123,35 @@ def test_search_gallica_printed_filter_matches_printed_monograph(monkeypatch):
     results = search_gallica("villamont", max_records=5, gallica_type_filter="printed")
     assert results
     assert results[0]["id"] == "bpt6k87126379"
+
+
+def test_gallica_sru_parser_streams_records_from_a_file_object():
+    """`iter_sru` yields the same records as `parse_sru`, reading from a stream."""
+    import io
+
+    from universal_iiif_core.providers import get_provider
+    from universal_iiif_core.resolvers.parsers import GallicaXMLParser
+
+    content = (Path(__file__).parent / "fixtures" / "gallica_sample.xml").read_bytes()
+    resolver = get_provider("Gallica").resolver()
+
+    streamed = list(GallicaXMLParser.iter_sru(io.BytesIO(content), resolver))
+    assert streamed == GallicaXMLParser.parse_sru(content, resolver)
+    assert streamed[0]["id"] == "btv1b10033406t"
+
+
+def test_gallica_sru_parser_falls_back_to_other_record_elements_only_without_srw_records():
+    """`*record` elements are results only when the response has no `srw:record` at all."""
+    from universal_iiif_core.providers import get_provider
+    from universal_iiif_core.resolvers.parsers import GallicaXMLParser
+
+    resolver = get_provider("Gallica").resolver()
+    dc = '<dc xmlns="http://purl.org/dc/elements/1.1/"><identifier>https://gallica.bnf.fr/ark:/12148/{}</identifier></dc>'
+    stray = f"<extra><metarecord>{dc.format('btv1bSTRAY')}</metarecord></extra>"
+    srw = f'<srw:record xmlns:srw="http://www.loc.gov/zing/srw/">{dc.format("btv1bSRW")}</srw:record>'
+
+    with_srw = f"<response>{stray}<records>{srw}</records></response>".encode()
+    assert [item["id"] for item in GallicaXMLParser.iter_sru(with_srw, resolver)] == ["btv1bSRW"]
+
+    without_srw = f"<response>{stray}<record>{dc.format('btv1bPLAIN')}</record></response>".encode()
+    assert [item["id"] for item in GallicaXMLParser.iter_sru(without_srw, resolver)] == ["btv1bSTRAY", "btv1bPLAIN"]
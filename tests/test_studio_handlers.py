@@ -6,12 +6,13 @@ import pytest
 from PIL import Image
 from starlette.requests import Request
 
-from studio_ui.common.title_utils import truncate_title
 from studio_ui.routes import studio_handlers
 from studio_ui.routes._studio import scan_resolution as _scan_resolution_mod
 from universal_iiif_core.config_manager import get_config_manager
+from universal_iiif_core.doc_revisions import bump_document_revision, document_revision_token
 from universal_iiif_core.http_client import HTTPClient
 from universal_iiif_core.services.storage.vault_manager import VaultManager
+from universal_iiif_core.title_utils import truncate_title
 
 # Mark as slow (extensive file I/O, image creation, vault operations)
 pytestmark = pytest.mark.slow
@@ -587,6 +588,8 @@ def test_export_panel_uses_submit_trigger_and_card_based_thumbnail_selection():
     assert 'id="studio-export-overrides-toggle"' in rendered_output
     assert 'id="studio-export-overrides-panel"' in rendered_output
     assert 'id="studio-export-pdf-list"' in rendered_output
+    assert 'id="studio-export-zip-download"' in rendered_output
+    assert "/api/export/stream/zip?" in rendered_output
     assert "Crea PDF rapido (tutte le pagine)" not in rendered_output
     assert "Crea PDF selezionato" not in rendered_output
     assert "studio-export-profile-form" not in rendered_output
@@ -1092,6 +1095,71 @@ def test_export_thumbs_done_state_does_not_force_remote_probe_every_refresh(tmp_
         cm.set_downloads_dir(str(old_downloads))
 
 
+def test_export_thumbs_slow_remote_probes_do_not_block_and_stream_later(tmp_path, monkeypatch):
+    """Slow info.json probes should run concurrently, return cached data first and persist late results."""
+    import threading
+    import time
+
+    cm = get_config_manager()
+    old_downloads = cm.get_downloads_dir()
+    old_wait = cm.get_setting("images.remote_probe_inline_wait_ms", 1500)
+    try:
+        tmp_downloads = tmp_path / "downloads"
+        cm.set_downloads_dir(str(tmp_downloads))
+        cm.set_setting("images.remote_probe_inline_wait_ms", 50)
+
+        doc_id = "DOC_THUMBS_SLOW_PROBE"
+        library = "Vaticana"
+        doc_root = Path(tmp_downloads) / library / doc_id
+        scans_dir = doc_root / "scans"
+        data_dir = doc_root / "data"
+        scans_dir.mkdir(parents=True, exist_ok=True)
+        data_dir.mkdir(parents=True, exist_ok=True)
+        for idx in range(3):
+            Image.new("RGB", (80, 60), (220, 220, 220)).save(scans_dir / f"pag_{idx:04d}.jpg", format="JPEG")
+        (data_dir / "manifest.json").write_text(json.dumps({"items": []}), encoding="utf-8")
+        vm = VaultManager()
+        vm.upsert_manuscript(doc_id, library=library, local_path=str(doc_root), status="saved", asset_state="saved")
+
+        release = threading.Event()
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def _slow_probe(_manifest_json, page_num):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            release.wait(5)
+            with lock:
+                active["now"] -= 1
+            return 1000 + page_num, 2000, f"https://example.org/iiif/{page_num}"
+
+        monkeypatch.setattr(_scan_resolution_mod, "probe_remote_max_dimensions", _slow_probe)
+
+        started = time.monotonic()
+        panel = studio_handlers.get_studio_export_thumbs(doc_id=doc_id, library=library, thumb_page=1, page_size=24)
+        assert time.monotonic() - started < 3
+        rendered = repr(panel)
+        assert "Remote 1001x2000" not in rendered
+        assert 'hx-trigger="load, every 2s [!window.studioLiveEvents], studio-docs[detail.doc_id==' in rendered
+
+        release.set()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and len(vm.get_remote_page_dims(doc_id, [1, 2, 3])) < 3:
+            time.sleep(0.02)
+        assert active["peak"] == 3
+        assert vm.get_remote_page_dims(doc_id, [2])["2"]["width"] == 1002
+
+        live = repr(
+            studio_handlers.get_studio_export_thumbs_live(doc_id=doc_id, library=library, thumb_page=1, page_size=24)
+        )
+        assert "Remote 1001x2000" in live
+        assert 'hx-trigger="load, every 2s"' not in live
+    finally:
+        cm.set_setting("images.remote_probe_inline_wait_ms", old_wait)
+        cm.set_downloads_dir(str(old_downloads))
+
+
 def test_export_thumbs_poller_disables_when_no_active_page_jobs(tmp_path):
     """Thumbs endpoint should render live poller only while page jobs are active."""
     cm = get_config_manager()
@@ -1134,7 +1202,7 @@ def test_export_thumbs_poller_disables_when_no_active_page_jobs(tmp_path):
         )
         active_rendered = repr(active_panel)
         assert 'id="studio-export-live-state-poller"' in active_rendered
-        assert 'hx-trigger="load, every 2s"' in active_rendered
+        assert f"studio-docs[detail.doc_id=='{doc_id}'] from:body" in active_rendered
         assert "/api/studio/export/thumbs/live?doc_id=" in active_rendered
         assert 'hx-swap="none"' in active_rendered
 
@@ -1215,6 +1283,50 @@ def test_export_thumbs_live_returns_oob_card_updates_only(tmp_path, monkeypatch)
         cm.set_downloads_dir(str(old_downloads))
 
 
+def test_export_thumbs_live_skips_unchanged_revision_and_renders_bumped_pages(tmp_path, monkeypatch):
+    """Live thumbs poll answers 204 for a current revision and rebuilds only cards bumped since."""
+    cm = get_config_manager()
+    old_downloads = cm.get_downloads_dir()
+    try:
+        tmp_downloads = tmp_path / "downloads"
+        cm.set_downloads_dir(str(tmp_downloads))
+        doc_id = "DOC_THUMBS_LIVE_REV"
+        library = "Vaticana"
+        doc_root = Path(tmp_downloads) / library / doc_id
+        scans_dir = doc_root / "scans"
+        scans_dir.mkdir(parents=True, exist_ok=True)
+        (doc_root / "data").mkdir(parents=True, exist_ok=True)
+        for idx in range(3):
+            Image.new("RGB", (80, 60), (220, 220, 220)).save(scans_dir / f"pag_{idx:04d}.jpg", format="JPEG")
+        VaultManager().upsert_manuscript(doc_id, library=library, local_path=str(doc_root), status="saved")
+        monkeypatch.setattr(
+            _scan_resolution_mod,
+            "probe_remote_max_dimensions",
+            lambda _manifest_json, _page_num: (3200, 2400, "https://example.org/iiif/page"),
+        )
+        # Warm the remote-size cache so later polls do not re-probe.
+        studio_handlers.get_studio_export_thumbs_live(doc_id=doc_id, library=library, thumb_page=1, page_size=24)
+
+        token = document_revision_token(doc_id)
+        unchanged = studio_handlers.get_studio_export_thumbs_live(
+            doc_id=doc_id, library=library, thumb_page=1, page_size=24, rev=token
+        )
+        assert unchanged.status_code == 204
+
+        bump_document_revision(doc_id, [2])
+        rendered = repr(
+            studio_handlers.get_studio_export_thumbs_live(
+                doc_id=doc_id, library=library, thumb_page=1, page_size=24, rev=token
+            )
+        )
+        assert 'hx-swap-oob="outerHTML:#studio-thumb-card-2"' in rendered
+        assert "studio-thumb-card-1" not in rendered
+        assert "studio-thumb-card-3" not in rendered
+        assert 'hx-swap-oob="outerHTML:#studio-export-pages-summary"' in rendered
+    finally:
+        cm.set_downloads_dir(str(old_downloads))
+
+
 def test_export_tab_does_not_show_stitch_badge_when_stats_mark_tile_stitch(tmp_path):
     """Thumbnail cards should rely on the progress indicator instead of a stale stitch badge."""
     cm = get_config_manager()
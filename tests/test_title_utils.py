@@ -1,4 +1,4 @@
-from studio_ui.common.title_utils import resolve_preferred_title, truncate_title
+from universal_iiif_core.title_utils import resolve_preferred_title, truncate_title
 
 
 def test_resolve_preferred_title_prefers_catalog_title():
@@ -217,3 +217,48 @@ def test_get_app_ui_pref_returns_default_on_malformed_json():
 
     fallback = {"doc_id": "fallback"}
     assert vm.get_app_ui_pref("studio.last_context", fallback) == fallback
+
+
+def test_bulk_update_manuscripts_writes_changed_rows_in_batches():
+    """Only rows with updates are written; unknown columns are dropped and progress is reported."""
+    vm = VaultManager()
+    for index in range(5):
+        vm.upsert_manuscript(f"DOC_BULK_{index}", library="Gallica", status="saved", item_type="manoscritto")
+    progress = []
+
+    def _compute(row):
+        if not str(row["id"]).startswith("DOC_BULK_") or row["id"].endswith("0"):
+            return None
+        return {"item_type": "altro", "item_type_reason": "bulk", "not_a_column": 1}
+
+    changed = vm.bulk_update_manuscripts(
+        _compute, batch_size=2, progress_callback=lambda done, total, _msg: progress.append((done, total))
+    )
+
+    assert changed == 4
+    assert vm.get_manuscript("DOC_BULK_0")["item_type_reason"] is None
+    updated = vm.get_manuscript("DOC_BULK_3")
+    assert (updated["item_type"], updated["item_type_reason"]) == ("non classificato", "bulk")
+    assert progress[-1][0] == progress[-1][1]
+    assert len(progress) == (progress[-1][1] + 1) // 2
+
+
+def test_bulk_update_manuscripts_reads_each_batch_fresh():
+    """Rows written by other writers between batches are recomputed, not overwritten with stale values."""
+    vm = VaultManager()
+    for index in range(4):
+        vm.upsert_manuscript(f"DOC_FRESH_{index}", library="Gallica", status="downloading", downloaded_canvases=0)
+
+    def _download_progress(done, _total, _msg):
+        if done == 2:
+            vm.upsert_manuscript("DOC_FRESH_3", downloaded_canvases=7)
+
+    def _compute(row):
+        if not str(row["id"]).startswith("DOC_FRESH_"):
+            return None
+        return {"downloaded_canvases": row["downloaded_canvases"], "asset_state": f"seen:{row['downloaded_canvases']}"}
+
+    vm.bulk_update_manuscripts(_compute, batch_size=2, progress_callback=_download_progress)
+
+    fresh = vm.get_manuscript("DOC_FRESH_3")
+    assert (fresh["downloaded_canvases"], fresh["asset_state"]) == (7, "seen:7")
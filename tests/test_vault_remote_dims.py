@@ -0,0 +1,77 @@
+"""Tests for the remote page-dimension cache table in VaultManager."""
+
+import json
+import time
+
+from studio_ui.routes._studio.thumbnail_cache import _load_remote_cache
+from universal_iiif_core.services.storage.vault_manager import VaultManager
+
+
+def _entry(width: int, **extra) -> dict:
+    return {"width": width, "height": width * 2, "service_url": f"https://iiif.example.org/{width}", **extra}
+
+
+def test_upsert_and_get_only_requested_pages(tmp_path):
+    vm = VaultManager(str(tmp_path / "vault.db"))
+    written = vm.upsert_remote_page_dims("DOC", {str(p): _entry(p * 100) for p in range(1, 6)})
+
+    assert written == 5
+    rows = vm.get_remote_page_dims("DOC", [2, 4, 99])
+    assert set(rows) == {"2", "4"}
+    assert rows["2"]["width"] == 200
+    assert rows["2"]["height"] == 400
+    assert rows["4"]["service_url"] == "https://iiif.example.org/400"
+    assert vm.get_remote_page_dims("OTHER", [1]) == {}
+
+
+def test_upsert_keeps_verified_dims_when_omitted(tmp_path):
+    vm = VaultManager(str(tmp_path / "vault.db"))
+    vm.upsert_remote_page_dims("DOC", {"1": _entry(100, verified_direct_width=900, verified_direct_height=1200)})
+    vm.upsert_remote_page_dims("DOC", {"1": _entry(150)})
+
+    row = vm.get_remote_page_dims("DOC", [1])["1"]
+    assert row["width"] == 150
+    assert (row["verified_direct_width"], row["verified_direct_height"]) == (900, 1200)
+
+
+def test_prune_applies_retention_and_lru_caps(tmp_path):
+    vm = VaultManager(str(tmp_path / "vault.db"))
+    vm.upsert_remote_page_dims("DOC", {str(p): _entry(p) for p in range(1, 6)})
+    conn = vm._get_conn()
+    now = int(time.time())
+    conn.executemany(
+        "UPDATE remote_page_dims SET last_access_ts = ? WHERE doc_id = 'DOC' AND page_num = ?",
+        [(now - 10 * 3600, 1), (now - 30, 2), (now - 20, 3), (now - 10, 4), (now, 5)],
+    )
+    conn.commit()
+    conn.close()
+
+    deleted = vm.prune_remote_page_dims("DOC", retention_hours=1, max_items=3, max_bytes=10**9)
+
+    assert deleted == 2
+    assert set(vm.get_remote_page_dims("DOC")) == {"3", "4", "5"}
+
+    vm.prune_remote_page_dims("DOC", retention_hours=1, max_items=100, max_bytes=1)
+    assert vm.get_remote_page_dims("DOC") == {}
+
+
+def test_delete_manuscript_drops_remote_dims(tmp_path):
+    vm = VaultManager(str(tmp_path / "vault.db"))
+    vm.upsert_manuscript("DOC", display_title="Doc")
+    vm.upsert_remote_page_dims("DOC", {"1": _entry(100)})
+
+    vm.delete_manuscript("DOC")
+
+    assert vm.get_remote_page_dims("DOC") == {}
+
+
+def test_load_remote_cache_imports_legacy_json_once(tmp_path):
+    legacy = tmp_path / "remote_resolution_cache.json"
+    legacy.write_text(json.dumps({"1": _entry(300), "2": _entry(400), "bad": "x"}), encoding="utf-8")
+
+    loaded = _load_remote_cache("LEGACY", [2], legacy_path=legacy)
+
+    assert not legacy.exists()
+    assert set(loaded) == {"2"}
+    assert loaded["2"]["width"] == 400
+    assert set(VaultManager().get_remote_page_dims("LEGACY")) == {"1", "2"}
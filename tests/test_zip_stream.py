@@ -0,0 +1,35 @@
+"""Tests for store-mode and streaming ZIP writing."""
+
+import io
+import zipfile
+
+from universal_iiif_core.zip_stream import iter_zip_stream, write_zip
+
+
+def _members(tmp_path):
+    (tmp_path / "pag_0000.jpg").write_bytes(b"\xff\xd8" + bytes(300_000))
+    (tmp_path / "notes.txt").write_text("trascrizione " * 500, encoding="utf-8")
+    return [
+        (tmp_path / "pag_0000.jpg", "pag_0000.jpg"),
+        (tmp_path / "missing.jpg", "missing.jpg"),
+        (tmp_path / "notes.txt", "notes.txt"),
+    ]
+
+
+def test_write_zip_stores_compressed_media_and_deflates_text(tmp_path):
+    output = write_zip(_members(tmp_path), tmp_path / "out" / "bundle.zip")
+
+    with zipfile.ZipFile(output) as archive:
+        modes = {info.filename: info.compress_type for info in archive.infolist()}
+    assert modes == {"pag_0000.jpg": zipfile.ZIP_STORED, "notes.txt": zipfile.ZIP_DEFLATED}
+
+
+def test_iter_zip_stream_yields_valid_archive_in_bounded_chunks(tmp_path):
+    chunks = list(iter_zip_stream(_members(tmp_path), chunk_size=64 * 1024))
+
+    assert len(chunks) > 3
+    assert max(len(chunk) for chunk in chunks) <= 64 * 1024 + 128
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        assert archive.testzip() is None
+        assert archive.read("pag_0000.jpg") == (tmp_path / "pag_0000.jpg").read_bytes()
+        assert archive.read("notes.txt").decode("utf-8").startswith("trascrizione")